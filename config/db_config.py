@@ -0,0 +1,88 @@
+"""
+Perfis de desempenho do SQLite.
+
+Cada perfil reúne os PRAGMAs aplicados uma única vez a cada conexão criada
+pelos pools (util/db_util.py) e o intervalo da manutenção periódica
+(util/db_manutencao.py). O perfil é escolhido pela variável de ambiente
+DATABASE_PERFIL:
+
+- economico: pouca memória por conexão (hospedagem pequena, muitos workers);
+- padrao: equilíbrio para o servidor de produção atual;
+- desempenho: cache e mmap maiores e checkpoints menos frequentes, para
+  máquinas com memória sobrando e bancos que não cabem no cache padrão.
+
+Para comparar os perfis no banco real:
+    python -m util.db_benchmark --perfis economico padrao desempenho
+"""
+import os
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+
+@dataclass(frozen=True)
+class PerfilBanco:
+    nome: str
+    # Cache de páginas por conexão, em KiB (aplicado como cache_size negativo)
+    cache_kb: int
+    # Bytes do arquivo lidos por memory-mapped I/O (0 desativa)
+    mmap_bytes: int
+    # Onde ficam tabelas e índices temporários: MEMORY, FILE ou DEFAULT
+    temp_store: str
+    # Páginas no WAL que disparam o checkpoint automático
+    wal_autocheckpoint: int
+    # Espera máxima pelo lock do banco, em milissegundos (None: usa DATABASE_TIMEOUT)
+    busy_timeout_ms: Optional[int]
+    # NORMAL é seguro em modo WAL (pode perder só a última transação em queda de energia)
+    synchronous: str
+    # Segundos entre execuções de PRAGMA optimize e wal_checkpoint(TRUNCATE) (0 desativa)
+    intervalo_manutencao: float
+
+
+PERFIS: Dict[str, PerfilBanco] = {
+    "economico": PerfilBanco(
+        nome="economico",
+        cache_kb=2000,
+        mmap_bytes=0,
+        temp_store="DEFAULT",
+        wal_autocheckpoint=1000,
+        busy_timeout_ms=None,
+        synchronous="NORMAL",
+        intervalo_manutencao=6 * 3600,
+    ),
+    "padrao": PerfilBanco(
+        nome="padrao",
+        cache_kb=20000,
+        mmap_bytes=256 * 1024 * 1024,
+        temp_store="MEMORY",
+        wal_autocheckpoint=1000,
+        busy_timeout_ms=None,
+        synchronous="NORMAL",
+        intervalo_manutencao=3600,
+    ),
+    "desempenho": PerfilBanco(
+        nome="desempenho",
+        cache_kb=64000,
+        mmap_bytes=1024 * 1024 * 1024,
+        temp_store="MEMORY",
+        wal_autocheckpoint=4000,
+        busy_timeout_ms=None,
+        synchronous="NORMAL",
+        intervalo_manutencao=1800,
+    ),
+}
+
+PERFIL_PADRAO = "padrao"
+
+
+def obter_perfil(nome: Optional[str] = None) -> PerfilBanco:
+    """
+    Retorna o perfil pelo nome (padrão: variável DATABASE_PERFIL ou "padrao").
+
+    Raises:
+        ValueError: Se o nome não corresponder a nenhum perfil
+    """
+    nome = (nome or os.getenv("DATABASE_PERFIL") or PERFIL_PADRAO).strip().lower()
+    try:
+        return PERFIS[nome]
+    except KeyError:
+        raise ValueError(f"Perfil de banco desconhecido: '{nome}'. Opções: {', '.join(PERFIS)}") from None
@@ -8,8 +8,25 @@ from typing import Set
 class UploadConfig:
     """Configurações centralizadas para upload de arquivos"""
 
-    # Diretórios    
-    USUARIOS_DIR = Path("static/img/usuarios")      
+    # Diretórios
+    IMG_DIR = Path("static/img")
+    USUARIOS_DIR = IMG_DIR / "usuarios"
+    FEEDS_DIR = IMG_DIR / "feeds"
+
+    # Armazenamento endereçado por conteúdo: static/midia/ab/abcdef....jpg
+    # (SHA-256 do arquivo). As URLs nunca mudam de conteúdo e podem ser
+    # cacheadas como imutáveis.
+    MIDIA_DIR = Path("static/midia")
+    MIDIA_URL = "/static/midia"
+
+    # Blobs que ficaram sem referência só são apagados depois deste prazo
+    # (segundos): páginas em cache, outros workers e navegadores ainda podem
+    # apontar para a URL antiga. Ver imagem_derivados.coletar_blobs_orfaos.
+    MIDIA_CARENCIA_ORFAOS = 24 * 3600
+
+    # Por quanto tempo (segundos) o registro de alterações da mídia é mantido
+    # para o índice em memória de cada worker. Ver util/indice_midia.py.
+    MIDIA_RETENCAO_ALTERACOES = 24 * 3600
 
     # Formato de nome de arquivo para fotos de usuários
     FOTO_USUARIO_PATTERN = "{:08d}"  # Formato: 00000123 (8 dígitos)
@@ -18,6 +35,9 @@ class UploadConfig:
     MAX_FILE_SIZE = 5 * 1024 * 1024  # 5MB
     MAX_FILE_SIZE_MB = 5
 
+    # Leitura do upload: tamanho de cada bloco gravado no arquivo temporário
+    CHUNK_SIZE = 64 * 1024  # 64KB
+
     # Dimensões de imagem
     MAX_WIDTH = 2048
     MAX_HEIGHT = 2048
@@ -39,6 +59,17 @@ class UploadConfig:
         b'RIFF': 'webp'  # Seguido por 'WEBP' nos bytes 8-11
     }
 
+    # Variantes geradas a cada upload: nome -> largura máxima em pixels.
+    # Salvas ao lado da original como 00000123_card.webp / 00000123_card.jpg
+    VARIANTES = {
+        "thumb": 160,
+        "card": 480,
+        "full": 1080,
+    }
+    FORMATOS_VARIANTES = ("webp", "jpg")
+    QUALIDADE_WEBP = 80
+    QUALIDADE_JPEG = 82
+
     # Permissões
     DIR_PERMISSIONS = 0o755
     FILE_PERMISSIONS = 0o644
@@ -49,7 +80,7 @@ class UploadConfig:
     @classmethod
     def init_directories(cls):
         """Cria diretórios necessários com permissões corretas"""
-        for directory in [cls.USUARIOS_DIR]:
+        for directory in [cls.USUARIOS_DIR, cls.FEEDS_DIR, cls.MIDIA_DIR]:
             directory.mkdir(parents=True, exist_ok=True)
             directory.chmod(cls.DIR_PERMISSIONS)
 
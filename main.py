@@ -1,15 +1,25 @@
 from routes.tutor import postagem_feed_routes
 from routes.publico import perfil_routes
 from fastapi import FastAPI
-from fastapi.staticfiles import StaticFiles
 import uvicorn
 import os
 import logging
+from contextlib import asynccontextmanager
 from logging.handlers import RotatingFileHandler
 from pathlib import Path
 from dotenv import load_dotenv
 
-from util.db_util import inicializar_banco
+from util.db_util import inicializar_banco, fechar_escritor
+from util.db_manutencao import iniciar_manutencao, parar_manutencao
+from util.visualizacoes_buffer import iniciar_buffers, parar_buffers
+from util.repo_util import fechar_executor_repo
+from util.db_async import fechar_banco_async
+from util.imagem_executor import fechar_executor_imagens
+from util.catalogo_categorias import catalogo_categorias
+from util.indice_midia import indice_midia
+from util.versao_dados import iniciar_atualizacao, parar_atualizacao
+from util.template_util import precompilar_templates
+from util.static_files import StaticFilesComCache
 from routes.publico import auth_routes, public_routes
 from util.middlewares import configurar_middlewares
 from routes.admin import (
@@ -61,18 +71,47 @@ logger = logging.getLogger(__name__)
 # Inicializar banco de dados
 inicializar_banco()
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Categorias ficam em memória; recarregadas a cada alteração pelo administrador
+    catalogo_categorias.carregar()
+    # Índice das imagens enviadas; daí em diante atualizado por registro alterado
+    indice_midia.carregar()
+    # Compilar os templates antes da primeira requisição
+    precompilar_templates()
+    # Gravação periódica das visualizações acumuladas em memória
+    iniciar_buffers()
+    # ANALYZE e manutenção periódica do SQLite (optimize/checkpoint)
+    iniciar_manutencao()
+    # Conferência, fora das requisições, das alterações feitas por outros workers
+    iniciar_atualizacao()
+    yield
+    parar_atualizacao()
+    # Gravar visualizações pendentes antes de encerrar
+    parar_buffers()
+    fechar_executor_repo()
+    fechar_executor_imagens()
+    fechar_banco_async()
+    # Antes do escritor: a última rodada de manutenção não deve recriá-lo
+    parar_manutencao()
+    # Gravar as escritas ainda na fila do escritor único
+    fechar_escritor()
+
+
 # Inicializar FastAPI
 app = FastAPI(
     title="VetConecta",
     description="Plataforma de conexão veterinária",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 # Configurar middlewares
 configurar_middlewares(app)
 
 # Montar arquivos estáticos
-app.mount("/static", StaticFiles(directory="static"), name="static")
+app.mount("/static", StaticFilesComCache(directory="static"), name="static")
 
 # Incluir rotas
 app.include_router(public_routes.router)
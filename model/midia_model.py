@@ -0,0 +1,11 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+
+@dataclass
+class Midia:
+    tipo: str
+    id_registro: int
+    hash: str
+    extensao: str
+    data_atualizacao: Optional[datetime] = None
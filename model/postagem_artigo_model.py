@@ -9,4 +9,5 @@ class PostagemArtigo:
     conteudo: str
     id_categoria_artigo: int
     data_publicacao: date
-    visualizacoes: int
\ No newline at end of file
+    visualizacoes: int
+    total_curtidas: int = 0
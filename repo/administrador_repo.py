@@ -1,7 +1,8 @@
 from typing import Optional, List
 from model.administrador_model import Administrador
 from sql.administrador_sql import *
-from util.db_util import get_connection
+from util.db_util import get_connection, get_connection_leitura, serializar_escrita
+from util.model_util import mapear_linha, mapear_linhas
 
 
 def criar_tabela() -> bool:
@@ -15,6 +16,7 @@ def criar_tabela() -> bool:
         return False
 
 
+@serializar_escrita
 def inserir(admin: Administrador) -> Optional[int]:
     with get_connection() as conn:
         cursor = conn.cursor()
@@ -22,6 +24,7 @@ def inserir(admin: Administrador) -> Optional[int]:
         return cursor.lastrowid
 
 
+@serializar_escrita
 def atualizar(admin: Administrador) -> bool:
     with get_connection() as conn:
         cursor = conn.cursor()
@@ -29,6 +32,7 @@ def atualizar(admin: Administrador) -> bool:
         return cursor.rowcount > 0
 
 
+@serializar_escrita
 def atualizar_senha(id_admin: int, nova_senha: str) -> bool:
     with get_connection() as conn:
         cursor = conn.cursor()
@@ -36,6 +40,7 @@ def atualizar_senha(id_admin: int, nova_senha: str) -> bool:
         return cursor.rowcount > 0
 
 
+@serializar_escrita
 def excluir(id_admin: int) -> bool:
     with get_connection() as conn:
         cursor = conn.cursor()
@@ -44,31 +49,37 @@ def excluir(id_admin: int) -> bool:
 
 
 def obter_pagina(offset: int, limite: int) -> List[Administrador]:
-    with get_connection() as conn:
+    with get_connection_leitura() as conn:
         cursor = conn.cursor()
         cursor.execute(OBTER_PAGINA, (limite, offset))
-        rows = cursor.fetchall()
-        return [Administrador(**row) for row in rows]
+        return mapear_linhas(cursor, Administrador)
 
 
 def obter_por_id(id_admin: int) -> Optional[Administrador]:
-    with get_connection() as conn:
+    with get_connection_leitura() as conn:
         cursor = conn.cursor()
         cursor.execute(OBTER_POR_ID, (id_admin,))
-        row = cursor.fetchone()
-        return Administrador(**row) if row else None
+        return mapear_linha(cursor, Administrador)
     
 
 def obter_por_email(email: str) -> Optional[Administrador]:
-    with get_connection() as conn:
+    with get_connection_leitura() as conn:
         cursor = conn.cursor()
         cursor.execute(OBTER_POR_EMAIL, (email,))
-        row = cursor.fetchone()
-        return Administrador(**row) if row else None
+        return mapear_linha(cursor, Administrador)
 
 
+@serializar_escrita
 def importar(admin: Administrador) -> bool:
     with get_connection() as conn:
         cursor = conn.cursor()
         cursor.execute(IMPORTAR, (admin.id_admin, admin.nome, admin.email, admin.senha))
         return cursor.rowcount > 0
+
+
+@serializar_escrita
+def importar_lote(admins: List[Administrador]) -> int:
+    """Insere vários administradores com executemany em uma única transação."""
+    with get_connection() as conn:
+        conn.executemany(IMPORTAR, [(a.id_admin, a.nome, a.email, a.senha) for a in admins])
+        return len(admins)
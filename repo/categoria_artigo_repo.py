@@ -1,7 +1,9 @@
 from typing import Optional, List
 from model.categoria_artigo_model import CategoriaArtigo
 from sql.categoria_artigo_sql import *
-from util.db_util import get_connection
+from util.db_util import get_connection, get_connection_leitura, serializar_escrita
+from util.model_util import mapear_linha, mapear_linhas
+from util.cache_util import invalida_cache
 
 
 def criar_tabela() -> bool:
@@ -15,6 +17,8 @@ def criar_tabela() -> bool:
         return False
 
 
+@invalida_cache("categorias")
+@serializar_escrita
 def inserir(categoria: CategoriaArtigo) -> Optional[int]:
     with get_connection() as conn:
         cursor = conn.cursor()
@@ -22,6 +26,8 @@ def inserir(categoria: CategoriaArtigo) -> Optional[int]:
         return cursor.lastrowid
 
 
+@invalida_cache("categorias")
+@serializar_escrita
 def atualizar(categoria: CategoriaArtigo) -> bool:
     with get_connection() as conn:
         cursor = conn.cursor()
@@ -36,6 +42,8 @@ def atualizar(categoria: CategoriaArtigo) -> bool:
         return cursor.rowcount > 0
 
 
+@invalida_cache("categorias")
+@serializar_escrita
 def excluir(id_categoria: int) -> bool:
     with get_connection() as conn:
         cursor = conn.cursor()
@@ -44,31 +52,39 @@ def excluir(id_categoria: int) -> bool:
 
 
 def obter_pagina(offset: int, limite: int) -> List[CategoriaArtigo]:
-    with get_connection() as conn:
+    with get_connection_leitura() as conn:
         cursor = conn.cursor()
         cursor.execute(OBTER_PAGINA, (limite, offset))
-        rows = cursor.fetchall()
-        return [CategoriaArtigo(**row) for row in rows]
+        return mapear_linhas(cursor, CategoriaArtigo)
 
 
 def obter_por_id(id_categoria: int) -> Optional[CategoriaArtigo]:
-    with get_connection() as conn:
+    with get_connection_leitura() as conn:
         cursor = conn.cursor()
         cursor.execute(OBTER_POR_ID, (id_categoria,))
-        row = cursor.fetchone()
-        return CategoriaArtigo(**row) if row else None
+        return mapear_linha(cursor, CategoriaArtigo)
 
 
 def obter_todos() -> List[CategoriaArtigo]:
-    with get_connection() as conn:
+    with get_connection_leitura() as conn:
         cursor = conn.cursor()
         cursor.execute(OBTER_TODOS)
-        rows = cursor.fetchall()
-        return [CategoriaArtigo(**row) for row in rows]
+        return mapear_linhas(cursor, CategoriaArtigo)
 
 
+@invalida_cache("categorias")
+@serializar_escrita
 def importar(categoria: CategoriaArtigo) -> Optional[int]:
     with get_connection() as conn:
         cursor = conn.cursor()
         cursor.execute(IMPORTAR, (categoria.id_categoria_artigo, categoria.nome, categoria.cor))
-        return categoria.id_categoria_artigo
\ No newline at end of file
+        return categoria.id_categoria_artigo
+
+
+@invalida_cache("categorias")
+@serializar_escrita
+def importar_lote(categorias: List[CategoriaArtigo]) -> int:
+    """Insere várias categorias com executemany em uma única transação."""
+    with get_connection() as conn:
+        conn.executemany(IMPORTAR, [(c.id_categoria_artigo, c.nome, c.cor) for c in categorias])
+        return len(categorias)
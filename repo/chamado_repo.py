@@ -2,7 +2,8 @@ from typing import Optional, List
 from model.chamado_model import Chamado
 from model.enums import ChamadoStatus
 from sql.chamado_sql import *
-from util.db_util import get_connection
+from util.db_util import get_connection, get_connection_leitura, serializar_escrita
+from util.model_util import mapear_linha, mapear_linhas
 import asyncio
 
 
@@ -17,6 +18,7 @@ def criar_tabela() -> bool:
         return False
 
 
+@serializar_escrita
 def inserir(chamado: Chamado) -> Optional[int]:
     with get_connection() as conn:
         cursor = conn.cursor()
@@ -34,6 +36,7 @@ def inserir(chamado: Chamado) -> Optional[int]:
         return cursor.lastrowid
 
 
+@serializar_escrita
 def atualizar_status(id_chamado: int, novo_status: ChamadoStatus) -> bool:
     with get_connection() as conn:
         cursor = conn.cursor()
@@ -41,6 +44,7 @@ def atualizar_status(id_chamado: int, novo_status: ChamadoStatus) -> bool:
         return cursor.rowcount > 0
 
 
+@serializar_escrita
 def excluir(id_chamado: int) -> bool:
     with get_connection() as conn:
         cursor = conn.cursor()
@@ -49,40 +53,17 @@ def excluir(id_chamado: int) -> bool:
 
 
 def obter_pagina(offset: int, limite: int) -> List[Chamado]:
-    with get_connection() as conn:
+    with get_connection_leitura() as conn:
         cursor = conn.cursor()
         cursor.execute(OBTER_PAGINA, (limite, offset))
-        rows = cursor.fetchall()
-        return [
-            Chamado(
-                id_chamado=row["id_chamado"],
-                id_usuario=row["id_usuario"],
-                id_admin=row["id_admin"],
-                titulo=row["titulo"],
-                descricao=row["descricao"],
-                status=ChamadoStatus(row["status"]),
-                data=row["data"],
-            )
-            for row in rows
-        ]
+        return mapear_linhas(cursor, Chamado, conversores={"status": ChamadoStatus})
 
 
 def obter_por_id(id_chamado: int) -> Optional[Chamado]:
-    with get_connection() as conn:
+    with get_connection_leitura() as conn:
         cursor = conn.cursor()
         cursor.execute(OBTER_POR_ID, (id_chamado,))
-        row = cursor.fetchone()
-        if row:
-            return Chamado(
-                id_chamado=row["id_chamado"],
-                id_usuario=row["id_usuario"],
-                id_admin=row["id_admin"],
-                titulo=row["titulo"],
-                descricao=row["descricao"],
-                status=ChamadoStatus(row["status"]),
-                data=row["data"],
-            )
-        return None
+        return mapear_linha(cursor, Chamado, conversores={"status": ChamadoStatus})
 
 
 async def contar_total(status: str = None) -> int:
@@ -95,7 +76,7 @@ async def contar_total(status: str = None) -> int:
             query += " WHERE status = ?"
             params.append(status)
             
-        async with get_connection() as conn:
+        async with get_connection_leitura() as conn:
             async with conn.cursor() as cursor:
                 await cursor.execute(query, params)
                 (total,) = await cursor.fetchone()
@@ -106,7 +87,7 @@ async def contar_total(status: str = None) -> int:
     
 def contar_total() -> int:
     """Conta o total de chamados no banco de dados."""
-    with get_connection() as conn:
+    with get_connection_leitura() as conn:
         cursor = conn.cursor()
         cursor.execute(CONTAR_TOTAL)  # Usando constante
         resultado = cursor.fetchone()
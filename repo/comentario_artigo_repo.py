@@ -3,7 +3,8 @@ from typing import Optional, List
 from fastapi.logger import logger
 from model.comentario_model import ComentarioArtigo
 from sql.comentario_sql import *
-from util.db_util import get_connection
+from util.db_util import get_connection, get_connection_leitura, serializar_escrita
+from util.model_util import mapear_linha, mapear_linhas
 
 
 def criar_tabela() -> bool:
@@ -17,6 +18,7 @@ def criar_tabela() -> bool:
         return False
 
 
+@serializar_escrita
 def inserir(comentario: ComentarioArtigo) -> Optional[int]:
     with get_connection() as conn:
         cursor = conn.cursor()
@@ -27,6 +29,7 @@ def inserir(comentario: ComentarioArtigo) -> Optional[int]:
         return cursor.lastrowid
 
 
+@serializar_escrita
 def atualizar(comentario: ComentarioArtigo) -> bool:
     with get_connection() as conn:
         cursor = conn.cursor()
@@ -41,6 +44,7 @@ def atualizar(comentario: ComentarioArtigo) -> bool:
         return cursor.rowcount > 0
 
 
+@serializar_escrita
 def excluir(id_comentario: int) -> bool:
     with get_connection() as conn:
         cursor = conn.cursor()
@@ -49,35 +53,14 @@ def excluir(id_comentario: int) -> bool:
 
 
 def obter_pagina(limite: int, offset: int) -> List[ComentarioArtigo]:
-    with get_connection() as conn:
+    with get_connection_leitura() as conn:
         cursor = conn.cursor()
         cursor.execute(OBTER_PAGINA, (limite, offset))
-        rows = cursor.fetchall()
-        return [
-            ComentarioArtigo(
-                id_comentario_artigo=row["id_comentario"],
-                id_usuario=row["id_usuario"],
-                id_postagem_artigo=row["id_postagem_artigo"],
-                texto=row["texto"],
-                data_comentario=row["data_comentario"],
-                data_moderacao=row["data_moderacao"],
-            )
-            for row in rows
-        ]
+        return mapear_linhas(cursor, ComentarioArtigo, colunas={"id_comentario_artigo": "id_comentario"})
 
 
 def obter_por_id(id_comentario: int) -> Optional[ComentarioArtigo]:
-    with get_connection() as conn:
+    with get_connection_leitura() as conn:
         cursor = conn.cursor()
         cursor.execute(OBTER_POR_ID, (id_comentario,))
-        row = cursor.fetchone()
-        if row:
-            return ComentarioArtigo(
-                id_comentario_artigo=row["id_comentario"],
-                id_usuario=row["id_usuario"],
-                id_postagem_artigo=row["id_postagem_artigo"],
-                texto=row["texto"],
-                data_comentario=row["data_comentario"],
-                data_moderacao=row["data_moderacao"],
-            )
-        return None
+        return mapear_linha(cursor, ComentarioArtigo, colunas={"id_comentario_artigo": "id_comentario"})
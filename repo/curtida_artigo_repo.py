@@ -1,8 +1,18 @@
-from typing import Optional, List
+from typing import Optional, List, Dict
 from datetime import datetime
 from model.curtida_artigo_model import CurtidaArtigo
 from sql.curtida_artigo_sql import *
-from util.db_util import get_connection
+from util.db_util import get_connection, get_connection_leitura, serializar_escrita
+from util.model_util import converter_data_hora, mapear_linha, mapear_linhas
+from util.cache_util import invalida_cache
+
+
+def _converter_data_curtida(valor) -> Optional[datetime]:
+    """Data da curtida como datetime; texto em formato inesperado vira None."""
+    try:
+        return converter_data_hora(valor)
+    except (TypeError, ValueError):
+        return None
 
 
 def criar_tabela() -> bool:
@@ -10,12 +20,16 @@ def criar_tabela() -> bool:
         with get_connection() as conn:
             cursor = conn.cursor()
             cursor.execute(CRIAR_TABELA)
+            for trigger in CRIAR_TRIGGERS_TOTAL_CURTIDAS:
+                cursor.execute(trigger)
             return True
     except Exception as e:
         print(f"Erro ao criar tabela de curtidas de artigo: {e}")
         return False
 
 
+@invalida_cache("curtidas")
+@serializar_escrita
 def inserir(curtida: CurtidaArtigo) -> bool:
     try:
         with get_connection() as conn:
@@ -30,6 +44,8 @@ def inserir(curtida: CurtidaArtigo) -> bool:
         return False
 
 
+@invalida_cache("curtidas")
+@serializar_escrita
 def excluir(id_usuario: int, id_postagem_artigo: int) -> bool:
     try:
         with get_connection() as conn:
@@ -43,30 +59,10 @@ def excluir(id_usuario: int, id_postagem_artigo: int) -> bool:
 
 def obter_pagina(limite: int, offset: int) -> List[CurtidaArtigo]:
     try:
-        with get_connection() as conn:
+        with get_connection_leitura() as conn:
             cursor = conn.cursor()
             cursor.execute(OBTER_PAGINA, (limite, offset))
-            rows = cursor.fetchall()
-            curtidas = []
-            for row in rows:
-                # Converter string para datetime se necessário
-                data_curtida = row["data_curtida"]
-                if isinstance(data_curtida, str):
-                    # Tentar diferentes formatos
-                    for fmt in ["%Y-%m-%d %H:%M:%S.%f", "%Y-%m-%d %H:%M:%S", "%Y-%m-%d"]:
-                        try:
-                            data_curtida = datetime.strptime(data_curtida, fmt)
-                            break
-                        except ValueError:
-                            continue
-                curtidas.append(
-                    CurtidaArtigo(
-                        id_usuario=row["id_usuario"],
-                        id_postagem_artigo=row["id_postagem_artigo"],
-                        data_curtida=data_curtida if isinstance(data_curtida, datetime) else None,
-                    )
-                )
-            return curtidas
+            return mapear_linhas(cursor, CurtidaArtigo, conversores={"data_curtida": _converter_data_curtida})
     except Exception as e:
         print(f"Erro ao obter curtidas paginadas: {e}")
         return []
@@ -74,27 +70,10 @@ def obter_pagina(limite: int, offset: int) -> List[CurtidaArtigo]:
 
 def obter_por_id(id_usuario: int, id_postagem_artigo: int) -> Optional[CurtidaArtigo]:
     try:
-        with get_connection() as conn:
+        with get_connection_leitura() as conn:
             cursor = conn.cursor()
             cursor.execute(OBTER_POR_ID, (id_usuario, id_postagem_artigo))
-            row = cursor.fetchone()
-            if row:
-                # Converter string para datetime se necessário
-                data_curtida = row["data_curtida"]
-                if isinstance(data_curtida, str):
-                    # Tentar diferentes formatos
-                    for fmt in ["%Y-%m-%d %H:%M:%S.%f", "%Y-%m-%d %H:%M:%S", "%Y-%m-%d"]:
-                        try:
-                            data_curtida = datetime.strptime(data_curtida, fmt)
-                            break
-                        except ValueError:
-                            continue
-                return CurtidaArtigo(
-                    id_usuario=row["id_usuario"],
-                    id_postagem_artigo=row["id_postagem_artigo"],
-                    data_curtida=data_curtida if isinstance(data_curtida, datetime) else None,
-                )
-            return None
+            return mapear_linha(cursor, CurtidaArtigo, conversores={"data_curtida": _converter_data_curtida})
     except Exception as e:
         print(f"Erro ao obter curtida por ID: {e}")
         return None
@@ -111,7 +90,7 @@ def contar_curtidas_por_artigo(id_postagem_artigo: int) -> int:
         Total de curtidas do artigo
     """
     try:
-        with get_connection() as conn:
+        with get_connection_leitura() as conn:
             cursor = conn.cursor()
             cursor.execute(CONTAR_CURTIDAS_POR_ARTIGO, (id_postagem_artigo,))
             row = cursor.fetchone()
@@ -119,3 +98,30 @@ def contar_curtidas_por_artigo(id_postagem_artigo: int) -> int:
     except Exception as e:
         print(f"Erro ao contar curtidas do artigo: {e}")
         return 0
+
+
+def contar_curtidas_por_artigos(ids_postagem_artigo: List[int]) -> Dict[int, int]:
+    """
+    Conta as curtidas de vários artigos em uma única consulta
+
+    Args:
+        ids_postagem_artigo: IDs dos artigos
+
+    Returns:
+        Dicionário {id_postagem_artigo: total_curtidas}; artigos sem curtidas ficam com 0
+    """
+    ids = list(dict.fromkeys(ids_postagem_artigo))
+    totais = {id_postagem_artigo: 0 for id_postagem_artigo in ids}
+    if not ids:
+        return totais
+    try:
+        with get_connection_leitura() as conn:
+            cursor = conn.cursor()
+            placeholders = ", ".join("?" * len(ids))
+            cursor.execute(CONTAR_CURTIDAS_POR_ARTIGOS.format(placeholders=placeholders), ids)
+            for row in cursor.fetchall():
+                totais[row["id_postagem_artigo"]] = row["total_curtidas"]
+            return totais
+    except Exception as e:
+        print(f"Erro ao contar curtidas dos artigos: {e}")
+        return totais
@@ -1,7 +1,9 @@
-from typing import Optional, List
+from typing import Optional, List, Dict
 from model.curtida_feed_model import CurtidaFeed
 from sql.curtida_feed_sql import *
-from util.db_util import get_connection
+from util.db_util import get_connection, get_connection_leitura, serializar_escrita
+from util.model_util import mapear_linhas
+from util.cache_util import invalida_cache
 
 
 def criar_tabela() -> bool:
@@ -9,12 +11,16 @@ def criar_tabela() -> bool:
         with get_connection() as conn:
             cursor = conn.cursor()
             cursor.execute(CRIAR_TABELA)
+            for trigger in CRIAR_TRIGGERS_TOTAL_CURTIDAS:
+                cursor.execute(trigger)
             return True
     except Exception as e:
         print(f"Erro ao criar tabela de curtida_feed: {e}")
         return False
 
 
+@invalida_cache("curtidas")
+@serializar_escrita
 def inserir(curtida: CurtidaFeed) -> bool:
     with get_connection() as conn:
         cursor = conn.cursor()
@@ -22,6 +28,8 @@ def inserir(curtida: CurtidaFeed) -> bool:
         return cursor.rowcount > 0
 
 
+@invalida_cache("curtidas")
+@serializar_escrita
 def excluir(id_usuario: int, id_postagem_feed: int) -> bool:
     with get_connection() as conn:
         cursor = conn.cursor()
@@ -30,22 +38,14 @@ def excluir(id_usuario: int, id_postagem_feed: int) -> bool:
 
 
 def obter_pagina(limite: int, offset: int) -> List[CurtidaFeed]:
-    with get_connection() as conn:
+    with get_connection_leitura() as conn:
         cursor = conn.cursor()
         cursor.execute(OBTER_PAGINA, (limite, offset))
-        rows = cursor.fetchall()
-        return [
-            CurtidaFeed(
-                id_usuario=row["id_usuario"],
-                id_postagem_feed=row["id_postagem_feed"],
-                data_curtida=row["data_curtida"],
-            )
-            for row in rows
-        ]
+        return mapear_linhas(cursor, CurtidaFeed)
 
 
 def obter_por_id(id_usuario: int, id_postagem_feed: int) -> Optional[CurtidaFeed]:
-    with get_connection() as conn:
+    with get_connection_leitura() as conn:
         cursor = conn.cursor()
         cursor.execute(OBTER_POR_ID, (id_usuario, id_postagem_feed))
         row = cursor.fetchone()
@@ -60,8 +60,23 @@ def obter_por_id(id_usuario: int, id_postagem_feed: int) -> Optional[CurtidaFeed
 
 def contar_curtidas_por_postagem(id_postagem_feed: int) -> int:
     """Retorna o total de curtidas de uma postagem."""
-    with get_connection() as conn:
+    with get_connection_leitura() as conn:
         cursor = conn.cursor()
         cursor.execute(CONTAR_CURTIDAS_POR_POSTAGEM, (id_postagem_feed,))
         row = cursor.fetchone()
         return row["total"] if row else 0
+
+
+def contar_curtidas_por_postagens(ids_postagem_feed: List[int]) -> Dict[int, int]:
+    """Retorna {id_postagem_feed: total de curtidas} para várias postagens em uma consulta."""
+    ids = list(dict.fromkeys(ids_postagem_feed))
+    totais = {id_postagem_feed: 0 for id_postagem_feed in ids}
+    if not ids:
+        return totais
+    with get_connection_leitura() as conn:
+        cursor = conn.cursor()
+        placeholders = ", ".join("?" * len(ids))
+        cursor.execute(CONTAR_CURTIDAS_POR_POSTAGENS.format(placeholders=placeholders), ids)
+        for row in cursor.fetchall():
+            totais[row["id_postagem_feed"]] = row["total"]
+        return totais
@@ -2,7 +2,8 @@ from typing import Optional, List
 from model.denuncia_model import Denuncia
 from model.enums import DenunciaStatus
 from sql.denuncia_sql import *
-from util.db_util import get_connection
+from util.db_util import get_connection, get_connection_leitura, serializar_escrita
+from util.model_util import mapear_linha, mapear_linhas
 
 
 def criar_tabela() -> bool:
@@ -16,6 +17,7 @@ def criar_tabela() -> bool:
         return False
 
 
+@serializar_escrita
 def inserir(denuncia: Denuncia) -> Optional[int]:
     with get_connection() as conn:
         cursor = conn.cursor()
@@ -32,6 +34,7 @@ def inserir(denuncia: Denuncia) -> Optional[int]:
         return cursor.lastrowid
 
 
+@serializar_escrita
 def atualizar(denuncia: Denuncia) -> bool:
     with get_connection() as conn:
         cursor = conn.cursor()
@@ -49,6 +52,7 @@ def atualizar(denuncia: Denuncia) -> bool:
         return cursor.rowcount > 0
 
 
+@serializar_escrita
 def excluir(id_denuncia: int) -> bool:
     with get_connection() as conn:
         cursor = conn.cursor()
@@ -57,38 +61,14 @@ def excluir(id_denuncia: int) -> bool:
 
 
 def obter_pagina(limite: int, offset: int) -> List[Denuncia]:
-    with get_connection() as conn:
+    with get_connection_leitura() as conn:
         cursor = conn.cursor()
         cursor.execute(OBTER_PAGINA, (limite, offset))
-        rows = cursor.fetchall()
-
-        denuncias = []
-        for row in rows:
-            dados = {
-                "id_denuncia": row["id_denuncia"],
-                "id_usuario": row["id_usuario"],
-                "id_admin": row["id_admin"],
-                "motivo": row["motivo"],
-                "data_denuncia": row["data_denuncia"],
-                "status": DenunciaStatus(row["status"]),
-            }
-            denuncias.append(Denuncia(**dados))
-        return denuncias
+        return mapear_linhas(cursor, Denuncia, conversores={"status": DenunciaStatus})
 
 
 def obter_por_id(id_denuncia: int) -> Optional[Denuncia]:
-    with get_connection() as conn:
+    with get_connection_leitura() as conn:
         cursor = conn.cursor()
         cursor.execute(OBTER_POR_ID, (id_denuncia,))
-        row = cursor.fetchone()
-        if row is None:
-            return None  # <- evita erro
-        denuncia = Denuncia(
-            id_denuncia=row["id_denuncia"],
-            id_usuario=row["id_usuario"],
-            id_admin=row["id_admin"],
-            motivo=row["motivo"],
-            data_denuncia=row["data_denuncia"],
-            status=DenunciaStatus(row["status"]),
-        )
-        return denuncia
+        return mapear_linha(cursor, Denuncia, conversores={"status": DenunciaStatus})
@@ -0,0 +1,141 @@
+from typing import Callable, Optional, List, Tuple
+from model.midia_model import Midia
+from sql.midia_sql import *
+from util.db_util import get_connection, get_connection_leitura, serializar_escrita
+from util.model_util import mapear_linha, mapear_linhas
+from util.cache_util import invalida_cache
+
+
+def criar_tabela() -> bool:
+    try:
+        with get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(CRIAR_TABELA)
+            cursor.execute(CRIAR_INDICE_HASH)
+            cursor.execute(CRIAR_TABELA_ORFAOS)
+            return True
+    except Exception as e:
+        print(f"Erro ao criar tabela de mídia: {e}")
+        return False
+
+
+@invalida_cache("midia")
+@serializar_escrita
+def definir(midia: Midia) -> Optional[Midia]:
+    """
+    Associa o registro (usuário, postagem) ao blob informado.
+
+    O blob anterior, se ficar sem referências, é registrado como órfão (ver
+    `coletar_orfaos`); o novo deixa de ser órfão caso fosse.
+
+    Returns:
+        A mídia anterior do registro, se havia uma
+    """
+    with get_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute(OBTER, (midia.tipo, midia.id_registro))
+        row = cursor.fetchone()
+        cursor.execute(DEFINIR, (midia.tipo, midia.id_registro, midia.hash, midia.extensao))
+        cursor.execute(EXCLUIR_ORFAO, (midia.hash,))
+        if row and row["hash"] != midia.hash:
+            cursor.execute(REGISTRAR_ORFAO, (row["hash"], row["extensao"], row["hash"]))
+        return Midia(**row) if row else None
+
+
+@invalida_cache("midia")
+@serializar_escrita
+def excluir(tipo: str, id_registro: int) -> Optional[Midia]:
+    """
+    Remove a associação do registro, registrando o blob como órfão se ficar sem referências.
+
+    Returns:
+        A mídia removida, se havia uma
+    """
+    with get_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute(OBTER, (tipo, id_registro))
+        row = cursor.fetchone()
+        cursor.execute(EXCLUIR, (tipo, id_registro))
+        if row:
+            cursor.execute(REGISTRAR_ORFAO, (row["hash"], row["extensao"], row["hash"]))
+        return Midia(**row) if row else None
+
+
+def obter(tipo: str, id_registro: int) -> Optional[Midia]:
+    with get_connection_leitura() as conn:
+        cursor = conn.cursor()
+        cursor.execute(OBTER, (tipo, id_registro))
+        return mapear_linha(cursor, Midia)
+
+
+def obter_todos() -> List[Midia]:
+    with get_connection_leitura() as conn:
+        cursor = conn.cursor()
+        cursor.execute(OBTER_TODOS)
+        return mapear_linhas(cursor, Midia)
+
+
+def obter_ultima_alteracao() -> int:
+    """Sequência da alteração mais recente no registro de alterações (0 se vazio)."""
+    with get_connection_leitura() as conn:
+        cursor = conn.cursor()
+        cursor.execute(OBTER_ULTIMA_ALTERACAO)
+        return cursor.fetchone()["seq"]
+
+
+def obter_alteracoes(desde_seq: int) -> List[Tuple[int, str, int, Optional[str], Optional[str]]]:
+    """
+    Alterações posteriores a `desde_seq`, em ordem, com o estado atual do registro.
+
+    Returns:
+        Tuplas (seq, tipo, id_registro, hash, extensao); hash e extensão são
+        None quando a associação foi removida
+    """
+    with get_connection_leitura() as conn:
+        cursor = conn.cursor()
+        cursor.execute(OBTER_ALTERACOES, (desde_seq,))
+        return [tuple(row) for row in cursor.fetchall()]
+
+
+def contar_referencias(hash_midia: str) -> int:
+    """Quantos registros apontam para o blob (blobs sem referência podem ser apagados)."""
+    with get_connection_leitura() as conn:
+        cursor = conn.cursor()
+        cursor.execute(CONTAR_REFERENCIAS, (hash_midia,))
+        return cursor.fetchone()["total"]
+
+
+@serializar_escrita
+def coletar_orfaos(carencia_segundos: float, apagar: Callable[[str, str], None]) -> int:
+    """
+    Apaga os blobs órfãos há mais de `carencia_segundos` que continuam sem referências.
+
+    `apagar(hash, extensao)` remove os arquivos. Roda no escritor único, com o
+    lock de escrita do banco: nenhum `definir` (deste ou de outro processo)
+    confirma uma nova referência ao blob entre a verificação e a remoção.
+
+    Returns:
+        Quantidade de blobs apagados
+    """
+    with get_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute(OBTER_ORFAOS_EXPIRADOS, (f"-{int(carencia_segundos)} seconds",))
+        orfaos = cursor.fetchall()
+        for orfao in orfaos:
+            apagar(orfao["hash"], orfao["extensao"])
+            cursor.execute(EXCLUIR_ORFAO, (orfao["hash"],))
+        return len(orfaos)
+
+
+@serializar_escrita
+def limpar_alteracoes(retencao_segundos: float) -> int:
+    """
+    Remove do registro de alterações as entradas com mais de `retencao_segundos`.
+
+    Returns:
+        Quantidade de entradas removidas
+    """
+    with get_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute(EXCLUIR_ALTERACOES_ANTIGAS, (f"-{int(retencao_segundos)} seconds",))
+        return cursor.rowcount
@@ -1,8 +1,12 @@
-from datetime import datetime
-from typing import Optional, List
+from typing import Optional, List, Tuple
 from model.postagem_artigo_model import PostagemArtigo
 from sql.postagem_artigo_sql import *
-from util.db_util import get_connection
+from util.db_util import get_connection, get_connection_leitura, serializar_escrita
+from util.model_util import converter_data, mapear_linha, mapear_linhas
+from util.cache_util import invalida_cache
+from util.visualizacoes_buffer import criar_buffer
+from util.paginacao_util import PaginaCursor, decodificar_cursor, montar_pagina
+from util.busca_util import montar_consulta_fts, destacar_trecho, INICIO_DESTAQUE, FIM_DESTAQUE
 from routes.veterinario import postagem_artigo_routes
 
 def criar_tabela() -> bool:
@@ -10,12 +14,41 @@ def criar_tabela() -> bool:
         with get_connection() as conn:
             cursor = conn.cursor()
             cursor.execute(CRIAR_TABELA)
+            _garantir_coluna_total_curtidas(cursor)
+            _garantir_indice_fts(cursor)
             return True
     except Exception as e:
         print(f"Erro ao criar tabela de postagem_artigo: {e}")
         return False
 
 
+def _garantir_coluna_total_curtidas(cursor) -> None:
+    """Adiciona e preenche total_curtidas em bancos criados antes do contador."""
+    colunas = {row["name"] for row in cursor.execute("PRAGMA table_info(postagem_artigo)")}
+    if "total_curtidas" in colunas:
+        return
+    cursor.execute(ADICIONAR_COLUNA_TOTAL_CURTIDAS)
+    tabela_curtida = cursor.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'curtida_artigo'"
+    ).fetchone()
+    if tabela_curtida:
+        cursor.execute(RECALCULAR_TOTAL_CURTIDAS)
+
+
+def _garantir_indice_fts(cursor) -> None:
+    """Cria o índice FTS5 e seus triggers, indexando as postagens já existentes."""
+    indice_existente = cursor.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'postagem_artigo_fts'"
+    ).fetchone()
+    cursor.execute(CRIAR_TABELA_FTS)
+    for trigger in CRIAR_TRIGGERS_FTS:
+        cursor.execute(trigger)
+    if not indice_existente:
+        cursor.execute(RECONSTRUIR_FTS)
+
+
+@invalida_cache("artigos")
+@serializar_escrita
 def inserir(postagem: PostagemArtigo) -> Optional[int]:
     with get_connection() as conn:
         cursor = conn.cursor()
@@ -31,6 +64,8 @@ def inserir(postagem: PostagemArtigo) -> Optional[int]:
         return cursor.lastrowid
 
 
+@invalida_cache("artigos")
+@serializar_escrita
 def atualizar(postagem: PostagemArtigo) -> bool:
     with get_connection() as conn:
         cursor = conn.cursor()
@@ -46,6 +81,7 @@ def atualizar(postagem: PostagemArtigo) -> bool:
         return cursor.rowcount > 0
 
 
+@serializar_escrita
 def incrementar_visualizacoes(id_postagem_artigo: int) -> bool:
     with get_connection() as conn:
         cursor = conn.cursor()
@@ -53,6 +89,38 @@ def incrementar_visualizacoes(id_postagem_artigo: int) -> bool:
         return cursor.rowcount > 0
 
 
+@serializar_escrita
+def incrementar_visualizacoes_em_lote(incrementos: List[Tuple[int, int]]) -> int:
+    """
+    Aplica vários incrementos de visualizações em uma única transação.
+
+    Args:
+        incrementos: Lista de tuplas (quantidade, id_postagem_artigo)
+
+    Returns:
+        Quantidade de postagens atualizadas
+    """
+    with get_connection() as conn:
+        cursor = conn.cursor()
+        cursor.executemany(INCREMENTAR_VISUALIZACOES_EM_LOTE, incrementos)
+        return cursor.rowcount
+
+
+_buffer_visualizacoes = criar_buffer("postagem_artigo", incrementar_visualizacoes_em_lote)
+
+
+def registrar_visualizacao(id_postagem_artigo: int) -> None:
+    """Acumula uma visualização em memória; a gravação no banco é feita em lote."""
+    _buffer_visualizacoes.registrar(id_postagem_artigo)
+
+
+def obter_visualizacoes_pendentes(id_postagem_artigo: int) -> int:
+    """Retorna as visualizações registradas que ainda não foram gravadas."""
+    return _buffer_visualizacoes.pendentes(id_postagem_artigo)
+
+
+@invalida_cache("artigos")
+@serializar_escrita
 def excluir(id_postagem_artigo: int) -> bool:
     with get_connection() as conn:
         cursor = conn.cursor()
@@ -63,45 +131,22 @@ def excluir(id_postagem_artigo: int) -> bool:
 def obter_pagina(pagina: int, tamanho_pagina: int) -> List[PostagemArtigo]:
     limite = tamanho_pagina
     offset = (pagina - 1) * tamanho_pagina
-    with get_connection() as conn:
+    with get_connection_leitura() as conn:
         cursor = conn.cursor()
         cursor.execute(OBTER_PAGINA, (limite, offset))
-        rows = cursor.fetchall()
-        return [
-            PostagemArtigo(
-                id_postagem_artigo=row["id_postagem_artigo"],
-                id_veterinario=row["id_veterinario"],
-                titulo=row["titulo"],
-                conteudo=row["conteudo"],
-                id_categoria_artigo=row["id_categoria_artigo"],
-                data_publicacao=datetime.strptime(row["data_publicacao"], "%Y-%m-%d %H:%M:%S").date(),
-                visualizacoes=row["visualizacoes"],
-            )
-            for row in rows
-        ]
+        return mapear_linhas(cursor, PostagemArtigo, conversores={"data_publicacao": converter_data})
 
 
 def obter_por_id(id_postagem_artigo: int) -> Optional[PostagemArtigo]:
-    with get_connection() as conn:
+    with get_connection_leitura() as conn:
         cursor = conn.cursor()
         cursor.execute(OBTER_POR_ID, (id_postagem_artigo,))
-        row = cursor.fetchone()
-        if row:
-            return PostagemArtigo(
-                id_postagem_artigo=row["id_postagem_artigo"],
-                id_veterinario=row["id_veterinario"],
-                titulo=row["titulo"],
-                conteudo=row["conteudo"],
-                id_categoria_artigo=row["id_categoria_artigo"],
-                data_publicacao=datetime.strptime(row["data_publicacao"], "%Y-%m-%d %H:%M:%S").date(),
-                visualizacoes=row["visualizacoes"],
-            )
-        return None
+        return mapear_linha(cursor, PostagemArtigo, conversores={"data_publicacao": converter_data})
 
 
 def obter_recentes_com_dados(limite: int) -> List[dict]:
     """Retorna os artigos mais recentes com dados do veterinário e categoria."""
-    with get_connection() as conn:
+    with get_connection_leitura() as conn:
         cursor = conn.cursor()
         cursor.execute(OBTER_RECENTES_COM_DADOS, (limite,))
         rows = cursor.fetchall()
@@ -112,7 +157,7 @@ def obter_pagina_com_dados(pagina: int, tamanho_pagina: int) -> List[dict]:
     """Retorna uma página de artigos com dados do veterinário e categoria."""
     limite = tamanho_pagina
     offset = (pagina - 1) * tamanho_pagina
-    with get_connection() as conn:
+    with get_connection_leitura() as conn:
         cursor = conn.cursor()
         cursor.execute(OBTER_PAGINA_COM_DADOS, (limite, offset))
         rows = cursor.fetchall()
@@ -123,13 +168,83 @@ def obter_por_categoria_com_dados(id_categoria: int, pagina: int, tamanho_pagina
     """Retorna artigos de uma categoria específica com dados do veterinário e categoria."""
     limite = tamanho_pagina
     offset = (pagina - 1) * tamanho_pagina
-    with get_connection() as conn:
+    with get_connection_leitura() as conn:
         cursor = conn.cursor()
         cursor.execute(OBTER_POR_CATEGORIA_COM_DADOS, (id_categoria, limite, offset))
         rows = cursor.fetchall()
         return [dict(row) for row in rows]
 
 
+def montar_consulta_cursor(
+    tamanho_pagina: int,
+    apos: Optional[str] = None,
+    antes: Optional[str] = None,
+    id_categoria: Optional[int] = None,
+) -> Tuple[str, list, bool, bool]:
+    """
+    Monta a consulta da paginação por cursor (usada também por postagem_artigo_repo_async).
+
+    Returns:
+        (sql, parâmetros, voltando, primeira_pagina), no formato de montar_pagina
+    """
+    filtros: List[str] = []
+    parametros: list = []
+    if id_categoria is not None:
+        filtros.append(FILTRO_CATEGORIA)
+        parametros.append(id_categoria)
+
+    chave_apos = decodificar_cursor(apos)
+    chave_antes = None if chave_apos else decodificar_cursor(antes)
+    if chave_apos:
+        filtros.append(FILTRO_CURSOR_APOS)
+        parametros.extend(chave_apos)
+    elif chave_antes:
+        filtros.append(FILTRO_CURSOR_ANTES)
+        parametros.extend(chave_antes)
+    parametros.append(tamanho_pagina + 1)
+
+    sql = OBTER_PAGINA_CURSOR_COM_DADOS.format(
+        filtro=" AND ".join(filtros) or "1 = 1",
+        ordem="ASC" if chave_antes else "DESC",
+    )
+    return sql, parametros, chave_antes is not None, not (chave_apos or chave_antes)
+
+
+def montar_pagina_cursor(rows: List[dict], tamanho_pagina: int, voltando: bool, primeira_pagina: bool) -> PaginaCursor:
+    return montar_pagina(
+        rows, tamanho_pagina, "data_publicacao", "id_postagem_artigo",
+        voltando=voltando, primeira_pagina=primeira_pagina,
+    )
+
+
+def obter_pagina_cursor_com_dados(
+    tamanho_pagina: int,
+    apos: Optional[str] = None,
+    antes: Optional[str] = None,
+    id_categoria: Optional[int] = None,
+) -> PaginaCursor:
+    """
+    Retorna uma página de artigos usando paginação por cursor (keyset).
+
+    Args:
+        tamanho_pagina: Quantidade de artigos por página
+        apos: Cursor do último artigo exibido (avança para os mais antigos)
+        antes: Cursor do primeiro artigo exibido (volta para os mais recentes)
+        id_categoria: Restringe a listagem a uma categoria
+
+    Returns:
+        PaginaCursor com os artigos e os cursores de navegação
+    """
+    sql, parametros, voltando, primeira_pagina = montar_consulta_cursor(tamanho_pagina, apos, antes, id_categoria)
+    with get_connection_leitura() as conn:
+        cursor = conn.cursor()
+        cursor.execute(sql, parametros)
+        rows = [dict(row) for row in cursor.fetchall()]
+    return montar_pagina_cursor(rows, tamanho_pagina, voltando, primeira_pagina)
+
+
+@invalida_cache("artigos")
+@serializar_escrita
 def importar(postagem: PostagemArtigo) -> Optional[int]:
     with get_connection() as conn:
         cursor = conn.cursor()
@@ -147,9 +262,31 @@ def importar(postagem: PostagemArtigo) -> Optional[int]:
         return postagem.id_postagem_artigo
 
 
+@invalida_cache("artigos")
+@serializar_escrita
+def importar_lote(postagens: List[PostagemArtigo]) -> int:
+    """Insere várias postagens com executemany em uma única transação."""
+    with get_connection() as conn:
+        conn.executemany(
+            IMPORTAR,
+            [
+                (
+                    p.id_postagem_artigo,
+                    p.id_veterinario,
+                    p.titulo,
+                    p.conteudo,
+                    p.id_categoria_artigo,
+                    p.visualizacoes,
+                )
+                for p in postagens
+            ],
+        )
+        return len(postagens)
+
+
 def contar_total() -> int:
     """Retorna o total de artigos publicados."""
-    with get_connection() as conn:
+    with get_connection_leitura() as conn:
         cursor = conn.cursor()
         cursor.execute(CONTAR_TOTAL)
         row = cursor.fetchone()
@@ -158,7 +295,7 @@ def contar_total() -> int:
 
 def contar_por_categoria(id_categoria: int) -> int:
     """Retorna o total de artigos de uma categoria específica."""
-    with get_connection() as conn:
+    with get_connection_leitura() as conn:
         cursor = conn.cursor()
         cursor.execute(CONTAR_POR_CATEGORIA, (id_categoria,))
         row = cursor.fetchone()
@@ -167,7 +304,7 @@ def contar_por_categoria(id_categoria: int) -> int:
 
 def obter_por_veterinario(id_veterinario: int) -> list[PostagemArtigo]:
     """Retorna todos os artigos de um veterinário ordenados por data de publicação"""
-    with get_connection() as conn:
+    with get_connection_leitura() as conn:
         cursor = conn.cursor()
         cursor.execute("""
             SELECT pa.*, u.nome as nome_veterinario, v.numero_crmv
@@ -177,21 +314,10 @@ def obter_por_veterinario(id_veterinario: int) -> list[PostagemArtigo]:
             WHERE pa.id_veterinario = ?
             ORDER BY pa.data_publicacao DESC
         """, (id_veterinario,))
-        rows = cursor.fetchall()
-        return [PostagemArtigo(
-            id_postagem_artigo=row["id_postagem_artigo"],
-            id_veterinario=row["id_veterinario"],
-            titulo=row["titulo"],
-            conteudo=row["conteudo"],
-            id_categoria_artigo=row["id_categoria_artigo"],
-            data_publicacao=datetime.strptime(row["data_publicacao"], "%Y-%m-%d %H:%M:%S").date(),
-            visualizacoes=row["visualizacoes"]
-        ) for row in rows]
-    
-    
+        return mapear_linhas(cursor, PostagemArtigo, conversores={"data_publicacao": converter_data})
 # def buscar_por_termo(termo: str) -> list[PostagemArtigo]:
 #     """Busca artigos por título ou conteúdo"""
-#     with get_connection() as conn:
+#     with get_connection_leitura() as conn:
 #         cursor = conn.cursor()
 #         cursor.execute("""
 #             SELECT pa.*, v.nome as nome_veterinario, ca.nome as nome_categoria, ca.cor as cor_categoria
@@ -205,11 +331,46 @@ def obter_por_veterinario(id_veterinario: int) -> list[PostagemArtigo]:
 #         """, (f"%{termo}%", f"%{termo}%"))
 #         return [PostagemArtigo(**row) for row in cursor.fetchall()]
 
-def buscar_por_termo(termo: str, limite: int = 50) -> List[dict]:
-    """Busca artigos por termo no título ou conteúdo com dados completos."""
-    termo_busca = f"%{termo}%"
-    with get_connection() as conn:
+def buscar_por_termo(termo: str, limite: int = 50, id_veterinario: Optional[int] = None) -> List[dict]:
+    """
+    Busca artigos no índice de texto completo (título e conteúdo).
+
+    Os resultados vêm ordenados por relevância (bm25) e trazem em `trecho`
+    um fragmento do conteúdo com os termos encontrados destacados.
+    Palavras incompletas são buscadas como prefixo ("vacin" encontra "vacinação").
+
+    Args:
+        termo: Texto digitado pelo usuário
+        limite: Quantidade máxima de resultados
+        id_veterinario: Restringe a busca aos artigos desse veterinário
+    """
+    consulta = montar_consulta_fts(termo)
+    if not consulta:
+        return []
+    with get_connection_leitura() as conn:
         cursor = conn.cursor()
-        cursor.execute(BUSCAR_POR_TERMO, (termo_busca, termo_busca, limite))
+        cursor.execute(
+            BUSCAR_POR_TERMO,
+            (INICIO_DESTAQUE, FIM_DESTAQUE, consulta, id_veterinario, id_veterinario, limite),
+        )
         rows = cursor.fetchall()
-        return [dict(row) for row in rows]
\ No newline at end of file
+        resultados = []
+        for row in rows:
+            artigo = dict(row)
+            artigo["trecho"] = destacar_trecho(artigo["trecho"])
+            resultados.append(artigo)
+        return resultados
+
+
+@serializar_escrita
+def recalcular_total_curtidas() -> int:
+    """
+    Reconstrói total_curtidas de todas as postagens a partir de curtida_artigo.
+
+    Returns:
+        Quantidade de postagens atualizadas
+    """
+    with get_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute(RECALCULAR_TOTAL_CURTIDAS)
+        return cursor.rowcount
@@ -0,0 +1,58 @@
+"""
+Versão async das consultas de postagem_artigo_repo, sobre util.db_async.
+
+Mesmas assinaturas e retornos das funções síncronas, com as mesmas
+constantes de sql/postagem_artigo_sql.py. Só há consultas: as escritas
+(incluindo visualizações e exclusões) passam por repo/postagem_artigo_repo.py,
+que usa o escritor serializado e invalida o cache.
+"""
+
+from typing import List, Optional
+from sql.postagem_artigo_sql import *
+from util.db_async import obter_banco_async
+from util.paginacao_util import PaginaCursor
+from repo.postagem_artigo_repo import montar_consulta_cursor, montar_pagina_cursor
+
+
+async def obter_recentes_com_dados(limite: int) -> List[dict]:
+    """Retorna os artigos mais recentes com dados do veterinário e categoria."""
+    return await obter_banco_async().consultar(OBTER_RECENTES_COM_DADOS, (limite,))
+
+
+async def obter_pagina_com_dados(pagina: int, tamanho_pagina: int) -> List[dict]:
+    """Retorna uma página de artigos com dados do veterinário e categoria."""
+    limite = tamanho_pagina
+    offset = (pagina - 1) * tamanho_pagina
+    return await obter_banco_async().consultar(OBTER_PAGINA_COM_DADOS, (limite, offset))
+
+
+async def obter_por_categoria_com_dados(id_categoria: int, pagina: int, tamanho_pagina: int) -> List[dict]:
+    """Retorna artigos de uma categoria específica com dados do veterinário e categoria."""
+    limite = tamanho_pagina
+    offset = (pagina - 1) * tamanho_pagina
+    return await obter_banco_async().consultar(OBTER_POR_CATEGORIA_COM_DADOS, (id_categoria, limite, offset))
+
+
+async def obter_pagina_cursor_com_dados(
+    tamanho_pagina: int,
+    apos: Optional[str] = None,
+    antes: Optional[str] = None,
+    id_categoria: Optional[int] = None,
+) -> PaginaCursor:
+    """Retorna uma página de artigos usando paginação por cursor (keyset)."""
+    sql, parametros, voltando, primeira_pagina = montar_consulta_cursor(tamanho_pagina, apos, antes, id_categoria)
+    rows = await obter_banco_async().consultar(sql, parametros)
+    return montar_pagina_cursor(rows, tamanho_pagina, voltando, primeira_pagina)
+
+
+async def contar_total() -> int:
+    """Retorna o total de artigos publicados."""
+    row = await obter_banco_async().consultar_um(CONTAR_TOTAL)
+    return row["total"] if row else 0
+
+
+async def contar_por_categoria(id_categoria: int) -> int:
+    """Retorna o total de artigos de uma categoria específica."""
+    row = await obter_banco_async().consultar_um(CONTAR_POR_CATEGORIA, (id_categoria,))
+    return row["total"] if row else 0
+
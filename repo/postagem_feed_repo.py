@@ -1,30 +1,12 @@
-from datetime import datetime
-from typing import Optional, List
+from typing import Optional, List, Tuple
 from model.postagem_feed_model import PostagemFeed
 from sql.postagem_feed_sql import *
-from util.db_util import get_connection
-
-
-def _parse_datetime(data_string: str) -> datetime:
-    """
-    Parse de data/hora que aceita múltiplos formatos.
-
-    Tenta primeiro datetime completo, depois apenas data.
-    Se for apenas data, assume meia-noite (00:00:00).
-    """
-    data_string = data_string.strip()
-
-    # Tenta formato completo primeiro (YYYY-MM-DD HH:MM:SS)
-    try:
-        return datetime.strptime(data_string[:19], "%Y-%m-%d %H:%M:%S")
-    except ValueError:
-        pass
-
-    # Tenta formato apenas data (YYYY-MM-DD)
-    try:
-        return datetime.strptime(data_string[:10], "%Y-%m-%d")
-    except ValueError:
-        raise ValueError(f"Formato de data/hora inválido: {data_string}")
+from util.db_util import get_connection, get_connection_leitura, serializar_escrita
+from util.model_util import converter_data_hora, mapear_linha, mapear_linhas
+from util.cache_util import invalida_cache
+from util.visualizacoes_buffer import criar_buffer
+from util.paginacao_util import PaginaCursor, decodificar_cursor, montar_pagina
+from util.busca_util import montar_consulta_fts, destacar_trecho, INICIO_DESTAQUE, FIM_DESTAQUE
 
 
 def criar_tabela() -> bool:
@@ -32,12 +14,41 @@ def criar_tabela() -> bool:
         with get_connection() as conn:
             cursor = conn.cursor()
             cursor.execute(CRIAR_TABELA)
+            _garantir_coluna_total_curtidas(cursor)
+            _garantir_indice_fts(cursor)
             return True
     except Exception as e:
         print(f"Erro ao criar tabela de categorias: {e}")
         return False
 
 
+def _garantir_coluna_total_curtidas(cursor) -> None:
+    """Adiciona e preenche total_curtidas em bancos criados antes do contador."""
+    colunas = {row["name"] for row in cursor.execute("PRAGMA table_info(postagem_feed)")}
+    if "total_curtidas" in colunas:
+        return
+    cursor.execute(ADICIONAR_COLUNA_TOTAL_CURTIDAS)
+    tabela_curtida = cursor.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'curtida_feed'"
+    ).fetchone()
+    if tabela_curtida:
+        cursor.execute(RECALCULAR_TOTAL_CURTIDAS)
+
+
+def _garantir_indice_fts(cursor) -> None:
+    """Cria o índice FTS5 e seus triggers, indexando as postagens já existentes."""
+    indice_existente = cursor.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'postagem_feed_fts'"
+    ).fetchone()
+    cursor.execute(CRIAR_TABELA_FTS)
+    for trigger in CRIAR_TRIGGERS_FTS:
+        cursor.execute(trigger)
+    if not indice_existente:
+        cursor.execute(RECONSTRUIR_FTS)
+
+
+@invalida_cache("posts")
+@serializar_escrita
 def inserir(postagem: PostagemFeed) -> Optional[int]:
     with get_connection() as conn:
         cursor = conn.cursor()
@@ -45,6 +56,8 @@ def inserir(postagem: PostagemFeed) -> Optional[int]:
         return cursor.lastrowid
 
 
+@invalida_cache("posts")
+@serializar_escrita
 def atualizar(postagem: PostagemFeed) -> bool:
     with get_connection() as conn:
         cursor = conn.cursor()
@@ -52,6 +65,8 @@ def atualizar(postagem: PostagemFeed) -> bool:
         return cursor.rowcount > 0
 
 
+@invalida_cache("posts")
+@serializar_escrita
 def excluir(id_postagem_feed: int) -> bool:
     with get_connection() as conn:
         cursor = conn.cursor()
@@ -62,38 +77,21 @@ def excluir(id_postagem_feed: int) -> bool:
 def obter_pagina(pagina: int, tamanho_pagina: int) -> List[PostagemFeed]:
     limite = tamanho_pagina
     offset = (pagina - 1) * tamanho_pagina
-    with get_connection() as conn:
+    with get_connection_leitura() as conn:
         cursor = conn.cursor()
         cursor.execute(OBTER_PAGINA, (limite, offset))
-        rows = cursor.fetchall()
-        return [
-            PostagemFeed(
-                id_postagem_feed=row["id_postagem_feed"],
-                id_tutor=row["id_tutor"],
-                descricao=row["descricao"],
-                data_postagem=_parse_datetime(row["data_postagem"]),
-                visualizacoes=row["visualizacoes"],
-            )
-            for row in rows
-        ]
+        return mapear_linhas(cursor, PostagemFeed, conversores={"data_postagem": converter_data_hora})
 
 
 def obter_por_id(id_postagem_feed: int) -> Optional[PostagemFeed]:
-    with get_connection() as conn:
+    with get_connection_leitura() as conn:
         cursor = conn.cursor()
         cursor.execute(OBTER_POR_ID, (id_postagem_feed,))
-        row = cursor.fetchone()
-        if row:
-            return PostagemFeed(
-                id_postagem_feed=row["id_postagem_feed"],
-                id_tutor=row["id_tutor"],
-                descricao=row["descricao"],
-                data_postagem=_parse_datetime(row["data_postagem"]),
-                visualizacoes=row["visualizacoes"],
-            )
-        return None
+        return mapear_linha(cursor, PostagemFeed, conversores={"data_postagem": converter_data_hora})
 
 
+@invalida_cache("posts")
+@serializar_escrita
 def importar(postagem: PostagemFeed) -> Optional[int]:
     with get_connection() as conn:
         cursor = conn.cursor()
@@ -110,9 +108,24 @@ def importar(postagem: PostagemFeed) -> Optional[int]:
         return postagem.id_postagem_feed
 
 
+@invalida_cache("posts")
+@serializar_escrita
+def importar_lote(postagens: List[PostagemFeed]) -> int:
+    """Insere várias postagens com executemany em uma única transação."""
+    with get_connection() as conn:
+        conn.executemany(
+            IMPORTAR,
+            [
+                (p.id_postagem_feed, p.id_tutor, p.descricao, p.data_postagem, p.visualizacoes)
+                for p in postagens
+            ],
+        )
+        return len(postagens)
+
+
 def obter_recentes_com_dados(limite: int) -> List[dict]:
     """Retorna os posts mais recentes com dados do tutor."""
-    with get_connection() as conn:
+    with get_connection_leitura() as conn:
         cursor = conn.cursor()
         cursor.execute(OBTER_RECENTES_COM_DADOS, (limite,))
         rows = cursor.fetchall()
@@ -123,16 +136,76 @@ def obter_pagina_com_dados(pagina: int, tamanho_pagina: int) -> List[dict]:
     """Retorna uma página de posts com dados do tutor."""
     limite = tamanho_pagina
     offset = (pagina - 1) * tamanho_pagina
-    with get_connection() as conn:
+    with get_connection_leitura() as conn:
         cursor = conn.cursor()
         cursor.execute(OBTER_PAGINA_COM_DADOS, (limite, offset))
         rows = cursor.fetchall()
         return [dict(row) for row in rows]
 
 
+def montar_consulta_cursor(
+    tamanho_pagina: int,
+    apos: Optional[str] = None,
+    antes: Optional[str] = None,
+) -> Tuple[str, list, bool, bool]:
+    """
+    Monta a consulta da paginação por cursor (usada também por postagem_feed_repo_async).
+
+    Returns:
+        (sql, parâmetros, voltando, primeira_pagina), no formato de montar_pagina
+    """
+    filtro = "1 = 1"
+    parametros: list = []
+    chave_apos = decodificar_cursor(apos)
+    chave_antes = None if chave_apos else decodificar_cursor(antes)
+    if chave_apos:
+        filtro = FILTRO_CURSOR_APOS
+        parametros.extend(chave_apos)
+    elif chave_antes:
+        filtro = FILTRO_CURSOR_ANTES
+        parametros.extend(chave_antes)
+    parametros.append(tamanho_pagina + 1)
+
+    sql = OBTER_PAGINA_CURSOR_COM_DADOS.format(
+        filtro=filtro, ordem="ASC" if chave_antes else "DESC"
+    )
+    return sql, parametros, chave_antes is not None, not (chave_apos or chave_antes)
+
+
+def montar_pagina_cursor(rows: List[dict], tamanho_pagina: int, voltando: bool, primeira_pagina: bool) -> PaginaCursor:
+    return montar_pagina(
+        rows, tamanho_pagina, "data_postagem", "id_postagem_feed",
+        voltando=voltando, primeira_pagina=primeira_pagina,
+    )
+
+
+def obter_pagina_cursor_com_dados(
+    tamanho_pagina: int,
+    apos: Optional[str] = None,
+    antes: Optional[str] = None,
+) -> PaginaCursor:
+    """
+    Retorna uma página de posts usando paginação por cursor (keyset).
+
+    Args:
+        tamanho_pagina: Quantidade de posts por página
+        apos: Cursor do último post exibido (avança para os mais antigos)
+        antes: Cursor do primeiro post exibido (volta para os mais recentes)
+
+    Returns:
+        PaginaCursor com os posts e os cursores de navegação
+    """
+    sql, parametros, voltando, primeira_pagina = montar_consulta_cursor(tamanho_pagina, apos, antes)
+    with get_connection_leitura() as conn:
+        cursor = conn.cursor()
+        cursor.execute(sql, parametros)
+        rows = [dict(row) for row in cursor.fetchall()]
+    return montar_pagina_cursor(rows, tamanho_pagina, voltando, primeira_pagina)
+
+
 def contar_total() -> int:
     """Retorna o total de posts no feed."""
-    with get_connection() as conn:
+    with get_connection_leitura() as conn:
         cursor = conn.cursor()
         cursor.execute(CONTAR_TOTAL)
         row = cursor.fetchone()
@@ -141,7 +214,7 @@ def contar_total() -> int:
 
 def obter_por_id_com_dados(id_postagem_feed: int) -> Optional[dict]:
     """Retorna um post por ID com dados completos do tutor."""
-    with get_connection() as conn:
+    with get_connection_leitura() as conn:
         cursor = conn.cursor()
         cursor.execute(OBTER_POR_ID_COM_DADOS, (id_postagem_feed,))
         row = cursor.fetchone()
@@ -150,6 +223,7 @@ def obter_por_id_com_dados(id_postagem_feed: int) -> Optional[dict]:
         return None
 
 
+@serializar_escrita
 def incrementar_visualizacoes(id_postagem_feed: int) -> bool:
     """Incrementa o contador de visualizações de um post."""
     with get_connection() as conn:
@@ -158,9 +232,39 @@ def incrementar_visualizacoes(id_postagem_feed: int) -> bool:
         return cursor.rowcount > 0
 
 
+@serializar_escrita
+def incrementar_visualizacoes_em_lote(incrementos: List[Tuple[int, int]]) -> int:
+    """
+    Aplica vários incrementos de visualizações em uma única transação.
+
+    Args:
+        incrementos: Lista de tuplas (quantidade, id_postagem_feed)
+
+    Returns:
+        Quantidade de postagens atualizadas
+    """
+    with get_connection() as conn:
+        cursor = conn.cursor()
+        cursor.executemany(INCREMENTAR_VISUALIZACOES_EM_LOTE, incrementos)
+        return cursor.rowcount
+
+
+_buffer_visualizacoes = criar_buffer("postagem_feed", incrementar_visualizacoes_em_lote)
+
+
+def registrar_visualizacao(id_postagem_feed: int) -> None:
+    """Acumula uma visualização em memória; a gravação no banco é feita em lote."""
+    _buffer_visualizacoes.registrar(id_postagem_feed)
+
+
+def obter_visualizacoes_pendentes(id_postagem_feed: int) -> int:
+    """Retorna as visualizações registradas que ainda não foram gravadas."""
+    return _buffer_visualizacoes.pendentes(id_postagem_feed)
+
+
 def obter_por_tutor(id_tutor: int) -> list[PostagemFeed]:
     """Retorna todos os posts de um tutor"""
-    with get_connection() as conn:
+    with get_connection_leitura() as conn:
         cursor = conn.cursor()
         cursor.execute("""
             SELECT pf.*, t.nome as nome_tutor, t.quantidade_pets
@@ -170,12 +274,11 @@ def obter_por_tutor(id_tutor: int) -> list[PostagemFeed]:
             WHERE pf.id_tutor = ?
             ORDER BY pf.data_postagem DESC
         """, (id_tutor,))
-        rows = cursor.fetchall()
-        return [PostagemFeed(**row) for row in rows]
+        return mapear_linhas(cursor, PostagemFeed, conversores={"data_postagem": converter_data_hora})
     
 # def buscar_por_termo(termo: str) -> list[PostagemFeed]:
 #     """Busca posts por descrição"""
-#     with get_connection() as conn:
+#     with get_connection_leitura() as conn:
 #         cursor = conn.cursor()
 #         cursor.execute("""
 #             SELECT pf.*, t.nome as nome_tutor, t.quantidade_pets
@@ -189,11 +292,45 @@ def obter_por_tutor(id_tutor: int) -> list[PostagemFeed]:
 #         return [PostagemFeed(**row) for row in cursor.fetchall()]
 
 
-def buscar_por_termo(termo: str, limite: int = 50) -> List[dict]:
-    """Busca posts do feed por termo na descrição com dados completos."""
-    termo_busca = f"%{termo}%"
-    with get_connection() as conn:
+def buscar_por_termo(termo: str, limite: int = 50, id_tutor: Optional[int] = None) -> List[dict]:
+    """
+    Busca posts no índice de texto completo da descrição.
+
+    Os resultados vêm ordenados por relevância (bm25) e trazem em `trecho`
+    a descrição com os termos encontrados destacados.
+
+    Args:
+        termo: Texto digitado pelo usuário
+        limite: Quantidade máxima de resultados
+        id_tutor: Restringe a busca aos posts desse tutor
+    """
+    consulta = montar_consulta_fts(termo)
+    if not consulta:
+        return []
+    with get_connection_leitura() as conn:
         cursor = conn.cursor()
-        cursor.execute(BUSCAR_POR_TERMO, (termo_busca, limite))
+        cursor.execute(
+            BUSCAR_POR_TERMO,
+            (INICIO_DESTAQUE, FIM_DESTAQUE, consulta, id_tutor, id_tutor, limite),
+        )
         rows = cursor.fetchall()
-        return [dict(row) for row in rows]
\ No newline at end of file
+        resultados = []
+        for row in rows:
+            post = dict(row)
+            post["trecho"] = destacar_trecho(post["trecho"])
+            resultados.append(post)
+        return resultados
+
+
+@serializar_escrita
+def recalcular_total_curtidas() -> int:
+    """
+    Reconstrói total_curtidas de todas as postagens a partir de curtida_feed.
+
+    Returns:
+        Quantidade de postagens atualizadas
+    """
+    with get_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute(RECALCULAR_TOTAL_CURTIDAS)
+        return cursor.rowcount
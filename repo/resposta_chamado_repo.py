@@ -1,7 +1,8 @@
 from typing import Optional, List
 from model.resposta_chamado_model import RespostaChamado
 from sql.resposta_chamado_sql import *
-from util.db_util import get_connection
+from util.db_util import get_connection, get_connection_leitura, serializar_escrita
+from util.model_util import mapear_linha, mapear_linhas
 
 
 def criar_tabela() -> bool:
@@ -15,6 +16,7 @@ def criar_tabela() -> bool:
         return False
 
 
+@serializar_escrita
 def inserir(resposta: RespostaChamado) -> Optional[int]:
     with get_connection() as conn:
         cursor = conn.cursor()
@@ -25,6 +27,7 @@ def inserir(resposta: RespostaChamado) -> Optional[int]:
         return cursor.lastrowid
 
 
+@serializar_escrita
 def atualizar(resposta: RespostaChamado) -> bool:
     try:
         with get_connection() as conn:
@@ -45,6 +48,7 @@ def atualizar(resposta: RespostaChamado) -> bool:
         return False
 
 
+@serializar_escrita
 def excluir(id_resposta: int) -> bool:
     try:
         with get_connection() as conn:
@@ -57,50 +61,21 @@ def excluir(id_resposta: int) -> bool:
 
 
 def obter_pagina(limite: int, offset: int) -> List[RespostaChamado]:
-    with get_connection() as conn:
+    with get_connection_leitura() as conn:
         cursor = conn.cursor()
         cursor.execute(OBTER_PAGINA, (limite, offset))
-        rows = cursor.fetchall()
-        return [
-            RespostaChamado(
-                id_resposta_chamado=row["id_resposta_chamado"],
-                id_chamado=row["id_chamado"],
-                titulo=row["titulo"],
-                descricao=row["descricao"],
-                data=row["data"],
-            )
-            for row in rows
-        ]
+        return mapear_linhas(cursor, RespostaChamado)
 
 
 def obter_por_id(id_resposta: int) -> Optional[RespostaChamado]:
-    with get_connection() as conn:
+    with get_connection_leitura() as conn:
         cursor = conn.cursor()
         cursor.execute(OBTER_POR_ID, (id_resposta,))
-        row = cursor.fetchone()
-        if row:
-            return RespostaChamado(
-                id_resposta_chamado=row["id_resposta_chamado"],
-                id_chamado=row["id_chamado"],
-                titulo=row["titulo"],
-                descricao=row["descricao"],
-                data=row["data"],
-            )
-        return None
+        return mapear_linha(cursor, RespostaChamado)
 
 def obter_por_chamado(id_chamado: int) -> List[RespostaChamado]:
     """Obtém todas as respostas de um chamado específico."""
-    with get_connection() as conn:
+    with get_connection_leitura() as conn:
         cursor = conn.cursor()
         cursor.execute(OBTER_POR_CHAMADO, (id_chamado,))
-        rows = cursor.fetchall()
-        return [
-            RespostaChamado(
-                id_resposta_chamado=row["id_resposta_chamado"],
-                id_chamado=row["id_chamado"],
-                titulo=row["titulo"],
-                descricao=row["descricao"],
-                data=row["data"],
-            )
-            for row in rows
-        ]
+        return mapear_linhas(cursor, RespostaChamado)
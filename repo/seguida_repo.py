@@ -1,8 +1,13 @@
-from datetime import datetime
 from typing import Optional, List
 from model.seguida_model import Seguida
 from sql.seguida_sql import *
-from util.db_util import get_connection
+from util.db_util import get_connection, get_connection_leitura, serializar_escrita
+from util.model_util import converter_data, mapear_linha, mapear_linhas
+
+_MAPEAMENTO_SEGUIDA = dict(
+    colunas={"id_seguidor": "id_veterinario", "id_seguido": "id_tutor"},
+    conversores={"data_inicio": converter_data},
+)
 
 
 def criar_tabela() -> bool:
@@ -16,6 +21,7 @@ def criar_tabela() -> bool:
         return False
 
 
+@serializar_escrita
 def inserir(seguida: Seguida) -> bool:
     try:
         with get_connection() as conn:
@@ -27,6 +33,7 @@ def inserir(seguida: Seguida) -> bool:
         return False
 
 
+@serializar_escrita
 def excluir(id_veterinario: int, id_tutor: int) -> bool:
     try:
         with get_connection() as conn:
@@ -42,20 +49,10 @@ def obter_pagina(pagina: int, tamanho_pagina: int) -> List[Seguida]:
     limite = tamanho_pagina
     offset = (pagina - 1) * tamanho_pagina
     try:
-        with get_connection() as conn:
+        with get_connection_leitura() as conn:
             cursor = conn.cursor()
             cursor.execute(OBTER_PAGINA, (limite, offset))
-            rows = cursor.fetchall()
-            return [
-                Seguida(
-                    id_seguidor=row["id_veterinario"],
-                    id_seguido=row["id_tutor"],
-                    data_inicio=datetime.strptime(
-                        row["data_inicio"][:10], "%Y-%m-%d"
-                    ).date(),
-                )
-                for row in rows
-            ]
+            return mapear_linhas(cursor, Seguida, **_MAPEAMENTO_SEGUIDA)
     except Exception as e:
         print(f"Erro ao obter seguidas paginado: {e}")
         return []
@@ -63,19 +60,10 @@ def obter_pagina(pagina: int, tamanho_pagina: int) -> List[Seguida]:
 
 def obter_por_id(id_veterinario: int, id_tutor: int) -> Optional[Seguida]:
     try:
-        with get_connection() as conn:
+        with get_connection_leitura() as conn:
             cursor = conn.cursor()
             cursor.execute(OBTER_POR_ID, (id_veterinario, id_tutor))
-            row = cursor.fetchone()
-            if row:
-                return Seguida(
-                    id_seguidor=row["id_veterinario"],
-                    id_seguido=row["id_tutor"],
-                    data_inicio=datetime.strptime(
-                        row["data_inicio"][:10], "%Y-%m-%d"
-                    ).date(),
-                )
-            return None
+            return mapear_linha(cursor, Seguida, **_MAPEAMENTO_SEGUIDA)
     except Exception as e:
         print(f"Erro ao obter seguida por ID: {e}")
         return None
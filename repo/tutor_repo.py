@@ -1,8 +1,23 @@
-from typing import Optional
+from typing import List, Optional
 from model.tutor_model import Tutor
 import sql.tutor_sql as tutor_sql
 import sql.usuario_sql as usuario_sql
-from util.db_util import get_connection
+from util.cache_util import invalida_cache
+from util.db_util import get_connection, get_connection_leitura, serializar_escrita
+from util.model_util import mapear_linha, mapear_linhas
+
+# A senha não é exposta; as listagens não trazem as colunas de token/cadastro
+_MAPEAMENTO_TUTOR = dict(
+    colunas={"id_usuario": "id_tutor"},
+    valores={"senha": ""},
+    padroes={
+        "perfil": "tutor",
+        "quantidade_pets": 0,
+        "token_redefinicao": None,
+        "data_token": None,
+        "data_cadastro": None,
+    },
+)
 
 
 def criar_tabela() -> bool:
@@ -16,6 +31,8 @@ def criar_tabela() -> bool:
         return False
 
 
+@invalida_cache("usuarios")
+@serializar_escrita
 def inserir(tutor: Tutor) -> Optional[int]:
     """Insere tutor e usuário em uma única transação atômica."""
     with get_connection() as conn:
@@ -34,6 +51,8 @@ def inserir(tutor: Tutor) -> Optional[int]:
         return id_tutor
 
 
+@invalida_cache("usuarios")
+@serializar_escrita
 def atualizar(tutor: Tutor) -> bool:
     """Atualiza tutor e usuário em uma única transação atômica."""
     with get_connection() as conn:
@@ -54,6 +73,8 @@ def atualizar(tutor: Tutor) -> bool:
         return cursor.rowcount > 0
 
 
+@invalida_cache("usuarios")
+@serializar_escrita
 def excluir(id_tutor: int) -> bool:
     try:
         with get_connection() as conn:
@@ -77,28 +98,10 @@ def excluir(id_tutor: int) -> bool:
 
 def obter_pagina(limite: int, offset: int) -> list[Tutor]:
     try:
-        with get_connection() as conn:
+        with get_connection_leitura() as conn:
             cursor = conn.cursor()
             cursor.execute(tutor_sql.OBTER_PAGINA, (limite, offset))
-            rows = cursor.fetchall()
-            tutores = []
-            for row in rows:
-                tutor = Tutor(
-                    id_usuario=row["id_tutor"],
-                    nome=row["nome"],
-                    email=row["email"],
-                    senha="",  # Não expor senha
-                    telefone=row["telefone"],
-                    perfil=row["perfil"] if "perfil" in row.keys() else "tutor",
-                    token_redefinicao=(row["token_redefinicao"] if "token_redefinicao" in row.keys() else None),
-                    data_token=(row["data_token"] if "data_token" in row.keys() else None),
-                    data_cadastro=(row["data_cadastro"] if "data_cadastro" in row.keys() else None),
-                    quantidade_pets=(row["quantidade_pets"] if "quantidade_pets" in row.keys() else 0),
-                    descricao_pets=(row["descricao_pets"] if "descricao_pets" in row.keys() else None),
-                )
-                tutores.append(tutor)
-
-            return tutores
+            return mapear_linhas(cursor, Tutor, **_MAPEAMENTO_TUTOR)
     except Exception as e:
         print(f"Erro ao obter tutores paginado: {e}")
         return []
@@ -106,31 +109,17 @@ def obter_pagina(limite: int, offset: int) -> list[Tutor]:
 
 def obter_por_id(id_tutor: int) -> Optional[Tutor]:
     try:
-        with get_connection() as conn:
+        with get_connection_leitura() as conn:
             cursor = conn.cursor()
             cursor.execute(tutor_sql.OBTER_POR_ID, (id_tutor,))
-            row = cursor.fetchone()
-            if row is None:
-                return None
-            tutor = Tutor(
-                id_usuario=row["id_tutor"],
-                nome=row["nome"],
-                email=row["email"],
-                senha="",  # Não expor senha
-                telefone=row["telefone"],
-                perfil=row["perfil"],                
-                data_cadastro=row["data_cadastro"],
-                data_token=row["data_token"],
-                token_redefinicao=row["token_redefinicao"],
-                quantidade_pets=row["quantidade_pets"],
-                descricao_pets=row["descricao_pets"],
-            )
-            return tutor
+            return mapear_linha(cursor, Tutor, **_MAPEAMENTO_TUTOR)
     except Exception as e:
         print(f"Erro ao obter tutor por ID: {e}")
         return None
 
 
+@invalida_cache("usuarios")
+@serializar_escrita
 def importar(tutor: Tutor) -> Optional[int]:
     with get_connection() as conn:
         cursor = conn.cursor()
@@ -144,4 +133,20 @@ def importar(tutor: Tutor) -> Optional[int]:
         # Inserir tutor
         cursor.execute(tutor_sql.INSERIR, (tutor.id_usuario, tutor.quantidade_pets, tutor.descricao_pets))
 
-        return tutor.id_usuario
\ No newline at end of file
+        return tutor.id_usuario
+
+
+@invalida_cache("usuarios")
+@serializar_escrita
+def importar_lote(tutores: List[Tutor]) -> int:
+    """Insere vários tutores (usuário + tutor) com executemany em uma única transação."""
+    with get_connection() as conn:
+        conn.executemany(
+            usuario_sql.IMPORTAR,
+            [(t.id_usuario, t.nome, t.email, t.senha, t.telefone, t.perfil) for t in tutores],
+        )
+        conn.executemany(
+            tutor_sql.INSERIR,
+            [(t.id_usuario, t.quantidade_pets, t.descricao_pets) for t in tutores],
+        )
+        return len(tutores)
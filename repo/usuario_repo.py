@@ -1,7 +1,9 @@
 from typing import Optional
 from model.usuario_model import Usuario
 from sql.usuario_sql import *
-from util.db_util import get_connection
+from util.cache_util import invalida_cache
+from util.db_util import get_connection, get_connection_leitura, serializar_escrita
+from util.model_util import mapear_linha, mapear_linhas
 
 
 def criar_tabela() -> bool:
@@ -15,6 +17,8 @@ def criar_tabela() -> bool:
         return False
 
 
+@invalida_cache("usuarios")
+@serializar_escrita
 def inserir(usuario: Usuario) -> Optional[int]:
     with get_connection() as conn:
         cursor = conn.cursor()
@@ -31,6 +35,8 @@ def inserir(usuario: Usuario) -> Optional[int]:
         return cursor.lastrowid
 
 
+@invalida_cache("usuarios")
+@serializar_escrita
 def atualizar(usuario: Usuario) -> bool:
     with get_connection() as conn:
         cursor = conn.cursor()
@@ -41,6 +47,7 @@ def atualizar(usuario: Usuario) -> bool:
         return cursor.rowcount > 0
 
 
+@serializar_escrita
 def atualizar_senha(id_usuario: int, senha: str) -> bool:
     with get_connection() as conn:
         cursor = conn.cursor()
@@ -48,6 +55,8 @@ def atualizar_senha(id_usuario: int, senha: str) -> bool:
         return cursor.rowcount > 0
 
 
+@invalida_cache("usuarios")
+@serializar_escrita
 def excluir(id_usuario: int) -> bool:
     with get_connection() as conn:
         cursor = conn.cursor()
@@ -56,68 +65,27 @@ def excluir(id_usuario: int) -> bool:
 
 
 def obter_pagina(limite: int, offset: int) -> list[Usuario]:
-    with get_connection() as conn:
+    with get_connection_leitura() as conn:
         cursor = conn.cursor()
         cursor.execute(OBTER_PAGINA, (limite, offset))
-        rows = cursor.fetchall()
-        usuarios = [
-            Usuario(
-                id_usuario=row["id_usuario"],
-                nome=row["nome"],
-                email=row["email"],
-                senha=row["senha"],
-                telefone=row["telefone"],
-                perfil=row["perfil"],
-                token_redefinicao=row["token_redefinicao"],
-                data_token=row["data_token"],
-                data_cadastro=row["data_cadastro"],
-            )
-            for row in rows
-        ]
-        return usuarios
+        return mapear_linhas(cursor, Usuario)
 
 
 def obter_por_id(id_usuario: int) -> Optional[Usuario]:
-    with get_connection() as conn:
+    with get_connection_leitura() as conn:
         cursor = conn.cursor()
         cursor.execute(OBTER_POR_ID, (id_usuario,))
-        row = cursor.fetchone()
-        if row is None:
-            return None
-        return Usuario(
-            id_usuario=row["id_usuario"],
-            nome=row["nome"],
-            email=row["email"],
-            senha=row["senha"],
-            telefone=row["telefone"],
-            perfil=row["perfil"],
-            token_redefinicao=row["token_redefinicao"],
-            data_token=row["data_token"],
-            data_cadastro=row["data_cadastro"],
-        )
+        return mapear_linha(cursor, Usuario)
 
 
 def obter_por_email(email: str) -> Optional[Usuario]:
-    with get_connection() as conn:
+    with get_connection_leitura() as conn:
         cursor = conn.cursor()
         cursor.execute(OBTER_POR_EMAIL, (email,))
-        row = cursor.fetchone()
-        if row:
-            usuario = Usuario(
-                id_usuario=row["id_usuario"],
-                nome=row["nome"],
-                email=row["email"],
-                senha=row["senha"],
-                telefone=row["telefone"],
-                perfil=row["perfil"],
-                token_redefinicao=row["token_redefinicao"],
-                data_token=row["data_token"],
-                data_cadastro=row["data_cadastro"],
-            )
-            return usuario
-        return None
+        return mapear_linha(cursor, Usuario)
 
 
+@serializar_escrita
 def atualizar_token(email: str, token: str, data_expiracao: str) -> bool:
     with get_connection() as conn:
         cursor = conn.cursor()
@@ -126,26 +94,13 @@ def atualizar_token(email: str, token: str, data_expiracao: str) -> bool:
 
 
 def obter_por_token(token: str) -> Optional[Usuario]:
-    with get_connection() as conn:
+    with get_connection_leitura() as conn:
         cursor = conn.cursor()
         cursor.execute(OBTER_POR_TOKEN, (token,))
-        row = cursor.fetchone()
-        if row:
-            usuario = Usuario(
-                id_usuario=row["id_usuario"],
-                nome=row["nome"],
-                email=row["email"],
-                senha=row["senha"],
-                telefone=row["telefone"],
-                perfil=row["perfil"],
-                token_redefinicao=row["token_redefinicao"],
-                data_token=row["data_token"],
-                data_cadastro=(row["data_cadastro"] if "data_cadastro" in row.keys() else None),
-            )
-            return usuario
-        return None
+        return mapear_linha(cursor, Usuario)
 
 
+@serializar_escrita
 def limpar_token(id_usuario: int) -> bool:
     with get_connection() as conn:
         cursor = conn.cursor()
@@ -154,27 +109,14 @@ def limpar_token(id_usuario: int) -> bool:
 
 
 def obter_todos_por_perfil(perfil: str) -> list[Usuario]:
-    with get_connection() as conn:
+    with get_connection_leitura() as conn:
         cursor = conn.cursor()
         cursor.execute(OBTER_POR_PERFIL, (perfil,))
-        rows = cursor.fetchall()
-        usuarios = []
-        for row in rows:
-            usuario = Usuario(
-                id_usuario=row["id_usuario"],
-                nome=row["nome"],
-                email=row["email"],
-                senha=row["senha"],
-                telefone=row["telefone"],
-                perfil=row["perfil"],
-                token_redefinicao=row["token_redefinicao"],
-                data_token=row["data_token"],
-                data_cadastro=row["data_cadastro"],
-            )
-            usuarios.append(usuario)
-        return usuarios
+        return mapear_linhas(cursor, Usuario)
 
 
+@invalida_cache("usuarios")
+@serializar_escrita
 def importar(usuario: Usuario) -> bool:
     with get_connection() as conn:
         cursor = conn.cursor()
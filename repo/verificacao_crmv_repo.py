@@ -2,7 +2,8 @@ from typing import Optional, List
 from model.verificacao_crmv_model import VerificacaoCRMV
 from model.enums import VerificacaoStatus
 from sql.verificacao_crmv_sql import *
-from util.db_util import get_connection
+from util.db_util import get_connection, get_connection_leitura, serializar_escrita
+from util.model_util import mapear_linha, mapear_linhas
 
 
 def criar_tabela() -> bool:
@@ -16,6 +17,7 @@ def criar_tabela() -> bool:
         return False
 
 
+@serializar_escrita
 def inserir(verificacao: VerificacaoCRMV) -> Optional[int]:
     with get_connection() as conn:
         cursor = conn.cursor()
@@ -30,6 +32,7 @@ def inserir(verificacao: VerificacaoCRMV) -> Optional[int]:
         return cursor.lastrowid
 
 
+@serializar_escrita
 def atualizar(id_veterinario: int, novo_status: VerificacaoStatus, id_administrador: int) -> bool:
     with get_connection() as conn:
         cursor = conn.cursor()
@@ -37,6 +40,7 @@ def atualizar(id_veterinario: int, novo_status: VerificacaoStatus, id_administra
         return cursor.rowcount > 0
 
 
+@serializar_escrita
 def excluir(id_veterinario: int) -> bool:
     with get_connection() as conn:
         cursor = conn.cursor()
@@ -45,39 +49,20 @@ def excluir(id_veterinario: int) -> bool:
 
 
 def obter_pagina(limite: int, offset: int) -> List[VerificacaoCRMV]:
-    with get_connection() as conn:
+    with get_connection_leitura() as conn:
         cursor = conn.cursor()
         cursor.execute(
             "SELECT * FROM verificacao_crmv ORDER BY id_verificacao_crmv LIMIT ? OFFSET ?",
             (limite, offset),
         )
-        rows = cursor.fetchall()
-        return [
-            VerificacaoCRMV(
-                id_verificacao_crmv=row["id_verificacao_crmv"],
-                id_veterinario=row["id_veterinario"],
-                id_administrador=row["id_administrador"],
-                data_verificacao=row["data_verificacao"],
-                status_verificacao=VerificacaoStatus(row["status_verificacao"]),
-            )
-            for row in rows
-        ]
+        return mapear_linhas(cursor, VerificacaoCRMV, conversores={"status_verificacao": VerificacaoStatus})
 
 
 def obter_por_id(id_verificacao_crmv: int) -> Optional[VerificacaoCRMV]:
-    with get_connection() as conn:
+    with get_connection_leitura() as conn:
         cursor = conn.cursor()
         cursor.execute(
             "SELECT * FROM verificacao_crmv WHERE id_verificacao_crmv = ?",
             (id_verificacao_crmv,),
         )
-        row = cursor.fetchone()
-        if row:
-            return VerificacaoCRMV(
-                id_verificacao_crmv=row["id_verificacao_crmv"],
-                id_veterinario=row["id_veterinario"],
-                id_administrador=row["id_administrador"],
-                data_verificacao=row["data_verificacao"],
-                status_verificacao=VerificacaoStatus(row["status_verificacao"]),
-            )
-        return None
+        return mapear_linha(cursor, VerificacaoCRMV, conversores={"status_verificacao": VerificacaoStatus})
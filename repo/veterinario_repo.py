@@ -1,8 +1,22 @@
-from typing import Optional
+from typing import List, Optional
 from sql import veterinario_sql, usuario_sql
 from model.veterinario_model import Veterinario
 from sql.veterinario_sql import *
-from util.db_util import get_connection
+from util.cache_util import invalida_cache
+from util.db_util import get_connection, get_connection_leitura, serializar_escrita
+from util.model_util import mapear_linha, mapear_linhas
+
+# A senha não é exposta; as listagens não trazem as colunas de token/cadastro
+_MAPEAMENTO_VETERINARIO = dict(
+    colunas={"id_usuario": "id_veterinario"},
+    valores={"senha": ""},
+    padroes={
+        "perfil": "veterinario",
+        "token_redefinicao": None,
+        "data_token": None,
+        "data_cadastro": None,
+    },
+)
 
 
 def criar_tabela() -> bool:
@@ -16,6 +30,8 @@ def criar_tabela() -> bool:
         return False
 
 
+@invalida_cache("usuarios")
+@serializar_escrita
 def inserir(vet: Veterinario) -> Optional[int]:
     """Insere veterinário e usuário em uma única transação atômica."""
     with get_connection() as conn:
@@ -34,6 +50,8 @@ def inserir(vet: Veterinario) -> Optional[int]:
         return id_veterinario
 
 
+@invalida_cache("usuarios")
+@serializar_escrita
 def atualizar(vet: Veterinario) -> bool:
     """Atualiza veterinário e usuário em uma única transação atômica."""
     with get_connection() as conn:
@@ -48,6 +66,8 @@ def atualizar(vet: Veterinario) -> bool:
         return cursor.rowcount > 0
 
 
+@invalida_cache("usuarios")
+@serializar_escrita
 def atualizar_verificacao(id_veterinario: int, verificado: bool) -> bool:
     with get_connection() as conn:
         cursor = conn.cursor()
@@ -55,6 +75,8 @@ def atualizar_verificacao(id_veterinario: int, verificado: bool) -> bool:
         return cursor.rowcount > 0
 
 
+@invalida_cache("usuarios")
+@serializar_escrita
 def excluir(id: int) -> bool:
     """Exclui veterinário e usuário em uma única transação atômica."""
     with get_connection() as conn:
@@ -72,54 +94,21 @@ def excluir(id: int) -> bool:
 
 
 def obter_pagina(limite: int, offset: int) -> list[Veterinario]:
-    with get_connection() as conn:
+    with get_connection_leitura() as conn:
         cursor = conn.cursor()
         cursor.execute(OBTER_PAGINA, (limite, offset))
-        rows = cursor.fetchall()
-        veterinarios = [
-            Veterinario(
-                id_usuario=row["id_veterinario"],
-                nome=row["nome"],
-                email=row["email"],
-                senha="",
-                telefone=row["telefone"],
-                perfil=row["perfil"] if "perfil" in row.keys() else "veterinario",
-                token_redefinicao=(row["token_redefinicao"] if "token_redefinicao" in row.keys() else None),
-                data_token=row["data_token"] if "data_token" in row.keys() else None,
-                data_cadastro=(row["data_cadastro"] if "data_cadastro" in row.keys() else None),
-                crmv=row["crmv"],
-                verificado=row["verificado"],
-                bio=row["bio"],
-            )
-            for row in rows
-        ]
-        return veterinarios
+        return mapear_linhas(cursor, Veterinario, **_MAPEAMENTO_VETERINARIO)
 
 
 def obter_por_id(id_veterinario: int) -> Optional[Veterinario]:
-    with get_connection() as conn:
+    with get_connection_leitura() as conn:
         cursor = conn.cursor()
         cursor.execute(OBTER_POR_ID, (id_veterinario,))
-        row = cursor.fetchone()
-        if row is None:
-            return None
-        veterinario = Veterinario(
-            id_usuario=row["id_veterinario"],
-            nome=row["nome"],
-            email=row["email"],
-            senha="",  # Não expor senha
-            telefone=row["telefone"],
-            perfil=row["perfil"],
-            data_cadastro=row["data_cadastro"],
-            data_token=row["data_token"],
-            token_redefinicao=row["token_redefinicao"],
-            crmv=row["crmv"],
-            verificado=row["verificado"],
-            bio=row["bio"],
-        )
-        return veterinario
+        return mapear_linha(cursor, Veterinario, **_MAPEAMENTO_VETERINARIO)
 
 
+@invalida_cache("usuarios")
+@serializar_escrita
 def importar(vet: Veterinario) -> Optional[int]:
     """Insere veterinário e usuário em uma única transação atômica."""
     with get_connection() as conn:
@@ -134,4 +123,20 @@ def importar(vet: Veterinario) -> Optional[int]:
         # Inserir veterinário
         cursor.execute(veterinario_sql.IMPORTAR, (vet.id_usuario, vet.crmv, vet.verificado, vet.bio))
 
-        return vet.id_usuario
\ No newline at end of file
+        return vet.id_usuario
+
+
+@invalida_cache("usuarios")
+@serializar_escrita
+def importar_lote(vets: List[Veterinario]) -> int:
+    """Insere vários veterinários (usuário + veterinário) com executemany em uma única transação."""
+    with get_connection() as conn:
+        conn.executemany(
+            usuario_sql.IMPORTAR,
+            [(v.id_usuario, v.nome, v.email, v.senha, v.telefone, v.perfil) for v in vets],
+        )
+        conn.executemany(
+            veterinario_sql.IMPORTAR,
+            [(v.id_usuario, v.crmv, v.verificado, v.bio) for v in vets],
+        )
+        return len(vets)
@@ -1,16 +1,17 @@
 from importlib import util
 from fastapi import APIRouter, Form, Request
 from fastapi.responses import RedirectResponse
-from fastapi.templating import Jinja2Templates
+from util.template_util import criar_templates
 
 from model.categoria_artigo_model import CategoriaArtigo
 from repo import categoria_artigo_repo
 from util.auth_decorator import requer_autenticacao, obter_usuario_logado
 from util.mensagens import adicionar_mensagem_sucesso
 from util.mensagens import adicionar_mensagem_sucesso, adicionar_mensagem_erro
+from util.repo_util import executar_repo
 
 router = APIRouter()
-templates = Jinja2Templates(directory="templates")
+templates = criar_templates()
 
 @router.get("/")
 @requer_autenticacao(perfis_autorizados=["admin"])
@@ -43,7 +44,7 @@ async def post_categoria_alterar(
     cor: str = Form(...),
     imagem: str = Form(...)):
     categoria = CategoriaArtigo(id_categoria_artigo=id_categoria, nome=nome, cor=cor, imagem=imagem)
-    if categoria_artigo_repo.atualizar(categoria):
+    if await executar_repo(categoria_artigo_repo.atualizar, categoria):
         response = RedirectResponse("/administrador/categorias", status_code=303)
         return response
     return templates.TemplateResponse("administrador/alterar_categoria.html", {"request": request, "mensagem": "Erro ao alterar categoria."})
@@ -60,7 +61,7 @@ async def get_cadastrar_categoria(request: Request):
 @requer_autenticacao(perfis_autorizados=["admin"])
 async def post_categoria_artigor(request: Request, nome: str = Form(...), cor: str = Form(...), imagem: str = Form(...)):
     categoria = CategoriaArtigo(id_categoria_artigo=0, nome=nome, cor=cor, imagem=imagem)
-    id_categoria = categoria_artigo_repo.inserir(categoria)
+    id_categoria = await executar_repo(categoria_artigo_repo.inserir, categoria)
     if id_categoria:
         adicionar_mensagem_sucesso(request, "Categoria cadastrada com sucesso!")
         response = RedirectResponse("/administrador/listar_categorias", status_code=303)
@@ -85,7 +86,7 @@ async def post_categoria_excluir(
     categoria = categoria_artigo_repo.obter_por_id(id_categoria)
     if not categoria:
         adicionar_mensagem_erro(request, "Categoria não encontrada.")
-    elif categoria_artigo_repo.excluir(id_categoria):
+    elif await executar_repo(categoria_artigo_repo.excluir, id_categoria):
         adicionar_mensagem_sucesso(request, "Categoria excluída com sucesso!")
     else:
         adicionar_mensagem_erro(request, "Erro ao excluir. Pode haver artigos vinculados.")
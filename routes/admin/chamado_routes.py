@@ -1,6 +1,6 @@
 from datetime import datetime
 from fastapi import APIRouter, Form, Request
-from fastapi.templating import Jinja2Templates
+from util.template_util import criar_templates
 from fastapi.responses import RedirectResponse
 from repo import chamado_repo, resposta_chamado_repo
 
@@ -10,7 +10,7 @@ from util.auth_decorator import requer_autenticacao, obter_usuario_logado
 from util.mensagens import adicionar_mensagem_erro, adicionar_mensagem_sucesso
 
 router = APIRouter()
-templates = Jinja2Templates(directory="templates")
+templates = criar_templates()
 
 @router.get("/")
 @requer_autenticacao(perfis_autorizados=["admin"])
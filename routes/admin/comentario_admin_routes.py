@@ -1,12 +1,12 @@
 from fastapi import APIRouter, Request
-from fastapi.templating import Jinja2Templates
+from util.template_util import criar_templates
 from fastapi.responses import RedirectResponse
 
 from repo import comentario_artigo_repo
 from util.auth_decorator import requer_autenticacao, obter_usuario_logado
 
 router = APIRouter()
-templates = Jinja2Templates(directory="templates")
+templates = criar_templates()
 
 @router.get("/")
 @requer_autenticacao(perfis_autorizados=["admin"])
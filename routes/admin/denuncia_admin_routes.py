@@ -1,5 +1,5 @@
 from fastapi import APIRouter, Request
-from fastapi.templating import Jinja2Templates
+from util.template_util import criar_templates
 from fastapi.responses import RedirectResponse
 
 from model.denuncia_model import Denuncia
@@ -7,7 +7,7 @@ from repo import denuncia_repo
 from util.auth_decorator import requer_autenticacao, obter_usuario_logado
 
 router = APIRouter()
-templates = Jinja2Templates(directory="templates")
+templates = criar_templates()
 
 
 @router.get("/")
@@ -1,5 +1,5 @@
 from fastapi import APIRouter, Request, HTTPException, status, Form
-from fastapi.templating import Jinja2Templates
+from util.template_util import criar_templates
 from fastapi.responses import RedirectResponse
 
 from model.verificacao_crmv_model import VerificacaoCRMV
@@ -7,7 +7,7 @@ from repo import verificacao_crmv_repo
 from util.auth_decorator import requer_autenticacao, obter_usuario_logado
 
 router = APIRouter()
-templates = Jinja2Templates(directory="templates")
+templates = criar_templates()
 
 
 @router.get("/")
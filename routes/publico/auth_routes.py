@@ -26,6 +26,8 @@ from util.security import (
     obter_data_expiracao_token,
 )
 from util.auth_decorator import criar_sessao, destruir_sessao, esta_logado
+from util.repo_util import executar_repo
+from util.imagem_derivados import url_imagem
 from util.template_util import criar_templates
 from util.validacoes_dto import processar_erros_validacao
 
@@ -60,15 +62,15 @@ async def post_login(
     try:
         login_dto = LoginDTO(email=email, senha=senha)
 
-        usuario = administrador_repo.obter_por_email(login_dto.email)
+        usuario = await executar_repo(administrador_repo.obter_por_email, login_dto.email)
         if usuario:
             usuario.perfil = PerfilUsuario.ADMIN.value
             usuario.id_usuario = usuario.id_admin
             usuario.telefone = ""
         else:
-            usuario = usuario_repo.obter_por_email(login_dto.email)
+            usuario = await executar_repo(usuario_repo.obter_por_email, login_dto.email)
 
-        if not usuario or not verificar_senha(login_dto.senha, usuario.senha):
+        if not usuario or not await executar_repo(verificar_senha, login_dto.senha, usuario.senha):
             return templates.TemplateResponse(
                 "login.html",
                 {
@@ -85,7 +87,7 @@ async def post_login(
             "email": usuario.email,
             "telefone": usuario.telefone,
             "perfil": usuario.perfil,
-            "foto": f"/static/img/usuarios/{usuario.id_usuario:08d}.jpg",
+            "foto": url_imagem("usuarios", usuario.id_usuario),
         }
         criar_sessao(request, usuario_dict)
 
@@ -183,7 +185,7 @@ async def post_cadastro(
         email_normalizado = email.strip().lower()
         
         # Verificar se email já existe
-        usuario_existente = usuario_repo.obter_por_email(email_normalizado)
+        usuario_existente = await executar_repo(usuario_repo.obter_por_email, email_normalizado)
         if usuario_existente:
             logger.warning(f"Tentativa de cadastro com email existente: {email_normalizado}")
             return templates.TemplateResponse(
@@ -220,7 +222,7 @@ async def post_cadastro(
                 id_usuario=0,
                 nome=cadastro_dto.nome,
                 email=cadastro_dto.email,
-                senha=criar_hash_senha(cadastro_dto.senha),
+                senha=await executar_repo(criar_hash_senha, cadastro_dto.senha),
                 telefone=cadastro_dto.telefone,
                 perfil=perfil,
                 token_redefinicao=None,
@@ -231,7 +233,7 @@ async def post_cadastro(
             )
 
             logger.info(f"Inserindo tutor no banco - Email: {email}")
-            id_usuario = tutor_repo.inserir(tutor)
+            id_usuario = await executar_repo(tutor_repo.inserir, tutor)
 
         # CADASTRO DE VETERINÁRIO
         elif perfil == PerfilUsuario.VETERINARIO.value:
@@ -253,7 +255,7 @@ async def post_cadastro(
                 id_usuario=0,
                 nome=cadastro_dto.nome,
                 email=cadastro_dto.email,
-                senha=criar_hash_senha(cadastro_dto.senha),
+                senha=await executar_repo(criar_hash_senha, cadastro_dto.senha),
                 telefone=cadastro_dto.telefone,
                 perfil=perfil,
                 token_redefinicao=None,
@@ -265,7 +267,7 @@ async def post_cadastro(
             )
 
             logger.info(f"Inserindo veterinário no banco - Email: {email}")
-            id_usuario = veterinario_repo.inserir(veterinario)
+            id_usuario = await executar_repo(veterinario_repo.inserir, veterinario)
 
         # Verificar se inserção foi bem-sucedida
         if not id_usuario or id_usuario <= 0:
@@ -273,7 +275,7 @@ async def post_cadastro(
             raise Exception("Falha ao criar usuário no banco de dados.")
 
         logger.info(f"✅ Cadastro concluído com sucesso! ID: {id_usuario}, Email: {email}")
-        email_service.enviar_boas_vindas(email, nome)
+        await executar_repo(email_service.enviar_boas_vindas, email, nome)
         return RedirectResponse("/login?cadastro=sucesso", status.HTTP_303_SEE_OTHER)
         
     # Erros de validação do DTO (Pydantic)
@@ -316,7 +318,7 @@ async def post_esqueci_senha(request: Request, email: str = Form()):
 
     try:
         esqueci_senha_dto = EsqueciSenhaDTO(email=email)
-        usuario = usuario_repo.obter_por_email(esqueci_senha_dto.email)
+        usuario = await executar_repo(usuario_repo.obter_por_email, esqueci_senha_dto.email)
 
         mensagem = "Se o e-mail estiver cadastrado, você receberá uma mensagem contendo instruções para redefinir sua senha. Cheque sua caixa de entrada e a pasta de spam e siga as instruções para redefinir sua senha."
 
@@ -329,7 +331,7 @@ async def post_esqueci_senha(request: Request, email: str = Form()):
             logger.info(f"Solicitação de redefinição para email: {esqueci_senha_dto.email}")
             token = gerar_token_redefinicao()
             data_expiracao = obter_data_expiracao_token(24)
-            usuario_repo.atualizar_token(email, token, data_expiracao)
+            await executar_repo(usuario_repo.atualizar_token, email, token, data_expiracao)
 
             response_data = {"request": request, "sucesso": mensagem}
             if os.getenv("ENVIRONMENT", "development") == "development":
@@ -350,7 +352,7 @@ async def post_esqueci_senha(request: Request, email: str = Form()):
 
 @router.get("/redefinir-senha/{token}")
 async def get_redefinir_senha(request: Request, token: str):
-    usuario = usuario_repo.obter_por_token(token)
+    usuario = await executar_repo(usuario_repo.obter_por_token, token)
     if not usuario:
         return templates.TemplateResponse(
             "redefinir_senha.html",
@@ -374,7 +376,7 @@ async def post_redefinir_senha(
 ):
     try:
         redefinir_senha_dto = RedefinirSenhaDTO(senha=senha, confirmar_senha=confirmar_senha)
-        usuario = usuario_repo.obter_por_token(token)
+        usuario = await executar_repo(usuario_repo.obter_por_token, token)
 
         if not usuario:
             return templates.TemplateResponse(
@@ -385,9 +387,9 @@ async def post_redefinir_senha(
                 },
             )
 
-        senha_hash = criar_hash_senha(redefinir_senha_dto.senha)
-        usuario_repo.atualizar_senha(usuario.id_usuario, senha_hash)
-        usuario_repo.limpar_token(usuario.id_usuario)
+        senha_hash = await executar_repo(criar_hash_senha, redefinir_senha_dto.senha)
+        await executar_repo(usuario_repo.atualizar_senha, usuario.id_usuario, senha_hash)
+        await executar_repo(usuario_repo.limpar_token, usuario.id_usuario)
 
         return templates.TemplateResponse(
             "redefinir_senha.html",
@@ -14,6 +14,7 @@ from util.template_util import criar_templates
 from repo import veterinario_repo
 from util.file_validator import FileValidator, FileValidationError
 from util.file_manager import FileManager
+from util.imagem_derivados import armazenar_imagem
 from config.upload_config import UploadConfig
 
 logger = logging.getLogger(__name__)
@@ -223,44 +224,40 @@ async def alterar_foto(
     try:
         # 1. Validação completa do arquivo
         try:
-            conteudo, extensao = await FileValidator.validar_imagem_completo(
+            imagem = await FileValidator.validar_imagem_completo(
                 foto, max_size=UploadConfig.MAX_FILE_SIZE
             )
         except FileValidationError as e:
             logger.warning(f"Validação falhou para usuário {usuario_id}: {e}")
             return RedirectResponse(f"/perfil?erro={str(e)}", status.HTTP_303_SEE_OTHER)
 
-        # 2. Verificar espaço em disco
-        if not FileManager.verificar_espaco_disco(len(conteudo)):
-            logger.error("Espaço em disco insuficiente")
-            return RedirectResponse(
-                "/perfil?erro=Espaço em disco insuficiente", status.HTTP_303_SEE_OTHER
-            )
-
-        # 3. Obter foto atual do usuário
-        usuario = usuario_repo.obter_por_id(usuario_id)
-        if not usuario:
-            logger.error(f"Usuário {usuario_id} não encontrado")
-            return RedirectResponse("/", status.HTTP_303_SEE_OTHER)
+        with imagem:
+            # 2. Verificar espaço em disco
+            if not FileManager.verificar_espaco_disco(imagem.tamanho):
+                logger.error("Espaço em disco insuficiente")
+                return RedirectResponse(
+                    "/perfil?erro=Espaço em disco insuficiente", status.HTTP_303_SEE_OTHER
+                )
 
-        # 4. Gerar nome de arquivo baseado no ID do usuário
-        nome_arquivo = FileManager.gerar_nome_foto_usuario(usuario_id, extensao)
+            # 3. Obter foto atual do usuário
+            usuario = usuario_repo.obter_por_id(usuario_id)
+            if not usuario:
+                logger.error(f"Usuário {usuario_id} não encontrado")
+                return RedirectResponse("/", status.HTTP_303_SEE_OTHER)
 
-        # 5. Salvar novo arquivo
-        try:
-            caminho_relativo = FileManager.salvar_arquivo(
-                conteudo, nome_arquivo, usuario_id
-            )
-        except (PermissionError, OSError) as e:
-            logger.error(f"Erro ao salvar arquivo: {e}", exc_info=True)
-            return RedirectResponse(
-                "/perfil?erro=Erro ao salvar arquivo. Contate o administrador.",
-                status.HTTP_303_SEE_OTHER,
-            )
+            # 4. Salvar no armazenamento por conteúdo e gerar variantes (thumb/card/full)
+            try:
+                caminho_relativo = await armazenar_imagem(imagem, "usuarios", usuario_id)
+            except (PermissionError, OSError) as e:
+                logger.error(f"Erro ao salvar arquivo: {e}", exc_info=True)
+                return RedirectResponse(
+                    "/perfil?erro=Erro ao salvar arquivo. Contate o administrador.",
+                    status.HTTP_303_SEE_OTHER,
+                )
 
-        # 6. Deletar todas as fotos antigas do usuário (LGPD compliance)
+        # 5. Deletar fotos do formato antigo (static/img/usuarios) (LGPD compliance)
         FileManager.deletar_todas_fotos_usuario(usuario_id)
-        
+
         logger.info(f"Upload concluído com sucesso para usuário {usuario_id}")
         return RedirectResponse("/perfil?foto_sucesso=1", status.HTTP_303_SEE_OTHER)
 
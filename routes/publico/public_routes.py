@@ -1,35 +1,36 @@
 import logging
+import math
 from fastapi import APIRouter, Query, Request, HTTPException
 from fastapi.responses import HTMLResponse, RedirectResponse
 
 from util.template_util import criar_templates
 from util.auth_decorator import obter_usuario_logado, requer_autenticacao
-from repo import postagem_artigo_repo, veterinario_repo, categoria_artigo_repo, curtida_artigo_repo, postagem_feed_repo, curtida_feed_repo
+from util.cache_util import CacheTTL, CACHE_CONTAGEM_TTL, cache_resposta
+from util.repo_util import executar_repo
+from util.catalogo_categorias import catalogo_categorias
+from repo import postagem_artigo_repo, veterinario_repo, curtida_artigo_repo, postagem_feed_repo, curtida_feed_repo
+from repo import postagem_artigo_repo_async, postagem_feed_repo_async
 
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 templates = criar_templates()
 
+# Totais das listagens: recalculados a cada CACHE_CONTAGEM_TTL segundos ou quando há novas postagens
+_cache_contagens = CacheTTL(ttl_segundos=CACHE_CONTAGEM_TTL)
+
 
 @router.get("/")
+@cache_resposta("artigos", "posts", "curtidas", "categorias", "midia", "usuarios")
 async def get_root(request: Request):
     # Buscar artigos recentes (6 primeiros)
-    artigos_recentes = postagem_artigo_repo.obter_recentes_com_dados(6)
-
-    # Adicionar contagem de curtidas para cada artigo
-    for artigo in artigos_recentes:
-        artigo['total_curtidas'] = curtida_artigo_repo.contar_curtidas_por_artigo(artigo['id_postagem_artigo'])
+    artigos_recentes = await postagem_artigo_repo_async.obter_recentes_com_dados(6)
 
-    # Buscar todas as categorias
-    categorias = categoria_artigo_repo.obter_todos()
+    # Categorias vêm do catálogo em memória
+    categorias = catalogo_categorias.obter_todas()
 
     # Buscar posts do Petgram recentes (6 primeiros)
-    posts_recentes = postagem_feed_repo.obter_recentes_com_dados(6)
-
-    # Adicionar contagem de curtidas para cada post
-    for post in posts_recentes:
-        post['total_curtidas'] = curtida_feed_repo.contar_curtidas_por_postagem(post['id_postagem_feed'])
+    posts_recentes = await postagem_feed_repo_async.obter_recentes_com_dados(6)
 
     context = {
         "request": request,
@@ -43,61 +44,81 @@ async def get_root(request: Request):
 
 
 @router.get("/quemsomos")
+@cache_resposta()
 async def get_sobre(request: Request):
     return templates.TemplateResponse("publico/quem_somos.html", {"request": request})
 
 
 @router.get("/artigos", response_class=HTMLResponse)
-async def get_artigos(request: Request, pagina: int = 1, categoria: int = None):
-    """Lista todos os artigos com paginação e filtro por categoria."""
+@cache_resposta("artigos", "curtidas", "categorias", "midia", "usuarios")
+async def get_artigos(
+    request: Request, categoria: int = None, apos: str = None, antes: str = None, pagina: int = None
+):
+    """
+    Lista todos os artigos com paginação por cursor e filtro por categoria.
+
+    Links antigos com ?pagina=N continuam funcionando por LIMIT/OFFSET.
+    """
     tamanho_pagina = 12
 
-    # Buscar artigos e contar total
     if categoria:
-        artigos = postagem_artigo_repo.obter_por_categoria_com_dados(categoria, pagina, tamanho_pagina)
-        categoria_selecionada = categoria_artigo_repo.obter_por_id(categoria)
-        total_artigos = postagem_artigo_repo.contar_por_categoria(categoria)
+        categoria_selecionada = catalogo_categorias.obter_por_id(categoria)
+        total_artigos = await executar_repo(
+            _cache_contagens.obter_ou_calcular,
+            ("artigos", categoria), lambda: postagem_artigo_repo.contar_por_categoria(categoria), ["artigos"],
+        )
     else:
-        artigos = postagem_artigo_repo.obter_pagina_com_dados(pagina, tamanho_pagina)
         categoria_selecionada = None
-        total_artigos = postagem_artigo_repo.contar_total()
-
-    # Calcular total de páginas
-    import math
-    total_paginas = math.ceil(total_artigos / tamanho_pagina) if total_artigos > 0 else 1
-
-    # Adicionar contagem de curtidas para cada artigo
-    for artigo in artigos:
-        artigo['total_curtidas'] = curtida_artigo_repo.contar_curtidas_por_artigo(artigo['id_postagem_artigo'])
-
-    # Buscar todas as categorias
-    categorias = categoria_artigo_repo.obter_todos()
+        total_artigos = await executar_repo(
+            _cache_contagens.obter_ou_calcular, ("artigos", None), postagem_artigo_repo.contar_total, ["artigos"]
+        )
 
     context = {
         "request": request,
-        "artigos": artigos,
-        "categorias": categorias,
+        "categorias": catalogo_categorias.obter_todas(),
         "categoria_selecionada": categoria_selecionada,
-        "pagina": pagina,
-        "total_paginas": total_paginas,
+        "total": total_artigos,
     }
 
+    if pagina is not None and not (apos or antes):
+        # Paginação por número de página (links anteriores ao cursor)
+        pagina = max(pagina, 1)
+        if categoria:
+            artigos = await postagem_artigo_repo_async.obter_por_categoria_com_dados(categoria, pagina, tamanho_pagina)
+        else:
+            artigos = await postagem_artigo_repo_async.obter_pagina_com_dados(pagina, tamanho_pagina)
+        context.update(
+            artigos=artigos,
+            pagina=pagina,
+            total_paginas=max(math.ceil(total_artigos / tamanho_pagina), 1),
+        )
+    else:
+        # Buscar a página de artigos a partir do cursor
+        pagina_cursor = await postagem_artigo_repo_async.obter_pagina_cursor_com_dados(
+            tamanho_pagina, apos=apos, antes=antes, id_categoria=categoria,
+        )
+        context.update(
+            artigos=pagina_cursor.itens,
+            cursor_anterior=pagina_cursor.cursor_anterior,
+            cursor_proximo=pagina_cursor.cursor_proximo,
+        )
+
     return templates.TemplateResponse("publico/artigos.html", context)
 
 
 @router.get("/artigos/{id_postagem_artigo}", response_class=HTMLResponse)
 async def get_detalhes_artigo(request: Request, id_postagem_artigo: int):
     # Buscar artigo
-    artigo = postagem_artigo_repo.obter_por_id(id_postagem_artigo)
+    artigo = await executar_repo(postagem_artigo_repo.obter_por_id, id_postagem_artigo)
     if not artigo:
         raise HTTPException(status_code=404, detail="Artigo não encontrado")
 
     # Buscar dados relacionados
-    veterinario = veterinario_repo.obter_por_id(artigo.id_veterinario)
-    categoria = categoria_artigo_repo.obter_por_id(artigo.id_categoria_artigo)
+    veterinario = await executar_repo(veterinario_repo.obter_por_id, artigo.id_veterinario)
+    categoria = catalogo_categorias.obter_por_id(artigo.id_categoria_artigo)
 
-    # Contar curtidas
-    total_curtidas = curtida_artigo_repo.contar_curtidas_por_artigo(id_postagem_artigo)
+    # Curtidas do artigo (contador mantido por trigger)
+    total_curtidas = artigo.total_curtidas
 
     # Usuário logado e se curtiu
     usuario_logado = obter_usuario_logado(request)
@@ -105,14 +126,12 @@ async def get_detalhes_artigo(request: Request, id_postagem_artigo: int):
     if usuario_logado:
         id_usuario = usuario_logado.get("id_usuario") or usuario_logado.get("id")
         if id_usuario is not None:
-            curtida = curtida_artigo_repo.obter_por_id(id_usuario, id_postagem_artigo)
+            curtida = await executar_repo(curtida_artigo_repo.obter_por_id, id_usuario, id_postagem_artigo)
             usuario_curtiu = curtida is not None
 
-    # Incrementar visualizações (não bloquear em erro)
-    try:
-        postagem_artigo_repo.incrementar_visualizacoes(id_postagem_artigo)
-    except Exception as e:
-        logger.exception("Erro ao incrementar visualizações: %s", e)
+    # Registrar visualização (gravada em lote) e somar as ainda pendentes
+    postagem_artigo_repo.registrar_visualizacao(id_postagem_artigo)
+    artigo.visualizacoes = (artigo.visualizacoes or 0) + postagem_artigo_repo.obter_visualizacoes_pendentes(id_postagem_artigo)
 
     context = {
         "request": request,
@@ -128,29 +147,42 @@ async def get_detalhes_artigo(request: Request, id_postagem_artigo: int):
 
 
 @router.get("/petgram", response_class=HTMLResponse)
-async def get_petgram(request: Request, pagina: int = 1):
-    """Lista todos os posts do Petgram com paginação."""
-    tamanho_pagina = 16
-
-    # Buscar posts e contar total
-    posts = postagem_feed_repo.obter_pagina_com_dados(pagina, tamanho_pagina)
-    total_posts = postagem_feed_repo.contar_total()
-
-    # Adicionar contagem de curtidas para cada post
-    for post in posts:
-        post['total_curtidas'] = curtida_feed_repo.contar_curtidas_por_postagem(post['id_postagem_feed'])
+@cache_resposta("posts", "curtidas", "midia", "usuarios")
+async def get_petgram(request: Request, apos: str = None, antes: str = None, pagina: int = None):
+    """
+    Lista todos os posts do Petgram com paginação por cursor.
 
-    # Calcular total de páginas
-    import math
-    total_paginas = math.ceil(total_posts / tamanho_pagina) if total_posts > 0 else 1
+    Links antigos com ?pagina=N continuam funcionando por LIMIT/OFFSET.
+    """
+    tamanho_pagina = 16
 
+    total_posts = await executar_repo(
+        _cache_contagens.obter_ou_calcular, ("petgram", None), postagem_feed_repo.contar_total, ["posts"]
+    )
     context = {
         "request": request,
-        "posts": posts,
-        "pagina": pagina,
-        "total_paginas": total_paginas,
+        "total": total_posts,
     }
 
+    if pagina is not None and not (apos or antes):
+        # Paginação por número de página (links anteriores ao cursor)
+        pagina = max(pagina, 1)
+        context.update(
+            posts=await postagem_feed_repo_async.obter_pagina_com_dados(pagina, tamanho_pagina),
+            pagina=pagina,
+            total_paginas=max(math.ceil(total_posts / tamanho_pagina), 1),
+        )
+    else:
+        # Buscar a página de posts a partir do cursor
+        pagina_cursor = await postagem_feed_repo_async.obter_pagina_cursor_com_dados(
+            tamanho_pagina, apos=apos, antes=antes
+        )
+        context.update(
+            posts=pagina_cursor.itens,
+            cursor_anterior=pagina_cursor.cursor_anterior,
+            cursor_proximo=pagina_cursor.cursor_proximo,
+        )
+
     return templates.TemplateResponse("publico/petgram.html", context)
 
 
@@ -158,18 +190,16 @@ async def get_petgram(request: Request, pagina: int = 1):
 async def get_detalhes_post(request: Request, id_postagem_feed: int):
     """Exibe detalhes de um post do Petgram."""
     # Buscar post com dados completos
-    post = postagem_feed_repo.obter_por_id_com_dados(id_postagem_feed)
+    post = await postagem_feed_repo_async.obter_por_id_com_dados(id_postagem_feed)
     if not post:
         raise HTTPException(status_code=404, detail="Post não encontrado")
 
-    # Incrementar visualizações (silencioso em erro)
-    try:
-        postagem_feed_repo.incrementar_visualizacoes(id_postagem_feed)
-    except Exception:
-        logger.exception("Erro ao incrementar visualizações para post %s", id_postagem_feed)
+    # Registrar visualização (gravada em lote) e somar as ainda pendentes
+    postagem_feed_repo.registrar_visualizacao(id_postagem_feed)
+    post["visualizacoes"] = (post["visualizacoes"] or 0) + postagem_feed_repo.obter_visualizacoes_pendentes(id_postagem_feed)
 
-    # Contar curtidas do post
-    total_curtidas = curtida_feed_repo.contar_curtidas_por_postagem(id_postagem_feed)
+    # Curtidas do post (contador mantido por trigger)
+    total_curtidas = post["total_curtidas"]
 
     # Verificar se usuário logado curtiu o post
     usuario_logado = obter_usuario_logado(request)
@@ -177,7 +207,7 @@ async def get_detalhes_post(request: Request, id_postagem_feed: int):
     if usuario_logado:
         id_usuario = usuario_logado.get("id_usuario") or usuario_logado.get("id")
         if id_usuario is not None:
-            curtida = curtida_feed_repo.obter_por_id(id_usuario, id_postagem_feed)
+            curtida = await executar_repo(curtida_feed_repo.obter_por_id, id_usuario, id_postagem_feed)
             usuario_curtiu = curtida is not None
 
     context = {
@@ -205,13 +235,13 @@ async def curtir_artigo(request: Request, id_artigo: int, usuario_logado: dict =
     # ✅ DEBUG: Log para verificar
     logger.info(f"Tentando curtir/descurtir artigo - Usuario: {id_usuario}, Artigo: {id_artigo}")
     
-    curtida_existente = curtida_artigo_repo.obter_por_id(id_usuario, id_artigo)
+    curtida_existente = await executar_repo(curtida_artigo_repo.obter_por_id, id_usuario, id_artigo)
     
     logger.info(f"Curtida existente: {curtida_existente}")
 
     if curtida_existente:
         # Descurtir
-        resultado = curtida_artigo_repo.excluir(id_usuario, id_artigo)
+        resultado = await executar_repo(curtida_artigo_repo.excluir, id_usuario, id_artigo)
         logger.info(f"Resultado da exclusão: {resultado}")
         adicionar_mensagem_info(request, "Curtida removida.")
     else:
@@ -222,7 +252,7 @@ async def curtir_artigo(request: Request, id_artigo: int, usuario_logado: dict =
                 id_postagem_artigo=id_artigo,
                 data_curtida=datetime.now()
             )
-            resultado = curtida_artigo_repo.inserir(curtida)
+            resultado = await executar_repo(curtida_artigo_repo.inserir, curtida)
             logger.info(f"Resultado da inserção: {resultado}")
             adicionar_mensagem_sucesso(request, "Artigo curtido!")
         except Exception as e:
@@ -245,13 +275,13 @@ async def curtir_feed(request: Request, id_postagem_feed: int, usuario_logado: d
     # ✅ DEBUG: Log para verificar
     logger.info(f"Tentando curtir/descurtir - Usuario: {id_usuario}, Post: {id_postagem_feed}")
     
-    curtida_existente = curtida_feed_repo.obter_por_id(id_usuario, id_postagem_feed)
+    curtida_existente = await executar_repo(curtida_feed_repo.obter_por_id, id_usuario, id_postagem_feed)
     
     logger.info(f"Curtida existente: {curtida_existente}")
 
     if curtida_existente:
         # Descurtir
-        resultado = curtida_feed_repo.excluir(id_usuario, id_postagem_feed)
+        resultado = await executar_repo(curtida_feed_repo.excluir, id_usuario, id_postagem_feed)
         logger.info(f"Resultado da exclusão: {resultado}")
         adicionar_mensagem_info(request, "Curtida removida.")
     else:
@@ -262,7 +292,7 @@ async def curtir_feed(request: Request, id_postagem_feed: int, usuario_logado: d
                 id_postagem_feed=id_postagem_feed,
                 data_curtida=datetime.now()
             )
-            resultado = curtida_feed_repo.inserir(curtida)
+            resultado = await executar_repo(curtida_feed_repo.inserir, curtida)
             logger.info(f"Resultado da inserção: {resultado}")
             adicionar_mensagem_sucesso(request, "Post curtido!")
         except Exception as e:
@@ -319,20 +349,10 @@ async def get_buscar(request: Request, q: str = None, tipo: str = "artigos"):
     try:
         # Buscar conforme o tipo selecionado
         if tipo == "artigos":
-            resultados = postagem_artigo_repo.buscar_por_termo(termo, limite=50)
-            # Adicionar contagem de curtidas
-            for artigo in resultados:
-                artigo['total_curtidas'] = curtida_artigo_repo.contar_curtidas_por_artigo(
-                    artigo['id_postagem_artigo']
-                )
+            resultados = await executar_repo(postagem_artigo_repo.buscar_por_termo, termo, limite=50)
         
         elif tipo == "petgram":
-            resultados = postagem_feed_repo.buscar_por_termo(termo, limite=50)
-            # Adicionar contagem de curtidas
-            for post in resultados:
-                post['total_curtidas'] = curtida_feed_repo.contar_curtidas_por_postagem(
-                    post['id_postagem_feed']
-                )
+            resultados = await executar_repo(postagem_feed_repo.buscar_por_termo, termo, limite=50)
         
         return templates.TemplateResponse("publico/buscar.html", {
             "request": request,
@@ -3,10 +3,12 @@ from fastapi.responses import RedirectResponse
 from util.auth_decorator import requer_autenticacao
 from util.template_util import criar_templates
 from util.mensagens import adicionar_mensagem_sucesso, adicionar_mensagem_erro
+from util.repo_util import executar_repo
 from repo import postagem_feed_repo
 from model.postagem_feed_model import PostagemFeed
 from util.file_validator import FileValidator
 from util.file_manager import FileManager
+from util.imagem_derivados import armazenar_imagem, remover_imagem
 from config.upload_config import UploadConfig
 from datetime import datetime
 
@@ -18,7 +20,7 @@ templates = criar_templates("templates/tutor")
 async def get_home_tutor(request: Request, usuario_logado: dict = None):
     """Dashboard do tutor"""
     # Buscar posts do tutor
-    posts = postagem_feed_repo.obter_por_tutor(usuario_logado['id'])  # Criar função
+    posts = await executar_repo(postagem_feed_repo.obter_por_tutor, usuario_logado['id'])  # Criar função
 
     return templates.TemplateResponse("tutor/home_tutor.html", {
         "request": request,
@@ -30,7 +32,7 @@ async def get_home_tutor(request: Request, usuario_logado: dict = None):
 @requer_autenticacao(perfis_autorizados=["tutor"])
 async def get_listar_postagens(request: Request, usuario_logado: dict = None):
     """Lista todos os posts do tutor"""
-    posts = postagem_feed_repo.obter_por_tutor(usuario_logado['id'])
+    posts = await executar_repo(postagem_feed_repo.obter_por_tutor, usuario_logado['id'])
 
     return templates.TemplateResponse("tutor/listar_postagens_feed.html", {
         "request": request,
@@ -65,7 +67,7 @@ async def post_fazer_postagem(
 
     # 2. Validar imagem
     try:
-        conteudo, extensao = await FileValidator.validar_imagem_completo(
+        imagem = await FileValidator.validar_imagem_completo(
             foto, max_size=UploadConfig.MAX_FILE_SIZE
         )
     except Exception as e:
@@ -81,24 +83,20 @@ async def post_fazer_postagem(
         visualizacoes=0
     )
 
-    id_post = postagem_feed_repo.inserir(post)
+    id_post = await executar_repo(postagem_feed_repo.inserir, post)
 
     if not id_post:
+        imagem.fechar()
         adicionar_mensagem_erro(request, "Erro ao criar postagem.")
         return RedirectResponse("/tutor/fazer_postagem_feed", status_code=303)
 
-    # 4. Salvar imagem com ID do post
-    nome_arquivo = f"{id_post:08d}{extensao}"
+    # 4. Salvar imagem (armazenamento por conteúdo + variantes) associada ao post
     try:
-        FileManager.salvar_arquivo(
-            conteudo,
-            nome_arquivo,
-            id_post,
-            subpasta="feeds"
-        )
+        with imagem:
+            await armazenar_imagem(imagem, "feeds", id_post)
     except Exception as e:
         # Rollback: excluir postagem se falhar upload
-        postagem_feed_repo.excluir(id_post)
+        await executar_repo(postagem_feed_repo.excluir, id_post)
         adicionar_mensagem_erro(request, "Erro ao salvar imagem.")
         return RedirectResponse("/tutor/fazer_postagem_feed", status_code=303)
 
@@ -113,7 +111,7 @@ async def get_editar_postagem(
     usuario_logado: dict = None
 ):
     """Formulário de edição (apenas descrição)"""
-    post = postagem_feed_repo.obter_por_id(id_postagem)
+    post = await executar_repo(postagem_feed_repo.obter_por_id, id_postagem)
 
     if not post or post.id_tutor != usuario_logado['id']:
         adicionar_mensagem_erro(request, "Postagem não encontrada ou sem permissão.")
@@ -133,14 +131,14 @@ async def post_editar_postagem(
     usuario_logado: dict = None
 ):
     """Atualiza descrição do post"""
-    post = postagem_feed_repo.obter_por_id(id_postagem)
+    post = await executar_repo(postagem_feed_repo.obter_por_id, id_postagem)
 
     if not post or post.id_tutor != usuario_logado['id']:
         adicionar_mensagem_erro(request, "Sem permissão.")
         return RedirectResponse("/tutor/listar_postagem_feed", status_code=303)
 
     post.descricao = descricao
-    if postagem_feed_repo.atualizar(post):
+    if await executar_repo(postagem_feed_repo.atualizar, post):
         adicionar_mensagem_sucesso(request, "Post atualizado!")
     else:
         adicionar_mensagem_erro(request, "Erro ao atualizar.")
@@ -155,7 +153,7 @@ async def get_excluir_postagem(
     usuario_logado: dict = None
 ):
     """Confirmação de exclusão"""
-    post = postagem_feed_repo.obter_por_id(id_postagem)
+    post = await executar_repo(postagem_feed_repo.obter_por_id, id_postagem)
 
     if not post or post.id_tutor != usuario_logado['id']:
         adicionar_mensagem_erro(request, "Postagem não encontrada.")
@@ -174,15 +172,16 @@ async def post_excluir_postagem(
     usuario_logado: dict = None
 ):
     """Exclui postagem e imagem"""
-    post = postagem_feed_repo.obter_por_id(id_postagem)
+    post = await executar_repo(postagem_feed_repo.obter_por_id, id_postagem)
 
     if not post or post.id_tutor != usuario_logado['id']:
         adicionar_mensagem_erro(request, "Sem permissão.")
         return RedirectResponse("/tutor/listar_postagem_feed", status_code=303)
 
     # Excluir do banco
-    if postagem_feed_repo.excluir(id_postagem):
-        # Excluir imagem do disco
+    if await executar_repo(postagem_feed_repo.excluir, id_postagem):
+        # Excluir imagem do disco (blob e arquivos do formato antigo)
+        await remover_imagem("feeds", id_postagem)
         FileManager.deletar_imagem_feed(id_postagem)
         adicionar_mensagem_sucesso(request, "Post excluído!")
     else:
@@ -208,17 +207,13 @@ async def get_buscar_postagens(
             "posts": []
         })
     
-    # Buscar todos os posts
-    posts = postagem_feed_repo.buscar_por_termo(q.strip())
-    
-    # Filtrar apenas os do tutor logado
-    posts_filtrados = [
-        p for p in posts 
-        if p['id_tutor'] == usuario_logado['id']
-    ]
+    # Buscar apenas nas postagens do tutor logado
+    posts = await executar_repo(
+        postagem_feed_repo.buscar_por_termo, q.strip(), id_tutor=usuario_logado['id']
+    )
     
     return templates.TemplateResponse("tutor/buscar_postagens.html", {
         "request": request,
         "termo": q.strip(),
-        "posts": posts_filtrados
+        "posts": posts
     })
\ No newline at end of file
@@ -1,9 +1,9 @@
 from fastapi import APIRouter, Request
-from fastapi.templating import Jinja2Templates
+from util.template_util import criar_templates
 
 
 router = APIRouter()
-templates = Jinja2Templates(directory="templates")
+templates = criar_templates()
 
 @router.get("/alterar_dados")
 async def get_alterar_dados(request: Request):
@@ -1,6 +1,5 @@
 from fastapi import APIRouter, File, Form, Request, UploadFile
 from fastapi.params import Query
-from fastapi.templating import Jinja2Templates
 
 from repo import postagem_artigo_repo
 from util.auth_decorator import requer_autenticacao, obter_usuario_logado
@@ -59,17 +58,13 @@ async def get_buscar_artigos(
             "artigos": []
         })
     
-    # Buscar todos os artigos
-    artigos = postagem_artigo_repo.buscar_por_termo(q.strip())
-    
-    # Filtrar apenas os do veterinário logado
-    artigos_filtrados = [
-        a for a in artigos 
-        if a['id_veterinario'] == usuario_logado['id']
-    ]
+    # Buscar apenas nos artigos do veterinário logado
+    artigos = postagem_artigo_repo.buscar_por_termo(
+        q.strip(), id_veterinario=usuario_logado['id']
+    )
     
     return templates.TemplateResponse("veterinario/buscar_artigos.html", {
         "request": request,
         "termo": q.strip(),
-        "artigos": artigos_filtrados
+        "artigos": artigos
     })
\ No newline at end of file
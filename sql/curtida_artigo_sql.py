@@ -9,6 +9,41 @@ CREATE TABLE IF NOT EXISTS curtida_artigo (
 );
 """
 
+# Triggers que mantêm postagem_artigo.total_curtidas sincronizado
+CRIAR_TRIGGERS_TOTAL_CURTIDAS = [
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_curtida_artigo_inserir
+    AFTER INSERT ON curtida_artigo
+    BEGIN
+        UPDATE postagem_artigo
+        SET total_curtidas = total_curtidas + 1
+        WHERE id_postagem_artigo = NEW.id_postagem_artigo;
+    END;
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_curtida_artigo_excluir
+    AFTER DELETE ON curtida_artigo
+    BEGIN
+        UPDATE postagem_artigo
+        SET total_curtidas = total_curtidas - 1
+        WHERE id_postagem_artigo = OLD.id_postagem_artigo;
+    END;
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_curtida_artigo_mover
+    AFTER UPDATE OF id_postagem_artigo ON curtida_artigo
+    WHEN OLD.id_postagem_artigo <> NEW.id_postagem_artigo
+    BEGIN
+        UPDATE postagem_artigo
+        SET total_curtidas = total_curtidas - 1
+        WHERE id_postagem_artigo = OLD.id_postagem_artigo;
+        UPDATE postagem_artigo
+        SET total_curtidas = total_curtidas + 1
+        WHERE id_postagem_artigo = NEW.id_postagem_artigo;
+    END;
+    """,
+]
+
 INSERIR = """
 INSERT INTO curtida_artigo (id_usuario, id_postagem_artigo, data_curtida)
 VALUES (?, ?, ?);
@@ -62,6 +97,14 @@ FROM curtida_artigo
 WHERE id_postagem_artigo = ?;
 """
 
+# Contagem em lote: {placeholders} é substituído por "?, ?, ..." no repositório
+CONTAR_CURTIDAS_POR_ARTIGOS = """
+SELECT id_postagem_artigo, COUNT(*) as total_curtidas
+FROM curtida_artigo
+WHERE id_postagem_artigo IN ({placeholders})
+GROUP BY id_postagem_artigo;
+"""
+
 CONTAR_CURTIDAS_POR_USUARIO = """
 SELECT COUNT(*) as total_curtidas
 FROM curtida_artigo
@@ -9,6 +9,41 @@ CREATE TABLE IF NOT EXISTS curtida_feed (
 );
 """
 
+# Triggers que mantêm postagem_feed.total_curtidas sincronizado
+CRIAR_TRIGGERS_TOTAL_CURTIDAS = [
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_curtida_feed_inserir
+    AFTER INSERT ON curtida_feed
+    BEGIN
+        UPDATE postagem_feed
+        SET total_curtidas = total_curtidas + 1
+        WHERE id_postagem_feed = NEW.id_postagem_feed;
+    END;
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_curtida_feed_excluir
+    AFTER DELETE ON curtida_feed
+    BEGIN
+        UPDATE postagem_feed
+        SET total_curtidas = total_curtidas - 1
+        WHERE id_postagem_feed = OLD.id_postagem_feed;
+    END;
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_curtida_feed_mover
+    AFTER UPDATE OF id_postagem_feed ON curtida_feed
+    WHEN OLD.id_postagem_feed <> NEW.id_postagem_feed
+    BEGIN
+        UPDATE postagem_feed
+        SET total_curtidas = total_curtidas - 1
+        WHERE id_postagem_feed = OLD.id_postagem_feed;
+        UPDATE postagem_feed
+        SET total_curtidas = total_curtidas + 1
+        WHERE id_postagem_feed = NEW.id_postagem_feed;
+    END;
+    """,
+]
+
 INSERIR = """
 INSERT INTO curtida_feed (id_usuario, id_postagem_feed)
 VALUES (?, ?);
@@ -50,3 +85,11 @@ SELECT COUNT(*) as total
 FROM curtida_feed
 WHERE id_postagem_feed = ?;
 """
+
+# Contagem em lote: {placeholders} é substituído por "?, ?, ..." no repositório
+CONTAR_CURTIDAS_POR_POSTAGENS = """
+SELECT id_postagem_feed, COUNT(*) as total
+FROM curtida_feed
+WHERE id_postagem_feed IN ({placeholders})
+GROUP BY id_postagem_feed;
+"""
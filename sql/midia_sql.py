@@ -0,0 +1,91 @@
+CRIAR_TABELA = """
+CREATE TABLE IF NOT EXISTS midia (
+    tipo TEXT NOT NULL,
+    id_registro INTEGER NOT NULL,
+    hash TEXT NOT NULL,
+    extensao TEXT NOT NULL,
+    data_atualizacao DATETIME DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (tipo, id_registro)
+);
+"""
+
+CRIAR_INDICE_HASH = """
+CREATE INDEX IF NOT EXISTS idx_midia_hash ON midia (hash);
+"""
+
+# Blobs que deixaram de ser referenciados, à espera da coleta
+CRIAR_TABELA_ORFAOS = """
+CREATE TABLE IF NOT EXISTS midia_orfa (
+    hash TEXT PRIMARY KEY,
+    extensao TEXT NOT NULL,
+    data_orfa DATETIME DEFAULT CURRENT_TIMESTAMP
+);
+"""
+
+DEFINIR = """
+INSERT INTO midia (tipo, id_registro, hash, extensao, data_atualizacao)
+VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP)
+ON CONFLICT (tipo, id_registro) DO UPDATE SET
+    hash = excluded.hash,
+    extensao = excluded.extensao,
+    data_atualizacao = excluded.data_atualizacao;
+"""
+
+EXCLUIR = """
+DELETE FROM midia
+WHERE tipo = ? AND id_registro = ?;
+"""
+
+OBTER = """
+SELECT tipo, id_registro, hash, extensao, data_atualizacao
+FROM midia
+WHERE tipo = ? AND id_registro = ?;
+"""
+
+OBTER_TODOS = """
+SELECT tipo, id_registro, hash, extensao, data_atualizacao
+FROM midia;
+"""
+
+CONTAR_REFERENCIAS = """
+SELECT COUNT(*) AS total
+FROM midia
+WHERE hash = ?;
+"""
+
+REGISTRAR_ORFAO = """
+INSERT OR IGNORE INTO midia_orfa (hash, extensao)
+SELECT ?, ?
+WHERE NOT EXISTS (SELECT 1 FROM midia WHERE hash = ?);
+"""
+
+EXCLUIR_ORFAO = """
+DELETE FROM midia_orfa
+WHERE hash = ?;
+"""
+
+OBTER_ORFAOS_EXPIRADOS = """
+SELECT o.hash, o.extensao
+FROM midia_orfa o
+WHERE o.data_orfa <= datetime('now', ?)
+  AND NOT EXISTS (SELECT 1 FROM midia m WHERE m.hash = o.hash);
+"""
+
+# Registro de alterações preenchido por triggers (sql/migracoes/021_midia_alteracao.sql)
+OBTER_ULTIMA_ALTERACAO = """
+SELECT COALESCE(MAX(seq), 0) AS seq
+FROM midia_alteracao;
+"""
+
+OBTER_ALTERACOES = """
+SELECT a.seq, a.tipo, a.id_registro, m.hash, m.extensao
+FROM midia_alteracao a
+LEFT JOIN midia m ON m.tipo = a.tipo AND m.id_registro = a.id_registro
+WHERE a.seq > ?
+ORDER BY a.seq;
+"""
+
+EXCLUIR_ALTERACOES_ANTIGAS = """
+DELETE FROM midia_alteracao
+WHERE data_alteracao <= datetime('now', ?);
+"""
@@ -0,0 +1,24 @@
+CRIAR_TABELA = """
+CREATE TABLE IF NOT EXISTS schema_version (
+    versao INTEGER PRIMARY KEY,
+    descricao TEXT NOT NULL,
+    data_aplicacao TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+"""
+
+OBTER_VERSOES = """
+SELECT versao
+FROM schema_version
+ORDER BY versao;
+"""
+
+REGISTRAR = """
+INSERT INTO schema_version (versao, descricao)
+VALUES (?, ?);
+"""
+
+OBTER_VERSAO = """
+SELECT 1
+FROM schema_version
+WHERE versao = ?;
+"""
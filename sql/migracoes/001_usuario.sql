@@ -0,0 +1,14 @@
+-- Migração 1: tabela usuario
+-- Publicada: não alterar. Mudanças no esquema vão em uma nova migração.
+
+CREATE TABLE IF NOT EXISTS usuario (
+    id_usuario INTEGER PRIMARY KEY AUTOINCREMENT,
+    nome TEXT NOT NULL,
+    email TEXT NOT NULL UNIQUE,
+    senha TEXT NOT NULL,
+    telefone TEXT NOT NULL,
+    perfil TEXT NOT NULL DEFAULT 'tutor',
+    token_redefinicao TEXT,
+    data_token TIMESTAMP,
+    data_cadastro TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
@@ -0,0 +1,9 @@
+-- Migração 2: tabela tutor
+-- Publicada: não alterar. Mudanças no esquema vão em uma nova migração.
+
+CREATE TABLE IF NOT EXISTS tutor (
+    id_tutor INTEGER PRIMARY KEY,
+    quantidade_pets INTEGER DEFAULT 0,
+    descricao_pets TEXT,
+    FOREIGN KEY (id_tutor) REFERENCES usuario(id_usuario)
+);
@@ -0,0 +1,10 @@
+-- Migração 3: tabela veterinario
+-- Publicada: não alterar. Mudanças no esquema vão em uma nova migração.
+
+CREATE TABLE IF NOT EXISTS veterinario (
+    id_veterinario INTEGER PRIMARY KEY,
+    crmv TEXT NOT NULL,
+    verificado BOOLEAN DEFAULT 0,
+    bio TEXT,
+    FOREIGN KEY (id_veterinario) REFERENCES usuario(id_usuario)
+);
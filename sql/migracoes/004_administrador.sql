@@ -0,0 +1,9 @@
+-- Migração 4: tabela administrador
+-- Publicada: não alterar. Mudanças no esquema vão em uma nova migração.
+
+CREATE TABLE IF NOT EXISTS administrador (
+    id_admin INTEGER PRIMARY KEY AUTOINCREMENT,
+    nome TEXT NOT NULL,
+    email TEXT NOT NULL UNIQUE,
+    senha CHAR(8) NOT NULL
+);
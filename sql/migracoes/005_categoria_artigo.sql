@@ -0,0 +1,8 @@
+-- Migração 5: tabela categoria_artigo
+-- Publicada: não alterar. Mudanças no esquema vão em uma nova migração.
+
+CREATE TABLE IF NOT EXISTS categoria_artigo (
+    id_categoria_artigo INTEGER PRIMARY KEY AUTOINCREMENT,
+    nome TEXT NOT NULL,
+    cor TEXT NOT NULL
+);
@@ -0,0 +1,49 @@
+-- Migração 6: tabela postagem_artigo
+-- Publicada: não alterar. Mudanças no esquema vão em uma nova migração.
+
+CREATE TABLE IF NOT EXISTS postagem_artigo (
+    id_postagem_artigo INTEGER PRIMARY KEY AUTOINCREMENT,
+    id_veterinario INTEGER NOT NULL,
+    titulo TEXT NOT NULL,
+    conteudo TEXT NOT NULL,
+    id_categoria_artigo INTEGER NOT NULL,
+    data_publicacao DATETIME DEFAULT CURRENT_TIMESTAMP,
+    visualizacoes INTEGER DEFAULT 0,
+    total_curtidas INTEGER NOT NULL DEFAULT 0,
+    FOREIGN KEY (id_veterinario) REFERENCES veterinario(id_veterinario),
+    FOREIGN KEY (id_categoria_artigo) REFERENCES categoria_artigo(id_categoria_artigo)
+);
+
+CREATE VIRTUAL TABLE IF NOT EXISTS postagem_artigo_fts USING fts5(
+    titulo,
+    conteudo,
+    content='postagem_artigo',
+    content_rowid='id_postagem_artigo',
+    tokenize='unicode61 remove_diacritics 2',
+    prefix='2 3'
+);
+
+CREATE TRIGGER IF NOT EXISTS trg_postagem_artigo_fts_inserir
+AFTER INSERT ON postagem_artigo
+BEGIN
+    INSERT INTO postagem_artigo_fts(rowid, titulo, conteudo)
+    VALUES (NEW.id_postagem_artigo, NEW.titulo, NEW.conteudo);
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_postagem_artigo_fts_excluir
+AFTER DELETE ON postagem_artigo
+BEGIN
+    INSERT INTO postagem_artigo_fts(postagem_artigo_fts, rowid, titulo, conteudo)
+    VALUES ('delete', OLD.id_postagem_artigo, OLD.titulo, OLD.conteudo);
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_postagem_artigo_fts_atualizar
+AFTER UPDATE OF titulo, conteudo ON postagem_artigo
+BEGIN
+    INSERT INTO postagem_artigo_fts(postagem_artigo_fts, rowid, titulo, conteudo)
+    VALUES ('delete', OLD.id_postagem_artigo, OLD.titulo, OLD.conteudo);
+    INSERT INTO postagem_artigo_fts(rowid, titulo, conteudo)
+    VALUES (NEW.id_postagem_artigo, NEW.titulo, NEW.conteudo);
+END;
+
+INSERT INTO postagem_artigo_fts(postagem_artigo_fts) VALUES ('rebuild');
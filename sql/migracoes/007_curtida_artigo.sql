@@ -0,0 +1,46 @@
+-- Migração 7: tabela curtida_artigo
+-- Publicada: não alterar. Mudanças no esquema vão em uma nova migração.
+
+CREATE TABLE IF NOT EXISTS curtida_artigo (
+    id_usuario INTEGER NOT NULL,
+    id_postagem_artigo INTEGER NOT NULL,
+    data_curtida DATETIME DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (id_usuario, id_postagem_artigo),
+    FOREIGN KEY (id_usuario) REFERENCES usuario(id_usuario) ON DELETE CASCADE,
+    FOREIGN KEY (id_postagem_artigo) REFERENCES postagem_artigo(id_postagem_artigo) ON DELETE CASCADE
+);
+
+CREATE TRIGGER IF NOT EXISTS trg_curtida_artigo_inserir
+AFTER INSERT ON curtida_artigo
+BEGIN
+    UPDATE postagem_artigo
+    SET total_curtidas = total_curtidas + 1
+    WHERE id_postagem_artigo = NEW.id_postagem_artigo;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_curtida_artigo_excluir
+AFTER DELETE ON curtida_artigo
+BEGIN
+    UPDATE postagem_artigo
+    SET total_curtidas = total_curtidas - 1
+    WHERE id_postagem_artigo = OLD.id_postagem_artigo;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_curtida_artigo_mover
+AFTER UPDATE OF id_postagem_artigo ON curtida_artigo
+WHEN OLD.id_postagem_artigo <> NEW.id_postagem_artigo
+BEGIN
+    UPDATE postagem_artigo
+    SET total_curtidas = total_curtidas - 1
+    WHERE id_postagem_artigo = OLD.id_postagem_artigo;
+    UPDATE postagem_artigo
+    SET total_curtidas = total_curtidas + 1
+    WHERE id_postagem_artigo = NEW.id_postagem_artigo;
+END;
+
+UPDATE postagem_artigo
+SET total_curtidas = (
+    SELECT COUNT(*)
+    FROM curtida_artigo ca
+    WHERE ca.id_postagem_artigo = postagem_artigo.id_postagem_artigo
+);
@@ -0,0 +1,46 @@
+-- Migração 8: tabela postagem_feed
+-- Publicada: não alterar. Mudanças no esquema vão em uma nova migração.
+
+CREATE TABLE IF NOT EXISTS postagem_feed (
+    id_postagem_feed INTEGER PRIMARY KEY AUTOINCREMENT,
+    id_tutor INTEGER NOT NULL,
+    descricao TEXT,
+    data_postagem DATETIME DEFAULT CURRENT_TIMESTAMP,
+    visualizacoes INTEGER DEFAULT 0,
+    total_curtidas INTEGER NOT NULL DEFAULT 0,
+    FOREIGN KEY (id_tutor) REFERENCES tutor(id_tutor)
+
+);
+
+CREATE VIRTUAL TABLE IF NOT EXISTS postagem_feed_fts USING fts5(
+    descricao,
+    content='postagem_feed',
+    content_rowid='id_postagem_feed',
+    tokenize='unicode61 remove_diacritics 2',
+    prefix='2 3'
+);
+
+CREATE TRIGGER IF NOT EXISTS trg_postagem_feed_fts_inserir
+AFTER INSERT ON postagem_feed
+BEGIN
+    INSERT INTO postagem_feed_fts(rowid, descricao)
+    VALUES (NEW.id_postagem_feed, NEW.descricao);
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_postagem_feed_fts_excluir
+AFTER DELETE ON postagem_feed
+BEGIN
+    INSERT INTO postagem_feed_fts(postagem_feed_fts, rowid, descricao)
+    VALUES ('delete', OLD.id_postagem_feed, OLD.descricao);
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_postagem_feed_fts_atualizar
+AFTER UPDATE OF descricao ON postagem_feed
+BEGIN
+    INSERT INTO postagem_feed_fts(postagem_feed_fts, rowid, descricao)
+    VALUES ('delete', OLD.id_postagem_feed, OLD.descricao);
+    INSERT INTO postagem_feed_fts(rowid, descricao)
+    VALUES (NEW.id_postagem_feed, NEW.descricao);
+END;
+
+INSERT INTO postagem_feed_fts(postagem_feed_fts) VALUES ('rebuild');
@@ -0,0 +1,46 @@
+-- Migração 9: tabela curtida_feed
+-- Publicada: não alterar. Mudanças no esquema vão em uma nova migração.
+
+CREATE TABLE IF NOT EXISTS curtida_feed (
+    id_usuario INTEGER NOT NULL,
+    id_postagem_feed INTEGER NOT NULL,
+    data_curtida DATETIME DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (id_usuario, id_postagem_feed),
+    FOREIGN KEY (id_usuario) REFERENCES usuario(id_usuario),
+    FOREIGN KEY (id_postagem_feed) REFERENCES postagem_feed(id_postagem_feed)
+);
+
+CREATE TRIGGER IF NOT EXISTS trg_curtida_feed_inserir
+AFTER INSERT ON curtida_feed
+BEGIN
+    UPDATE postagem_feed
+    SET total_curtidas = total_curtidas + 1
+    WHERE id_postagem_feed = NEW.id_postagem_feed;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_curtida_feed_excluir
+AFTER DELETE ON curtida_feed
+BEGIN
+    UPDATE postagem_feed
+    SET total_curtidas = total_curtidas - 1
+    WHERE id_postagem_feed = OLD.id_postagem_feed;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_curtida_feed_mover
+AFTER UPDATE OF id_postagem_feed ON curtida_feed
+WHEN OLD.id_postagem_feed <> NEW.id_postagem_feed
+BEGIN
+    UPDATE postagem_feed
+    SET total_curtidas = total_curtidas - 1
+    WHERE id_postagem_feed = OLD.id_postagem_feed;
+    UPDATE postagem_feed
+    SET total_curtidas = total_curtidas + 1
+    WHERE id_postagem_feed = NEW.id_postagem_feed;
+END;
+
+UPDATE postagem_feed
+SET total_curtidas = (
+    SELECT COUNT(*)
+    FROM curtida_feed cf
+    WHERE cf.id_postagem_feed = postagem_feed.id_postagem_feed
+);
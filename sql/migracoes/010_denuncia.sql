@@ -0,0 +1,13 @@
+-- Migração 10: tabela denuncia
+-- Publicada: não alterar. Mudanças no esquema vão em uma nova migração.
+
+CREATE TABLE IF NOT EXISTS denuncia (
+    id_denuncia INTEGER PRIMARY KEY AUTOINCREMENT,
+    id_usuario INTEGER NOT NULL,
+    id_admin INTEGER,
+    motivo TEXT NOT NULL,
+    data_denuncia DATETIME DEFAULT CURRENT_TIMESTAMP,
+    status TEXT NOT NULL CHECK (status IN ('pendente', 'em_analise', 'resolvida', 'rejeitada')),
+    FOREIGN KEY (id_usuario) REFERENCES usuario(id_usuario),
+    FOREIGN KEY (id_admin) REFERENCES administrador(id_admin)
+);
@@ -0,0 +1,10 @@
+-- Migração 11: tabela verificacao_crmv
+-- Publicada: não alterar. Mudanças no esquema vão em uma nova migração.
+
+CREATE TABLE IF NOT EXISTS verificacao_crmv (
+    id_verificacao_crmv INTEGER PRIMARY KEY AUTOINCREMENT,
+    id_veterinario INTEGER NOT NULL,
+    id_administrador INTEGER,
+    data_verificacao DATETIME DEFAULT CURRENT_TIMESTAMP,
+    status_verificacao TEXT CHECK(status_verificacao IN ('pendente', 'aprovado', 'rejeitado', 'em_analise')) DEFAULT 'pendente'
+);
@@ -0,0 +1,11 @@
+-- Migração 12: tabela seguida
+-- Publicada: não alterar. Mudanças no esquema vão em uma nova migração.
+
+CREATE TABLE IF NOT EXISTS seguida (
+  id_veterinario INTEGER NOT NULL,
+  id_tutor INTEGER NOT NULL,
+  data_inicio DATETIME DEFAULT CURRENT_TIMESTAMP,
+  PRIMARY KEY (id_veterinario, id_tutor),
+  FOREIGN KEY (id_veterinario) REFERENCES veterinario(id_veterinario),
+  FOREIGN KEY (id_tutor) REFERENCES tutor(id_tutor)
+);
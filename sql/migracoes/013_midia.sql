@@ -0,0 +1,13 @@
+-- Migração 13: tabela midia
+-- Publicada: não alterar. Mudanças no esquema vão em uma nova migração.
+
+CREATE TABLE IF NOT EXISTS midia (
+    tipo TEXT NOT NULL,
+    id_registro INTEGER NOT NULL,
+    hash TEXT NOT NULL,
+    extensao TEXT NOT NULL,
+    data_atualizacao DATETIME DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (tipo, id_registro)
+);
+
+CREATE INDEX IF NOT EXISTS idx_midia_hash ON midia (hash);
@@ -0,0 +1,14 @@
+-- Migração 14: tabela chamado
+-- Publicada: não alterar. Mudanças no esquema vão em uma nova migração.
+
+CREATE TABLE IF NOT EXISTS chamado (
+    id_chamado INTEGER PRIMARY KEY AUTOINCREMENT,
+    id_usuario INTEGER NOT NULL,
+    id_admin INTEGER,
+    titulo TEXT NOT NULL,
+    descricao TEXT NOT NULL,
+    status TEXT CHECK(status IN ('aberto', 'em_andamento', 'resolvido')) DEFAULT 'aberto',
+    data DATETIME DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (id_usuario) REFERENCES usuario(id_usuario),
+    FOREIGN KEY (id_admin) REFERENCES administrador(id_admin)
+);
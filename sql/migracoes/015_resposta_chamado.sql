@@ -0,0 +1,11 @@
+-- Migração 15: tabela resposta_chamado
+-- Publicada: não alterar. Mudanças no esquema vão em uma nova migração.
+
+CREATE TABLE IF NOT EXISTS resposta_chamado (
+    id_resposta_chamado INTEGER PRIMARY KEY AUTOINCREMENT,
+    id_chamado INTEGER NOT NULL,
+    titulo TEXT NOT NULL,
+    descricao TEXT NOT NULL,
+    data DATETIME DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (id_chamado) REFERENCES chamado(id_chamado)
+);
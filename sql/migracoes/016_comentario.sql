@@ -0,0 +1,13 @@
+-- Migração 16: tabela comentario
+-- Publicada: não alterar. Mudanças no esquema vão em uma nova migração.
+
+CREATE TABLE IF NOT EXISTS comentario (
+    id_comentario INTEGER PRIMARY KEY AUTOINCREMENT,
+    id_usuario INTEGER NOT NULL,
+    id_postagem_artigo INTEGER NOT NULL,
+    texto TEXT NOT NULL,
+    data_comentario DATETIME DEFAULT CURRENT_TIMESTAMP,
+    data_moderacao DATETIME,
+    FOREIGN KEY (id_usuario) REFERENCES usuario(id_usuario),
+    FOREIGN KEY (id_postagem_artigo) REFERENCES postagem_artigo(id_postagem_artigo)
+);
@@ -0,0 +1,71 @@
+-- Índices compostos/cobrindo para as consultas de listagem mais usadas
+-- VetConecta - Sistema de Conexão Veterinária
+--
+-- Cada índice cobre o filtro e a ordenação da consulta, evitando a ordenação
+-- em B-tree temporária. O SQLite percorre índices nos dois sentidos, por isso
+-- as colunas de data ficam em ordem crescente: o mesmo índice atende ORDER BY
+-- ... DESC (avançar página) e ASC (voltar página na paginação por cursor).
+-- Índices de coluna única que viraram prefixo de um composto são removidos
+-- para não pesar nas escritas.
+-- Verificado por tests/test_indices.py (EXPLAIN QUERY PLAN).
+
+-- =====================================================================
+-- POSTAGEM_ARTIGO
+-- =====================================================================
+
+-- Listagens e cursor: ORDER BY data_publicacao, id_postagem_artigo
+CREATE INDEX IF NOT EXISTS idx_postagem_artigo_data_id ON postagem_artigo(data_publicacao, id_postagem_artigo);
+DROP INDEX IF EXISTS idx_postagem_data;
+
+-- Artigos por categoria: WHERE id_categoria_artigo = ? ORDER BY data_publicacao, id
+CREATE INDEX IF NOT EXISTS idx_postagem_artigo_categoria_data ON postagem_artigo(id_categoria_artigo, data_publicacao, id_postagem_artigo);
+DROP INDEX IF EXISTS idx_postagem_categoria;
+
+-- Artigos de um veterinário: WHERE id_veterinario = ? ORDER BY data_publicacao
+CREATE INDEX IF NOT EXISTS idx_postagem_artigo_veterinario_data ON postagem_artigo(id_veterinario, data_publicacao);
+DROP INDEX IF EXISTS idx_postagem_veterinario;
+
+-- =====================================================================
+-- POSTAGEM_FEED
+-- =====================================================================
+
+-- Feed e cursor: ORDER BY data_postagem, id_postagem_feed
+CREATE INDEX IF NOT EXISTS idx_postagem_feed_data_id ON postagem_feed(data_postagem, id_postagem_feed);
+DROP INDEX IF EXISTS idx_postagem_feed_data;
+
+-- Posts de um tutor: WHERE id_tutor = ? ORDER BY data_postagem
+CREATE INDEX IF NOT EXISTS idx_postagem_feed_tutor_data ON postagem_feed(id_tutor, data_postagem);
+DROP INDEX IF EXISTS idx_postagem_feed_tutor;
+
+-- =====================================================================
+-- CURTIDAS
+-- =====================================================================
+
+-- Contagem de curtidas por post (cobrindo) e busca da curtida de um usuário
+CREATE INDEX IF NOT EXISTS idx_curtida_feed_postagem_usuario ON curtida_feed(id_postagem_feed, id_usuario);
+DROP INDEX IF EXISTS idx_curtida_feed_postagem;
+
+CREATE INDEX IF NOT EXISTS idx_curtida_artigo_postagem_usuario ON curtida_artigo(id_postagem_artigo, id_usuario);
+DROP INDEX IF EXISTS idx_curtida_artigo_postagem;
+
+-- Artigos curtidos por um usuário: WHERE id_usuario = ? ORDER BY data_curtida
+CREATE INDEX IF NOT EXISTS idx_curtida_artigo_usuario_data ON curtida_artigo(id_usuario, data_curtida);
+DROP INDEX IF EXISTS idx_curtida_artigo_usuario;
+
+-- =====================================================================
+-- SEGUIDA
+-- =====================================================================
+
+-- Listagem de seguidas: ORDER BY data_inicio
+CREATE INDEX IF NOT EXISTS idx_seguida_data ON seguida(data_inicio);
+
+-- =====================================================================
+-- USUARIO
+-- =====================================================================
+
+-- Listagem de usuários e tutores: ORDER BY nome
+CREATE INDEX IF NOT EXISTS idx_usuario_nome ON usuario(nome);
+
+-- Usuários de um perfil: WHERE perfil = ? ORDER BY nome
+CREATE INDEX IF NOT EXISTS idx_usuario_perfil_nome ON usuario(perfil, nome);
+DROP INDEX IF EXISTS idx_usuario_perfil;
@@ -0,0 +1,27 @@
+-- Migração 19: contador de versão por conjunto de dados
+-- Publicada: não alterar. Mudanças no esquema vão em uma nova migração.
+
+CREATE TABLE IF NOT EXISTS versao_dados (
+    tag TEXT PRIMARY KEY,
+    versao INTEGER NOT NULL DEFAULT 0
+);
+
+INSERT OR IGNORE INTO versao_dados (tag, versao) VALUES ('categorias', 0);
+
+CREATE TRIGGER IF NOT EXISTS trg_categoria_artigo_versao_inserir
+AFTER INSERT ON categoria_artigo
+BEGIN
+    UPDATE versao_dados SET versao = versao + 1 WHERE tag = 'categorias';
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_categoria_artigo_versao_atualizar
+AFTER UPDATE ON categoria_artigo
+BEGIN
+    UPDATE versao_dados SET versao = versao + 1 WHERE tag = 'categorias';
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_categoria_artigo_versao_excluir
+AFTER DELETE ON categoria_artigo
+BEGIN
+    UPDATE versao_dados SET versao = versao + 1 WHERE tag = 'categorias';
+END;
@@ -0,0 +1,28 @@
+-- Migração 20: blobs órfãos aguardando coleta e contador de versão da mídia
+-- Publicada: não alterar. Mudanças no esquema vão em uma nova migração.
+
+CREATE TABLE IF NOT EXISTS midia_orfa (
+    hash TEXT PRIMARY KEY,
+    extensao TEXT NOT NULL,
+    data_orfa DATETIME DEFAULT CURRENT_TIMESTAMP
+);
+
+INSERT OR IGNORE INTO versao_dados (tag, versao) VALUES ('midia', 0);
+
+CREATE TRIGGER IF NOT EXISTS trg_midia_versao_inserir
+AFTER INSERT ON midia
+BEGIN
+    UPDATE versao_dados SET versao = versao + 1 WHERE tag = 'midia';
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_midia_versao_atualizar
+AFTER UPDATE ON midia
+BEGIN
+    UPDATE versao_dados SET versao = versao + 1 WHERE tag = 'midia';
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_midia_versao_excluir
+AFTER DELETE ON midia
+BEGIN
+    UPDATE versao_dados SET versao = versao + 1 WHERE tag = 'midia';
+END;
@@ -0,0 +1,33 @@
+-- Migração 21: registro das alterações da mídia para o índice em memória
+-- Publicada: não alterar. Mudanças no esquema vão em uma nova migração.
+
+CREATE TABLE IF NOT EXISTS midia_alteracao (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    tipo TEXT NOT NULL,
+    id_registro INTEGER NOT NULL,
+    data_alteracao DATETIME DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TRIGGER IF NOT EXISTS trg_midia_alteracao_inserir
+AFTER INSERT ON midia
+BEGIN
+    INSERT INTO midia_alteracao (tipo, id_registro) VALUES (NEW.tipo, NEW.id_registro);
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_midia_alteracao_atualizar
+AFTER UPDATE ON midia
+BEGIN
+    INSERT INTO midia_alteracao (tipo, id_registro) VALUES (NEW.tipo, NEW.id_registro);
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_midia_alteracao_excluir
+AFTER DELETE ON midia
+BEGIN
+    INSERT INTO midia_alteracao (tipo, id_registro) VALUES (OLD.tipo, OLD.id_registro);
+END;
+
+-- O registro de alterações substitui o contador de versão da mídia
+DROP TRIGGER IF EXISTS trg_midia_versao_inserir;
+DROP TRIGGER IF EXISTS trg_midia_versao_atualizar;
+DROP TRIGGER IF EXISTS trg_midia_versao_excluir;
+DELETE FROM versao_dados WHERE tag = 'midia';
@@ -7,11 +7,67 @@ CREATE TABLE IF NOT EXISTS postagem_artigo (
     id_categoria_artigo INTEGER NOT NULL,
     data_publicacao DATETIME DEFAULT CURRENT_TIMESTAMP,
     visualizacoes INTEGER DEFAULT 0,
+    total_curtidas INTEGER NOT NULL DEFAULT 0,
     FOREIGN KEY (id_veterinario) REFERENCES veterinario(id_veterinario),
     FOREIGN KEY (id_categoria_artigo) REFERENCES categoria_artigo(id_categoria_artigo)
 );
 """
 
+# Índice de texto completo (external content) sobre título e conteúdo.
+# unicode61 com remove_diacritics 2 ignora acentos ("vacinação" = "vacinacao")
+# e os índices de prefixo aceleram buscas por palavras incompletas.
+CRIAR_TABELA_FTS = """
+CREATE VIRTUAL TABLE IF NOT EXISTS postagem_artigo_fts USING fts5(
+    titulo,
+    conteudo,
+    content='postagem_artigo',
+    content_rowid='id_postagem_artigo',
+    tokenize='unicode61 remove_diacritics 2',
+    prefix='2 3'
+);
+"""
+
+# Mantêm o índice sincronizado com a tabela postagem_artigo
+CRIAR_TRIGGERS_FTS = [
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_postagem_artigo_fts_inserir
+    AFTER INSERT ON postagem_artigo
+    BEGIN
+        INSERT INTO postagem_artigo_fts(rowid, titulo, conteudo)
+        VALUES (NEW.id_postagem_artigo, NEW.titulo, NEW.conteudo);
+    END;
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_postagem_artigo_fts_excluir
+    AFTER DELETE ON postagem_artigo
+    BEGIN
+        INSERT INTO postagem_artigo_fts(postagem_artigo_fts, rowid, titulo, conteudo)
+        VALUES ('delete', OLD.id_postagem_artigo, OLD.titulo, OLD.conteudo);
+    END;
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_postagem_artigo_fts_atualizar
+    AFTER UPDATE OF titulo, conteudo ON postagem_artigo
+    BEGIN
+        INSERT INTO postagem_artigo_fts(postagem_artigo_fts, rowid, titulo, conteudo)
+        VALUES ('delete', OLD.id_postagem_artigo, OLD.titulo, OLD.conteudo);
+        INSERT INTO postagem_artigo_fts(rowid, titulo, conteudo)
+        VALUES (NEW.id_postagem_artigo, NEW.titulo, NEW.conteudo);
+    END;
+    """,
+]
+
+# Reconstrói o índice a partir da tabela (bancos existentes ou reparo)
+RECONSTRUIR_FTS = """
+INSERT INTO postagem_artigo_fts(postagem_artigo_fts) VALUES ('rebuild');
+"""
+
+# Bancos criados antes do contador desnormalizado recebem a coluna via ALTER TABLE
+ADICIONAR_COLUNA_TOTAL_CURTIDAS = """
+ALTER TABLE postagem_artigo
+ADD COLUMN total_curtidas INTEGER NOT NULL DEFAULT 0;
+"""
+
 INSERIR = """
 INSERT INTO postagem_artigo (id_veterinario, titulo, conteudo, id_categoria_artigo)
 VALUES (?, ?, ?, ?);
@@ -29,6 +85,12 @@ SET visualizacoes = visualizacoes + 1
 WHERE id_postagem_artigo = ?;
 """
 
+INCREMENTAR_VISUALIZACOES_EM_LOTE = """
+UPDATE postagem_artigo
+SET visualizacoes = visualizacoes + ?
+WHERE id_postagem_artigo = ?;
+"""
+
 EXCLUIR = """
 DELETE FROM postagem_artigo
 WHERE id_postagem_artigo = ?;
@@ -56,7 +118,8 @@ SELECT
     conteudo,
     id_categoria_artigo,
     data_publicacao,
-    visualizacoes
+    visualizacoes,
+    total_curtidas
 FROM postagem_artigo
 WHERE id_postagem_artigo = ?;
 """
@@ -70,6 +133,7 @@ SELECT
     pa.id_categoria_artigo,
     pa.data_publicacao,
     pa.visualizacoes,
+    pa.total_curtidas,
     u.nome as nome_veterinario,
     ca.nome as nome_categoria,
     ca.cor as cor_categoria
@@ -90,6 +154,7 @@ SELECT
     pa.id_categoria_artigo,
     pa.data_publicacao,
     pa.visualizacoes,
+    pa.total_curtidas,
     u.nome as nome_veterinario,
     ca.nome as nome_categoria,
     ca.cor as cor_categoria
@@ -110,6 +175,7 @@ SELECT
     pa.id_categoria_artigo,
     pa.data_publicacao,
     pa.visualizacoes,
+    pa.total_curtidas,
     u.nome as nome_veterinario,
     ca.nome as nome_categoria,
     ca.cor as cor_categoria
@@ -122,6 +188,35 @@ ORDER BY pa.data_publicacao DESC
 LIMIT ? OFFSET ?;
 """
 
+# Paginação por cursor (keyset) em (data_publicacao, id_postagem_artigo).
+# {filtro} recebe as condições de cursor/categoria e {ordem} é DESC ao
+# avançar ou ASC ao voltar uma página.
+OBTER_PAGINA_CURSOR_COM_DADOS = """
+SELECT
+    pa.id_postagem_artigo,
+    pa.id_veterinario,
+    pa.titulo,
+    pa.conteudo,
+    pa.id_categoria_artigo,
+    pa.data_publicacao,
+    pa.visualizacoes,
+    pa.total_curtidas,
+    u.nome as nome_veterinario,
+    ca.nome as nome_categoria,
+    ca.cor as cor_categoria
+FROM postagem_artigo pa
+JOIN veterinario v ON pa.id_veterinario = v.id_veterinario
+JOIN usuario u ON v.id_veterinario = u.id_usuario
+JOIN categoria_artigo ca ON pa.id_categoria_artigo = ca.id_categoria_artigo
+WHERE {filtro}
+ORDER BY pa.data_publicacao {ordem}, pa.id_postagem_artigo {ordem}
+LIMIT ?;
+"""
+
+FILTRO_CURSOR_APOS = "(pa.data_publicacao, pa.id_postagem_artigo) < (?, ?)"
+FILTRO_CURSOR_ANTES = "(pa.data_publicacao, pa.id_postagem_artigo) > (?, ?)"
+FILTRO_CATEGORIA = "pa.id_categoria_artigo = ?"
+
 IMPORTAR = """
 INSERT INTO postagem_artigo (id_postagem_artigo, id_veterinario, titulo, conteudo, id_categoria_artigo, visualizacoes)
 VALUES (?, ?, ?, ?, ?, ?);
@@ -147,6 +242,7 @@ SELECT
     pa.id_categoria_artigo,
     pa.data_publicacao,
     pa.visualizacoes,
+    pa.total_curtidas,
     u.nome as nome_veterinario,
     ca.nome as nome_categoria,
     ca.cor as cor_categoria
@@ -158,6 +254,9 @@ WHERE u.id_usuario = ?
 ORDER BY pa.data_publicacao DESC;
 """
 
+# Busca no índice FTS5 ordenada por relevância (bm25, título com peso maior).
+# Parâmetros: marcador inicial, marcador final, consulta MATCH,
+# id_veterinario (ou NULL para todos) repetido, limite.
 BUSCAR_POR_TERMO = """
 SELECT
     pa.id_postagem_artigo,
@@ -167,15 +266,28 @@ SELECT
     pa.id_categoria_artigo,
     pa.data_publicacao,
     pa.visualizacoes,
+    pa.total_curtidas,
     u.nome as nome_veterinario,
     ca.nome as nome_categoria,
-    ca.cor as cor_categoria
-FROM postagem_artigo pa
+    ca.cor as cor_categoria,
+    snippet(postagem_artigo_fts, 1, ?, ?, '…', 24) as trecho
+FROM postagem_artigo_fts
+JOIN postagem_artigo pa ON pa.id_postagem_artigo = postagem_artigo_fts.rowid
 JOIN veterinario v ON pa.id_veterinario = v.id_veterinario
 JOIN usuario u ON v.id_veterinario = u.id_usuario
 JOIN categoria_artigo ca ON pa.id_categoria_artigo = ca.id_categoria_artigo
-WHERE pa.titulo LIKE ? OR pa.conteudo LIKE ?
-ORDER BY pa.data_publicacao DESC
+WHERE postagem_artigo_fts MATCH ?
+AND (? IS NULL OR pa.id_veterinario = ?)
+ORDER BY bm25(postagem_artigo_fts, 10.0, 1.0)
 LIMIT ?;
 """
 
+# Reconstrói o contador desnormalizado a partir da tabela curtida_artigo
+RECALCULAR_TOTAL_CURTIDAS = """
+UPDATE postagem_artigo
+SET total_curtidas = (
+    SELECT COUNT(*)
+    FROM curtida_artigo ca
+    WHERE ca.id_postagem_artigo = postagem_artigo.id_postagem_artigo
+);
+"""
@@ -5,11 +5,66 @@ CREATE TABLE IF NOT EXISTS postagem_feed (
     descricao TEXT,
     data_postagem DATETIME DEFAULT CURRENT_TIMESTAMP,
     visualizacoes INTEGER DEFAULT 0,
+    total_curtidas INTEGER NOT NULL DEFAULT 0,
     FOREIGN KEY (id_tutor) REFERENCES tutor(id_tutor)
 
 );
 """
 
+# Índice de texto completo (external content) sobre a descrição dos posts.
+# unicode61 com remove_diacritics 2 ignora acentos e os índices de prefixo
+# aceleram buscas por palavras incompletas.
+CRIAR_TABELA_FTS = """
+CREATE VIRTUAL TABLE IF NOT EXISTS postagem_feed_fts USING fts5(
+    descricao,
+    content='postagem_feed',
+    content_rowid='id_postagem_feed',
+    tokenize='unicode61 remove_diacritics 2',
+    prefix='2 3'
+);
+"""
+
+# Mantêm o índice sincronizado com a tabela postagem_feed
+CRIAR_TRIGGERS_FTS = [
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_postagem_feed_fts_inserir
+    AFTER INSERT ON postagem_feed
+    BEGIN
+        INSERT INTO postagem_feed_fts(rowid, descricao)
+        VALUES (NEW.id_postagem_feed, NEW.descricao);
+    END;
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_postagem_feed_fts_excluir
+    AFTER DELETE ON postagem_feed
+    BEGIN
+        INSERT INTO postagem_feed_fts(postagem_feed_fts, rowid, descricao)
+        VALUES ('delete', OLD.id_postagem_feed, OLD.descricao);
+    END;
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_postagem_feed_fts_atualizar
+    AFTER UPDATE OF descricao ON postagem_feed
+    BEGIN
+        INSERT INTO postagem_feed_fts(postagem_feed_fts, rowid, descricao)
+        VALUES ('delete', OLD.id_postagem_feed, OLD.descricao);
+        INSERT INTO postagem_feed_fts(rowid, descricao)
+        VALUES (NEW.id_postagem_feed, NEW.descricao);
+    END;
+    """,
+]
+
+# Reconstrói o índice a partir da tabela (bancos existentes ou reparo)
+RECONSTRUIR_FTS = """
+INSERT INTO postagem_feed_fts(postagem_feed_fts) VALUES ('rebuild');
+"""
+
+# Bancos criados antes do contador desnormalizado recebem a coluna via ALTER TABLE
+ADICIONAR_COLUNA_TOTAL_CURTIDAS = """
+ALTER TABLE postagem_feed
+ADD COLUMN total_curtidas INTEGER NOT NULL DEFAULT 0;
+"""
+
 INSERIR = """
 INSERT INTO postagem_feed (id_tutor, descricao)
 VALUES (?, ?);
@@ -55,6 +110,12 @@ SET visualizacoes = visualizacoes + 1
 WHERE id_postagem_feed = ?;
 """
 
+INCREMENTAR_VISUALIZACOES_EM_LOTE = """
+UPDATE postagem_feed
+SET visualizacoes = visualizacoes + ?
+WHERE id_postagem_feed = ?;
+"""
+
 IMPORTAR = """
 INSERT INTO postagem_feed (id_postagem_feed, id_tutor, descricao, data_postagem, visualizacoes)
 VALUES (?, ?, ?, ?, ?);
@@ -67,6 +128,7 @@ SELECT
     pf.descricao,
     pf.data_postagem,
     pf.visualizacoes,
+    pf.total_curtidas,
     u.nome as nome_tutor,
     t.quantidade_pets
 FROM postagem_feed pf
@@ -83,6 +145,7 @@ SELECT
     pf.descricao,
     pf.data_postagem,
     pf.visualizacoes,
+    pf.total_curtidas,
     u.nome as nome_tutor,
     t.quantidade_pets
 FROM postagem_feed pf
@@ -92,6 +155,30 @@ ORDER BY pf.data_postagem DESC
 LIMIT ? OFFSET ?;
 """
 
+# Paginação por cursor (keyset) em (data_postagem, id_postagem_feed).
+# {filtro} recebe a condição do cursor e {ordem} é DESC ao avançar ou ASC
+# ao voltar uma página.
+OBTER_PAGINA_CURSOR_COM_DADOS = """
+SELECT
+    pf.id_postagem_feed,
+    pf.id_tutor,
+    pf.descricao,
+    pf.data_postagem,
+    pf.visualizacoes,
+    pf.total_curtidas,
+    u.nome as nome_tutor,
+    t.quantidade_pets
+FROM postagem_feed pf
+JOIN tutor t ON pf.id_tutor = t.id_tutor
+JOIN usuario u ON t.id_tutor = u.id_usuario
+WHERE {filtro}
+ORDER BY pf.data_postagem {ordem}, pf.id_postagem_feed {ordem}
+LIMIT ?;
+"""
+
+FILTRO_CURSOR_APOS = "(pf.data_postagem, pf.id_postagem_feed) < (?, ?)"
+FILTRO_CURSOR_ANTES = "(pf.data_postagem, pf.id_postagem_feed) > (?, ?)"
+
 CONTAR_TOTAL = """
 SELECT COUNT(*) as total
 FROM postagem_feed;
@@ -104,6 +191,7 @@ SELECT
     pf.descricao,
     pf.data_postagem,
     pf.visualizacoes,
+    pf.total_curtidas,
     u.id_usuario,
     u.nome as nome_tutor,
     u.email as email_tutor,
@@ -115,6 +203,9 @@ JOIN usuario u ON t.id_tutor = u.id_usuario
 WHERE pf.id_postagem_feed = ?;
 """
 
+# Busca no índice FTS5 ordenada por relevância (bm25).
+# Parâmetros: marcador inicial, marcador final, consulta MATCH,
+# id_tutor (ou NULL para todos) repetido, limite.
 BUSCAR_POR_TERMO = """
 SELECT
     pf.id_postagem_feed,
@@ -122,12 +213,26 @@ SELECT
     pf.descricao,
     pf.data_postagem,
     pf.visualizacoes,
+    pf.total_curtidas,
     u.nome as nome_tutor,
-    t.quantidade_pets
-FROM postagem_feed pf
+    t.quantidade_pets,
+    snippet(postagem_feed_fts, 0, ?, ?, '…', 24) as trecho
+FROM postagem_feed_fts
+JOIN postagem_feed pf ON pf.id_postagem_feed = postagem_feed_fts.rowid
 JOIN tutor t ON pf.id_tutor = t.id_tutor
 JOIN usuario u ON t.id_tutor = u.id_usuario
-WHERE pf.descricao LIKE ?
-ORDER BY pf.data_postagem DESC
+WHERE postagem_feed_fts MATCH ?
+AND (? IS NULL OR pf.id_tutor = ?)
+ORDER BY bm25(postagem_feed_fts)
 LIMIT ?;
-"""
\ No newline at end of file
+"""
+
+# Reconstrói o contador desnormalizado a partir da tabela curtida_feed
+RECALCULAR_TOTAL_CURTIDAS = """
+UPDATE postagem_feed
+SET total_curtidas = (
+    SELECT COUNT(*)
+    FROM curtida_feed cf
+    WHERE cf.id_postagem_feed = postagem_feed.id_postagem_feed
+);
+"""
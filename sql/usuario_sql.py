@@ -95,7 +95,8 @@ SELECT
     telefone, 
     perfil, 
     token_redefinicao, 
-    data_token
+    data_token,
+    data_cadastro
 FROM usuario
 WHERE token_redefinicao=? AND data_token > datetime('now')
 """
@@ -0,0 +1,5 @@
+OBTER_VERSAO = """
+SELECT versao
+FROM versao_dados
+WHERE tag = ?;
+"""
@@ -0,0 +1,172 @@
+import gzip
+import json
+from io import BytesIO
+
+import pytest
+from PIL import Image
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from util import assets
+from util.assets import ManifestoAssets, construir_assets, minificar_css, minificar_js
+from util.static_files import (
+    CACHE_CONTROL_IMAGENS,
+    CACHE_CONTROL_IMUTAVEL,
+    CACHE_CONTROL_REVALIDAR,
+    StaticFilesComCache,
+)
+
+CSS = "body { color: #333; }\n" * 100
+
+
+@pytest.fixture
+def diretorio_static(tmp_path):
+    (tmp_path / "css").mkdir()
+    (tmp_path / "css" / "base.css").write_text(CSS)
+    (tmp_path / "img").mkdir()
+    (tmp_path / "img" / "logo.png").write_bytes(b"\x89PNG")
+    return tmp_path
+
+
+def criar_jpeg(largura: int, altura: int) -> bytes:
+    buffer = BytesIO()
+    Image.new("RGB", (largura, altura), (200, 120, 40)).save(buffer, format="JPEG")
+    return buffer.getvalue()
+
+
+@pytest.fixture
+def cliente(diretorio_static):
+    app = FastAPI()
+    app.mount("/static", StaticFilesComCache(directory=str(diretorio_static)), name="static")
+    return TestClient(app)
+
+
+class TestConstruirAssets:
+    def test_manifesto_aponta_para_arquivo_versionado(self, diretorio_static):
+        # Act
+        manifesto = construir_assets(diretorio_static)
+        # Assert
+        versionado = manifesto["css/base.css"]
+        assert versionado.startswith("dist/css/base.") and versionado.endswith(".css")
+        assert (diretorio_static / versionado).read_text() == minificar_css(CSS)
+        assert gzip.decompress((diretorio_static / f"{versionado}.gz").read_bytes()).decode() == minificar_css(CSS)
+        salvo = json.loads((diretorio_static / "dist" / "manifest.json").read_text())
+        assert salvo == manifesto
+
+    def test_resolver_sem_build_usa_caminho_original(self, diretorio_static):
+        # Arrange
+        manifesto = ManifestoAssets(diretorio_static)
+        # Act / Assert
+        assert manifesto.resolver("css/base.css") == "css/base.css"
+        construir_assets(diretorio_static)
+        assert manifesto.carregar()["css/base.css"] == manifesto.resolver("/css/base.css")
+
+    def test_build_mantem_arquivos_dos_builds_anteriores(self, diretorio_static):
+        # Arrange
+        css = diretorio_static / "css" / "base.css"
+        versoes = []
+        # Act
+        for cor in ("#111", "#222", "#333"):
+            css.write_text(f"body {{ color: {cor}; }}\n" * 100)
+            versoes.append(construir_assets(diretorio_static, manter_builds=2)["css/base.css"])
+        # Assert
+        assert not (diretorio_static / versoes[0]).exists(), "O build mais antigo deveria ter sido removido"
+        assert not (diretorio_static / f"{versoes[0]}.gz").exists()
+        assert (diretorio_static / versoes[1]).exists(), "O build anterior deveria continuar disponível"
+        assert (diretorio_static / f"{versoes[1]}.gz").exists()
+        assert (diretorio_static / versoes[2]).exists()
+
+    def test_manifesto_recarregado_apos_novo_build(self, diretorio_static):
+        # Arrange
+        manifesto = ManifestoAssets(diretorio_static, intervalo_segundos=0)
+        anterior = construir_assets(diretorio_static)["css/base.css"]
+        assert manifesto.resolver("css/base.css") == anterior
+        (diretorio_static / "css" / "base.css").write_text("body { margin: 0; }")
+        # Act
+        novo = construir_assets(diretorio_static)["css/base.css"]
+        # Assert
+        assert novo != anterior
+        assert manifesto.resolver("css/base.css") == novo
+
+    def test_pacote_junta_arquivos_na_ordem(self, diretorio_static):
+        # Arrange
+        (diretorio_static / "css" / "pagina.css").write_text(".pagina { margin: 0; }")
+        pacotes = {"tela.css": ("css/base.css", "css/pagina.css")}
+        # Act
+        manifesto = construir_assets(diretorio_static, pacotes=pacotes)
+        # Assert
+        conteudo = (diretorio_static / manifesto["pacotes/tela.css"]).read_text()
+        assert conteudo == minificar_css(CSS) + "\n.pagina{margin:0}"
+
+    def test_pacote_sem_build_usa_arquivos_originais(self, diretorio_static, monkeypatch):
+        # Arrange
+        monkeypatch.setattr(assets, "PACOTES", {"tela.js": ("js/a.js", "js/b.js")})
+        monkeypatch.setattr(assets, "manifesto_assets", ManifestoAssets(diretorio_static))
+        # Act
+        urls = assets.pacote("tela.js")
+        # Assert
+        assert urls == ["/static/js/a.js", "/static/js/b.js"]
+
+    def test_imagens_recomprimidas_e_referenciadas_no_css(self, diretorio_static, monkeypatch):
+        # Arrange
+        (diretorio_static / "img" / "banners").mkdir()
+        (diretorio_static / "img" / "banners" / "banner1.jpg").write_bytes(criar_jpeg(2400, 800))
+        (diretorio_static / "css" / "fundo.css").write_text(".fundo { background: url('/static/img/banners/banner1.webp'); }")
+        monkeypatch.setattr(assets, "manifesto_assets", ManifestoAssets(diretorio_static))
+        # Act
+        manifesto = construir_assets(diretorio_static, imagens=("img/banners",))
+        # Assert
+        with Image.open(diretorio_static / manifesto["img/banners/banner1.webp"]) as img:
+            assert img.format == "WEBP"
+            assert img.size == (assets.LARGURA_MAXIMA_IMAGEM, 640)
+        css = (diretorio_static / manifesto["css/fundo.css"]).read_text()
+        assert f"url('/static/{manifesto['img/banners/banner1.webp']}')" in css
+        tipos = [tipo for _, tipo in assets.fontes_imagem("img/banners/banner1.jpg")]
+        assert "image/webp" in tipos
+        assert assets.fontes_imagem("img/logo.png") == []
+
+
+class TestMinificacao:
+    def test_css_remove_comentarios_e_espacos_preservando_strings(self):
+        # Arrange
+        css = "/* titulo */\n.a > .b ,\n.c {\n  content: \"  /* x */  \";\n  color : red;\n}\n"
+        # Act
+        resultado = minificar_css(css)
+        # Assert
+        assert resultado == '.a>.b,.c{content:"  /* x */  ";color :red}'
+
+    def test_js_remove_comentarios_sem_juntar_linhas(self):
+        # Arrange
+        js = "// inicio\nfunction f() {\n    /* bloco */ return 'a // b'; // fim\n\n    }\n"
+        # Act
+        resultado = minificar_js(js)
+        # Assert
+        assert resultado == "function f() {\nreturn 'a // b';\n}"
+
+
+class TestStaticFilesComCache:
+    def test_serve_versao_gzip_quando_aceita(self, diretorio_static, cliente):
+        # Arrange
+        versionado = construir_assets(diretorio_static)["css/base.css"]
+        # Act
+        comprimida = cliente.get(f"/static/{versionado}", headers={"Accept-Encoding": "gzip"})
+        original = cliente.get(f"/static/{versionado}", headers={"Accept-Encoding": "identity"})
+        # Assert
+        assert comprimida.headers["Content-Encoding"] == "gzip"
+        assert comprimida.headers["Content-Type"].startswith("text/css")
+        assert comprimida.text == minificar_css(CSS)
+        assert "Content-Encoding" not in original.headers
+        assert comprimida.headers["Vary"] == original.headers["Vary"] == "Accept-Encoding"
+        assert comprimida.headers["Cache-Control"] == CACHE_CONTROL_IMUTAVEL
+        assert comprimida.headers["ETag"] != original.headers["ETag"]
+
+    def test_politica_de_cache_por_classe(self, cliente):
+        # Act
+        css = cliente.get("/static/css/base.css")
+        imagem = cliente.get("/static/img/logo.png")
+        revalidacao = cliente.get("/static/css/base.css", headers={"If-None-Match": css.headers["ETag"]})
+        # Assert
+        assert css.headers["Cache-Control"] == CACHE_CONTROL_REVALIDAR
+        assert imagem.headers["Cache-Control"] == CACHE_CONTROL_IMAGENS
+        assert revalidacao.status_code == 304
+        assert revalidacao.content == b""
@@ -0,0 +1,170 @@
+import time
+
+from fastapi import FastAPI, Request
+from fastapi.responses import HTMLResponse
+from fastapi.testclient import TestClient
+from starlette.middleware.sessions import SessionMiddleware
+
+from util import cache_util
+from util.cache_util import CacheTTL, cache_resposta, invalida_cache, invalidar_tags
+
+
+class TestCacheTTL:
+    def test_entrada_expira_apos_ttl(self):
+        # Arrange
+        cache = CacheTTL(ttl_segundos=0.01)
+        cache.definir("chave", 1)
+        # Act
+        time.sleep(0.02)
+        encontrado, _ = cache.obter("chave")
+        # Assert
+        assert encontrado is False, "A entrada deveria expirar"
+
+    def test_obter_ou_calcular_usa_valor_em_cache(self):
+        # Arrange
+        cache = CacheTTL(ttl_segundos=60)
+        chamadas = []
+
+        def calcular():
+            chamadas.append(1)
+            return 42
+
+        # Act
+        primeiro = cache.obter_ou_calcular("total", calcular)
+        segundo = cache.obter_ou_calcular("total", calcular)
+        # Assert
+        assert primeiro == segundo == 42
+        assert len(chamadas) == 1, "O valor deveria ser calculado uma única vez"
+
+    def test_valor_calculado_durante_invalidacao_nao_e_armazenado(self):
+        # Arrange
+        cache = CacheTTL(ttl_segundos=60)
+
+        def calcular_com_escrita_concorrente():
+            invalidar_tags("posts")
+            return "antigo"
+
+        # Act
+        valor = cache.obter_ou_calcular("total", calcular_com_escrita_concorrente, ["posts"])
+        # Assert
+        assert valor == "antigo"
+        assert cache.obter("total")[0] is False, "O valor calculado antes da escrita não deveria voltar ao cache"
+
+    def test_invalidar_tags_remove_apenas_entradas_relacionadas(self):
+        # Arrange
+        cache = CacheTTL(ttl_segundos=60)
+        cache.definir("home", "html", tags=["artigos", "posts"])
+        cache.definir("petgram", "html", tags=["posts"])
+        cache.definir("sobre", "html")
+        # Act
+        invalidar_tags("artigos")
+        # Assert
+        assert cache.obter("home")[0] is False
+        assert cache.obter("petgram")[0] is True
+        assert cache.obter("sobre")[0] is True
+
+    def test_invalida_cache_notifica_ouvintes(self):
+        # Arrange
+        recebidas = []
+        cache_util.registrar_ouvinte(recebidas.append)
+        cache = CacheTTL(ttl_segundos=60)
+        cache.definir("lista", [1], tags=["categorias"])
+
+        @invalida_cache("categorias")
+        def gravar():
+            return True
+
+        # Act
+        resultado = gravar()
+        # Assert
+        assert resultado is True
+        assert ("categorias",) in recebidas
+        assert cache.obter("lista")[0] is False
+        cache_util._ouvintes.remove(recebidas.append)
+
+
+    def test_ouvintes_atualizados_antes_de_descartar_entradas(self):
+        # Arrange
+        cache = CacheTTL(ttl_segundos=60)
+        cache.definir("pagina", "html", tags=["categorias"])
+        vistos = []
+
+        def ouvinte(tags):
+            vistos.append(cache.obter("pagina")[0])
+
+        cache_util.registrar_ouvinte(ouvinte)
+        # Act
+        invalidar_tags("categorias")
+        # Assert
+        cache_util._ouvintes.remove(ouvinte)
+        assert vistos == [True], "O ouvinte deveria rodar antes de a entrada ser descartada"
+        assert cache.obter("pagina")[0] is False
+
+
+class TestCacheResposta:
+    def _criar_app(self, contador):
+        app = FastAPI()
+        app.add_middleware(SessionMiddleware, secret_key="teste")
+
+        @app.get("/pagina")
+        @cache_resposta("artigos")
+        async def pagina(request: Request):
+            contador.append(1)
+            return HTMLResponse(f"<p>{len(contador)}</p>")
+
+        @app.get("/entrar")
+        async def entrar(request: Request):
+            request.session["usuario"] = {"id": 1}
+            return HTMLResponse("ok")
+
+        return app
+
+    def test_visitante_anonimo_recebe_resposta_em_cache(self):
+        # Arrange
+        cache_util.cache_respostas.invalidar()
+        contador = []
+        cliente = TestClient(self._criar_app(contador))
+        # Act
+        primeira = cliente.get("/pagina")
+        segunda = cliente.get("/pagina")
+        invalidar_tags("artigos")
+        terceira = cliente.get("/pagina")
+        # Assert
+        assert primeira.headers["X-Cache"] == "MISS"
+        assert segunda.headers["X-Cache"] == "HIT"
+        assert segunda.text == primeira.text
+        assert terceira.text == "<p>2</p>", "A invalidação deveria forçar nova renderização"
+
+    def test_usuario_logado_nao_usa_cache(self):
+        # Arrange
+        cache_util.cache_respostas.invalidar()
+        contador = []
+        cliente = TestClient(self._criar_app(contador))
+        cliente.get("/pagina")
+        cliente.get("/entrar")
+        # Act
+        resposta = cliente.get("/pagina")
+        # Assert
+        assert "X-Cache" not in resposta.headers
+        assert resposta.text == "<p>2</p>"
+
+    def test_pagina_renderizada_durante_invalidacao_nao_e_armazenada(self):
+        # Arrange
+        cache_util.cache_respostas.invalidar()
+        contador = []
+        app = FastAPI()
+
+        @app.get("/lenta")
+        @cache_resposta("usuarios")
+        async def lenta(request: Request):
+            contador.append(1)
+            invalidar_tags("usuarios")  # escrita concorrente durante a renderização
+            return HTMLResponse(f"<p>{len(contador)}</p>")
+
+        cliente = TestClient(app)
+        # Act
+        primeira = cliente.get("/lenta")
+        segunda = cliente.get("/lenta")
+        # Assert
+        assert "X-Cache" not in primeira.headers
+        assert segunda.text == "<p>2</p>", "A página desatualizada não deveria ter sido armazenada"
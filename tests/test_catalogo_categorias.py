@@ -0,0 +1,78 @@
+import time
+
+import pytest
+
+from model.categoria_artigo_model import CategoriaArtigo
+from repo import categoria_artigo_repo
+from util.catalogo_categorias import catalogo_categorias
+from util.db_util import get_connection
+from util.migracoes import migrar
+from util.versao_dados import AtualizacaoPeriodica, atualizacao_periodica
+
+
+class TestCatalogoCategorias:
+    @pytest.fixture(autouse=True)
+    def setup(self, test_db):
+        categoria_artigo_repo.criar_tabela()
+        catalogo_categorias.carregar()
+        yield
+        catalogo_categorias.descartar()
+
+    def test_categorias_ordenadas_por_nome(self, test_db):
+        # Arrange
+        categoria_artigo_repo.inserir(CategoriaArtigo(0, "Vacinação", "#111111"))
+        categoria_artigo_repo.inserir(CategoriaArtigo(0, "Alimentação", "#222222"))
+        # Act
+        categorias = catalogo_categorias.obter_todas()
+        # Assert
+        assert [c.nome for c in categorias] == ["Alimentação", "Vacinação"]
+        assert catalogo_categorias.obter_por_id(categorias[1].id_categoria_artigo).nome == "Vacinação"
+        assert catalogo_categorias.obter_por_id(999) is None
+
+    def test_escrita_no_repositorio_recarrega_catalogo(self, test_db):
+        # Arrange
+        id_categoria = categoria_artigo_repo.inserir(CategoriaArtigo(0, "Saúde", "#333333"))
+        versao_inicial = catalogo_categorias.versao
+        # Act
+        categoria_artigo_repo.atualizar(CategoriaArtigo(id_categoria, "Saúde Animal", "#333333"))
+        # Assert
+        assert catalogo_categorias.obter_por_id(id_categoria).nome == "Saúde Animal"
+        assert catalogo_categorias.versao != versao_inicial, "A versão deveria mudar após a alteração"
+
+    def test_versao_estavel_sem_alteracoes(self, test_db):
+        # Arrange
+        categoria_artigo_repo.inserir(CategoriaArtigo(0, "Comportamento", "#444444"))
+        versao = catalogo_categorias.versao
+        # Act
+        catalogo_categorias.carregar()
+        # Assert
+        assert catalogo_categorias.versao == versao
+
+    def test_alteracao_feita_por_outro_processo_recarrega_catalogo(self, test_db):
+        # Arrange
+        migrar()
+        id_categoria = categoria_artigo_repo.inserir(CategoriaArtigo(0, "Nutrição", "#555555"))
+        versao_inicial = catalogo_categorias.versao
+        # Act: escrita direta no banco, sem o ouvinte de invalidação deste processo
+        with get_connection() as conn:
+            conn.execute("UPDATE categoria_artigo SET nome = ? WHERE id_categoria_artigo = ?", ("Dieta", id_categoria))
+        assert catalogo_categorias.obter_por_id(id_categoria).nome == "Nutrição", "A leitura não deveria consultar o banco"
+        atualizacao_periodica.executar_uma_vez()
+        # Assert
+        assert catalogo_categorias.obter_por_id(id_categoria).nome == "Dieta"
+        assert catalogo_categorias.versao != versao_inicial
+
+
+class TestAtualizacaoPeriodica:
+    def test_thread_executa_verificacoes_registradas(self):
+        # Arrange
+        atualizacao = AtualizacaoPeriodica(intervalo_segundos=0.01)
+        execucoes = []
+        atualizacao.registrar(lambda: execucoes.append(1))
+        # Act
+        atualizacao.iniciar()
+        time.sleep(0.2)
+        atualizacao.parar()
+        # Assert
+        assert len(execucoes) >= 2
+        assert not atualizacao.em_execucao()
@@ -300,3 +300,55 @@ class TestCurtidaArtigoRepo:
 
         # Assert
         assert curtida is None, "Curtida inexistente deveria retornar None"
+
+    def test_contar_curtidas_por_artigos(self, test_db):
+        """Testa contagem de curtidas de vários artigos em uma consulta"""
+        # Arrange
+        usuario_repo.criar_tabela()
+        veterinario_repo.criar_tabela()
+        categoria_artigo_repo.criar_tabela()
+        postagem_artigo_repo.criar_tabela()
+        curtida_artigo_repo.criar_tabela()
+
+        veterinario = Veterinario(
+            0, "Dr. Lote", "dr.lote@vet.com", "vet123", "987654321",
+            "veterinario", None, None, None, "54321-SP", True, None,
+        )
+        id_veterinario = veterinario_repo.inserir(veterinario)
+        id_categoria = categoria_artigo_repo.inserir(CategoriaArtigo(0, "Saúde", "#FF0000"))
+        ids_postagens = []
+        for i in range(3):
+            postagem = PostagemArtigo(
+                0, id_veterinario, f"Artigo {i}", "Conteúdo", id_categoria,  # type: ignore[arg-type]
+                datetime.today().date(), 0,
+            )
+            ids_postagens.append(postagem_artigo_repo.inserir(postagem))
+
+        for i in range(2):
+            id_usuario = usuario_repo.inserir(
+                Usuario(0, f"Leitor{i}", f"leitor{i}@example.com", "senha", "111111111",
+                        "tutor", None, None, None)
+            )
+            curtida_artigo_repo.inserir(CurtidaArtigo(id_usuario, ids_postagens[0], datetime.now()))  # type: ignore[arg-type]  # noqa: E501
+        curtida_artigo_repo.inserir(CurtidaArtigo(id_usuario, ids_postagens[1], datetime.now()))  # type: ignore[arg-type]  # noqa: E501
+
+        # Act
+        totais = curtida_artigo_repo.contar_curtidas_por_artigos(ids_postagens)
+
+        # Assert
+        assert totais == {
+            ids_postagens[0]: 2,
+            ids_postagens[1]: 1,
+            ids_postagens[2]: 0,
+        }, "Cada artigo deveria ter sua contagem, inclusive os sem curtidas"
+
+    def test_contar_curtidas_por_artigos_lista_vazia(self, test_db):
+        """Testa contagem em lote sem IDs"""
+        # Arrange
+        curtida_artigo_repo.criar_tabela()
+
+        # Act
+        totais = curtida_artigo_repo.contar_curtidas_por_artigos([])
+
+        # Assert
+        assert totais == {}, "Lista vazia deveria retornar dicionário vazio"
@@ -256,3 +256,35 @@ class TestCurtidaFeedRepo:
         assert (
             resultado.data_curtida is not None
         ), "A data da curtida retornada não deveria ser None"
+
+    def test_contar_curtidas_por_postagens(self, test_db):
+        # Arrange
+        usuario_repo.criar_tabela()
+        tutor_repo.criar_tabela()
+        postagem_feed_repo.criar_tabela()
+        curtida_feed_repo.criar_tabela()
+
+        tutor = tutor_model.Tutor(
+            0, "Tutor Lote", "tutor_lote@gmail.com", "senha123", "12345678941",
+            "tutor", None, None, None, 1, "Um cão",
+        )
+        tutor_id = tutor_repo.inserir(tutor)
+        assert tutor_id is not None
+        ids_postagens = [
+            postagem_feed_repo.inserir(
+                postagem_feed_model.PostagemFeed(0, tutor_id, f"Post {i}", date.today())
+            )
+            for i in range(2)
+        ]
+        curtida_feed_repo.inserir(
+            curtida_feed_model.CurtidaFeed(id_usuario=tutor_id, id_postagem_feed=ids_postagens[0])
+        )
+
+        # Act
+        totais = curtida_feed_repo.contar_curtidas_por_postagens(ids_postagens)  # type: ignore[arg-type]  # noqa: E501
+
+        # Assert
+        assert totais == {
+            ids_postagens[0]: 1,
+            ids_postagens[1]: 0,
+        }, "A contagem em lote deveria incluir postagens sem curtidas"
@@ -0,0 +1,137 @@
+import asyncio
+import sqlite3
+import threading
+from datetime import datetime
+
+import pytest
+
+from model.postagem_feed_model import PostagemFeed
+from model.tutor_model import Tutor
+from repo import postagem_feed_repo, postagem_feed_repo_async, tutor_repo, usuario_repo
+from util.db_async import BancoAssincrono, fechar_banco_async
+
+# Consulta que só termina se for interrompida
+CONSULTA_INFINITA = "WITH RECURSIVE c(x) AS (SELECT 1 UNION ALL SELECT x + 1 FROM c) SELECT count(*) FROM c"
+
+
+@pytest.fixture
+def banco(test_db):
+    banco = BancoAssincrono(test_db, leitores=1)
+    yield banco
+    banco.fechar()
+
+
+def criar_posts(quantidade: int) -> list:
+    usuario_repo.criar_tabela()
+    tutor_repo.criar_tabela()
+    postagem_feed_repo.criar_tabela()
+    id_tutor = tutor_repo.inserir(Tutor(
+        0, "Tutor Async", "tutor_async@email.com", "123", "999999999",
+        "tutor", None, None, None, 1, "Um cão",
+    ))
+    return [
+        postagem_feed_repo.inserir(PostagemFeed(0, id_tutor, f"Post {i}", datetime.now()))  # type: ignore[arg-type]
+        for i in range(quantidade)
+    ]
+
+
+class TestBancoAssincrono:
+    def test_escrita_e_leitura(self, banco):
+        # Arrange
+        async def cenario():
+            await banco.executar("CREATE TABLE t (id INTEGER PRIMARY KEY, nome TEXT)")
+            inseridas = await banco.executar("INSERT INTO t (nome) VALUES (?)", ("a",))
+            return inseridas, await banco.consultar("SELECT * FROM t"), await banco.consultar_um("SELECT * FROM t WHERE id = 2")
+        # Act
+        inseridas, linhas, inexistente = asyncio.run(cenario())
+        # Assert
+        assert inseridas == 1
+        assert linhas == [{"id": 1, "nome": "a"}]
+        assert inexistente is None
+
+    def test_leitor_recusa_escrita(self, banco):
+        # Arrange
+        async def cenario():
+            await banco.executar("CREATE TABLE t (id INTEGER PRIMARY KEY)")
+            await banco.ler(lambda conn: conn.execute("INSERT INTO t DEFAULT VALUES"))
+        # Act / Assert
+        with pytest.raises(sqlite3.OperationalError):
+            asyncio.run(cenario())
+
+    def test_escrita_com_erro_e_desfeita(self, banco):
+        # Arrange
+        def escrever_e_falhar(conn):
+            conn.execute("INSERT INTO t DEFAULT VALUES")
+            raise ValueError("falha")
+
+        async def cenario():
+            await banco.executar("CREATE TABLE t (id INTEGER PRIMARY KEY)")
+            with pytest.raises(ValueError):
+                await banco.escrever(escrever_e_falhar)
+            return await banco.consultar_um("SELECT count(*) AS total FROM t")
+        # Act
+        resultado = asyncio.run(cenario())
+        # Assert
+        assert resultado["total"] == 0
+
+    def test_cancelamento_interrompe_consulta_em_execucao(self, banco):
+        # Arrange
+        async def cenario():
+            tarefa = asyncio.ensure_future(banco.consultar(CONSULTA_INFINITA))
+            await asyncio.sleep(0.1)
+            tarefa.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await tarefa
+            # O leitor continua utilizável depois da interrupção
+            return await asyncio.wait_for(banco.consultar_um("SELECT 1 AS um"), timeout=5)
+        # Act
+        resultado = asyncio.run(cenario())
+        # Assert
+        assert resultado == {"um": 1}
+        assert banco.leitores[0].metricas()["interrompidas"] == 1
+
+    def test_cancelamento_descarta_consulta_na_fila(self, banco):
+        # Arrange
+        liberar = threading.Event()
+        executou = []
+
+        async def cenario():
+            ocupada = asyncio.ensure_future(banco.ler(lambda conn: liberar.wait(5)))
+            na_fila = asyncio.ensure_future(banco.ler(lambda conn: executou.append(True)))
+            await asyncio.sleep(0.05)
+            na_fila.cancel()
+            await asyncio.sleep(0.05)
+            liberar.set()
+            await ocupada
+            await banco.consultar_um("SELECT 1")
+        # Act
+        asyncio.run(cenario())
+        # Assert
+        assert executou == []
+        assert banco.leitores[0].metricas()["descartadas"] == 1
+
+
+class TestPostagemFeedRepoAsync:
+    def test_espelha_repositorio_sincrono(self, test_db):
+        # Arrange
+        criar_posts(5)
+
+        async def cenario():
+            try:
+                pagina = await postagem_feed_repo_async.obter_pagina_cursor_com_dados(2)
+                seguinte = await postagem_feed_repo_async.obter_pagina_cursor_com_dados(2, apos=pagina.cursor_proximo)
+                return (
+                    await postagem_feed_repo_async.obter_pagina_com_dados(1, 3),
+                    pagina,
+                    seguinte,
+                    await postagem_feed_repo_async.contar_total(),
+                )
+            finally:
+                fechar_banco_async()
+        # Act
+        por_pagina, pagina, seguinte, total = asyncio.run(cenario())
+        # Assert
+        assert por_pagina == postagem_feed_repo.obter_pagina_com_dados(1, 3)
+        assert pagina == postagem_feed_repo.obter_pagina_cursor_com_dados(2)
+        assert seguinte == postagem_feed_repo.obter_pagina_cursor_com_dados(2, apos=pagina.cursor_proximo)
+        assert total == postagem_feed_repo.contar_total() == 5
@@ -0,0 +1,147 @@
+import dataclasses
+import os
+import time
+
+import pytest
+
+from config.db_config import PERFIS, obter_perfil
+from util import db_benchmark, db_util
+from util.db_manutencao import ManutencaoBanco, analisar, checkpoint
+from util.db_util import get_connection, get_connection_leitura
+from util.migracoes import migrar
+
+
+@pytest.fixture
+def perfil_desempenho():
+    original = db_util.perfil_banco
+    db_util.definir_perfil(PERFIS["desempenho"])
+    yield PERFIS["desempenho"]
+    db_util.definir_perfil(original)
+
+
+class TestPerfilBanco:
+    def test_perfil_escolhido_por_variavel_de_ambiente(self, monkeypatch):
+        # Arrange
+        monkeypatch.setenv("DATABASE_PERFIL", "Economico")
+        # Act
+        perfil = obter_perfil()
+        # Assert
+        assert perfil is PERFIS["economico"]
+
+    def test_perfil_desconhecido(self):
+        # Act / Assert
+        with pytest.raises(ValueError):
+            obter_perfil("turbo")
+
+    def test_pragmas_do_perfil_aplicados_nas_conexoes(self, test_db, perfil_desempenho):
+        # Act
+        with get_connection() as conn:
+            escrita = {
+                nome: conn.execute(f"PRAGMA {nome}").fetchone()[0]
+                for nome in ("wal_autocheckpoint", "busy_timeout", "synchronous", "cache_size")
+            }
+        with get_connection_leitura() as conn:
+            mmap = conn.execute("PRAGMA mmap_size").fetchone()[0]
+        # Assert
+        assert escrita["wal_autocheckpoint"] == perfil_desempenho.wal_autocheckpoint
+        assert escrita["busy_timeout"] == int(db_util.DB_TIMEOUT * 1000), "Sem valor no perfil vale DATABASE_TIMEOUT"
+        assert escrita["synchronous"] == 1  # NORMAL
+        assert escrita["cache_size"] == -perfil_desempenho.cache_kb
+        assert mmap == perfil_desempenho.mmap_bytes
+
+    def test_busy_timeout_explicito_no_perfil(self, test_db):
+        # Arrange
+        original = db_util.perfil_banco
+        db_util.definir_perfil(dataclasses.replace(original, busy_timeout_ms=1234))
+        try:
+            # Act
+            with get_connection() as conn:
+                busy_timeout = conn.execute("PRAGMA busy_timeout").fetchone()[0]
+        finally:
+            db_util.definir_perfil(original)
+        # Assert
+        assert busy_timeout == 1234
+
+    def test_troca_de_perfil_recria_o_escritor(self, test_db):
+        # Arrange
+        original = db_util.perfil_banco
+        escritor_anterior = db_util.obter_escritor()
+        # Act
+        db_util.definir_perfil(PERFIS["desempenho"])
+        try:
+            escritor = db_util.obter_escritor()
+            wal_autocheckpoint = escritor.executar(lambda conn: conn.execute("PRAGMA wal_autocheckpoint").fetchone()[0])
+        finally:
+            db_util.definir_perfil(original)
+        # Assert
+        assert escritor is not escritor_anterior
+        assert wal_autocheckpoint == PERFIS["desempenho"].wal_autocheckpoint
+
+
+class TestManutencao:
+    def test_analisar_gera_estatisticas(self, test_db):
+        # Arrange
+        migrar()
+        # Act
+        analisar()
+        # Assert
+        with get_connection() as conn:
+            assert conn.execute("SELECT name FROM sqlite_master WHERE name = 'sqlite_stat1'").fetchone()
+
+    def test_checkpoint_trunca_wal(self, test_db):
+        # Arrange
+        with get_connection() as conn:
+            conn.execute("CREATE TABLE t (x TEXT)")
+            conn.executemany("INSERT INTO t VALUES (?)", [("x" * 1000,)] * 100)
+        assert os.path.getsize(f"{test_db}-wal") > 0
+        # Act
+        resultado = checkpoint()
+        # Assert
+        assert resultado["bloqueado"] is False
+        assert os.path.getsize(f"{test_db}-wal") == 0
+
+    def test_manutencao_periodica(self, test_db):
+        # Arrange
+        manutencao = ManutencaoBanco(intervalo_segundos=0.01)
+        # Act
+        manutencao.iniciar()
+        time.sleep(0.2)
+        manutencao.parar()
+        # Assert
+        assert manutencao.execucoes >= 2
+        assert not manutencao.em_execucao()
+
+    def test_ultima_rodada_nao_recria_escritor(self, test_db):
+        # Arrange
+        migrar()
+        manutencao = ManutencaoBanco(intervalo_segundos=60)
+        manutencao.iniciar()
+        db_util.fechar_escritor()
+        # Act
+        manutencao.parar()
+        # Assert
+        assert db_util._escritor is None, "A rodada de encerramento não deveria passar pelo escritor"
+        assert manutencao.execucoes == 1
+
+    def test_manutencao_desativada_com_intervalo_zero(self, test_db):
+        # Arrange
+        manutencao = ManutencaoBanco(intervalo_segundos=0)
+        # Act
+        manutencao.iniciar()
+        # Assert
+        assert not manutencao.em_execucao()
+
+
+class TestBenchmark:
+    def test_mede_consultas_em_cada_perfil(self, test_db):
+        # Arrange
+        migrar()
+        perfil_original = db_util.perfil_banco
+        # Act
+        resultados = db_benchmark.medir(["economico", "padrao"], repeticoes=2)
+        # Assert
+        assert list(resultados) == ["economico", "padrao"]
+        assert set(resultados["padrao"]) == set(db_benchmark._consultas())
+        assert all(tempos["mediana"] >= 0 for tempos in resultados["padrao"].values())
+        assert db_util.perfil_banco is perfil_original
+        assert "busca de artigos" in db_benchmark.formatar(resultados)
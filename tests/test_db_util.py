@@ -0,0 +1,279 @@
+import json
+import sqlite3
+import threading
+
+import pytest
+
+from util import db_util
+from util.db_util import (
+    EscritorSerializado,
+    PoolConexoes,
+    get_connection,
+    get_connection_leitura,
+    serializar_escrita,
+    transacao,
+)
+from util.migracoes import migrar
+from util.security import verificar_senha
+
+
+class TestPoolConexoes:
+    def test_get_connection_reutiliza_conexao(self, test_db):
+        # Arrange
+        with get_connection() as conn:
+            primeira = conn
+        # Act
+        with get_connection() as conn:
+            segunda = conn
+        # Assert
+        assert primeira is segunda, "A conexão deveria ser reaproveitada pelo pool"
+        metricas = db_util.obter_metricas_pool()
+        assert metricas["criadas"] == 1
+        assert metricas["em_uso"] == 0
+
+    def test_pragmas_aplicados_na_conexao(self, test_db):
+        # Arrange / Act
+        with get_connection() as conn:
+            foreign_keys = conn.execute("PRAGMA foreign_keys").fetchone()[0]
+            journal_mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+        # Assert
+        assert foreign_keys == 1
+        assert journal_mode.lower() == "wal"
+
+    def test_rollback_em_erro_nao_contamina_pool(self, test_db):
+        # Arrange
+        with get_connection() as conn:
+            conn.execute("CREATE TABLE t (x INTEGER)")
+        # Act
+        with pytest.raises(RuntimeError):
+            with get_connection() as conn:
+                conn.execute("INSERT INTO t VALUES (1)")
+                raise RuntimeError("falha simulada")
+        # Assert
+        with get_connection() as conn:
+            assert not conn.in_transaction
+            total = conn.execute("SELECT COUNT(*) FROM t").fetchone()[0]
+        assert total == 0, "A inserção deveria ter sido desfeita"
+
+    def test_pool_limitado_gera_timeout(self, test_db):
+        # Arrange
+        pool = PoolConexoes(test_db, tamanho_maximo=1, timeout=0.05)
+        conn = pool.adquirir()
+        # Act / Assert
+        with pytest.raises(sqlite3.OperationalError):
+            pool.adquirir()
+        pool.devolver(conn)
+        assert pool.metricas()["timeouts"] == 1
+        pool.fechar()
+
+    def test_pool_aguarda_conexao_devolvida(self, test_db):
+        # Arrange
+        pool = PoolConexoes(test_db, tamanho_maximo=1, timeout=2)
+        conn = pool.adquirir()
+        threading.Timer(0.05, pool.devolver, args=(conn,)).start()
+        # Act
+        outra = pool.adquirir()
+        # Assert
+        assert outra is conn
+        metricas = pool.metricas()
+        assert metricas["esperas"] == 1
+        assert metricas["tempo_espera_maximo"] > 0
+        pool.devolver(outra)
+        pool.fechar()
+
+    def test_conexoes_ociosas_sao_descartadas(self, test_db):
+        # Arrange
+        pool = PoolConexoes(test_db, tamanho_maximo=2, tempo_ocioso_maximo=0.01)
+        pool.devolver(pool.adquirir())
+        threading.Event().wait(0.05)
+        # Act
+        pool.devolver(pool.adquirir())
+        # Assert
+        metricas = pool.metricas()
+        assert metricas["criadas"] == 2
+        assert metricas["descartadas"] == 1
+        pool.fechar()
+
+
+class TestConexoesLeitura:
+    def test_conexao_de_leitura_recusa_escrita(self, test_db):
+        # Arrange
+        with get_connection() as conn:
+            conn.execute("CREATE TABLE t (x INTEGER)")
+        # Act / Assert
+        with pytest.raises(sqlite3.OperationalError):
+            with get_connection_leitura() as conn:
+                conn.execute("INSERT INTO t VALUES (1)")
+
+    def test_pragmas_da_conexao_de_leitura(self, test_db):
+        # Act
+        with get_connection_leitura() as conn:
+            pragmas = {
+                nome: conn.execute(f"PRAGMA {nome}").fetchone()[0]
+                for nome in ("query_only", "cache_size", "mmap_size", "temp_store")
+            }
+        # Assert
+        assert pragmas["query_only"] == 1
+        assert pragmas["cache_size"] == -db_util.perfil_banco.cache_kb
+        assert pragmas["mmap_size"] == db_util.perfil_banco.mmap_bytes
+        assert pragmas["temp_store"] == 2  # MEMORY
+
+    def test_leitura_reutiliza_conexao_do_pool_de_leitura(self, test_db):
+        # Arrange
+        with get_connection_leitura() as conn:
+            primeira = conn
+        # Act
+        with get_connection_leitura() as conn:
+            segunda = conn
+        # Assert
+        assert primeira is segunda
+        metricas = db_util.obter_metricas_pool_leitura()
+        assert metricas["somente_leitura"] is True
+        assert metricas["criadas"] == 1
+
+    def test_leitura_dentro_de_transacao_enxerga_escrita_pendente(self, test_db):
+        # Arrange
+        with get_connection() as conn:
+            conn.execute("CREATE TABLE t (x INTEGER)")
+        # Act
+        with transacao() as conn:
+            conn.execute("INSERT INTO t VALUES (1)")
+            with get_connection_leitura() as leitura:
+                dentro = leitura.execute("SELECT COUNT(*) FROM t").fetchone()[0]
+            outra = db_util.get_connection_sem_commit()
+            fora = outra.execute("SELECT COUNT(*) FROM t").fetchone()[0]
+            outra.close()
+        # Assert
+        assert dentro == 1
+        assert fora == 0
+
+
+@pytest.fixture
+def escritor(test_db):
+    with get_connection() as conn:
+        conn.execute("CREATE TABLE t (x INTEGER UNIQUE)")
+    escritor = EscritorSerializado(test_db)
+    yield escritor
+    escritor.fechar()
+
+
+def inserir_valor(valor):
+    return lambda conn: conn.execute("INSERT INTO t VALUES (?)", (valor,)).lastrowid
+
+
+class TestEscritorSerializado:
+    def test_escritas_enfileiradas_sao_gravadas_em_um_lote(self, escritor):
+        # Arrange
+        iniciou, liberar = threading.Event(), threading.Event()
+        ocupada = escritor.enviar(lambda conn: iniciou.set() or liberar.wait(5))
+        iniciou.wait(5)
+        # Act
+        futuros = [escritor.enviar(inserir_valor(i)) for i in range(10)]
+        liberar.set()
+        resultados = [futuro.result(timeout=5) for futuro in futuros]
+        # Assert
+        assert ocupada.result() is True
+        assert resultados == list(range(1, 11))
+        metricas = escritor.metricas()
+        assert metricas["lotes"] == 2
+        assert metricas["maior_lote"] == 10
+        assert metricas["escritas"] == 11
+        assert metricas["na_fila"] == 0
+
+    def test_falha_desfaz_apenas_a_propria_escrita(self, escritor):
+        # Arrange
+        liberar = threading.Event()
+        escritor.enviar(lambda conn: liberar.wait(5))
+        # Act
+        primeira = escritor.enviar(inserir_valor(1))
+        repetida = escritor.enviar(inserir_valor(1))
+        segunda = escritor.enviar(inserir_valor(2))
+        liberar.set()
+        # Assert
+        assert primeira.result(timeout=5) and segunda.result(timeout=5)
+        with pytest.raises(sqlite3.IntegrityError):
+            repetida.result(timeout=5)
+        with get_connection() as conn:
+            assert [row[0] for row in conn.execute("SELECT x FROM t ORDER BY x")] == [1, 2]
+        assert escritor.metricas()["erros"] == 1
+
+    def test_escritas_concorrentes_sem_database_is_locked(self, test_db):
+        # Arrange
+        with get_connection() as conn:
+            conn.execute("CREATE TABLE t (x INTEGER UNIQUE)")
+
+        @serializar_escrita
+        def inserir(valor):
+            with get_connection() as conn:
+                conn.execute("INSERT INTO t VALUES (?)", (valor,))
+
+        erros = []
+
+        def trabalhar(inicio):
+            try:
+                for valor in range(inicio, inicio + 25):
+                    inserir(valor)
+            except sqlite3.Error as e:
+                erros.append(e)
+
+        threads = [threading.Thread(target=trabalhar, args=(i * 100,)) for i in range(8)]
+        # Act
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        # Assert
+        assert erros == []
+        with get_connection() as conn:
+            assert conn.execute("SELECT COUNT(*) FROM t").fetchone()[0] == 200
+        metricas = db_util.obter_metricas_escritor()
+        assert metricas["escritas"] == 200
+        assert metricas["latencia_maxima"] > 0
+        db_util.fechar_escritor()
+
+
+def escrever_json(diretorio, nome, dados):
+    (diretorio / nome).write_text(json.dumps(dados), encoding="utf-8")
+
+
+class TestImportacaoEmLote:
+    def test_importar_dados_de_diretorio(self, test_db, tmp_path):
+        # Arrange
+        migrar()
+        escrever_json(tmp_path, "admins.json", [
+            {"id_admin": i, "nome": f"Admin {i}", "email": f"admin{i}@teste.com", "senha": f"Senha@{i}"}
+            for i in range(1, 5)
+        ])
+        escrever_json(tmp_path, "tutores.json", [
+            {"id_usuario": 10, "nome": "Tutor", "email": "tutor@teste.com", "senha": "Senha@10",
+             "telefone": "27999990000", "quantidade_pets": 2, "descricao_pets": "Dois gatos"},
+        ])
+        escrever_json(tmp_path, "categorias_artigos.json", [
+            {"id_categoria_artigo": 1, "nome": "Nutrição", "cor": "#00ff00"},
+        ])
+        # Act
+        importados = db_util.importar_dados(tmp_path, processos=2)
+        # Assert
+        assert importados["admins"] == 4
+        assert importados["tutores"] == 1
+        assert importados["categorias_artigos"] == 1
+        assert importados["veterinarios"] == importados["postagens_feeds"] == 0
+        with get_connection() as conn:
+            hashes = [row["senha"] for row in conn.execute("SELECT senha FROM administrador ORDER BY id_admin")]
+            tutor = conn.execute("SELECT quantidade_pets FROM tutor WHERE id_tutor = 10").fetchone()
+        assert [verificar_senha(f"Senha@{i}", h) for i, h in enumerate(hashes, 1)] == [True] * 4
+        assert tutor["quantidade_pets"] == 2
+
+    def test_arquivo_com_erro_nao_grava_nenhum_registro(self, test_db, tmp_path):
+        # Arrange
+        migrar()
+        escrever_json(tmp_path, "categorias_artigos.json", [
+            {"id_categoria_artigo": 1, "nome": "Nutrição", "cor": "#00ff00"},
+            {"id_categoria_artigo": 1, "nome": "Repetida", "cor": "#ff0000"},
+        ])
+        # Act
+        with pytest.raises(sqlite3.IntegrityError):
+            db_util.importar_categorias_artigos(tmp_path)
+        # Assert
+        with get_connection() as conn:
+            assert conn.execute("SELECT COUNT(*) FROM categoria_artigo").fetchone()[0] == 0
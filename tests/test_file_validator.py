@@ -0,0 +1,91 @@
+import asyncio
+import os
+from io import BytesIO
+
+import pytest
+from PIL import Image
+from starlette.datastructures import Headers, UploadFile
+
+from config.upload_config import UploadConfig
+from util.file_manager import FileManager
+from util.file_validator import FileValidationError, FileValidator
+
+
+def criar_upload(conteudo: bytes, nome: str = "foto.png", tipo: str = "image/png") -> UploadFile:
+    return UploadFile(
+        BytesIO(conteudo), filename=nome, headers=Headers({"content-type": tipo})
+    )
+
+
+def criar_png(largura: int = 200, altura: int = 150) -> bytes:
+    buffer = BytesIO()
+    Image.new("RGB", (largura, altura), (200, 100, 50)).save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+class TestFileValidator:
+    def test_imagem_valida_retorna_arquivo_temporario(self):
+        # Arrange
+        conteudo = criar_png()
+        # Act
+        imagem = asyncio.run(FileValidator.validar_imagem_completo(criar_upload(conteudo)))
+        # Assert
+        with imagem:
+            assert (imagem.largura, imagem.altura) == (200, 150)
+            assert imagem.tipo == "png"
+            assert imagem.tamanho == len(conteudo)
+            assert imagem.arquivo.read() == conteudo
+
+    def test_validacao_no_pool_recebe_caminho_do_temporario(self, monkeypatch):
+        # Arrange
+        import util.file_validator as file_validator
+
+        argumentos = []
+        executar_original = file_validator.executar_processamento_imagem
+
+        async def registrar(funcao, *args):
+            argumentos.extend(args)
+            return await executar_original(funcao, *args)
+
+        monkeypatch.setattr(file_validator, "executar_processamento_imagem", registrar)
+        # Act
+        imagem = asyncio.run(FileValidator.validar_imagem_completo(criar_upload(criar_png())))
+        with imagem:
+            caminho = imagem.arquivo.name
+            existia = os.path.exists(caminho)
+        # Assert
+        assert argumentos == [caminho], "O pool deveria receber o caminho, não o conteúdo"
+        assert existia
+        assert not os.path.exists(caminho), "O temporário deveria ser apagado ao fechar"
+
+    def test_assinatura_invalida_rejeitada_no_primeiro_bloco(self):
+        # Arrange
+        conteudo = b"nao e imagem" + b"\x00" * (UploadConfig.CHUNK_SIZE * 4)
+        upload = criar_upload(conteudo)
+        # Act
+        with pytest.raises(FileValidationError, match="assinatura"):
+            asyncio.run(FileValidator.validar_imagem_completo(upload))
+        # Assert
+        assert upload.file.tell() == UploadConfig.CHUNK_SIZE, "Só o primeiro bloco deveria ser lido"
+
+    def test_arquivo_acima_do_limite_rejeitado(self):
+        # Arrange
+        conteudo = criar_png(1000, 1000)
+        # Act / Assert
+        with pytest.raises(FileValidationError, match="muito grande"):
+            asyncio.run(
+                FileValidator.validar_imagem_completo(criar_upload(conteudo), max_size=len(conteudo) - 1)
+            )
+
+    def test_salvar_arquivo_copia_conteudo_do_temporario(self, tmp_path, monkeypatch):
+        # Arrange
+        monkeypatch.setattr(UploadConfig, "IMG_DIR", tmp_path)
+        (tmp_path / "feeds").mkdir()
+        conteudo = criar_png()
+        imagem = asyncio.run(FileValidator.validar_imagem_completo(criar_upload(conteudo)))
+        # Act
+        with imagem:
+            FileManager.salvar_arquivo(imagem.arquivo, "00000001.png", 1, subpasta="feeds")
+        # Assert
+        assert (tmp_path / "feeds" / "00000001.png").read_bytes() == conteudo
+        assert not list((tmp_path / "feeds").glob(".*.tmp"))
@@ -0,0 +1,173 @@
+import asyncio
+import tempfile
+from io import BytesIO
+
+from PIL import Image
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from config.upload_config import UploadConfig
+from repo import midia_repo
+from util.file_manager import FileManager
+from util.file_validator import ImagemValidada
+from util.imagem_derivados import (
+    armazenar_imagem,
+    coletar_blobs_orfaos,
+    gerar_variantes,
+    remover_imagem,
+    srcset_imagem,
+    url_imagem,
+)
+from util.indice_midia import indice_midia
+from util.static_files import StaticFilesComCache
+
+
+def criar_png_transparente(largura: int, altura: int) -> bytes:
+    buffer = BytesIO()
+    Image.new("RGBA", (largura, altura), (10, 20, 30, 128)).save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+class TestImagemDerivados:
+    def test_gerar_variantes_com_larguras_fixas(self, tmp_path):
+        # Arrange
+        origem = tmp_path / "origem.png"
+        origem.write_bytes(criar_png_transparente(2000, 1000))
+        # Act
+        gerados = gerar_variantes(str(origem), str(tmp_path), "00000007")
+        # Assert
+        assert len(gerados) == len(UploadConfig.VARIANTES) * len(UploadConfig.FORMATOS_VARIANTES)
+        for variante, largura in UploadConfig.VARIANTES.items():
+            for formato in UploadConfig.FORMATOS_VARIANTES:
+                with Image.open(tmp_path / f"00000007_{variante}.{formato}") as img:
+                    assert img.size == (largura, largura // 2)
+                    assert img.mode == "RGB"
+
+    def test_imagem_pequena_nao_e_ampliada(self, tmp_path):
+        # Arrange
+        origem = tmp_path / "origem.png"
+        origem.write_bytes(criar_png_transparente(300, 300))
+        # Act
+        gerar_variantes(str(origem), str(tmp_path), "00000008")
+        # Assert
+        with Image.open(tmp_path / "00000008_full.webp") as img:
+            assert img.size == (300, 300)
+        with Image.open(tmp_path / "00000008_thumb.jpg") as img:
+            assert img.size == (160, 160)
+
+    def test_srcset_lista_todas_as_variantes(self, test_db):
+        # Arrange
+        midia_repo.criar_tabela()
+        indice_midia.carregar()
+        # Act
+        srcset = srcset_imagem("feeds", 12, "webp")
+        # Assert
+        assert srcset == (
+            "/static/img/feeds/00000012_thumb.webp 160w, "
+            "/static/img/feeds/00000012_card.webp 480w, "
+            "/static/img/feeds/00000012_full.webp 1080w"
+        )
+        assert url_imagem("usuarios", 3) == "/static/img/usuarios/00000003.jpg"
+
+    def test_deletar_imagem_feed_remove_original_e_variantes(self, tmp_path, monkeypatch):
+        # Arrange
+        monkeypatch.setattr(UploadConfig, "FEEDS_DIR", tmp_path)
+        conteudo = criar_png_transparente(600, 400)
+        (tmp_path / "00000009.png").write_bytes(conteudo)
+        gerar_variantes(str(tmp_path / "00000009.png"), str(tmp_path), "00000009")
+        (tmp_path / "00000010.png").write_bytes(conteudo)
+        # Act
+        FileManager.deletar_imagem_feed(9)
+        # Assert
+        assert [p.name for p in tmp_path.iterdir()] == ["00000010.png"]
+
+
+def criar_imagem_validada(conteudo: bytes) -> ImagemValidada:
+    arquivo = tempfile.NamedTemporaryFile()
+    arquivo.write(conteudo)
+    arquivo.seek(0)
+    return ImagemValidada(arquivo=arquivo, extensao=".png", tipo="png", tamanho=len(conteudo), largura=0, altura=0)
+
+
+class TestArmazenamentoPorConteudo:
+    def test_conteudo_identico_reaproveita_blob(self, test_db, tmp_path, monkeypatch):
+        # Arrange
+        monkeypatch.setattr(UploadConfig, "MIDIA_DIR", tmp_path)
+        midia_repo.criar_tabela()
+        conteudo = criar_png_transparente(500, 500)
+        # Act
+        with criar_imagem_validada(conteudo) as imagem:
+            url_1 = asyncio.run(armazenar_imagem(imagem, "feeds", 1))
+        with criar_imagem_validada(conteudo) as imagem:
+            url_2 = asyncio.run(armazenar_imagem(imagem, "feeds", 2))
+        # Assert
+        assert url_1 == url_2
+        assert url_1.startswith(UploadConfig.MIDIA_URL + "/")
+        blobs = [p for p in tmp_path.rglob("*") if p.is_file() and "_" not in p.name]
+        assert len(blobs) == 1, "O mesmo conteúdo deveria ser gravado uma única vez"
+        assert url_imagem("feeds", 1, "card", "webp").endswith("_card.webp")
+
+    def test_blob_substituido_so_e_apagado_pela_coleta(self, test_db, tmp_path, monkeypatch):
+        # Arrange
+        monkeypatch.setattr(UploadConfig, "MIDIA_DIR", tmp_path)
+        midia_repo.criar_tabela()
+        with criar_imagem_validada(criar_png_transparente(300, 300)) as imagem:
+            asyncio.run(armazenar_imagem(imagem, "usuarios", 5))
+        hash_anterior = midia_repo.obter("usuarios", 5).hash
+        with criar_imagem_validada(criar_png_transparente(400, 300)) as imagem:
+            asyncio.run(armazenar_imagem(imagem, "usuarios", 5))
+        hash_atual = midia_repo.obter("usuarios", 5).hash
+
+        def hashes_em_disco():
+            return {p.name.split("_")[0].split(".")[0] for p in tmp_path.rglob("*") if p.is_file()}
+
+        # Act
+        asyncio.run(remover_imagem("usuarios", 5))
+        antes_da_coleta = hashes_em_disco()
+        dentro_da_carencia = coletar_blobs_orfaos(carencia_segundos=3600)
+        apagados = coletar_blobs_orfaos(carencia_segundos=0)
+        # Assert
+        assert antes_da_coleta == {hash_anterior, hash_atual}, "Trocar a foto não deveria apagar o blob na hora"
+        assert dentro_da_carencia == 0
+        assert apagados == 2
+        assert not [p for p in tmp_path.rglob("*") if p.is_file()]
+        assert url_imagem("usuarios", 5) == "/static/img/usuarios/00000005.jpg"
+
+    def test_blob_coletado_antes_do_definir_e_regravado(self, test_db, tmp_path, monkeypatch):
+        # Arrange
+        monkeypatch.setattr(UploadConfig, "MIDIA_DIR", tmp_path)
+        midia_repo.criar_tabela()
+        conteudo = criar_png_transparente(300, 300)
+        with criar_imagem_validada(conteudo) as imagem:
+            asyncio.run(armazenar_imagem(imagem, "feeds", 1))
+        asyncio.run(remover_imagem("feeds", 1))
+        definir_original = midia_repo.definir
+
+        def definir_apos_coleta(midia):
+            # Outro processo coleta o órfão depois de salvar_blob ter encontrado o arquivo
+            coletar_blobs_orfaos(carencia_segundos=0)
+            return definir_original(midia)
+
+        monkeypatch.setattr(midia_repo, "definir", definir_apos_coleta)
+        # Act
+        with criar_imagem_validada(conteudo) as imagem:
+            asyncio.run(armazenar_imagem(imagem, "feeds", 2))
+        # Assert
+        hash_midia, extensao = midia_repo.obter("feeds", 2).hash, ".png"
+        assert FileManager.caminho_blob(hash_midia, extensao).exists()
+        assert FileManager.caminho_blob(hash_midia, "_card.webp").exists()
+
+    def test_midia_servida_como_imutavel(self, tmp_path):
+        # Arrange
+        (tmp_path / "midia" / "ab").mkdir(parents=True)
+        (tmp_path / "midia" / "ab" / "abc.jpg").write_bytes(b"conteudo")
+        (tmp_path / "outro.css").write_text("body {}")
+        app = FastAPI()
+        app.mount("/static", StaticFilesComCache(directory=str(tmp_path)), name="static")
+        cliente = TestClient(app)
+        # Act
+        midia = cliente.get("/static/midia/ab/abc.jpg")
+        outro = cliente.get("/static/outro.css")
+        # Assert
+        assert midia.headers["Cache-Control"] == "public, max-age=31536000, immutable"
+        assert "immutable" not in outro.headers.get("Cache-Control", "")
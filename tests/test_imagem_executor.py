@@ -0,0 +1,55 @@
+import asyncio
+import os
+import time
+
+import pytest
+
+from util.imagem_executor import ExecutorImagens, ExecutorImagensOcupadoError
+
+
+def dormir(segundos: float) -> int:
+    time.sleep(segundos)
+    return os.getpid()
+
+
+class TestExecutorImagens:
+    def test_executar_em_outro_processo(self):
+        # Arrange
+        executor = ExecutorImagens(max_processos=1, limite_fila=2)
+        # Act
+        pid = asyncio.run(executor.executar(dormir, 0))
+        # Assert
+        assert pid != os.getpid(), "A função deveria rodar em um processo filho"
+        metricas = executor.metricas()
+        assert metricas["concluidas"] == 1
+        assert metricas["pendentes"] == 0
+        executor.fechar()
+
+    def test_pool_saturado_recusa_novas_tarefas(self):
+        # Arrange
+        executor = ExecutorImagens(max_processos=1, limite_fila=1)
+
+        async def cenario():
+            primeira = asyncio.ensure_future(executor.executar(dormir, 0.3))
+            await asyncio.sleep(0)
+            with pytest.raises(ExecutorImagensOcupadoError):
+                await executor.executar(dormir, 0)
+            return await primeira
+
+        # Act
+        asyncio.run(cenario())
+        # Assert
+        assert executor.metricas()["recusadas"] == 1
+        executor.fechar()
+
+    def test_timeout_e_tempo_de_processamento(self):
+        # Arrange
+        executor = ExecutorImagens(max_processos=1, limite_fila=2, timeout_segundos=0.05)
+        # Act / Assert
+        with pytest.raises(asyncio.TimeoutError):
+            asyncio.run(executor.executar(dormir, 0.3))
+        executor.fechar()
+        metricas = executor.metricas()
+        assert metricas["timeouts"] == 1
+        assert metricas["pendentes"] == 0, "A tarefa deveria deixar de contar ao terminar no processo filho"
+        assert metricas["tempo_processamento_maximo"] >= 0.3
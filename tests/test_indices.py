@@ -0,0 +1,104 @@
+from sql import (
+    curtida_artigo_sql,
+    curtida_feed_sql,
+    postagem_artigo_sql,
+    postagem_feed_sql,
+    seguida_sql,
+    tutor_sql,
+    usuario_sql,
+)
+from util.db_util import get_connection
+from util.migracoes import migrar
+
+# Consultas das listagens e contagens mais usadas. As buscas FTS
+# (BUSCAR_POR_TERMO) ficam de fora: ordenam por relevância (bm25), o que
+# sempre exige ordenação temporária.
+CONSULTAS_CRITICAS = {
+    "artigos recentes": postagem_artigo_sql.OBTER_RECENTES_COM_DADOS,
+    "artigos por página": postagem_artigo_sql.OBTER_PAGINA_COM_DADOS,
+    "artigos por categoria": postagem_artigo_sql.OBTER_POR_CATEGORIA_COM_DADOS,
+    "artigos por veterinário": postagem_artigo_sql.OBTER_POR_VETERINARIO,
+    "contagem por categoria": postagem_artigo_sql.CONTAR_POR_CATEGORIA,
+    "feed recente": postagem_feed_sql.OBTER_RECENTES_COM_DADOS,
+    "feed por página": postagem_feed_sql.OBTER_PAGINA_COM_DADOS,
+    "curtidas de um post": curtida_feed_sql.CONTAR_CURTIDAS_POR_POSTAGEM,
+    "curtidas de vários posts": curtida_feed_sql.CONTAR_CURTIDAS_POR_POSTAGENS.format(placeholders="?, ?, ?"),
+    "curtidas de um artigo": curtida_artigo_sql.CONTAR_CURTIDAS_POR_ARTIGO,
+    "curtidas de vários artigos": curtida_artigo_sql.CONTAR_CURTIDAS_POR_ARTIGOS.format(placeholders="?, ?, ?"),
+    "artigos curtidos por usuário": curtida_artigo_sql.OBTER_ARTIGOS_CURTIDOS_POR_USUARIO,
+    "seguidas": seguida_sql.OBTER_PAGINA,
+    "usuários": usuario_sql.OBTER_PAGINA,
+    "usuários por perfil": usuario_sql.OBTER_POR_PERFIL,
+    "tutores": tutor_sql.OBTER_PAGINA,
+}
+
+# Paginação por cursor, nos dois sentidos e com/sem filtro de categoria
+for _ordem, _filtro_pa, _filtro_pf in (
+    ("DESC", postagem_artigo_sql.FILTRO_CURSOR_APOS, postagem_feed_sql.FILTRO_CURSOR_APOS),
+    ("ASC", postagem_artigo_sql.FILTRO_CURSOR_ANTES, postagem_feed_sql.FILTRO_CURSOR_ANTES),
+):
+    CONSULTAS_CRITICAS[f"artigos por cursor {_ordem}"] = postagem_artigo_sql.OBTER_PAGINA_CURSOR_COM_DADOS.format(
+        filtro=_filtro_pa, ordem=_ordem
+    )
+    CONSULTAS_CRITICAS[f"artigos da categoria por cursor {_ordem}"] = (
+        postagem_artigo_sql.OBTER_PAGINA_CURSOR_COM_DADOS.format(
+            filtro=f"{postagem_artigo_sql.FILTRO_CATEGORIA} AND {_filtro_pa}", ordem=_ordem
+        )
+    )
+    CONSULTAS_CRITICAS[f"feed por cursor {_ordem}"] = postagem_feed_sql.OBTER_PAGINA_CURSOR_COM_DADOS.format(
+        filtro=_filtro_pf, ordem=_ordem
+    )
+
+
+def obter_plano(sql: str) -> list:
+    with get_connection() as conn:
+        parametros = (None,) * sql.count("?")
+        return [row["detail"] for row in conn.execute(f"EXPLAIN QUERY PLAN {sql}", parametros)]
+
+
+def problemas_do_plano(plano: list) -> list:
+    """Varredura completa de tabela (SCAN sem índice) ou ordenação em B-tree temporária."""
+    return [
+        passo for passo in plano
+        if "TEMP B-TREE" in passo or (passo.startswith("SCAN") and " USING " not in passo)
+    ]
+
+
+class TestIndices:
+    def test_consultas_criticas_nao_fazem_scan_nem_ordenacao_temporaria(self, test_db):
+        # Arrange
+        migrar()
+        # Act
+        problemas = {
+            nome: problemas_do_plano(obter_plano(sql))
+            for nome, sql in CONSULTAS_CRITICAS.items()
+        }
+        # Assert
+        problemas = {nome: passos for nome, passos in problemas.items() if passos}
+        assert problemas == {}, f"Consultas sem índice adequado: {problemas}"
+
+    def test_consultas_usam_indices_compostos(self, test_db):
+        # Arrange
+        migrar()
+        esperados = {
+            "artigos por categoria": "idx_postagem_artigo_categoria_data",
+            "artigos por veterinário": "idx_postagem_artigo_veterinario_data",
+            "feed por cursor DESC": "idx_postagem_feed_data_id",
+            "artigos curtidos por usuário": "idx_curtida_artigo_usuario_data",
+        }
+        # Act / Assert
+        for nome, indice in esperados.items():
+            plano = " | ".join(obter_plano(CONSULTAS_CRITICAS[nome]))
+            assert indice in plano, f"{nome}: {plano}"
+        plano_curtidas = " | ".join(obter_plano(CONSULTAS_CRITICAS["curtidas de um post"]))
+        assert "COVERING INDEX idx_curtida_feed_postagem_usuario" in plano_curtidas
+
+    def test_indices_substituidos_por_compostos_sao_removidos(self, test_db):
+        # Arrange
+        migrar()
+        # Act
+        with get_connection() as conn:
+            indices = {row["name"] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+        # Assert
+        assert {"idx_postagem_categoria", "idx_postagem_feed_tutor", "idx_curtida_feed_postagem"}.isdisjoint(indices)
+        assert {"idx_postagem_artigo_categoria_data", "idx_postagem_feed_tutor_data"} <= indices
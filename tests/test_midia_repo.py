@@ -0,0 +1,93 @@
+import pytest
+
+from model.midia_model import Midia
+from repo import midia_repo
+from util.db_util import get_connection
+from util.indice_midia import indice_midia
+from util.migracoes import migrar
+from util.versao_dados import atualizacao_periodica
+
+
+class TestMidiaRepo:
+    @pytest.fixture(autouse=True)
+    def setup(self, test_db):
+        midia_repo.criar_tabela()
+
+    def test_definir_retorna_midia_anterior(self, test_db):
+        # Arrange
+        midia_repo.definir(Midia("usuarios", 1, "a" * 64, ".jpg"))
+        # Act
+        anterior = midia_repo.definir(Midia("usuarios", 1, "b" * 64, ".png"))
+        # Assert
+        assert anterior.hash == "a" * 64
+        atual = midia_repo.obter("usuarios", 1)
+        assert (atual.hash, atual.extensao) == ("b" * 64, ".png")
+
+    def test_contar_referencias_de_blob_compartilhado(self, test_db):
+        # Arrange
+        midia_repo.definir(Midia("feeds", 1, "c" * 64, ".jpg"))
+        midia_repo.definir(Midia("feeds", 2, "c" * 64, ".jpg"))
+        # Act
+        removida = midia_repo.excluir("feeds", 1)
+        # Assert
+        assert removida.id_registro == 1
+        assert midia_repo.contar_referencias("c" * 64) == 1
+        assert midia_repo.obter("feeds", 1) is None
+
+    def test_blob_substituido_registrado_como_orfao(self, test_db):
+        # Arrange
+        midia_repo.definir(Midia("usuarios", 1, "a" * 64, ".jpg"))
+        midia_repo.definir(Midia("usuarios", 2, "d" * 64, ".jpg"))
+        apagados = []
+        # Act
+        midia_repo.definir(Midia("usuarios", 1, "b" * 64, ".jpg"))
+        midia_repo.excluir("usuarios", 2)
+        midia_repo.definir(Midia("usuarios", 3, "d" * 64, ".jpg"))  # reaproveitado: deixa de ser órfão
+        total = midia_repo.coletar_orfaos(0, lambda hash_midia, extensao: apagados.append(hash_midia))
+        # Assert
+        assert total == 1
+        assert apagados == ["a" * 64]
+
+    def test_indice_percebe_escrita_de_outro_processo(self, test_db):
+        # Arrange
+        migrar()
+        midia_repo.definir(Midia("feeds", 7, "e" * 64, ".jpg"))
+        indice_midia.carregar()
+        assert indice_midia.obter("feeds", 7) == ("e" * 64, ".jpg")
+        # Act: escrita direta no banco, sem o ouvinte de invalidação deste processo
+        with get_connection() as conn:
+            conn.execute("UPDATE midia SET hash = ? WHERE tipo = 'feeds' AND id_registro = 7", ("f" * 64,))
+        assert indice_midia.obter("feeds", 7) == ("e" * 64, ".jpg"), "A leitura não deveria consultar o banco"
+        atualizacao_periodica.executar_uma_vez()
+        # Assert
+        assert indice_midia.obter("feeds", 7) == ("f" * 64, ".jpg")
+
+    def test_indice_aplica_apenas_registros_alterados(self, test_db, monkeypatch):
+        # Arrange
+        migrar()
+        midia_repo.definir(Midia("usuarios", 1, "a" * 64, ".jpg"))
+        midia_repo.definir(Midia("usuarios", 2, "b" * 64, ".jpg"))
+        indice_midia.carregar()
+        monkeypatch.setattr(midia_repo, "obter_todos", lambda: pytest.fail("Não deveria recarregar a tabela inteira"))
+        # Act
+        midia_repo.definir(Midia("usuarios", 1, "c" * 64, ".png"))
+        midia_repo.excluir("usuarios", 2)
+        # Assert
+        assert indice_midia.obter("usuarios", 1) == ("c" * 64, ".png")
+        assert indice_midia.obter("usuarios", 2) is None
+
+    def test_indice_recarrega_quando_registro_de_alteracoes_foi_podado(self, test_db):
+        # Arrange
+        migrar()
+        midia_repo.definir(Midia("feeds", 1, "a" * 64, ".jpg"))
+        indice_midia.carregar()
+        with get_connection() as conn:
+            conn.execute("UPDATE midia SET hash = ? WHERE tipo = 'feeds' AND id_registro = 1", ("b" * 64,))
+            conn.execute("INSERT INTO midia (tipo, id_registro, hash, extensao) VALUES ('feeds', 2, ?, '.jpg')", ("d" * 64,))
+        # Act: a manutenção remove as entradas que o índice ainda não aplicou
+        with get_connection() as conn:
+            conn.execute("DELETE FROM midia_alteracao WHERE id_registro = 1")
+        indice_midia.aplicar_alteracoes()
+        # Assert
+        assert indice_midia.obter("feeds", 1) == ("b" * 64, ".jpg")
+        assert indice_midia.obter("feeds", 2) == ("d" * 64, ".jpg")
@@ -0,0 +1,173 @@
+import importlib
+import re
+import shutil
+import sqlite3
+import threading
+
+import pytest
+
+from util import db_util, migracoes
+from util.db_util import get_connection
+from util.migracoes import MIGRACOES, Migracao, dividir_script, migrar, versoes_aplicadas
+
+REPOSITORIOS = [
+    "usuario_repo", "tutor_repo", "veterinario_repo", "administrador_repo", "categoria_artigo_repo",
+    "postagem_artigo_repo", "curtida_artigo_repo", "postagem_feed_repo", "curtida_feed_repo",
+    "denuncia_repo", "verificacao_crmv_repo", "seguida_repo", "midia_repo", "chamado_repo",
+    "resposta_chamado_repo", "comentario_artigo_repo",
+]
+
+
+def esquema() -> set:
+    """(tipo, nome, DDL com espaços normalizados) de tabelas, triggers e índices."""
+    with get_connection() as conn:
+        return {
+            (row["type"], row["name"], re.sub(r"\s+", " ", row["sql"]).strip().rstrip(";"))
+            for row in conn.execute("SELECT type, name, sql FROM sqlite_master WHERE sql IS NOT NULL")
+        }
+
+
+def listar_objetos(tipo: str) -> set:
+    with get_connection() as conn:
+        return {row["name"] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = ?", (tipo,))}
+
+
+class TestMigracoes:
+    def test_migrar_aplica_tabelas_e_indices_uma_unica_vez(self, test_db):
+        # Act
+        aplicadas = migrar()
+        segunda_execucao = migrar()
+        # Assert
+        assert [m.versao for m in aplicadas] == [m.versao for m in MIGRACOES]
+        assert segunda_execucao == []
+        assert versoes_aplicadas() == {m.versao for m in MIGRACOES}
+        indices = listar_objetos("index")
+        assert {"idx_postagem_feed_data_id", "idx_curtida_feed_postagem_usuario", "idx_usuario_email"} <= indices
+
+    def test_dry_run_nao_altera_o_banco(self, test_db):
+        # Act
+        pendentes = migrar(dry_run=True)
+        # Assert
+        assert len(pendentes) == len(MIGRACOES)
+        assert listar_objetos("table") == set()
+
+    def test_migracao_com_erro_e_desfeita(self, test_db):
+        # Arrange
+        def criar_e_falhar(conn):
+            conn.execute("CREATE TABLE temporaria (id INTEGER)")
+            conn.execute("CREATE INDEX idx_inexistente ON tabela_inexistente(id)")
+
+        migracoes = [
+            Migracao(1, "tabela usuario", MIGRACOES[0].aplicar),
+            Migracao(2, "migração com erro", criar_e_falhar),
+        ]
+        # Act
+        with pytest.raises(sqlite3.OperationalError):
+            migrar(migracoes=migracoes)
+        # Assert
+        assert versoes_aplicadas() == {1}
+        assert "temporaria" not in listar_objetos("table")
+        assert "usuario" in listar_objetos("table")
+
+    def test_versoes_fora_de_ordem_sao_rejeitadas(self, test_db):
+        # Arrange
+        migracoes = [Migracao(2, "b", lambda conn: None), Migracao(1, "a", lambda conn: None)]
+        # Act / Assert
+        with pytest.raises(ValueError):
+            migrar(migracoes=migracoes)
+
+    def test_ddl_dos_repositorios_coberto_pelas_migracoes(self, tmp_path, monkeypatch):
+        # Arrange
+        monkeypatch.setenv("TEST_DATABASE_PATH", str(tmp_path / "repositorios.db"))
+        for nome in REPOSITORIOS:
+            assert importlib.import_module(f"repo.{nome}").criar_tabela()
+        esquema_repositorios = esquema()
+        monkeypatch.setenv("TEST_DATABASE_PATH", str(tmp_path / "migracoes.db"))
+        # Act
+        migrar()
+        # Assert
+        diferenca = esquema_repositorios - esquema()
+        assert not diferenca, f"DDL alterado nos repositórios sem uma migração nova: {sorted(diferenca)}"
+
+    def test_migracoes_leem_apenas_scripts_congelados(self, test_db, tmp_path, monkeypatch):
+        # Arrange: só sql/migracoes fica visível para as migrações
+        shutil.copytree(migracoes.DIRETORIO_SQL / "migracoes", tmp_path / "migracoes")
+        monkeypatch.setattr(migracoes, "DIRETORIO_SQL", tmp_path)
+        # Act
+        aplicadas = migrar()
+        # Assert
+        assert len(aplicadas) == len(MIGRACOES), "Toda migração deveria usar um arquivo de sql/migracoes"
+
+    def test_banco_anterior_ao_contador_recebe_total_curtidas(self, test_db):
+        # Arrange
+        with get_connection() as conn:
+            conn.execute(
+                "CREATE TABLE postagem_artigo (id_postagem_artigo INTEGER PRIMARY KEY AUTOINCREMENT, "
+                "id_veterinario INTEGER, titulo TEXT, conteudo TEXT, id_categoria_artigo INTEGER, "
+                "data_publicacao DATETIME, visualizacoes INTEGER DEFAULT 0)"
+            )
+            conn.execute(
+                "INSERT INTO postagem_artigo (id_veterinario, titulo, conteudo, id_categoria_artigo) "
+                "VALUES (1, 'Vacinas', 'Texto', 1)"
+            )
+        # Act
+        migrar()
+        # Assert
+        with get_connection() as conn:
+            row = conn.execute("SELECT total_curtidas FROM postagem_artigo").fetchone()
+            encontrados = conn.execute(
+                "SELECT COUNT(*) FROM postagem_artigo_fts WHERE postagem_artigo_fts MATCH 'vacinas'"
+            ).fetchone()[0]
+        assert row["total_curtidas"] == 0
+        assert encontrados == 1
+
+    def test_dividir_script_ignora_comentarios(self):
+        # Arrange
+        script = "-- comentário\nCREATE INDEX a ON t(x);\n\n-- outro\nCREATE INDEX b\n  ON t(y);\n"
+        # Act
+        comandos = dividir_script(script)
+        # Assert
+        assert comandos == ["CREATE INDEX a ON t(x);", "CREATE INDEX b\n  ON t(y);"]
+
+
+class TestInicializacaoRapida:
+    def test_segunda_inicializacao_nao_migra_nem_importa(self, test_db, monkeypatch):
+        # Arrange
+        chamadas = []
+        monkeypatch.setattr(db_util, "importar_dados", lambda: chamadas.append("importar"))
+        migrar_original = migracoes.migrar
+        monkeypatch.setattr(migracoes, "migrar", lambda: chamadas.append("migrar") or migrar_original())
+        # Act
+        db_util.inicializar_banco()
+        db_util.inicializar_banco()
+        # Assert
+        assert chamadas == ["migrar", "importar"]
+        assert migracoes.obter_versao_banco() == migracoes.VERSAO_ESQUEMA
+
+    def test_nova_migracao_invalida_o_caminho_rapido(self, test_db, monkeypatch):
+        # Arrange
+        monkeypatch.setattr(db_util, "importar_dados", lambda: None)
+        db_util.inicializar_banco()
+        # Act
+        monkeypatch.setattr(migracoes, "VERSAO_ESQUEMA", migracoes.VERSAO_ESQUEMA + 1)
+        # Assert
+        assert not migracoes.esquema_atualizado()
+
+    def test_trava_migracao_exclusiva_entre_aberturas(self, tmp_path):
+        # Arrange
+        caminho = str(tmp_path / "banco.db.lock")
+        obtida = threading.Event()
+
+        def segundo_processo():
+            with migracoes.trava_migracao(caminho):
+                obtida.set()
+
+        # Act
+        with migracoes.trava_migracao(caminho):
+            thread = threading.Thread(target=segundo_processo)
+            thread.start()
+            bloqueada = not obtida.wait(0.2)
+        thread.join(timeout=5)
+        # Assert
+        assert bloqueada, "A segunda abertura deveria esperar o lock ser liberado"
+        assert obtida.is_set()
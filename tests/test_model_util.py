@@ -0,0 +1,121 @@
+import sqlite3
+from datetime import date, datetime
+
+import pytest
+
+from model.chamado_model import Chamado
+from model.enums import ChamadoStatus
+from model.tutor_model import Tutor
+from util.model_util import (
+    _compilar_mapeador,
+    converter_data,
+    converter_data_hora,
+    limpar_cache_mapeadores,
+    mapear_linha,
+    mapear_linhas,
+)
+
+
+@pytest.fixture
+def conn():
+    conn = sqlite3.connect(":memory:")
+    conn.row_factory = sqlite3.Row
+    conn.execute(
+        "CREATE TABLE chamado (id_chamado INTEGER, id_usuario INTEGER, id_admin INTEGER, "
+        "titulo TEXT, descricao TEXT, status TEXT, data TEXT)"
+    )
+    conn.executemany(
+        "INSERT INTO chamado VALUES (?, ?, ?, ?, ?, ?, ?)",
+        [
+            (1, 10, None, "Erro", "Não carrega", "aberto", "2024-05-01 10:00:00"),
+            (2, 11, 1, "Dúvida", "Como faço", "resolvido", "2024-05-02 11:30:00"),
+        ],
+    )
+    limpar_cache_mapeadores()
+    yield conn
+    conn.close()
+
+
+class TestConversores:
+    def test_converter_data_hora(self):
+        # Act / Assert
+        assert converter_data_hora("2024-05-01 10:20:30") == datetime(2024, 5, 1, 10, 20, 30)
+        assert converter_data_hora("2024-05-01 10:20:30.500000") == datetime(2024, 5, 1, 10, 20, 30, 500000)
+        assert converter_data_hora("2024-05-01") == datetime(2024, 5, 1)
+        assert converter_data_hora(None) is None
+
+    def test_converter_data_descarta_hora(self):
+        # Act / Assert
+        assert converter_data("2024-05-01 23:59:59") == date(2024, 5, 1)
+        assert converter_data(date(2024, 5, 1)) == date(2024, 5, 1)
+
+    def test_formato_invalido(self):
+        # Act / Assert
+        with pytest.raises(ValueError):
+            converter_data_hora("01/05/2024")
+
+
+class TestMapeador:
+    def test_mapear_linhas_com_conversor(self, conn):
+        # Arrange
+        cursor = conn.execute("SELECT * FROM chamado ORDER BY id_chamado")
+        # Act
+        chamados = mapear_linhas(cursor, Chamado, conversores={"status": ChamadoStatus})
+        # Assert
+        assert chamados[0] == Chamado(
+            id_chamado=1,
+            id_usuario=10,
+            id_admin=None,
+            titulo="Erro",
+            descricao="Não carrega",
+            status=ChamadoStatus.ABERTO,
+            data="2024-05-01 10:00:00",
+        )
+        assert chamados[1].status == ChamadoStatus.RESOLVIDO
+
+    def test_mapear_linha_inexistente(self, conn):
+        # Arrange
+        cursor = conn.execute("SELECT * FROM chamado WHERE id_chamado = 99")
+        # Act / Assert
+        assert mapear_linha(cursor, Chamado) is None
+
+    def test_mapeador_compilado_uma_vez_por_consulta(self, conn):
+        # Arrange
+        sql = "SELECT * FROM chamado WHERE id_chamado = ?"
+        # Act
+        for id_chamado in (1, 2, 1):
+            mapear_linha(conn.execute(sql, (id_chamado,)), Chamado)
+        mapear_linhas(conn.execute("SELECT titulo, id_chamado, * FROM chamado"), Chamado)
+        # Assert
+        info = _compilar_mapeador.cache_info()
+        assert info.misses == 2
+        assert info.hits == 2
+
+    def test_colunas_renomeadas_valores_fixos_e_padroes(self, conn):
+        # Arrange
+        conn.execute("CREATE TABLE tutor (id_tutor INTEGER, nome TEXT, email TEXT, senha TEXT, telefone TEXT)")
+        conn.execute("INSERT INTO tutor VALUES (5, 'Ana', 'ana@ex.com', 'hash', '2799')")
+        cursor = conn.execute("SELECT * FROM tutor")
+        # Act
+        tutor = mapear_linha(
+            cursor,
+            Tutor,
+            colunas={"id_usuario": "id_tutor"},
+            valores={"senha": ""},
+            padroes={"perfil": "tutor", "quantidade_pets": 0, "token_redefinicao": None, "data_token": None,
+                     "data_cadastro": None, "descricao_pets": None},
+        )
+        # Assert
+        assert tutor.id_usuario == 5
+        assert tutor.senha == ""
+        assert tutor.perfil == "tutor"
+        assert tutor.quantidade_pets == 0
+        assert tutor.token_redefinicao is None
+        assert tutor.descricao_pets is None
+
+    def test_coluna_obrigatoria_ausente_levanta_erro(self, conn):
+        # Arrange
+        cursor = conn.execute("SELECT id_chamado, titulo FROM chamado")
+        # Act / Assert
+        with pytest.raises(ValueError, match="Chamado.id_usuario"):
+            mapear_linhas(cursor, Chamado)
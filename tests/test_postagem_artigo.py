@@ -6,11 +6,14 @@ from repo import (
     veterinario_repo,
     categoria_artigo_repo,
     postagem_artigo_repo,
+    curtida_artigo_repo,
 )
 from model.categoria_artigo_model import CategoriaArtigo
 from model.postagem_artigo_model import PostagemArtigo
+from model.curtida_artigo_model import CurtidaArtigo
+from model.usuario_model import Usuario
 from model.veterinario_model import Veterinario
-# from util.db_util import get_connection  # noqa: F401
+from util.db_util import get_connection
 
 
 class TestPostagemArtigoRepo:
@@ -320,3 +323,172 @@ class TestPostagemArtigoRepo:
         assert (
             pagina2[0].id_postagem_artigo == ids_posts[6]
         ), "A primeira postagem da segunda página está incorreta"
+
+    def test_total_curtidas_mantido_por_triggers(self, test_db):
+        """Testa que curtir e descurtir atualizam o contador do artigo"""
+        # Arrange
+        usuario_repo.criar_tabela()
+        veterinario_repo.criar_tabela()
+        categoria_artigo_repo.criar_tabela()
+        postagem_artigo_repo.criar_tabela()
+        curtida_artigo_repo.criar_tabela()
+        id_vet = veterinario_repo.inserir(Veterinario(
+            0, "Dr. Contador", "contador@vet.com", "123", "999999999",
+            "veterinario", None, None, None, "CRMV999", True, None,
+        ))
+        id_cat = categoria_artigo_repo.inserir(CategoriaArtigo(0, "Contagem", "#000000"))
+        id_post = postagem_artigo_repo.inserir(PostagemArtigo(
+            0, id_vet, "Artigo curtido", "Conteúdo", id_cat,  # type: ignore[arg-type]
+            datetime.today().date(), 0,
+        ))
+        ids_usuarios = [
+            usuario_repo.inserir(Usuario(
+                0, f"Leitor{i}", f"leitor_contador{i}@example.com", "senha",
+                "111111111", "tutor", None, None, None,
+            ))
+            for i in range(2)
+        ]
+        # Act
+        for id_usuario in ids_usuarios:
+            curtida_artigo_repo.inserir(CurtidaArtigo(id_usuario, id_post, datetime.now()))  # type: ignore[arg-type]  # noqa: E501
+        curtida_artigo_repo.excluir(ids_usuarios[0], id_post)  # type: ignore[arg-type]
+        # Assert
+        artigo = postagem_artigo_repo.obter_recentes_com_dados(1)[0]
+        assert artigo["total_curtidas"] == 1, "O contador deveria refletir a curtida restante"
+        assert postagem_artigo_repo.obter_por_id(id_post).total_curtidas == 1  # type: ignore[arg-type, union-attr]
+
+    def test_recalcular_total_curtidas(self, test_db):
+        """Testa a reconstrução do contador a partir de curtida_artigo"""
+        # Arrange
+        usuario_repo.criar_tabela()
+        veterinario_repo.criar_tabela()
+        categoria_artigo_repo.criar_tabela()
+        postagem_artigo_repo.criar_tabela()
+        curtida_artigo_repo.criar_tabela()
+        id_vet = veterinario_repo.inserir(Veterinario(
+            0, "Dr. Recalculo", "recalculo@vet.com", "123", "999999999",
+            "veterinario", None, None, None, "CRMV998", True, None,
+        ))
+        id_cat = categoria_artigo_repo.inserir(CategoriaArtigo(0, "Recalculo", "#111111"))
+        id_post = postagem_artigo_repo.inserir(PostagemArtigo(
+            0, id_vet, "Artigo divergente", "Conteúdo", id_cat,  # type: ignore[arg-type]
+            datetime.today().date(), 0,
+        ))
+        curtida_artigo_repo.inserir(CurtidaArtigo(id_vet, id_post, datetime.now()))  # type: ignore[arg-type]
+        with get_connection() as conn:
+            conn.execute("UPDATE postagem_artigo SET total_curtidas = 42")
+        # Act
+        atualizados = postagem_artigo_repo.recalcular_total_curtidas()
+        # Assert
+        assert atualizados == 1, "Deveria recalcular uma postagem"
+        artigo = postagem_artigo_repo.obter_recentes_com_dados(1)[0]
+        assert artigo["total_curtidas"] == 1, "O contador deveria voltar ao valor real"
+
+    def test_incrementar_visualizacoes_em_lote(self, test_db):
+        """Testa a gravação de vários incrementos em uma transação"""
+        # Arrange
+        usuario_repo.criar_tabela()
+        veterinario_repo.criar_tabela()
+        categoria_artigo_repo.criar_tabela()
+        postagem_artigo_repo.criar_tabela()
+        id_vet = veterinario_repo.inserir(Veterinario(
+            0, "Dr. Visitas", "visitas@vet.com", "123", "999999999",
+            "veterinario", None, None, None, "CRMV997", True, None,
+        ))
+        id_cat = categoria_artigo_repo.inserir(CategoriaArtigo(0, "Visitas", "#222222"))
+        ids_posts = [
+            postagem_artigo_repo.inserir(PostagemArtigo(
+                0, id_vet, f"Artigo visitado {i}", "Conteúdo", id_cat,  # type: ignore[arg-type]
+                datetime.today().date(), 0,
+            ))
+            for i in range(2)
+        ]
+        # Act
+        atualizados = postagem_artigo_repo.incrementar_visualizacoes_em_lote(
+            [(3, ids_posts[0]), (1, ids_posts[1]), (5, 9999)]  # type: ignore[list-item]
+        )
+        # Assert
+        assert atualizados == 2, "Apenas as postagens existentes deveriam ser atualizadas"
+        assert postagem_artigo_repo.obter_por_id(ids_posts[0]).visualizacoes == 3  # type: ignore[arg-type, union-attr]  # noqa: E501
+        assert postagem_artigo_repo.obter_por_id(ids_posts[1]).visualizacoes == 1  # type: ignore[arg-type, union-attr]  # noqa: E501
+
+    def test_buscar_por_termo_fts(self, test_db):
+        """Testa a busca no índice FTS5: acentos, prefixo, filtro e sincronização"""
+        # Arrange
+        usuario_repo.criar_tabela()
+        veterinario_repo.criar_tabela()
+        categoria_artigo_repo.criar_tabela()
+        postagem_artigo_repo.criar_tabela()
+        ids_vets = [
+            veterinario_repo.inserir(Veterinario(
+                0, f"Dr. Busca {i}", f"busca{i}@vet.com", "123", "999999999",
+                "veterinario", None, None, None, f"CRMV90{i}", True, None,
+            ))
+            for i in range(2)
+        ]
+        id_cat = categoria_artigo_repo.inserir(CategoriaArtigo(0, "Busca", "#333333"))
+        id_titulo = postagem_artigo_repo.inserir(PostagemArtigo(
+            0, ids_vets[0], "Vacinação de filhotes", "Calendário completo.", id_cat,  # type: ignore[arg-type]
+            datetime.today().date(), 0,
+        ))
+        id_conteudo = postagem_artigo_repo.inserir(PostagemArtigo(
+            0, ids_vets[1], "Cuidados gerais", "A vacinação anual <b>evita</b> doenças.", id_cat,  # type: ignore[arg-type]
+            datetime.today().date(), 0,
+        ))
+        # Act
+        sem_acento = postagem_artigo_repo.buscar_por_termo("vacinacao")
+        prefixo = postagem_artigo_repo.buscar_por_termo("vacin")
+        do_veterinario = postagem_artigo_repo.buscar_por_termo("vacina", id_veterinario=ids_vets[1])
+        com_aspas = postagem_artigo_repo.buscar_por_termo('"vacin OR')
+        # Assert
+        assert [a["id_postagem_artigo"] for a in sem_acento] == [id_titulo, id_conteudo], \
+            "A busca deveria ignorar acentos e priorizar o título"
+        assert len(prefixo) == 2, "Palavras incompletas deveriam ser buscadas como prefixo"
+        assert [a["id_postagem_artigo"] for a in do_veterinario] == [id_conteudo]
+        assert com_aspas == [], "Operadores digitados não deveriam gerar erro de sintaxe"
+        trecho = do_veterinario[0]["trecho"]
+        assert "<mark>vacinação</mark>" in trecho, "O termo encontrado deveria ser destacado"
+        assert "&lt;b&gt;" in trecho, "O conteúdo do trecho deveria ser escapado"
+
+        # Act - alteração e exclusão mantêm o índice sincronizado
+        artigo = postagem_artigo_repo.obter_por_id(id_titulo)
+        artigo.titulo = "Vermifugação de filhotes"  # type: ignore[union-attr]
+        postagem_artigo_repo.atualizar(artigo)  # type: ignore[arg-type]
+        postagem_artigo_repo.excluir(id_conteudo)  # type: ignore[arg-type]
+        # Assert
+        assert postagem_artigo_repo.buscar_por_termo("vacinacao") == []
+        assert len(postagem_artigo_repo.buscar_por_termo("vermifugacao")) == 1
+
+    def test_obter_pagina_cursor_por_categoria(self, test_db):
+        """Testa a paginação por cursor filtrando por categoria"""
+        # Arrange
+        usuario_repo.criar_tabela()
+        veterinario_repo.criar_tabela()
+        categoria_artigo_repo.criar_tabela()
+        postagem_artigo_repo.criar_tabela()
+        id_vet = veterinario_repo.inserir(Veterinario(
+            0, "Dr. Cursor", "cursor@vet.com", "123", "999999999",
+            "veterinario", None, None, None, "CRMV996", True, None,
+        ))
+        id_cat = categoria_artigo_repo.inserir(CategoriaArtigo(0, "Cursor", "#444444"))
+        id_outra = categoria_artigo_repo.inserir(CategoriaArtigo(0, "Outra", "#555555"))
+        ids_categoria = []
+        for i in range(3):
+            ids_categoria.append(postagem_artigo_repo.inserir(PostagemArtigo(
+                0, id_vet, f"Artigo {i}", "Conteúdo", id_cat,  # type: ignore[arg-type]
+                datetime.today().date(), 0,
+            )))
+            postagem_artigo_repo.inserir(PostagemArtigo(
+                0, id_vet, f"Outro {i}", "Conteúdo", id_outra,  # type: ignore[arg-type]
+                datetime.today().date(), 0,
+            ))
+        # Act
+        pagina1 = postagem_artigo_repo.obter_pagina_cursor_com_dados(2, id_categoria=id_cat)
+        pagina2 = postagem_artigo_repo.obter_pagina_cursor_com_dados(
+            2, apos=pagina1.cursor_proximo, id_categoria=id_cat
+        )
+        # Assert
+        ids = [a["id_postagem_artigo"] for a in pagina1.itens + pagina2.itens]
+        assert ids == list(reversed(ids_categoria)), "Deveria listar só a categoria, do mais novo ao mais antigo"
+        assert pagina2.cursor_proximo is None
+        assert pagina2.cursor_anterior is not None
@@ -1,10 +1,12 @@
 from datetime import datetime
 # import os  # noqa: F401
 # import sys  # noqa: F401
-from repo import usuario_repo, tutor_repo, postagem_feed_repo
+from repo import usuario_repo, tutor_repo, postagem_feed_repo, curtida_feed_repo
+from model.curtida_feed_model import CurtidaFeed
 from model.postagem_feed_model import PostagemFeed
 # from model.usuario_model import Usuario  # noqa: F401
 from model.tutor_model import Tutor
+from util.db_util import get_connection
 
 
 class TestPostagemFeedRepo:
@@ -247,3 +249,148 @@ class TestPostagemFeedRepo:
 
         # Assert
         assert postagem is None, "Postagem inexistente deveria retornar None"
+
+    def test_total_curtidas_mantido_por_triggers(self, test_db):
+        """Testa que curtir e descurtir atualizam o contador da postagem"""
+        # Arrange
+        usuario_repo.criar_tabela()
+        tutor_repo.criar_tabela()
+        postagem_feed_repo.criar_tabela()
+        curtida_feed_repo.criar_tabela()
+        id_tutor = tutor_repo.inserir(Tutor(
+            0, "Tutor Contador", "tutor_contador@email.com", "123", "999999999",
+            "tutor", None, None, None, 1, "Um gato",
+        ))
+        id_post = postagem_feed_repo.inserir(
+            PostagemFeed(0, id_tutor, "Post curtido", datetime.now())  # type: ignore[arg-type]
+        )
+        # Act
+        curtida_feed_repo.inserir(CurtidaFeed(id_usuario=id_tutor, id_postagem_feed=id_post))  # type: ignore[arg-type]  # noqa: E501
+        post_curtido = postagem_feed_repo.obter_por_id_com_dados(id_post)  # type: ignore[arg-type]
+        curtida_feed_repo.excluir(id_tutor, id_post)  # type: ignore[arg-type]
+        post_descurtido = postagem_feed_repo.obter_por_id_com_dados(id_post)  # type: ignore[arg-type]
+        # Assert
+        assert post_curtido is not None and post_descurtido is not None
+        assert post_curtido["total_curtidas"] == 1, "A curtida deveria incrementar o contador"
+        assert post_descurtido["total_curtidas"] == 0, "A exclusão deveria decrementar o contador"
+
+    def test_recalcular_total_curtidas(self, test_db):
+        """Testa a reconstrução do contador a partir de curtida_feed"""
+        # Arrange
+        usuario_repo.criar_tabela()
+        tutor_repo.criar_tabela()
+        postagem_feed_repo.criar_tabela()
+        curtida_feed_repo.criar_tabela()
+        id_tutor = tutor_repo.inserir(Tutor(
+            0, "Tutor Recalculo", "tutor_recalculo@email.com", "123", "999999999",
+            "tutor", None, None, None, 1, "Um cão",
+        ))
+        id_post = postagem_feed_repo.inserir(
+            PostagemFeed(0, id_tutor, "Post divergente", datetime.now())  # type: ignore[arg-type]
+        )
+        with get_connection() as conn:
+            conn.execute("UPDATE postagem_feed SET total_curtidas = 7")
+        # Act
+        atualizados = postagem_feed_repo.recalcular_total_curtidas()
+        # Assert
+        assert atualizados == 1, "Deveria recalcular uma postagem"
+        post = postagem_feed_repo.obter_por_id_com_dados(id_post)  # type: ignore[arg-type]
+        assert post is not None
+        assert post["total_curtidas"] == 0, "O contador deveria voltar ao valor real"
+
+    def test_incrementar_visualizacoes_em_lote(self, test_db):
+        """Testa a gravação de vários incrementos em uma transação"""
+        # Arrange
+        usuario_repo.criar_tabela()
+        tutor_repo.criar_tabela()
+        postagem_feed_repo.criar_tabela()
+        id_tutor = tutor_repo.inserir(Tutor(
+            0, "Tutor Visitas", "tutor_visitas@email.com", "123", "999999999",
+            "tutor", None, None, None, 1, "Um gato",
+        ))
+        id_post = postagem_feed_repo.inserir(
+            PostagemFeed(0, id_tutor, "Post visitado", datetime.now())  # type: ignore[arg-type]
+        )
+        # Act
+        atualizados = postagem_feed_repo.incrementar_visualizacoes_em_lote([(4, id_post)])  # type: ignore[list-item]  # noqa: E501
+        # Assert
+        assert atualizados == 1
+        post = postagem_feed_repo.obter_por_id_com_dados(id_post)  # type: ignore[arg-type]
+        assert post is not None
+        assert post["visualizacoes"] == 4, "O incremento acumulado deveria ser aplicado"
+
+    def test_buscar_por_termo_fts(self, test_db):
+        """Testa a busca no índice FTS5 da descrição dos posts"""
+        # Arrange
+        usuario_repo.criar_tabela()
+        tutor_repo.criar_tabela()
+        postagem_feed_repo.criar_tabela()
+        ids_tutores = [
+            tutor_repo.inserir(Tutor(
+                0, f"Tutor Busca {i}", f"tutor_busca{i}@email.com", "123", "999999999",
+                "tutor", None, None, None, 1, "Um cão",
+            ))
+            for i in range(2)
+        ]
+        id_post = postagem_feed_repo.inserir(
+            PostagemFeed(0, ids_tutores[0], "Meu cachorro na praia", datetime.now())  # type: ignore[arg-type]
+        )
+        postagem_feed_repo.inserir(
+            PostagemFeed(0, ids_tutores[1], "Cachorrinho dormindo", datetime.now())  # type: ignore[arg-type]
+        )
+        # Act
+        todos = postagem_feed_repo.buscar_por_termo("cachorr")
+        do_tutor = postagem_feed_repo.buscar_por_termo("cachorr", id_tutor=ids_tutores[0])
+        # Assert
+        assert len(todos) == 2, "A busca por prefixo deveria encontrar os dois posts"
+        assert [p["id_postagem_feed"] for p in do_tutor] == [id_post]
+        assert do_tutor[0]["trecho"] == "Meu <mark>cachorro</mark> na praia"
+
+    def test_obter_pagina_cursor_com_dados(self, test_db):
+        """Testa a navegação por cursor para frente e para trás"""
+        # Arrange
+        usuario_repo.criar_tabela()
+        tutor_repo.criar_tabela()
+        postagem_feed_repo.criar_tabela()
+        id_tutor = tutor_repo.inserir(Tutor(
+            0, "Tutor Cursor", "tutor_cursor@email.com", "123", "999999999",
+            "tutor", None, None, None, 1, "Um gato",
+        ))
+        ids_posts = [
+            postagem_feed_repo.inserir(
+                PostagemFeed(0, id_tutor, f"Post {i}", datetime.now())  # type: ignore[arg-type]
+            )
+            for i in range(5)
+        ]
+        # Posts com a mesma data são desempatados pelo ID (mais novo primeiro)
+        esperados = list(reversed(ids_posts))
+
+        # Act
+        pagina1 = postagem_feed_repo.obter_pagina_cursor_com_dados(2)
+        pagina2 = postagem_feed_repo.obter_pagina_cursor_com_dados(2, apos=pagina1.cursor_proximo)
+        pagina3 = postagem_feed_repo.obter_pagina_cursor_com_dados(2, apos=pagina2.cursor_proximo)
+        volta = postagem_feed_repo.obter_pagina_cursor_com_dados(2, antes=pagina2.cursor_anterior)
+
+        # Assert
+        def ids(pagina):
+            return [p["id_postagem_feed"] for p in pagina.itens]
+
+        assert ids(pagina1) == esperados[0:2]
+        assert pagina1.cursor_anterior is None, "A primeira página não tem anterior"
+        assert ids(pagina2) == esperados[2:4]
+        assert ids(pagina3) == esperados[4:]
+        assert pagina3.cursor_proximo is None, "A última página não tem próxima"
+        assert ids(volta) == esperados[0:2], "Voltar deveria retornar à primeira página"
+        assert volta.cursor_anterior is None
+
+    def test_obter_pagina_cursor_invalido(self, test_db):
+        """Testa que um cursor malformado retorna a primeira página"""
+        # Arrange
+        usuario_repo.criar_tabela()
+        tutor_repo.criar_tabela()
+        postagem_feed_repo.criar_tabela()
+        # Act
+        pagina = postagem_feed_repo.obter_pagina_cursor_com_dados(10, apos="nao-e-um-cursor")
+        # Assert
+        assert pagina.itens == []
+        assert pagina.cursor_anterior is None and pagina.cursor_proximo is None
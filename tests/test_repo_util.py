@@ -0,0 +1,86 @@
+import asyncio
+import threading
+
+import pytest
+
+from util.repo_util import ExecutorRepo
+
+
+class TestExecutorRepo:
+    def test_executar_fora_do_event_loop(self):
+        # Arrange
+        executor = ExecutorRepo(max_threads=2)
+        thread_loop = threading.current_thread()
+
+        async def cenario():
+            return await executor.executar(threading.current_thread)
+
+        # Act
+        thread_execucao = asyncio.run(cenario())
+        # Assert
+        assert thread_execucao is not thread_loop, "A função deveria rodar em outra thread"
+        assert executor.metricas()["concluidas"] == 1
+        executor.fechar()
+
+    def test_fila_limitada_ao_tamanho_do_pool(self):
+        # Arrange
+        executor = ExecutorRepo(max_threads=1)
+        liberar = threading.Event()
+
+        async def cenario():
+            tarefas = [
+                asyncio.ensure_future(executor.executar(liberar.wait, 2)) for _ in range(3)
+            ]
+            await asyncio.sleep(0.05)
+            durante = executor.metricas()
+            liberar.set()
+            await asyncio.gather(*tarefas)
+            return durante
+
+        # Act
+        durante = asyncio.run(cenario())
+        # Assert
+        assert durante["em_execucao"] == 1, "Só uma tarefa deveria rodar com uma thread"
+        assert durante["na_fila"] == 2, "As demais deveriam aguardar na fila"
+        depois = executor.metricas()
+        assert depois["na_fila"] == 0
+        assert depois["pico_fila"] >= 2
+        assert depois["tempo_fila_maximo"] > 0
+        executor.fechar()
+
+    def test_excecao_propagada_e_contabilizada(self):
+        # Arrange
+        executor = ExecutorRepo(max_threads=1)
+
+        def falhar():
+            raise ValueError("erro no repositório")
+
+        # Act / Assert
+        with pytest.raises(ValueError):
+            asyncio.run(executor.executar(falhar))
+        assert executor.metricas()["erros"] == 1
+        executor.fechar()
+
+    def test_tarefa_cancelada_na_fila_sai_das_metricas(self):
+        # Arrange
+        executor = ExecutorRepo(max_threads=1)
+        liberar = threading.Event()
+
+        async def cenario():
+            ocupando = asyncio.ensure_future(executor.executar(liberar.wait, 2))
+            aguardando = asyncio.ensure_future(executor.executar(lambda: None))
+            await asyncio.sleep(0.05)
+            aguardando.cancel()
+            await asyncio.sleep(0)
+            liberar.set()
+            await ocupando
+            with pytest.raises(asyncio.CancelledError):
+                await aguardando
+
+        # Act
+        asyncio.run(cenario())
+        # Assert
+        metricas = executor.metricas()
+        assert metricas["na_fila"] == 0, "A tarefa cancelada antes de começar não deveria ficar na fila"
+        assert metricas["concluidas"] == 1
+        executor.fechar()
@@ -0,0 +1,30 @@
+from util.template_util import criar_templates, obter_templates, precompilar_templates
+
+
+class TestTemplateUtil:
+    def test_criar_templates_retorna_ambiente_compartilhado(self):
+        # Arrange / Act
+        raiz = criar_templates()
+        publico = criar_templates("templates/publico")
+        # Assert
+        assert raiz is publico is obter_templates(), "Todas as rotas deveriam compartilhar o mesmo ambiente"
+        assert "templates/publico" in raiz.env.loader.searchpath
+        assert raiz.env.loader.searchpath[0] == "templates"
+
+    def test_diretorio_adicionado_uma_unica_vez(self):
+        # Arrange
+        criar_templates("templates/tutor")
+        # Act
+        templates = criar_templates("templates/tutor")
+        # Assert
+        assert templates.env.loader.searchpath.count("templates/tutor") == 1
+
+    def test_precompilar_carrega_templates_no_cache(self):
+        # Arrange
+        ambiente = obter_templates().env
+        # Act
+        compilados = precompilar_templates()
+        # Assert
+        assert compilados > 0
+        assert ambiente.get_template("publico/index.html") is ambiente.get_template("publico/index.html")
+        assert "data_br" in ambiente.filters
@@ -12,6 +12,7 @@ from repo.usuario_repo import (
     obter_por_id as obter_usuario_por_id,
 )
 from model.tutor_model import Tutor
+from util.cache_util import cache_respostas
 # from model.usuario_model import Usuario  # noqa: F401
 
 
@@ -142,6 +143,30 @@ class TestTutorRepo:
         assert tutor_db.quantidade_pets == 3
         assert tutor_db.descricao_pets == "Um gato e dois cachorros"
 
+    def test_atualizar_tutor_invalida_paginas_com_nome_do_autor(self, test_db):
+        """A troca de nome deve descartar as páginas em cache que exibem o tutor"""
+        # Arrange
+        tutor = Tutor(
+            id_usuario=0,
+            nome="Nome Original",
+            email="cache@email.com",
+            senha="senha123",
+            telefone="11999998888",
+            perfil="tutor",
+            token_redefinicao=None,
+            data_token=None,
+            data_cadastro=None,
+            quantidade_pets=1,
+            descricao_pets="Um gato",
+        )
+        tutor.id_usuario = inserir_tutor(tutor)
+        cache_respostas.definir("/petgram", "html", tags=["posts", "usuarios"])
+        # Act
+        tutor.nome = "Nome Novo"
+        atualizar_tutor(tutor)
+        # Assert
+        assert cache_respostas.obter("/petgram")[0] is False
+
     def test_atualizar_tutor_inexistente(self, test_db):
         """Testa atualização de tutor inexistente"""
         # Arrange
@@ -0,0 +1,80 @@
+import threading
+
+from util.visualizacoes_buffer import BufferVisualizacoes
+
+
+class TestBufferVisualizacoes:
+    def test_registrar_acumula_por_id(self):
+        # Arrange
+        gravados = []
+        buffer = BufferVisualizacoes("teste", lambda lote: gravados.extend(lote) or len(lote))
+        # Act
+        buffer.registrar(1)
+        buffer.registrar(1)
+        buffer.registrar(2)
+        # Assert
+        assert buffer.pendentes(1) == 2
+        assert buffer.pendentes(2) == 1
+        assert buffer.pendentes(3) == 0
+        assert gravados == [], "Nada deveria ser gravado antes da descarga"
+
+    def test_descarregar_grava_lote_unico(self):
+        # Arrange
+        lotes = []
+        buffer = BufferVisualizacoes("teste", lambda lote: lotes.append(lote) or len(lote))
+        for _ in range(3):
+            buffer.registrar(7)
+        buffer.registrar(8)
+        # Act
+        atualizados = buffer.descarregar()
+        # Assert
+        assert atualizados == 2
+        assert lotes == [[(3, 7), (1, 8)]], "Os incrementos deveriam ser agrupados por ID"
+        assert buffer.pendentes(7) == 0
+
+    def test_limite_de_eventos_dispara_descarga(self):
+        # Arrange
+        lotes = []
+        buffer = BufferVisualizacoes(
+            "teste", lambda lote: lotes.append(lote) or len(lote), limite_eventos=3
+        )
+        # Act
+        for _ in range(3):
+            buffer.registrar(1)
+        # Assert
+        assert lotes == [[(3, 1)]]
+
+    def test_erro_na_gravacao_mantem_pendentes(self):
+        # Arrange
+        def gravar_com_falha(lote):
+            raise RuntimeError("banco indisponível")
+
+        buffer = BufferVisualizacoes("teste", gravar_com_falha)
+        buffer.registrar(5)
+        # Act
+        atualizados = buffer.descarregar()
+        # Assert
+        assert atualizados == 0
+        assert buffer.pendentes(5) == 1, "Os incrementos não deveriam ser perdidos"
+
+    def test_thread_descarrega_periodicamente_e_ao_parar(self):
+        # Arrange
+        gravou = threading.Event()
+        lotes = []
+
+        def gravar(lote):
+            lotes.append(lote)
+            gravou.set()
+            return len(lote)
+
+        buffer = BufferVisualizacoes("teste", gravar, intervalo_segundos=0.01)
+        buffer.iniciar()
+        # Act
+        buffer.registrar(1)
+        assert gravou.wait(2), "A thread deveria descarregar o buffer"
+        buffer.registrar(2)
+        buffer.parar()
+        # Assert
+        assert not buffer.em_execucao()
+        assert sum(len(lote) for lote in lotes) == 2
+        assert buffer.pendentes(2) == 0
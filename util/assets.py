@@ -0,0 +1,510 @@
+"""
+Assets estáticos com nomes versionados, minificados e pré-comprimidos.
+
+O comando de build gera static/dist a partir de static/:
+
+- imagens grandes do site (IMAGENS_OTIMIZADAS) são reduzidas a no máximo
+  LARGURA_MAXIMA_IMAGEM e recomprimidas em WebP e AVIF, ao lado de uma cópia
+  versionada do original;
+- cada arquivo de static/css e static/js é minificado e copiado com o hash do
+  conteúdo no nome (base.css -> base.3fa9c1d2e4.css);
+- os pacotes de PACOTES juntam, na ordem, os arquivos usados por uma página
+  em um único CSS/JS (menos requisições no primeiro carregamento);
+- referências `url('/static/...')` dentro do CSS passam a apontar para as
+  versões de static/dist;
+- CSS/JS ganham ao lado as versões .gz (e .br, se o pacote `brotli` estiver
+  instalado).
+
+Tudo é registrado em static/dist/manifest.json:
+
+    {"css/base.css": "dist/css/base.3fa9c1d2e4.css",
+     "img/banners/banner1.webp": "dist/img/banners/banner1.5b0e7a91c2.webp",
+     "pacotes/publico.css": "dist/pacotes/publico.9d81f0c3aa.css", ...}
+
+Os arquivos de builds anteriores não são apagados na hora: páginas já
+renderizadas (ou em cache) e outros workers que ainda usam o manifesto
+antigo continuam encontrando os arquivos. O histórico em
+static/dist/builds.json guarda os arquivos de cada build, e os que não
+pertencem a nenhum dos BUILDS_MANTIDOS builds mais recentes são removidos.
+O manifesto é gravado por último, de forma atômica, e recarregado pelos
+workers quando o arquivo muda.
+
+Nos templates, `asset('css/base.css')` devolve a URL versionada quando o
+manifesto existe e a URL original caso contrário (ambiente de
+desenvolvimento sem build); `pacote('publico.css')` devolve a URL do pacote
+ou, sem build, as URLs dos arquivos que o compõem; `fontes_imagem(...)` lista
+as versões AVIF/WebP geradas para um `<picture>`. Como o nome muda junto com
+o conteúdo, os arquivos de static/dist são servidos como imutáveis (ver
+util/static_files.py).
+
+Uso:
+    python -m util.assets
+"""
+
+import gzip
+import hashlib
+import json
+import logging
+import os
+import re
+import sys
+import threading
+import time
+from io import BytesIO
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from PIL import Image, ImageOps, features
+
+try:
+    import brotli
+except ImportError:  # Opcional: sem ele só são geradas as versões .gz
+    brotli = None
+
+logger = logging.getLogger(__name__)
+
+DIRETORIO_STATIC = Path("static")
+NOME_DIST = "dist"
+NOME_MANIFESTO = "manifest.json"
+NOME_HISTORICO = "builds.json"
+PASTA_PACOTES = "pacotes"
+
+# Pastas de static/ processadas pelo build
+PASTAS_ASSETS = ("css", "js")
+
+# Pacotes por página: nome do pacote -> arquivos (relativos a static/), na ordem
+PACOTES: Dict[str, Tuple[str, ...]] = {
+    "publico.css": ("css/base.css",),
+    "publico.js": ("js/toasts.js",),
+}
+
+# Imagens do site recomprimidas pelo build (arquivos ou pastas relativos a static/)
+IMAGENS_OTIMIZADAS = ("img/animais.png", "img/banners", "img/categorias")
+EXTENSOES_IMAGEM = {".png", ".jpg", ".jpeg"}
+LARGURA_MAXIMA_IMAGEM = 1920
+
+# Formato -> (extensão, tipo MIME, opções do Pillow), em ordem de preferência
+FORMATOS_IMAGEM = {
+    "AVIF": (".avif", "image/avif", {"quality": 60, "speed": 6}),
+    "WEBP": (".webp", "image/webp", {"quality": 80, "method": 6}),
+}
+
+# Tipos de arquivo que valem a pena comprimir e tamanho mínimo para isso
+EXTENSOES_COMPRIMIVEIS = {".css", ".js", ".json", ".svg", ".txt", ".html", ".xml"}
+TAMANHO_MINIMO_COMPRESSAO = 512
+
+TAMANHO_HASH = 10
+
+# Builds cujos arquivos continuam em static/dist (o atual e os anteriores)
+BUILDS_MANTIDOS = 3
+
+# Intervalo mínimo entre verificações de alteração do manifesto, em segundos
+INTERVALO_VERIFICACAO_MANIFESTO = 1.0
+
+# Literais de string e comentários: o minificador só mexe no que fica entre eles
+_TOKENS_CSS = re.compile(r"""("(?:\\.|[^"\\])*"|'(?:\\.|[^'\\])*')|(/\*.*?\*/)""", re.S)
+_TOKENS_JS = re.compile(
+    r"""("(?:\\.|[^"\\\n])*"|'(?:\\.|[^'\\\n])*'|`(?:\\.|[^`\\])*`)|(/\*.*?\*/|//[^\n]*)""",
+    re.S,
+)
+_URL_CSS = re.compile(r"""url\(\s*(['"]?)/static/([^'")?#]+)\1\s*\)""")
+
+
+def calcular_fingerprint(conteudo: bytes) -> str:
+    return hashlib.sha256(conteudo).hexdigest()[:TAMANHO_HASH]
+
+
+def nome_versionado(caminho: Path, fingerprint: str) -> str:
+    """base.css -> base.<fingerprint>.css"""
+    return f"{caminho.stem}.{fingerprint}{caminho.suffix}"
+
+
+def _minificar(texto: str, tokens: re.Pattern, compactar) -> str:
+    partes = []
+    codigo = []
+    posicao = 0
+    for encontrado in tokens.finditer(texto):
+        codigo.append(texto[posicao:encontrado.start()])
+        if encontrado.group(1):
+            partes.append(compactar("".join(codigo)))
+            partes.append(encontrado.group(1))
+            codigo = []
+        elif encontrado.group(2).startswith("/*"):
+            # Comentário de bloco vira espaço para não juntar os tokens vizinhos
+            codigo.append(" ")
+        posicao = encontrado.end()
+    codigo.append(texto[posicao:])
+    partes.append(compactar("".join(codigo)))
+    return "".join(partes).strip()
+
+
+def _compactar_css(trecho: str) -> str:
+    trecho = re.sub(r"\s+", " ", trecho)
+    trecho = re.sub(r"\s*([{};,>])\s*", r"\1", trecho)
+    trecho = re.sub(r":\s+", ":", trecho)
+    return trecho.replace(";}", "}")
+
+
+def _compactar_js(trecho: str) -> str:
+    # Conservador: só remove indentação, espaços repetidos e linhas vazias, mantendo as quebras de
+    # linha (a inserção automática de ponto e vírgula continua valendo)
+    trecho = re.sub(r"[ \t]*\n\s*", "\n", trecho)
+    return re.sub(r"[ \t]+", " ", trecho)
+
+
+def minificar_css(texto: str) -> str:
+    """Remove comentários e espaços desnecessários, preservando strings."""
+    return _minificar(texto, _TOKENS_CSS, _compactar_css)
+
+
+def minificar_js(texto: str) -> str:
+    """
+    Remove comentários, indentação e linhas vazias, preservando strings.
+
+    Não reescreve identificadores nem junta linhas; literais de expressão
+    regular contendo `//` não são suportados.
+    """
+    return _minificar(texto, _TOKENS_JS, _compactar_js)
+
+
+MINIFICADORES = {".css": minificar_css, ".js": minificar_js}
+
+
+def comprimir_arquivo(caminho: Path) -> list:
+    """
+    Grava as versões .gz e .br ao lado do arquivo, quando ficam menores.
+
+    Returns:
+        Extensões geradas (ex.: [".gz", ".br"])
+    """
+    if caminho.suffix not in EXTENSOES_COMPRIMIVEIS:
+        return []
+    conteudo = caminho.read_bytes()
+    if len(conteudo) < TAMANHO_MINIMO_COMPRESSAO:
+        return []
+
+    versoes = {".gz": gzip.compress(conteudo, compresslevel=9, mtime=0)}
+    if brotli is not None:
+        versoes[".br"] = brotli.compress(conteudo, quality=11)
+
+    geradas = []
+    for extensao, comprimido in versoes.items():
+        if len(comprimido) < len(conteudo):
+            Path(f"{caminho}{extensao}").write_bytes(comprimido)
+            geradas.append(extensao)
+    return geradas
+
+
+def _gravar_versionado(dist: Path, relativo: str, conteudo: bytes) -> str:
+    """Grava em dist/<relativo> com o hash no nome e retorna o caminho relativo a static/."""
+    caminho = Path(relativo)
+    destino = dist / caminho.parent / nome_versionado(caminho, calcular_fingerprint(conteudo))
+    destino.parent.mkdir(parents=True, exist_ok=True)
+    destino.write_bytes(conteudo)
+    comprimir_arquivo(destino)
+    return f"{NOME_DIST}/{destino.relative_to(dist).as_posix()}"
+
+
+def _listar_imagens(diretorio_static: Path, origens: Iterable[str]) -> List[Path]:
+    imagens = []
+    for origem in origens:
+        caminho = diretorio_static / origem
+        candidatos = sorted(caminho.rglob("*")) if caminho.is_dir() else [caminho]
+        imagens.extend(p for p in candidatos if p.is_file() and p.suffix.lower() in EXTENSOES_IMAGEM)
+    return imagens
+
+
+def _formatos_disponiveis() -> Dict[str, tuple]:
+    disponiveis = {}
+    for formato, opcoes in FORMATOS_IMAGEM.items():
+        if features.check(formato.lower()):
+            disponiveis[formato] = opcoes
+        else:
+            logger.warning(f"Pillow sem suporte a {formato}: versões {opcoes[0]} não serão geradas")
+    return disponiveis
+
+
+def otimizar_imagens(
+    diretorio_static: Path = DIRETORIO_STATIC,
+    origens: Iterable[str] = IMAGENS_OTIMIZADAS,
+) -> Dict[str, str]:
+    """
+    Grava em static/dist as imagens do site versionadas e recomprimidas.
+
+    Para cada imagem (ex.: img/banners/banner1.jpg) são gerados o original
+    versionado e as versões .avif/.webp, reduzidas a LARGURA_MAXIMA_IMAGEM.
+
+    Returns:
+        Entradas do manifesto (img/banners/banner1.webp -> dist/img/banners/...)
+    """
+    dist = diretorio_static / NOME_DIST
+    formatos = _formatos_disponiveis()
+    manifesto: Dict[str, str] = {}
+
+    for arquivo in _listar_imagens(diretorio_static, origens):
+        relativo = arquivo.relative_to(diretorio_static).as_posix()
+        conteudo = arquivo.read_bytes()
+        manifesto[relativo] = _gravar_versionado(dist, relativo, conteudo)
+
+        try:
+            with Image.open(BytesIO(conteudo)) as img:
+                img = ImageOps.exif_transpose(img)
+                if img.width > LARGURA_MAXIMA_IMAGEM:
+                    altura = round(img.height * LARGURA_MAXIMA_IMAGEM / img.width)
+                    img = img.resize((LARGURA_MAXIMA_IMAGEM, altura), Image.LANCZOS)
+                if img.mode not in ("RGB", "RGBA"):
+                    img = img.convert("RGBA" if "A" in img.getbands() else "RGB")
+                for formato, (extensao, _, opcoes) in formatos.items():
+                    buffer = BytesIO()
+                    img.save(buffer, format=formato, **opcoes)
+                    alternativo = str(Path(relativo).with_suffix(extensao).as_posix())
+                    manifesto[alternativo] = _gravar_versionado(dist, alternativo, buffer.getvalue())
+        except (OSError, ValueError) as e:
+            logger.error(f"Erro ao recomprimir {arquivo}: {e}")
+            continue
+
+        logger.info(f"Imagem otimizada: {relativo}")
+    return manifesto
+
+
+def _reescrever_urls_css(texto: str, manifesto: Dict[str, str]) -> str:
+    """Troca url('/static/img/x.webp') pela versão de static/dist, quando houver."""
+
+    def substituir(encontrado: re.Match) -> str:
+        versionado = manifesto.get(encontrado.group(2))
+        if versionado is None:
+            return encontrado.group(0)
+        aspas = encontrado.group(1)
+        return f"url({aspas}/static/{versionado}{aspas})"
+
+    return _URL_CSS.sub(substituir, texto)
+
+
+def _preparar_texto(caminho: Path, manifesto: Dict[str, str]) -> bytes:
+    """Conteúdo minificado (e com URLs reescritas, no caso do CSS)."""
+    minificador = MINIFICADORES.get(caminho.suffix)
+    if minificador is None:
+        return caminho.read_bytes()
+    texto = caminho.read_text(encoding="utf-8")
+    if caminho.suffix == ".css":
+        texto = _reescrever_urls_css(texto, manifesto)
+    return minificador(texto).encode("utf-8")
+
+
+def construir_assets(
+    diretorio_static: Path = DIRETORIO_STATIC,
+    pastas: Iterable[str] = PASTAS_ASSETS,
+    pacotes: Optional[Dict[str, Tuple[str, ...]]] = None,
+    imagens: Iterable[str] = IMAGENS_OTIMIZADAS,
+    manter_builds: int = BUILDS_MANTIDOS,
+) -> Dict[str, str]:
+    """
+    Gera static/dist com imagens, CSS/JS e pacotes versionados, comprimidos e o manifesto.
+
+    Os arquivos novos são gravados ao lado dos de builds anteriores, que só
+    são removidos quando saem dos `manter_builds` builds mais recentes. As
+    imagens são processadas primeiro para que o CSS já aponte para as
+    versões otimizadas.
+
+    Returns:
+        Manifesto: caminho original (relativo a static/) -> caminho versionado
+    """
+    pacotes = PACOTES if pacotes is None else pacotes
+    dist = diretorio_static / NOME_DIST
+
+    manifesto: Dict[str, str] = otimizar_imagens(diretorio_static, imagens)
+
+    conteudos: Dict[str, bytes] = {}
+    for pasta in pastas:
+        origem = diretorio_static / pasta
+        if not origem.is_dir():
+            continue
+        for arquivo in sorted(p for p in origem.rglob("*") if p.is_file()):
+            relativo = arquivo.relative_to(diretorio_static).as_posix()
+            conteudos[relativo] = _preparar_texto(arquivo, manifesto)
+
+    for relativo, conteudo in conteudos.items():
+        manifesto[relativo] = _gravar_versionado(dist, relativo, conteudo)
+
+    for nome, arquivos in pacotes.items():
+        faltando = [a for a in arquivos if a not in conteudos]
+        if faltando:
+            logger.error(f"Pacote {nome} ignorado: arquivos inexistentes {faltando}")
+            continue
+        juncao = b";\n" if nome.endswith(".js") else b"\n"
+        conteudo = juncao.join(conteudos[a] for a in arquivos)
+        manifesto[f"{PASTA_PACOTES}/{nome}"] = _gravar_versionado(dist, f"{PASTA_PACOTES}/{nome}", conteudo)
+
+    dist.mkdir(parents=True, exist_ok=True)
+    _gravar_atomico(dist / NOME_MANIFESTO, json.dumps(manifesto, indent=2, sort_keys=True))
+    removidos = _podar_builds_antigos(dist, manifesto, manter_builds)
+    logger.info(f"{len(manifesto)} assets gerados em {dist} ({removidos} arquivos de builds antigos removidos)")
+    return manifesto
+
+
+def _gravar_atomico(caminho: Path, texto: str) -> None:
+    """Grava em um temporário e troca o arquivo de uma vez (leitores nunca veem metade)."""
+    temporario = caminho.with_name(f".{caminho.name}.tmp")
+    temporario.write_text(texto, encoding="utf-8")
+    os.replace(temporario, caminho)
+
+
+def _podar_builds_antigos(dist: Path, manifesto: Dict[str, str], manter_builds: int) -> int:
+    """
+    Registra o build em builds.json e apaga os arquivos que não pertencem a
+    nenhum dos `manter_builds` builds mais recentes.
+
+    Returns:
+        Quantidade de arquivos removidos
+    """
+    caminho_historico = dist / NOME_HISTORICO
+    try:
+        historico = json.loads(caminho_historico.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        historico = []
+
+    atual = sorted(set(manifesto.values()))
+    historico = [build for build in historico if build != atual]
+    historico = [atual] + historico[:max(manter_builds, 1) - 1]
+    _gravar_atomico(caminho_historico, json.dumps(historico))
+
+    mantidos = set()
+    for build in historico:
+        for versionado in build:
+            mantidos.update({versionado, f"{versionado}.gz", f"{versionado}.br"})
+
+    removidos = 0
+    for arquivo in sorted(dist.rglob("*"), reverse=True):
+        if arquivo.is_dir():
+            if not any(arquivo.iterdir()):
+                arquivo.rmdir()
+            continue
+        if arquivo.parent == dist:
+            continue  # manifesto e histórico
+        if f"{NOME_DIST}/{arquivo.relative_to(dist).as_posix()}" not in mantidos:
+            arquivo.unlink()
+            removidos += 1
+    return removidos
+
+
+class ManifestoAssets:
+    """
+    Manifesto lido de static/dist/manifest.json na primeira consulta.
+
+    Recarregado quando o arquivo é substituído por um novo build (verificado
+    no máximo a cada `intervalo_segundos`).
+    """
+
+    def __init__(
+        self,
+        diretorio_static: Path = DIRETORIO_STATIC,
+        intervalo_segundos: float = INTERVALO_VERIFICACAO_MANIFESTO,
+    ):
+        self.diretorio_static = diretorio_static
+        self.intervalo_segundos = intervalo_segundos
+        self._itens: Optional[Dict[str, str]] = None
+        self._assinatura: Optional[Tuple[int, int]] = None
+        self._proxima_verificacao = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def caminho(self) -> Path:
+        return self.diretorio_static / NOME_DIST / NOME_MANIFESTO
+
+    def _assinatura_atual(self) -> Optional[Tuple[int, int]]:
+        try:
+            estado = self.caminho.stat()
+        except OSError:
+            return None
+        return estado.st_ino, estado.st_mtime_ns
+
+    def carregar(self) -> Dict[str, str]:
+        caminho = self.caminho
+        assinatura = self._assinatura_atual()
+        try:
+            itens = json.loads(caminho.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            itens = {}
+        except (OSError, ValueError) as e:
+            logger.error(f"Erro ao ler manifesto de assets {caminho}: {e}")
+            itens = {}
+        with self._lock:
+            self._itens = itens
+            self._assinatura = assinatura
+            self._proxima_verificacao = time.monotonic() + self.intervalo_segundos
+        return itens
+
+    def _obter_itens(self) -> Dict[str, str]:
+        itens = self._itens
+        if itens is None:
+            return self.carregar()
+        agora = time.monotonic()
+        if agora < self._proxima_verificacao:
+            return itens
+        self._proxima_verificacao = agora + self.intervalo_segundos
+        if self._assinatura_atual() != self._assinatura:
+            return self.carregar()
+        return itens
+
+    def obter(self, caminho: str) -> Optional[str]:
+        """Caminho versionado (relativo a static/) ou None se não estiver no build."""
+        return self._obter_itens().get(caminho.lstrip("/"))
+
+    def resolver(self, caminho: str) -> str:
+        """Caminho versionado (relativo a static/) ou o próprio caminho se não houver build."""
+        caminho = caminho.lstrip("/")
+        return self._obter_itens().get(caminho, caminho)
+
+
+manifesto_assets = ManifestoAssets()
+
+
+def asset(caminho: str) -> str:
+    """
+    URL de um arquivo de static/, versionada quando houver build.
+
+    Examples:
+        >>> asset("css/base.css")
+        '/static/dist/css/base.3fa9c1d2e4.css'
+    """
+    return f"/static/{manifesto_assets.resolver(caminho)}"
+
+
+def pacote(nome: str) -> List[str]:
+    """
+    URLs a incluir na página para um pacote de PACOTES.
+
+    Com build é uma única URL versionada; sem build, as URLs dos arquivos
+    que compõem o pacote, na ordem.
+
+    Examples:
+        >>> pacote("publico.css")
+        ['/static/dist/pacotes/publico.9d81f0c3aa.css']
+    """
+    versionado = manifesto_assets.obter(f"{PASTA_PACOTES}/{nome}")
+    if versionado is not None:
+        return [f"/static/{versionado}"]
+    return [asset(arquivo) for arquivo in PACOTES.get(nome, ())]
+
+
+def fontes_imagem(caminho: str) -> List[Tuple[str, str]]:
+    """
+    Versões AVIF/WebP geradas pelo build para uma imagem de static/.
+
+    Returns:
+        Lista de (URL, tipo MIME) em ordem de preferência, para os `<source>`
+        de um `<picture>`; vazia sem build ou se a imagem não foi otimizada
+    """
+    fontes = []
+    base = Path(caminho.lstrip("/"))
+    for extensao, tipo, _ in FORMATOS_IMAGEM.values():
+        versionado = manifesto_assets.obter(base.with_suffix(extensao).as_posix())
+        if versionado is not None:
+            fontes.append((f"/static/{versionado}", tipo))
+    return fontes
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s - %(message)s")
+    construir_assets()
+    sys.exit(0)
@@ -0,0 +1,44 @@
+"""
+Utilitários para as buscas textuais feitas nos índices FTS5.
+"""
+
+import re
+from typing import Optional
+
+from markupsafe import Markup, escape
+
+# Marcadores passados ao snippet() do FTS5. São caracteres de controle que não
+# aparecem no texto digitado pelos usuários, então podem ser trocados por HTML
+# depois que o trecho já foi escapado.
+INICIO_DESTAQUE = "\x02"
+FIM_DESTAQUE = "\x03"
+
+_PALAVRA = re.compile(r"\w+", re.UNICODE)
+
+
+def montar_consulta_fts(termo: Optional[str]) -> Optional[str]:
+    """
+    Converte o texto digitado pelo usuário em uma consulta FTS5 segura.
+
+    Cada palavra vira uma busca por prefixo entre aspas e todas precisam estar
+    presentes no documento. Operadores e aspas digitados são descartados, de
+    modo que o termo nunca gera erro de sintaxe no MATCH.
+
+    Exemplo:
+        montar_consulta_fts('vacina "gat') -> '"vacina"* "gat"*'
+
+    Returns:
+        Consulta para o MATCH ou None se o termo não tiver palavras
+    """
+    palavras = _PALAVRA.findall(termo or "")
+    if not palavras:
+        return None
+    return " ".join(f'"{palavra}"*' for palavra in palavras)
+
+
+def destacar_trecho(trecho: Optional[str]) -> Markup:
+    """Escapa o trecho retornado pelo snippet() e marca os termos encontrados com <mark>."""
+    if not trecho:
+        return Markup("")
+    html = str(escape(trecho))
+    return Markup(html.replace(INICIO_DESTAQUE, "<mark>").replace(FIM_DESTAQUE, "</mark>"))
@@ -0,0 +1,271 @@
+"""
+Cache em memória com tempo de expiração (TTL) e invalidação por tags.
+
+Usado em dois níveis:
+- respostas completas de páginas públicas para visitantes anônimos
+  (decorador `cache_resposta`);
+- fragmentos/valores caros de calcular, como os totais das listagens.
+
+Cada entrada pode ser associada a tags ("artigos", "posts", "curtidas",
+"categorias", "usuarios"). As escritas nos repositórios chamam `invalidar_tags`
+por meio do decorador `invalida_cache`, descartando tudo o que dependia
+daqueles dados.
+
+Cada tag tem também um número de geração, incrementado a cada invalidação.
+Quem calcula um valor anota as gerações antes de começar e só o armazena se
+nenhuma mudou: assim um cálculo que leu dados anteriores a uma escrita
+concorrente não repõe no cache o valor já invalidado.
+"""
+
+import os
+import time
+import inspect
+import logging
+import threading
+from collections import OrderedDict
+from functools import wraps
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, Set, Tuple, TypeVar
+
+from fastapi import Request
+from fastapi.responses import Response
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+CACHE_CONTAGEM_TTL: float = float(os.getenv("CACHE_CONTAGEM_TTL", "60"))
+CACHE_RESPOSTA_TTL: float = float(os.getenv("CACHE_RESPOSTA_TTL", "300"))
+CACHE_RESPOSTA_MAX_ITENS: int = int(os.getenv("CACHE_RESPOSTA_MAX_ITENS", "512"))
+
+# Chaves de sessão que tornam a página específica do visitante
+_CHAVES_SESSAO_PERSONALIZADA = ("usuario", "_mensagens", "flash_messages")
+
+
+class CacheTTL:
+    """
+    Dicionário thread-safe cujas entradas expiram após `ttl_segundos`.
+
+    Quando `max_itens` é atingido, a entrada usada há mais tempo é removida.
+    Todas as instâncias participam da invalidação global por tags.
+    """
+
+    def __init__(self, ttl_segundos: float, max_itens: int = 1024):
+        self.ttl_segundos = ttl_segundos
+        self.max_itens = max_itens
+        self._itens: "OrderedDict[Hashable, Tuple[float, Any, Tuple[str, ...]]]" = OrderedDict()
+        self._por_tag: Dict[str, Set[Hashable]] = {}
+        self._lock = threading.Lock()
+        self.acertos = 0
+        self.falhas = 0
+        _registrar_cache(self)
+
+    def obter(self, chave: Hashable) -> Tuple[bool, Any]:
+        """Retorna (encontrado, valor) para a chave, ignorando entradas expiradas."""
+        with self._lock:
+            item = self._itens.get(chave)
+            if item is None:
+                self.falhas += 1
+                return False, None
+            expira_em, valor, _ = item
+            if expira_em <= time.monotonic():
+                self._remover(chave)
+                self.falhas += 1
+                return False, None
+            self._itens.move_to_end(chave)
+            self.acertos += 1
+            return True, valor
+
+    def definir(self, chave: Hashable, valor: Any, tags: Iterable[str] = ()) -> None:
+        tags = tuple(tags)
+        with self._lock:
+            self._remover(chave)
+            self._itens[chave] = (time.monotonic() + self.ttl_segundos, valor, tags)
+            for tag in tags:
+                self._por_tag.setdefault(tag, set()).add(chave)
+            while len(self._itens) > self.max_itens:
+                self._remover(next(iter(self._itens)))
+
+    def obter_ou_calcular(
+        self, chave: Hashable, calcular: Callable[[], Any], tags: Iterable[str] = ()
+    ) -> Any:
+        """
+        Retorna o valor em cache ou calcula, armazena e retorna um novo.
+
+        O valor calculado não é armazenado se alguma das tags for invalidada
+        durante o cálculo.
+        """
+        encontrado, valor = self.obter(chave)
+        if encontrado:
+            return valor
+        tags = tuple(tags)
+        geracoes_antes = obter_geracoes(tags)
+        valor = calcular()
+        if obter_geracoes(tags) == geracoes_antes:
+            self.definir(chave, valor, tags)
+        return valor
+
+    def invalidar(self, chave: Optional[Hashable] = None) -> None:
+        """Remove uma chave ou, sem argumentos, todo o conteúdo do cache."""
+        with self._lock:
+            if chave is None:
+                self._itens.clear()
+                self._por_tag.clear()
+            else:
+                self._remover(chave)
+
+    def invalidar_tags(self, tags: Iterable[str]) -> int:
+        """Remove todas as entradas associadas a alguma das tags."""
+        removidas = 0
+        with self._lock:
+            for tag in tags:
+                for chave in self._por_tag.pop(tag, set()):
+                    if chave in self._itens:
+                        self._remover(chave)
+                        removidas += 1
+        return removidas
+
+    def _remover(self, chave: Hashable) -> None:
+        item = self._itens.pop(chave, None)
+        if item is None:
+            return
+        for tag in item[2]:
+            chaves = self._por_tag.get(tag)
+            if chaves is not None:
+                chaves.discard(chave)
+
+    def __len__(self) -> int:
+        return len(self._itens)
+
+
+_caches: List[CacheTTL] = []
+_ouvintes: List[Callable[[Tuple[str, ...]], None]] = []
+_geracoes: Dict[str, int] = {}
+_lock_registro = threading.Lock()
+
+
+def _registrar_cache(cache: CacheTTL) -> None:
+    with _lock_registro:
+        _caches.append(cache)
+
+
+def registrar_ouvinte(ouvinte: Callable[[Tuple[str, ...]], None]) -> None:
+    """Registra uma função chamada com as tags sempre que houver invalidação."""
+    with _lock_registro:
+        _ouvintes.append(ouvinte)
+
+
+def obter_geracoes(tags: Iterable[str]) -> Tuple[int, ...]:
+    """Retorna a geração atual de cada tag (quantas vezes já foi invalidada)."""
+    with _lock_registro:
+        return tuple(_geracoes.get(tag, 0) for tag in tags)
+
+
+def invalidar_tags(*tags: str) -> None:
+    """
+    Notifica os ouvintes registrados e invalida as tags em todos os caches.
+
+    Os ouvintes (cópias em memória, como o catálogo de categorias) são
+    atualizados antes: uma página renderizada depois que as entradas foram
+    descartadas já enxerga os dados novos, e uma iniciada antes é descartada
+    pela mudança de geração.
+    """
+    with _lock_registro:
+        caches = list(_caches)
+        ouvintes = list(_ouvintes)
+    for ouvinte in ouvintes:
+        try:
+            ouvinte(tags)
+        except Exception as e:
+            logger.error(f"Erro em ouvinte de invalidação de cache {tags}: {e}")
+    with _lock_registro:
+        for tag in tags:
+            _geracoes[tag] = _geracoes.get(tag, 0) + 1
+    for cache in caches:
+        cache.invalidar_tags(tags)
+
+
+def invalida_cache(*tags: str):
+    """
+    Decorador para funções de escrita dos repositórios: após a execução sem
+    exceção, invalida as entradas de cache associadas às tags. Também aceita
+    funções async (repositórios de repo/*_repo_async.py).
+
+    Examples:
+        >>> @invalida_cache("artigos")
+        ... def inserir(postagem: PostagemArtigo) -> Optional[int]:
+        ...     ...
+    """
+    def decorator(func: Callable[..., T]) -> Callable[..., T]:
+        if inspect.iscoroutinefunction(func):
+            @wraps(func)
+            async def wrapper_async(*args, **kwargs) -> T:
+                resultado = await func(*args, **kwargs)
+                invalidar_tags(*tags)
+                return resultado
+            return wrapper_async
+
+        @wraps(func)
+        def wrapper(*args, **kwargs) -> T:
+            resultado = func(*args, **kwargs)
+            invalidar_tags(*tags)
+            return resultado
+        return wrapper
+    return decorator
+
+
+cache_respostas = CacheTTL(CACHE_RESPOSTA_TTL, max_itens=CACHE_RESPOSTA_MAX_ITENS)
+
+
+def _visitante_anonimo(request: Request) -> bool:
+    """Verifica se a página pode ser compartilhada entre visitantes (sem login nem mensagens)."""
+    if request.method != "GET":
+        return False
+    sessao = request.session if "session" in request.scope else {}
+    return not any(chave in sessao for chave in _CHAVES_SESSAO_PERSONALIZADA)
+
+
+def cache_resposta(*tags: str):
+    """
+    Decorador para rotas GET públicas: respostas para visitantes anônimos
+    ficam em memória por CACHE_RESPOSTA_TTL segundos ou até alguma das tags
+    ser invalidada. Usuários logados e páginas com mensagens flash pendentes
+    sempre recebem a página renderizada na hora.
+
+    A chave do cache é o caminho mais a query string ordenada. A resposta
+    não é armazenada se alguma das tags for invalidada enquanto a página
+    estava sendo renderizada (ela pode refletir dados anteriores à escrita).
+
+    Examples:
+        >>> @router.get("/artigos")
+        ... @cache_resposta("artigos", "categorias")
+        ... async def get_artigos(request: Request, ...):
+        ...     ...
+    """
+    def decorator(func):
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            request: Optional[Request] = kwargs.get("request")
+            if request is None or not _visitante_anonimo(request):
+                return await func(*args, **kwargs)
+
+            chave = (request.url.path, tuple(sorted(request.query_params.multi_items())))
+            encontrado, item = cache_respostas.obter(chave)
+            if encontrado:
+                status_code, corpo, cabecalhos = item
+                resposta = Response(content=corpo, status_code=status_code, headers=cabecalhos)
+                resposta.headers["X-Cache"] = "HIT"
+                return resposta
+
+            geracoes_antes = obter_geracoes(tags)
+            resposta = await func(*args, **kwargs)
+            corpo = getattr(resposta, "body", None)
+            if resposta.status_code == 200 and corpo is not None and obter_geracoes(tags) == geracoes_antes:
+                cabecalhos = {
+                    nome: valor for nome, valor in resposta.headers.items()
+                    if nome.lower() != "set-cookie"
+                }
+                cache_respostas.definir(chave, (resposta.status_code, corpo, cabecalhos), tags)
+                resposta.headers["X-Cache"] = "MISS"
+            return resposta
+        return wrapper
+    return decorator
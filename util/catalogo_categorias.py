@@ -0,0 +1,120 @@
+"""
+Catálogo em memória das categorias de artigos.
+
+As categorias são lidas em quase todas as páginas públicas e mudam raramente
+(somente pela área do administrador). O catálogo mantém uma cópia no processo,
+indexada por ID e ordenada por nome, carregada na inicialização da aplicação e
+recarregada sempre que um repositório invalida a tag "categorias" — ou seja,
+após qualquer inserir/atualizar/excluir em `categoria_artigo_repo`. Os outros
+workers percebem a alteração pelo contador de `versao_dados`, conferido pela
+thread de atualização periódica (ver util/versao_dados.py). As leituras feitas
+pelas rotas e templates nunca consultam o banco: devolvem a cópia atual.
+
+A propriedade `versao` é um hash curto do conteúdo: muda quando alguma
+categoria muda e é igual em todos os processos que enxergam os mesmos dados,
+podendo ser usada em templates e em cabeçalhos de cache HTTP (ETag).
+"""
+
+import hashlib
+import logging
+import threading
+from typing import Dict, List, Optional, Tuple
+
+from model.categoria_artigo_model import CategoriaArtigo
+from util.cache_util import invalidar_tags, registrar_ouvinte
+from util.versao_dados import VersaoDados, atualizacao_periodica
+
+logger = logging.getLogger(__name__)
+
+TAG_CATEGORIAS = "categorias"
+
+
+class CatalogoCategorias:
+    """Cópia somente leitura das categorias, trocada por inteiro a cada recarga."""
+
+    def __init__(self):
+        self._por_id: Dict[int, CategoriaArtigo] = {}
+        self._ordenadas: Tuple[CategoriaArtigo, ...] = ()
+        self._versao: str = ""
+        self._carregado = False
+        self._lock = threading.Lock()
+        self._versao_dados = VersaoDados(TAG_CATEGORIAS)
+
+    def carregar(self) -> bool:
+        """
+        Lê todas as categorias do banco e substitui o conteúdo do catálogo.
+
+        Returns:
+            True se o catálogo foi carregado, False em caso de erro
+        """
+        from repo import categoria_artigo_repo
+
+        # Consultada antes da leitura: uma escrita no meio do caminho provoca nova recarga
+        versao_banco = self._versao_dados.consultar()
+        try:
+            categorias = categoria_artigo_repo.obter_todos()
+        except Exception as e:
+            logger.error(f"Erro ao carregar catálogo de categorias: {e}")
+            with self._lock:
+                self._carregado = False
+            return False
+
+        ordenadas = tuple(sorted(categorias, key=lambda c: (c.nome.casefold(), c.id_categoria_artigo)))
+        assinatura = "\n".join(f"{c.id_categoria_artigo}|{c.nome}|{c.cor}" for c in ordenadas)
+        versao = hashlib.sha1(assinatura.encode("utf-8")).hexdigest()[:12]
+
+        with self._lock:
+            self._ordenadas = ordenadas
+            self._por_id = {c.id_categoria_artigo: c for c in ordenadas}
+            self._versao = versao
+            self._carregado = True
+        self._versao_dados.marcar(versao_banco)
+        logger.info(f"Catálogo de categorias carregado: {len(ordenadas)} categorias (versão {versao})")
+        return True
+
+    def descartar(self) -> None:
+        """Esvazia o catálogo até o próximo `carregar`."""
+        with self._lock:
+            self._por_id = {}
+            self._ordenadas = ()
+            self._versao = ""
+            self._carregado = False
+
+    def verificar_atualizacao(self) -> None:
+        """
+        Executada pela thread de atualização periódica: carrega o catálogo se
+        ainda não foi carregado e, se outro processo alterou as categorias,
+        invalida a tag (o ouvinte recarrega o catálogo e as páginas em cache
+        deste processo são descartadas).
+        """
+        if not self._carregado:
+            self.carregar()
+        elif self._versao_dados.desatualizada():
+            invalidar_tags(TAG_CATEGORIAS)
+
+    def obter_todas(self) -> List[CategoriaArtigo]:
+        """Retorna as categorias ordenadas por nome."""
+        return list(self._ordenadas)
+
+    def obter_por_id(self, id_categoria: Optional[int]) -> Optional[CategoriaArtigo]:
+        if id_categoria is None:
+            return None
+        return self._por_id.get(id_categoria)
+
+    @property
+    def versao(self) -> str:
+        """Hash do conteúdo atual do catálogo."""
+        return self._versao
+
+    def ao_invalidar(self, tags: Tuple[str, ...]) -> None:
+        """Ouvinte de `cache_util`: recarrega após escritas nas categorias."""
+        if TAG_CATEGORIAS in tags:
+            self.carregar()
+
+    def __len__(self) -> int:
+        return len(self._ordenadas)
+
+
+catalogo_categorias = CatalogoCategorias()
+registrar_ouvinte(catalogo_categorias.ao_invalidar)
+atualizacao_periodica.registrar(catalogo_categorias.verificar_atualizacao)
@@ -0,0 +1,269 @@
+"""
+Camada assíncrona de acesso ao banco, paralela aos repositórios síncronos.
+
+Rotas async aguardam as consultas sem ocupar threads do ExecutorRepo: cada
+conexão SQLite pertence a uma thread dedicada que consome uma fila de
+tarefas, e o resultado volta ao event loop por um Future. O banco assíncrono
+usa:
+
+- para as escritas, o escritor único de db_util (EscritorSerializado), o
+  mesmo dos repositórios síncronos: as escritas são gravadas em lote, cada
+  uma em seu SAVEPOINT, e não disputam o lock do SQLite;
+- N leitores (`DATABASE_ASYNC_LEITORES`) somente leitura, que em modo
+  WAL leem em paralelo com o escritor. Cada leitura vai para o leitor com
+  menos tarefas pendentes.
+
+Cancelamento: se a tarefa async for cancelada (ex.: o cliente desconectou e
+o servidor cancelou a requisição), uma consulta ainda na fila é descartada
+sem executar e uma consulta em execução é abortada com
+`Connection.interrupt()`. Escritas só podem ser canceladas enquanto estão na
+fila; depois de iniciadas, seguem até o commit do lote.
+
+Os módulos repo/*_repo_async.py espelham as funções dos repositórios
+síncronos e usam as mesmas constantes de sql/*.py.
+
+Examples:
+    >>> posts = await postagem_feed_repo_async.obter_pagina_com_dados(1, 16)
+"""
+
+import os
+import queue
+import atexit
+import asyncio
+import logging
+import sqlite3
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, List, Optional, Sequence, TypeVar
+
+from util.db_util import _criar_conexao_leitura, _get_db_path, obter_escritor
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Conexões de leitura do banco assíncrono (cada uma com sua thread)
+DB_ASYNC_LEITORES: int = int(os.getenv("DATABASE_ASYNC_LEITORES", "4"))
+
+# Operação executada na thread da conexão: recebe a conexão e devolve o resultado
+Operacao = Callable[[sqlite3.Connection], T]
+
+
+class _Tarefa:
+    __slots__ = ("operacao", "futuro")
+
+    def __init__(self, operacao: Operacao):
+        self.operacao = operacao
+        self.futuro: Future = Future()
+
+
+class ConexaoAssincrona:
+    """
+    Conexão SQLite somente leitura de uma thread dedicada, que executa as
+    tarefas na ordem de chegada.
+
+    Usa as conexões de leitura de db_util (`mode=ro` e `PRAGMA query_only`):
+    qualquer escrita falha com sqlite3.OperationalError. Escritas vão para o
+    escritor único (`BancoAssincrono.escrever`).
+    """
+
+    def __init__(self, db_path: str, nome: str):
+        self.db_path = db_path
+        self.nome = nome
+
+        self._fila: "queue.SimpleQueue[Optional[_Tarefa]]" = queue.SimpleQueue()
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._atual: Optional[_Tarefa] = None
+        self._pendentes = 0  # Na fila + em execução
+        self._fechada = False
+
+        # Métricas
+        self._executadas = 0
+        self._erros = 0
+        self._descartadas = 0
+        self._interrompidas = 0
+
+        self._thread = threading.Thread(target=self._processar, name=f"sqlite-{nome}", daemon=True)
+        self._thread.start()
+
+    @property
+    def pendentes(self) -> int:
+        return self._pendentes
+
+    async def executar(self, operacao: Operacao) -> T:
+        """Enfileira `operacao(conn)` na thread da conexão e aguarda o resultado."""
+        tarefa = _Tarefa(operacao)
+        with self._lock:
+            if self._fechada:
+                raise sqlite3.ProgrammingError(f"Conexão assíncrona '{self.nome}' já foi fechada")
+            self._pendentes += 1
+        self._fila.put(tarefa)
+        try:
+            return await asyncio.wrap_future(tarefa.futuro)
+        except asyncio.CancelledError:
+            self._cancelar(tarefa)
+            raise
+
+    def _cancelar(self, tarefa: _Tarefa) -> None:
+        """Descarta a tarefa se ainda estiver na fila; interrompe a consulta se já estiver rodando."""
+        if tarefa.futuro.cancel():
+            return
+        with self._lock:
+            # Sob o lock, a thread não troca de tarefa: o interrupt não atinge a próxima
+            if self._atual is tarefa and self._conn is not None:
+                self._conn.interrupt()
+                self._interrompidas += 1
+
+    def _processar(self) -> None:
+        conn: Optional[sqlite3.Connection] = None
+        erro_abertura: Optional[sqlite3.Error] = None
+        try:
+            conn = _criar_conexao_leitura(self.db_path)
+        except sqlite3.Error as e:
+            erro_abertura = e
+        with self._lock:
+            self._conn = conn
+
+        while True:
+            tarefa = self._fila.get()
+            if tarefa is None:
+                break
+            if not tarefa.futuro.set_running_or_notify_cancel():
+                with self._lock:
+                    self._pendentes -= 1
+                    self._descartadas += 1
+                continue
+
+            with self._lock:
+                self._atual = tarefa
+            try:
+                if conn is None:
+                    raise erro_abertura
+                resultado = tarefa.operacao(conn)
+            except BaseException as e:
+                with self._lock:
+                    self._atual = None
+                    self._pendentes -= 1
+                    self._erros += 1
+                tarefa.futuro.set_exception(e)
+            else:
+                with self._lock:
+                    self._atual = None
+                    self._pendentes -= 1
+                    self._executadas += 1
+                tarefa.futuro.set_result(resultado)
+
+        with self._lock:
+            self._conn = None
+        if conn is not None:
+            conn.close()
+
+    def fechar(self, timeout: Optional[float] = 5.0) -> None:
+        """Recusa novas tarefas, conclui as já enfileiradas e fecha a conexão."""
+        with self._lock:
+            if self._fechada:
+                return
+            self._fechada = True
+        self._fila.put(None)
+        self._thread.join(timeout)
+
+    def metricas(self) -> dict:
+        with self._lock:
+            return {
+                "nome": self.nome,
+                "pendentes": self._pendentes,
+                "executadas": self._executadas,
+                "erros": self._erros,
+                "descartadas": self._descartadas,
+                "interrompidas": self._interrompidas,
+            }
+
+
+class BancoAssincrono:
+    """Grupo de leitores assíncronos para um arquivo de banco; as escritas vão para o escritor único."""
+
+    def __init__(self, db_path: str, leitores: int = DB_ASYNC_LEITORES):
+        self.db_path = db_path
+        self.leitores = [
+            ConexaoAssincrona(db_path, f"leitor-{i}") for i in range(max(1, leitores))
+        ]
+
+    def _leitor_livre(self) -> ConexaoAssincrona:
+        return min(self.leitores, key=lambda leitor: leitor.pendentes)
+
+    async def ler(self, operacao: Operacao) -> T:
+        """Executa uma operação somente leitura no leitor menos ocupado."""
+        return await self._leitor_livre().executar(operacao)
+
+    async def escrever(self, operacao: Operacao) -> T:
+        """Executa uma operação de escrita no escritor único (commit do lote; só ela é desfeita em erro)."""
+        return await asyncio.wrap_future(obter_escritor().enviar(operacao))
+
+    async def consultar(self, sql: str, parametros: Sequence[Any] = ()) -> List[dict]:
+        """Retorna todas as linhas da consulta como dicionários."""
+        def operacao(conn: sqlite3.Connection) -> List[dict]:
+            return [dict(row) for row in conn.execute(sql, parametros).fetchall()]
+        return await self.ler(operacao)
+
+    async def consultar_um(self, sql: str, parametros: Sequence[Any] = ()) -> Optional[dict]:
+        """Retorna a primeira linha da consulta como dicionário (None se não houver)."""
+        def operacao(conn: sqlite3.Connection) -> Optional[dict]:
+            row = conn.execute(sql, parametros).fetchone()
+            return dict(row) if row else None
+        return await self.ler(operacao)
+
+    async def executar(self, sql: str, parametros: Sequence[Any] = ()) -> int:
+        """Executa um comando de escrita e retorna a quantidade de linhas afetadas."""
+        return await self.escrever(lambda conn: conn.execute(sql, parametros).rowcount)
+
+    def metricas(self) -> dict:
+        return {
+            "db_path": self.db_path,
+            "escritor": obter_escritor().metricas(),
+            "leitores": [leitor.metricas() for leitor in self.leitores],
+        }
+
+    def fechar(self) -> None:
+        for leitor in self.leitores:
+            leitor.fechar()
+
+
+_banco: Optional[BancoAssincrono] = None
+_banco_lock = threading.Lock()
+
+
+def obter_banco_async() -> BancoAssincrono:
+    """
+    Retorna o banco assíncrono do caminho atual.
+
+    Como em db_util._obter_pool, se o caminho do banco mudar (ex.: cada teste
+    usa um arquivo temporário), o anterior é fechado e um novo é criado.
+    """
+    global _banco
+    db_path = _get_db_path()
+    banco = _banco
+    if banco is not None and banco.db_path == db_path:
+        return banco
+    with _banco_lock:
+        if _banco is None or _banco.db_path != db_path:
+            if _banco is not None:
+                _banco.fechar()
+            _banco = BancoAssincrono(db_path)
+        return _banco
+
+
+def fechar_banco_async() -> None:
+    """Fecha as conexões do banco assíncrono (usado no encerramento da aplicação)."""
+    global _banco
+    with _banco_lock:
+        if _banco is not None:
+            _banco.fechar()
+            _banco = None
+
+
+def obter_metricas_banco_async() -> dict:
+    return obter_banco_async().metricas()
+
+
+atexit.register(fechar_banco_async)
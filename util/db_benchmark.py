@@ -0,0 +1,123 @@
+"""
+Benchmark das consultas de listagem e busca em cada perfil de desempenho do banco.
+
+Para cada perfil (config/db_config.py), os pools são recriados com os PRAGMAs
+do perfil e as funções reais dos repositórios são executadas `repeticoes`
+vezes. São reportados o tempo da primeira execução (conexão nova, cache de
+páginas vazio) e a mediana e o p95 das seguintes, em milissegundos.
+
+O cache de páginas do sistema operacional é compartilhado entre os perfis:
+rode o benchmark sobre uma cópia do banco de produção (ou uma massa
+sintética importada com `db_cli importar-dados`) para que as diferenças de
+cache_size/mmap_size apareçam.
+
+Uso:
+    python -m util.db_benchmark [--banco dados.db] [--perfis economico padrao desempenho] [--repeticoes 50]
+"""
+
+import argparse
+import logging
+import os
+import statistics
+import sys
+import time
+from typing import Any, Callable, Dict, Optional, Sequence
+
+from dotenv import load_dotenv
+
+logger = logging.getLogger(__name__)
+
+
+def _consultas() -> Dict[str, Callable[[], Any]]:
+    from repo import postagem_artigo_repo, postagem_feed_repo
+
+    return {
+        "artigos recentes": lambda: postagem_artigo_repo.obter_recentes_com_dados(6),
+        "artigos por cursor": lambda: postagem_artigo_repo.obter_pagina_cursor_com_dados(12),
+        "artigos da categoria": lambda: postagem_artigo_repo.obter_pagina_cursor_com_dados(12, id_categoria=1),
+        "artigos por página (offset)": lambda: postagem_artigo_repo.obter_pagina_com_dados(20, 12),
+        "total de artigos": postagem_artigo_repo.contar_total,
+        "feed por cursor": lambda: postagem_feed_repo.obter_pagina_cursor_com_dados(16),
+        "busca de artigos": lambda: postagem_artigo_repo.buscar_por_termo("vacina"),
+        "busca no feed": lambda: postagem_feed_repo.buscar_por_termo("gato"),
+    }
+
+
+def _medir_ms(funcao: Callable[[], Any]) -> float:
+    inicio = time.perf_counter()
+    funcao()
+    return (time.perf_counter() - inicio) * 1000
+
+
+def medir(perfis: Sequence[str], repeticoes: int = 50) -> Dict[str, Dict[str, dict]]:
+    """
+    Mede as consultas em cada perfil, no banco atual.
+
+    Returns:
+        {perfil: {consulta: {"frio": ms, "mediana": ms, "p95": ms}}}
+    """
+    from config.db_config import obter_perfil
+    from util import db_util
+
+    perfil_original = db_util.perfil_banco
+    consultas = _consultas()
+    resultados: Dict[str, Dict[str, dict]] = {}
+    try:
+        for nome_perfil in perfis:
+            db_util.definir_perfil(obter_perfil(nome_perfil))
+            resultados[nome_perfil] = {}
+            for nome, funcao in consultas.items():
+                frio = _medir_ms(funcao)
+                tempos = sorted(_medir_ms(funcao) for _ in range(max(1, repeticoes)))
+                resultados[nome_perfil][nome] = {
+                    "frio": frio,
+                    "mediana": statistics.median(tempos),
+                    "p95": tempos[min(len(tempos) - 1, int(len(tempos) * 0.95))],
+                }
+    finally:
+        db_util.definir_perfil(perfil_original)
+    return resultados
+
+
+def formatar(resultados: Dict[str, Dict[str, dict]]) -> str:
+    """Tabela com uma linha por consulta e as colunas frio/mediana/p95 de cada perfil."""
+    perfis = list(resultados)
+    if not perfis:
+        return ""
+    consultas = list(resultados[perfis[0]])
+    largura = max(len(nome) for nome in consultas)
+    cabecalho = " " * largura + "".join(f" | {perfil:^26}" for perfil in perfis)
+    subtitulo = " " * largura + " | {:>8} {:>8} {:>8}".format("frio", "mediana", "p95") * len(perfis)
+    linhas = [cabecalho, subtitulo, "-" * len(subtitulo)]
+    for nome in consultas:
+        colunas = "".join(
+            " | {frio:8.2f} {mediana:8.2f} {p95:8.2f}".format(**resultados[perfil][nome]) for perfil in perfis
+        )
+        linhas.append(f"{nome:<{largura}}{colunas}")
+    return "\n".join(linhas)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    from config.db_config import PERFIS
+
+    parser = argparse.ArgumentParser(
+        prog="python -m util.db_benchmark",
+        description="Compara os perfis de desempenho do SQLite nas consultas de listagem e busca.",
+    )
+    parser.add_argument("--banco", default=None, help="Arquivo do banco (padrão: DATABASE_PATH).")
+    parser.add_argument(
+        "--perfis", nargs="+", choices=list(PERFIS), default=list(PERFIS), help="Perfis a comparar (padrão: todos)."
+    )
+    parser.add_argument("--repeticoes", type=int, default=50, help="Execuções de cada consulta por perfil.")
+    args = parser.parse_args(argv)
+
+    if args.banco:
+        os.environ["DATABASE_PATH"] = args.banco
+    print(formatar(medir(args.perfis, args.repeticoes)))
+    return 0
+
+
+if __name__ == "__main__":
+    load_dotenv()
+    logging.basicConfig(level=logging.WARNING, format="%(levelname)s - %(message)s")
+    sys.exit(main())
@@ -0,0 +1,100 @@
+"""
+Comandos de manutenção do banco de dados.
+
+Uso:
+    python -m util.db_cli recalcular-curtidas
+    python -m util.db_cli importar-dados [--diretorio data] [--processos 8]
+    python -m util.db_cli migrar [--dry-run]
+"""
+
+import argparse
+import logging
+import sys
+from pathlib import Path
+from typing import Optional, Sequence
+
+from dotenv import load_dotenv
+
+logger = logging.getLogger(__name__)
+
+
+def recalcular_curtidas() -> None:
+    """Reconstrói os contadores total_curtidas de artigos e posts do feed."""
+    from repo import postagem_artigo_repo, postagem_feed_repo
+
+    total_artigos = postagem_artigo_repo.recalcular_total_curtidas()
+    logger.info(f"Contador de curtidas recalculado para {total_artigos} artigos.")
+
+    total_posts = postagem_feed_repo.recalcular_total_curtidas()
+    logger.info(f"Contador de curtidas recalculado para {total_posts} posts do feed.")
+
+
+def migrar(dry_run: bool = False) -> None:
+    """Aplica (ou, no dry-run, apenas lista) as migrações pendentes do esquema."""
+    from util.migracoes import migrar as aplicar_migracoes, trava_migracao
+
+    with trava_migracao():
+        migracoes = aplicar_migracoes(dry_run=dry_run)
+    if not migracoes:
+        logger.info("Esquema já está na versão mais recente.")
+    elif dry_run:
+        logger.info(f"{len(migracoes)} migrações seriam aplicadas.")
+    else:
+        logger.info(f"{len(migracoes)} migrações aplicadas.")
+
+
+def importar_dados(diretorio: Path, processos: Optional[int] = None) -> None:
+    """Cria as tabelas e importa os JSON de `diretorio` (ex.: massas de dados sintéticas)."""
+    from util.db_util import importar_dados as importar
+    from util.migracoes import migrar as aplicar_migracoes, trava_migracao
+
+    with trava_migracao():
+        aplicar_migracoes()
+        importados = importar(diretorio, processos)
+    logger.info(f"Importação concluída: {sum(importados.values())} registros de {diretorio}.")
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m util.db_cli",
+        description="Comandos de manutenção do banco de dados do VetConecta.",
+    )
+    subparsers = parser.add_subparsers(dest="comando", required=True)
+    subparsers.add_parser(
+        "recalcular-curtidas",
+        help="Reconstrói total_curtidas de postagem_artigo e postagem_feed a partir das tabelas de curtidas.",
+    )
+    importar_parser = subparsers.add_parser(
+        "importar-dados",
+        help="Importa em lote os arquivos JSON (admins.json, tutores.json, ...) de um diretório nas tabelas vazias.",
+    )
+    importar_parser.add_argument(
+        "--diretorio", type=Path, default=None, help="Diretório com os arquivos JSON (padrão: data/)."
+    )
+    importar_parser.add_argument(
+        "--processos", type=int, default=None, help="Processos para o hash das senhas (padrão: número de CPUs)."
+    )
+    migrar_parser = subparsers.add_parser(
+        "migrar",
+        help="Aplica as migrações pendentes do esquema (tabelas e índices), registrando-as em schema_version.",
+    )
+    migrar_parser.add_argument(
+        "--dry-run", action="store_true", help="Apenas lista as migrações pendentes, sem alterar o banco."
+    )
+    args = parser.parse_args(argv)
+
+    if args.comando == "recalcular-curtidas":
+        recalcular_curtidas()
+    elif args.comando == "migrar":
+        migrar(args.dry_run)
+    elif args.comando == "importar-dados":
+        from util.db_util import DIRETORIO_DADOS
+
+        importar_dados(args.diretorio or DIRETORIO_DADOS, args.processos)
+    return 0
+
+
+if __name__ == "__main__":
+    load_dotenv()
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s - %(message)s")
+    sys.exit(main())
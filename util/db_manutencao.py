@@ -0,0 +1,148 @@
+"""
+Manutenção periódica do banco SQLite em segundo plano.
+
+- Na inicialização, `ANALYZE` (com `analysis_limit`, para não varrer tabelas
+  grandes inteiras) atualiza as estatísticas que o planejador usa para
+  escolher os índices.
+- A cada `intervalo_manutencao` segundos do perfil (config/db_config.py),
+  `PRAGMA optimize` refaz as estatísticas que ficaram desatualizadas e
+  `PRAGMA wal_checkpoint(TRUNCATE)` devolve as páginas do WAL ao banco e
+  zera o arquivo -wal, que de outro modo só cresce entre checkpoints
+  completos. Na mesma rodada, os blobs de mídia órfãos há mais que a
+  carência são apagados (imagem_derivados.coletar_blobs_orfaos) e o registro
+  de alterações da mídia é podado (util/indice_midia.py).
+- No encerramento, uma última rodada de optimize/checkpoint, sem a coleta de
+  órfãos e a poda do registro de alterações: essas passam pelo escritor único,
+  que a aplicação fecha logo depois (ver o lifespan em main.py).
+
+Os comandos usam uma conexão de escrita do pool fora de transação (o
+checkpoint não pode rodar dentro de uma); se o escritor estiver no meio de um
+lote, o checkpoint apenas reporta as páginas que ainda não pôde copiar.
+"""
+
+import atexit
+import logging
+import threading
+import time
+from typing import Optional
+
+from util import db_util
+from util.db_util import get_connection
+
+logger = logging.getLogger(__name__)
+
+# Linhas amostradas por índice no ANALYZE da inicialização
+LIMITE_ANALISE = 1000
+
+
+def analisar() -> None:
+    """Atualiza as estatísticas do planejador (sqlite_stat1)."""
+    inicio = time.perf_counter()
+    with get_connection() as conn:
+        conn.execute(f"PRAGMA analysis_limit = {LIMITE_ANALISE}")
+        conn.execute("ANALYZE")
+    logger.info(f"ANALYZE concluído em {time.perf_counter() - inicio:.3f}s")
+
+
+def otimizar() -> None:
+    """Executa PRAGMA optimize (reanalisa só o que o SQLite julgar necessário)."""
+    with get_connection() as conn:
+        conn.execute("PRAGMA optimize")
+
+
+def checkpoint() -> dict:
+    """
+    Executa PRAGMA wal_checkpoint(TRUNCATE).
+
+    Returns:
+        Resultado do checkpoint: se foi bloqueado, páginas no WAL e páginas copiadas
+    """
+    with get_connection() as conn:
+        bloqueado, paginas_wal, copiadas = conn.execute("PRAGMA wal_checkpoint(TRUNCATE)").fetchone()
+    if bloqueado:
+        logger.info(f"Checkpoint parcial: {copiadas} de {paginas_wal} páginas do WAL copiadas")
+    return {"bloqueado": bool(bloqueado), "paginas_wal": paginas_wal, "copiadas": copiadas}
+
+
+class ManutencaoBanco:
+    """Thread que executa optimize e checkpoint periodicamente."""
+
+    def __init__(self, intervalo_segundos: Optional[float] = None):
+        self._intervalo_segundos = intervalo_segundos
+        self._parar = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.execucoes = 0
+
+    @property
+    def intervalo_segundos(self) -> float:
+        """Intervalo informado na criação ou, na falta dele, o do perfil atual."""
+        if self._intervalo_segundos is not None:
+            return self._intervalo_segundos
+        return db_util.perfil_banco.intervalo_manutencao
+
+    def em_execucao(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def executar_uma_vez(self, coletar_midia: bool = True) -> None:
+        """Optimize e checkpoint; com `coletar_midia`, também as limpezas da mídia (escritas)."""
+        try:
+            otimizar()
+            checkpoint()
+            self.execucoes += 1
+        except Exception as e:
+            logger.error(f"Erro na manutenção do banco: {e}")
+        if not coletar_midia:
+            return
+        try:
+            from util.imagem_derivados import coletar_blobs_orfaos
+
+            coletar_blobs_orfaos()
+        except Exception as e:
+            logger.error(f"Erro na coleta de mídia órfã: {e}")
+        try:
+            from config.upload_config import UploadConfig
+            from repo import midia_repo
+
+            midia_repo.limpar_alteracoes(UploadConfig.MIDIA_RETENCAO_ALTERACOES)
+        except Exception as e:
+            logger.error(f"Erro na limpeza do registro de alterações da mídia: {e}")
+
+    def iniciar(self) -> None:
+        """Inicia a thread de manutenção (nada a fazer se o intervalo do perfil for 0)."""
+        if self.em_execucao() or self.intervalo_segundos <= 0:
+            return
+        self._parar.clear()
+        self._thread = threading.Thread(target=self._executar, name="manutencao-banco", daemon=True)
+        self._thread.start()
+
+    def parar(self) -> None:
+        """Interrompe a thread e faz uma última rodada de optimize/checkpoint."""
+        if self._thread is None:
+            return
+        self._parar.set()
+        self._thread.join()
+        self._thread = None
+        self.executar_uma_vez(coletar_midia=False)
+
+    def _executar(self) -> None:
+        while not self._parar.wait(self.intervalo_segundos):
+            self.executar_uma_vez()
+
+
+_manutencao = ManutencaoBanco()
+
+
+def iniciar_manutencao() -> None:
+    """ANALYZE de inicialização e início da manutenção periódica."""
+    try:
+        analisar()
+    except Exception as e:
+        logger.error(f"Erro no ANALYZE de inicialização: {e}")
+    _manutencao.iniciar()
+
+
+def parar_manutencao() -> None:
+    _manutencao.parar()
+
+
+atexit.register(parar_manutencao)
@@ -1,16 +1,42 @@
 import sqlite3
 import os
 import json
+import time
+import queue
+import atexit
+import threading
+from concurrent.futures import Future
 from contextlib import contextmanager
-from typing import Generator
+from functools import wraps
+from typing import Any, Callable, Generator, List, Optional, TypeVar
 from pathlib import Path
 import logging
 
+from config.db_config import PerfilBanco, obter_perfil
+
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
 # Timeout padrão
 DB_TIMEOUT: float = float(os.getenv("DATABASE_TIMEOUT", "30.0"))
 
+# Configurações do pool de conexões
+DB_POOL_TAMANHO: int = int(os.getenv("DATABASE_POOL_SIZE", "10"))
+DB_POOL_TEMPO_OCIOSO: float = float(os.getenv("DATABASE_POOL_MAX_IDLE", "300.0"))
+DB_POOL_TIMEOUT: float = float(os.getenv("DATABASE_POOL_TIMEOUT", str(DB_TIMEOUT)))
+DB_POOL_VERIFICAR_APOS: float = float(os.getenv("DATABASE_POOL_HEALTHCHECK_AFTER", "30.0"))
+
+# Pool de conexões somente leitura (obter_*, contar_*, buscar_* dos repositórios)
+DB_POOL_LEITURA_TAMANHO: int = int(os.getenv("DATABASE_POOL_LEITURA_SIZE", str(DB_POOL_TAMANHO)))
+
+# Perfil de desempenho (cache, mmap, checkpoints...) aplicado a cada conexão nova (ver config/db_config.py)
+perfil_banco: PerfilBanco = obter_perfil()
+
+# Escritor único: máximo de escritas por commit e espera (ms) por mais escritas antes de gravar
+DB_ESCRITA_LOTE: int = int(os.getenv("DATABASE_ESCRITA_LOTE", "32"))
+DB_ESCRITA_JANELA: float = float(os.getenv("DATABASE_ESCRITA_JANELA_MS", "0")) / 1000
+
 
 # Função para obter o caminho do banco de dados, considerando variáveis
 # de ambiente que indicam caminhos diferentes para testes e produção.
@@ -19,143 +45,786 @@ def _get_db_path() -> str:
     return os.getenv("TEST_DATABASE_PATH") or os.getenv("DATABASE_PATH") or "dados.db"
 
 
-def _criar_conexao() -> sqlite3.Connection:
+def definir_perfil(perfil: PerfilBanco) -> None:
+    """
+    Troca o perfil de desempenho.
+
+    Os pools, o escritor único e o banco assíncrono são fechados (as escritas
+    pendentes são gravadas antes) para que as próximas conexões recebam o
+    perfil novo.
+    """
+    from util.db_async import fechar_banco_async
+
+    global perfil_banco
+    perfil_banco = perfil
+    fechar_pool_conexoes()
+    fechar_escritor()
+    fechar_banco_async()
+
+
+def _aplicar_perfil(conn: sqlite3.Connection, perfil: PerfilBanco, somente_leitura: bool = False) -> None:
+    """Aplica os PRAGMAs do perfil (uma vez por conexão, na criação)."""
+    busy_timeout_ms = perfil.busy_timeout_ms if perfil.busy_timeout_ms is not None else DB_TIMEOUT * 1000
+    conn.execute(f"PRAGMA busy_timeout = {int(busy_timeout_ms)}")
+    conn.execute(f"PRAGMA cache_size = {-int(perfil.cache_kb)}")
+    conn.execute(f"PRAGMA mmap_size = {int(perfil.mmap_bytes)}")
+    conn.execute(f"PRAGMA temp_store = {perfil.temp_store}")
+    if not somente_leitura:
+        conn.execute(f"PRAGMA synchronous = {perfil.synchronous}")
+        conn.execute(f"PRAGMA wal_autocheckpoint = {int(perfil.wal_autocheckpoint)}")
+
+
+def _criar_conexao(db_path: Optional[str] = None, perfil: Optional[PerfilBanco] = None) -> sqlite3.Connection:
     """Cria uma conexão configurada com o banco de dados."""
     try:
-        db_path = _get_db_path()  # Lê dinamicamente a cada conexão
+        db_path = db_path or _get_db_path()  # Lê dinamicamente a cada conexão
         conn = sqlite3.connect(db_path, timeout=DB_TIMEOUT, check_same_thread=False)
         conn.row_factory = sqlite3.Row
         # CRITICAL: Habilitar foreign keys no SQLite
         conn.execute("PRAGMA foreign_keys = ON")
         # Performance improvements
         conn.execute("PRAGMA journal_mode = WAL")
-        conn.execute("PRAGMA synchronous = NORMAL")
+        _aplicar_perfil(conn, perfil or perfil_banco)
         return conn
     except sqlite3.Error as e:
         logger.error(f"Erro ao conectar ao banco de dados: {e}")
         raise
 
 
+def _criar_conexao_leitura(db_path: Optional[str] = None, perfil: Optional[PerfilBanco] = None) -> sqlite3.Connection:
+    """
+    Cria uma conexão somente leitura (URI `mode=ro` + `PRAGMA query_only`).
+
+    Não faz commit nem pega o lock de escrita; em modo WAL lê em paralelo com
+    o escritor. O arquivo do banco precisa existir (é criado por
+    inicializar_banco, em uma conexão de escrita).
+    """
+    try:
+        db_path = db_path or _get_db_path()
+        uri = f"{Path(db_path).resolve().as_uri()}?mode=ro"
+        conn = sqlite3.connect(uri, uri=True, timeout=DB_TIMEOUT, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA query_only = ON")
+        _aplicar_perfil(conn, perfil or perfil_banco, somente_leitura=True)
+        return conn
+    except sqlite3.Error as e:
+        logger.error(f"Erro ao conectar ao banco de dados (somente leitura): {e}")
+        raise
+
+
+class PoolConexoes:
+    """
+    Pool limitado de conexões SQLite reutilizáveis para um arquivo de banco.
+
+    Cada conexão é criada (e recebe os PRAGMAs) uma única vez e depois é
+    devolvida ao pool ao fim de cada uso. Conexões ociosas há mais de
+    `tempo_ocioso_maximo` segundos são fechadas, e conexões paradas há mais
+    de `verificar_apos` segundos passam por um health check antes de serem
+    entregues novamente. Com `somente_leitura`, as conexões são criadas por
+    `_criar_conexao_leitura`.
+    """
+
+    def __init__(
+        self,
+        db_path: str,
+        tamanho_maximo: int = DB_POOL_TAMANHO,
+        tempo_ocioso_maximo: float = DB_POOL_TEMPO_OCIOSO,
+        timeout: float = DB_POOL_TIMEOUT,
+        verificar_apos: float = DB_POOL_VERIFICAR_APOS,
+        somente_leitura: bool = False,
+    ):
+        self.db_path = db_path
+        self.somente_leitura = somente_leitura
+        self.tamanho_maximo = max(1, tamanho_maximo)
+        self.tempo_ocioso_maximo = tempo_ocioso_maximo
+        self.timeout = timeout
+        self.verificar_apos = verificar_apos
+
+        # Pilha LIFO de (conexão, instante da devolução): reaproveita as mais quentes
+        self._livres: list[tuple[sqlite3.Connection, float]] = []
+        self._total = 0  # Conexões abertas (livres + em uso)
+        self._em_uso = 0
+        self._fechado = False
+        self._condicao = threading.Condition()
+
+        # Métricas
+        self._aquisicoes = 0
+        self._esperas = 0
+        self._tempo_espera_total = 0.0
+        self._tempo_espera_maximo = 0.0
+        self._timeouts = 0
+        self._criadas = 0
+        self._descartadas = 0
+
+    def adquirir(self) -> sqlite3.Connection:
+        """Retira uma conexão do pool, aguardando até `timeout` se estiver cheio."""
+        inicio = time.monotonic()
+        esperou = False
+        conn: Optional[sqlite3.Connection] = None
+        devolvida_em = 0.0
+
+        with self._condicao:
+            while True:
+                if self._fechado:
+                    raise sqlite3.ProgrammingError("Pool de conexões já foi fechado")
+                self._descartar_ociosas()
+                if self._livres:
+                    conn, devolvida_em = self._livres.pop()
+                    break
+                if self._total < self.tamanho_maximo:
+                    self._total += 1  # Reserva a vaga; a conexão é criada fora do lock
+                    break
+                restante = self.timeout - (time.monotonic() - inicio)
+                if restante <= 0:
+                    self._timeouts += 1
+                    raise sqlite3.OperationalError(
+                        f"Tempo esgotado aguardando conexão livre no pool ({self.timeout}s)"
+                    )
+                esperou = True
+                self._condicao.wait(restante)
+            self._em_uso += 1
+
+        try:
+            if conn is None:
+                conn = self._nova_conexao()
+            elif time.monotonic() - devolvida_em > self.verificar_apos and not self._saudavel(conn):
+                logger.warning("Conexão do pool falhou no health check; recriando")
+                self._fechar_silencioso(conn)
+                with self._condicao:
+                    self._descartadas += 1
+                conn = self._nova_conexao()
+        except Exception:
+            with self._condicao:
+                self._total -= 1
+                self._em_uso -= 1
+                self._condicao.notify()
+            raise
+
+        espera = time.monotonic() - inicio
+        with self._condicao:
+            self._aquisicoes += 1
+            if esperou:
+                self._esperas += 1
+            self._tempo_espera_total += espera
+            self._tempo_espera_maximo = max(self._tempo_espera_maximo, espera)
+        return conn
+
+    def devolver(self, conn: sqlite3.Connection) -> None:
+        """Devolve a conexão ao pool, descartando-a se estiver em estado inválido."""
+        try:
+            # Nunca devolver conexão com transação pendente
+            if conn.in_transaction:
+                conn.rollback()
+            conn.row_factory = sqlite3.Row
+        except sqlite3.Error as e:
+            logger.warning(f"Conexão descartada ao retornar ao pool: {e}")
+            self.descartar(conn)
+            return
+
+        with self._condicao:
+            self._em_uso -= 1
+            if self._fechado:
+                self._total -= 1
+                self._fechar_silencioso(conn)
+            else:
+                self._livres.append((conn, time.monotonic()))
+            self._condicao.notify()
+
+    def descartar(self, conn: sqlite3.Connection) -> None:
+        """Fecha uma conexão em uso sem devolvê-la ao pool."""
+        self._fechar_silencioso(conn)
+        with self._condicao:
+            self._em_uso -= 1
+            self._total -= 1
+            self._descartadas += 1
+            self._condicao.notify()
+
+    def fechar(self) -> None:
+        """Fecha as conexões livres; as que estão em uso são fechadas ao serem devolvidas."""
+        with self._condicao:
+            self._fechado = True
+            for conn, _ in self._livres:
+                self._fechar_silencioso(conn)
+            self._total -= len(self._livres)
+            self._livres.clear()
+            self._condicao.notify_all()
+
+    def metricas(self) -> dict:
+        """Retorna um retrato das métricas de uso do pool."""
+        with self._condicao:
+            return {
+                "db_path": self.db_path,
+                "somente_leitura": self.somente_leitura,
+                "tamanho_maximo": self.tamanho_maximo,
+                "abertas": self._total,
+                "livres": len(self._livres),
+                "em_uso": self._em_uso,
+                "aquisicoes": self._aquisicoes,
+                "esperas": self._esperas,
+                "tempo_espera_total": self._tempo_espera_total,
+                "tempo_espera_medio": (
+                    self._tempo_espera_total / self._aquisicoes if self._aquisicoes else 0.0
+                ),
+                "tempo_espera_maximo": self._tempo_espera_maximo,
+                "timeouts": self._timeouts,
+                "criadas": self._criadas,
+                "descartadas": self._descartadas,
+            }
+
+    def _nova_conexao(self) -> sqlite3.Connection:
+        criar = _criar_conexao_leitura if self.somente_leitura else _criar_conexao
+        conn = criar(self.db_path)
+        with self._condicao:
+            self._criadas += 1
+        return conn
+
+    def _descartar_ociosas(self) -> None:
+        """Fecha conexões livres ociosas há mais tempo que o limite (chamar com lock)."""
+        if not self._livres or self.tempo_ocioso_maximo <= 0:
+            return
+        limite = time.monotonic() - self.tempo_ocioso_maximo
+        # A pilha é LIFO: as mais antigas ficam no início da lista
+        while self._livres and self._livres[0][1] < limite:
+            conn, _ = self._livres.pop(0)
+            self._fechar_silencioso(conn)
+            self._total -= 1
+            self._descartadas += 1
+
+    @staticmethod
+    def _saudavel(conn: sqlite3.Connection) -> bool:
+        try:
+            conn.execute("SELECT 1").fetchone()
+            return True
+        except sqlite3.Error:
+            return False
+
+    @staticmethod
+    def _fechar_silencioso(conn: sqlite3.Connection) -> None:
+        try:
+            conn.close()
+        except sqlite3.Error:
+            pass
+
+
+_pool: Optional[PoolConexoes] = None
+_pool_lock = threading.Lock()
+
+
+def _obter_pool() -> PoolConexoes:
+    """
+    Retorna o pool do banco atual.
+
+    Se o caminho do banco mudar (ex.: cada teste usa um arquivo temporário),
+    o pool anterior é fechado e um novo é criado para o caminho atual.
+    """
+    global _pool
+    db_path = _get_db_path()
+    pool = _pool
+    if pool is not None and pool.db_path == db_path:
+        return pool
+    with _pool_lock:
+        if _pool is None or _pool.db_path != db_path:
+            if _pool is not None:
+                _pool.fechar()
+            _pool = PoolConexoes(db_path)
+        return _pool
+
+
+_pool_leitura: Optional[PoolConexoes] = None
+
+
+def _obter_pool_leitura() -> PoolConexoes:
+    """Retorna o pool somente leitura do banco atual (recriado se o caminho mudar, como _obter_pool)."""
+    global _pool_leitura
+    db_path = _get_db_path()
+    pool = _pool_leitura
+    if pool is not None and pool.db_path == db_path:
+        return pool
+    with _pool_lock:
+        if _pool_leitura is None or _pool_leitura.db_path != db_path:
+            if _pool_leitura is not None:
+                _pool_leitura.fechar()
+            _pool_leitura = PoolConexoes(db_path, tamanho_maximo=DB_POOL_LEITURA_TAMANHO, somente_leitura=True)
+        return _pool_leitura
+
+
+def fechar_pool_conexoes() -> None:
+    """Fecha todas as conexões dos pools (usado no encerramento da aplicação)."""
+    global _pool, _pool_leitura
+    with _pool_lock:
+        for pool in (_pool, _pool_leitura):
+            if pool is not None:
+                pool.fechar()
+        _pool = _pool_leitura = None
+
+
+def obter_metricas_pool() -> dict:
+    """Retorna as métricas do pool de conexões do banco atual."""
+    return _obter_pool().metricas()
+
+
+def obter_metricas_pool_leitura() -> dict:
+    """Retorna as métricas do pool de conexões somente leitura do banco atual."""
+    return _obter_pool_leitura().metricas()
+
+
+atexit.register(fechar_pool_conexoes)
+
+
+# Transação explícita em andamento na thread (ver transacao())
+_transacao_atual = threading.local()
+
+
 @contextmanager
 def get_connection() -> Generator[sqlite3.Connection, None, None]:
     """Context manager para gerenciar conexões com commit/rollback automático."""
-    conn = _criar_conexao()
+    conn_transacao = getattr(_transacao_atual, "conn", None)
+    if conn_transacao is not None:
+        # Dentro de transacao(): quem abriu a transação decide o commit/rollback
+        yield conn_transacao
+        return
+
+    pool = _obter_pool()
+    conn = pool.adquirir()
     try:
         yield conn
         conn.commit()
     except Exception as e:
-        conn.rollback()
+        try:
+            conn.rollback()
+        except sqlite3.Error:
+            pass
+        logger.error(f"Erro na transação, rollback executado: {e}")
+        raise
+    finally:
+        pool.devolver(conn)
+
+
+@contextmanager
+def transacao() -> Generator[sqlite3.Connection, None, None]:
+    """
+    Agrupa tudo o que for feito na thread em uma única transação explícita.
+
+    Enquanto o bloco estiver aberto, as chamadas a get_connection() da mesma
+    thread (inclusive dentro das funções dos repositórios) recebem esta mesma
+    conexão e não fazem commit próprio. Como a transação é aberta com
+    `BEGIN IMMEDIATE`, também comandos DDL (CREATE TABLE/INDEX) são desfeitos
+    no rollback.
+    """
+    if getattr(_transacao_atual, "conn", None) is not None:
+        raise sqlite3.ProgrammingError("Já existe uma transação aberta nesta thread")
+
+    pool = _obter_pool()
+    conn = pool.adquirir()
+    try:
+        conn.execute("BEGIN IMMEDIATE")
+        _transacao_atual.conn = conn
+        try:
+            yield conn
+        finally:
+            _transacao_atual.conn = None
+        conn.commit()
+    except Exception as e:
+        try:
+            conn.rollback()
+        except sqlite3.Error:
+            pass
         logger.error(f"Erro na transação, rollback executado: {e}")
         raise
     finally:
-        conn.close()
+        pool.devolver(conn)
+
+
+class _Escrita:
+    __slots__ = ("operacao", "futuro", "enfileirada_em")
+
+    def __init__(self, operacao: Callable[[sqlite3.Connection], Any]):
+        self.operacao = operacao
+        self.futuro: Future = Future()
+        self.enfileirada_em = time.perf_counter()
+
+
+class EscritorSerializado:
+    """
+    Thread única dona da conexão de escrita do banco.
+
+    As escritas são enfileiradas e devolvem um Future. A thread retira da fila
+    tudo o que já estiver esperando (até `tamanho_lote` escritas, aguardando
+    no máximo `janela` segundos por mais) e grava o lote em uma única
+    transação (group commit): um só lock de escrita e um só sync do WAL para
+    várias escritas. Cada escrita roda em um SAVEPOINT próprio, então a falha
+    de uma é desfeita sem afetar as demais do lote. O Future só é resolvido
+    depois do COMMIT.
+
+    Como só esta thread escreve, as escritas não disputam o lock do SQLite
+    entre si e não esperam DATABASE_TIMEOUT em "database is locked".
+    """
+
+    def __init__(self, db_path: str, tamanho_lote: int = DB_ESCRITA_LOTE, janela: float = DB_ESCRITA_JANELA):
+        self.db_path = db_path
+        self.tamanho_lote = max(1, tamanho_lote)
+        self.janela = janela
+
+        self._fila: "queue.SimpleQueue[Optional[_Escrita]]" = queue.SimpleQueue()
+        self._lock = threading.Lock()
+        self._fechado = False
+
+        # Métricas
+        self._na_fila = 0
+        self._pico_fila = 0
+        self._escritas = 0
+        self._erros = 0
+        self._canceladas = 0
+        self._lotes = 0
+        self._maior_lote = 0
+        self._latencia_total = 0.0
+        self._latencia_maxima = 0.0
+
+        self._thread = threading.Thread(target=self._processar, name="sqlite-escritor", daemon=True)
+        self._thread.start()
+
+    def na_thread_escritora(self) -> bool:
+        return threading.current_thread() is self._thread
+
+    def enviar(self, operacao: Callable[[sqlite3.Connection], T]) -> "Future[T]":
+        """Enfileira `operacao(conn)`; o Future recebe o retorno após o commit do lote."""
+        escrita = _Escrita(operacao)
+        with self._lock:
+            if self._fechado:
+                raise sqlite3.ProgrammingError("Escritor do banco já foi fechado")
+            self._na_fila += 1
+            self._pico_fila = max(self._pico_fila, self._na_fila)
+        self._fila.put(escrita)
+        return escrita.futuro
+
+    def executar(self, operacao: Callable[[sqlite3.Connection], T]) -> T:
+        """Enfileira a escrita e aguarda o resultado (ou a exceção da própria escrita)."""
+        return self.enviar(operacao).result()
+
+    def _processar(self) -> None:
+        conn: Optional[sqlite3.Connection] = None
+        erro_abertura: Optional[sqlite3.Error] = None
+        try:
+            conn = _criar_conexao(self.db_path)
+        except sqlite3.Error as e:
+            erro_abertura = e
+
+        encerrar = False
+        while not encerrar:
+            primeira = self._fila.get()
+            if primeira is None:
+                break
+            lote = [primeira]
+            prazo = time.monotonic() + self.janela
+            while len(lote) < self.tamanho_lote:
+                try:
+                    restante = prazo - time.monotonic()
+                    escrita = self._fila.get(timeout=restante) if restante > 0 else self._fila.get_nowait()
+                except queue.Empty:
+                    break
+                if escrita is None:
+                    encerrar = True
+                    break
+                lote.append(escrita)
+
+            with self._lock:
+                self._na_fila -= len(lote)
+            ativas = [escrita for escrita in lote if escrita.futuro.set_running_or_notify_cancel()]
+            if len(ativas) < len(lote):
+                with self._lock:
+                    self._canceladas += len(lote) - len(ativas)
+            if not ativas:
+                continue
+            if conn is None:
+                for escrita in ativas:
+                    escrita.futuro.set_exception(erro_abertura)
+                continue
+            self._gravar_lote(conn, ativas)
+
+        if conn is not None:
+            conn.close()
+
+    def _gravar_lote(self, conn: sqlite3.Connection, lote: List[_Escrita]) -> None:
+        resultados = []
+        _transacao_atual.conn = conn  # get_connection() dentro das escritas usa esta conexão
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            for escrita in lote:
+                conn.execute("SAVEPOINT escrita")
+                try:
+                    resultado = escrita.operacao(conn)
+                except Exception as e:
+                    conn.execute("ROLLBACK TO escrita")
+                    conn.execute("RELEASE escrita")
+                    resultados.append((escrita, None, e))
+                else:
+                    conn.execute("RELEASE escrita")
+                    resultados.append((escrita, resultado, None))
+            conn.commit()
+        except sqlite3.Error as e:
+            try:
+                conn.rollback()
+            except sqlite3.Error:
+                pass
+            logger.error(f"Erro ao gravar lote de {len(lote)} escritas, rollback executado: {e}")
+            # Escritas que já tinham falhado mantêm o próprio erro; as demais recebem o do lote
+            concluidas = {id(escrita): erro for escrita, _, erro in resultados if erro is not None}
+            resultados = [(escrita, None, concluidas.get(id(escrita), e)) for escrita in lote]
+        finally:
+            _transacao_atual.conn = None
+
+        agora = time.perf_counter()
+        with self._lock:
+            self._lotes += 1
+            self._maior_lote = max(self._maior_lote, len(lote))
+            for escrita, _, erro in resultados:
+                latencia = agora - escrita.enfileirada_em
+                self._latencia_total += latencia
+                self._latencia_maxima = max(self._latencia_maxima, latencia)
+                if erro is None:
+                    self._escritas += 1
+                else:
+                    self._erros += 1
+        for escrita, resultado, erro in resultados:
+            if erro is None:
+                escrita.futuro.set_result(resultado)
+            else:
+                escrita.futuro.set_exception(erro)
+
+    def fechar(self, timeout: Optional[float] = 10.0) -> None:
+        """Recusa novas escritas, grava as que já estão na fila e fecha a conexão."""
+        with self._lock:
+            if self._fechado:
+                return
+            self._fechado = True
+        self._fila.put(None)
+        if not self.na_thread_escritora():
+            self._thread.join(timeout)
+
+    def metricas(self) -> dict:
+        """Retorna um retrato das métricas do escritor."""
+        with self._lock:
+            concluidas = self._escritas + self._erros
+            return {
+                "db_path": self.db_path,
+                "na_fila": self._na_fila,
+                "pico_fila": self._pico_fila,
+                "escritas": self._escritas,
+                "erros": self._erros,
+                "canceladas": self._canceladas,
+                "lotes": self._lotes,
+                "escritas_por_lote": concluidas / self._lotes if self._lotes else 0.0,
+                "maior_lote": self._maior_lote,
+                "latencia_media": self._latencia_total / concluidas if concluidas else 0.0,
+                "latencia_maxima": self._latencia_maxima,
+            }
+
+
+_escritor: Optional[EscritorSerializado] = None
+_escritor_lock = threading.Lock()
+
+
+def obter_escritor() -> EscritorSerializado:
+    """Retorna o escritor do banco atual (recriado se o caminho do banco mudar, como o pool)."""
+    global _escritor
+    db_path = _get_db_path()
+    escritor = _escritor
+    if escritor is not None and escritor.db_path == db_path:
+        return escritor
+    with _escritor_lock:
+        if _escritor is None or _escritor.db_path != db_path:
+            if _escritor is not None:
+                _escritor.fechar()
+            _escritor = EscritorSerializado(db_path)
+        return _escritor
+
+
+def fechar_escritor() -> None:
+    """Grava as escritas pendentes e encerra o escritor (usado no encerramento da aplicação)."""
+    global _escritor
+    with _escritor_lock:
+        if _escritor is not None:
+            _escritor.fechar()
+            _escritor = None
+
+
+def obter_metricas_escritor() -> dict:
+    """Retorna a profundidade da fila e a latência das escritas do banco atual."""
+    return obter_escritor().metricas()
+
+
+atexit.register(fechar_escritor)
+
+
+def serializar_escrita(func: Callable[..., T]) -> Callable[..., T]:
+    """
+    Decorador para as funções de escrita dos repositórios: a função é
+    executada pelo escritor único (ver EscritorSerializado) e a chamada
+    bloqueia até o commit do lote, retornando o mesmo valor (ou levantando a
+    mesma exceção) da função original.
+
+    Dentro de transacao() ou da própria thread escritora a função roda
+    diretamente, na transação já aberta.
+
+    Examples:
+        >>> @invalida_cache("posts")
+        ... @serializar_escrita
+        ... def inserir(postagem: PostagemFeed) -> Optional[int]:
+        ...     ...
+    """
+    @wraps(func)
+    def wrapper(*args, **kwargs) -> T:
+        if getattr(_transacao_atual, "conn", None) is not None:
+            return func(*args, **kwargs)
+        return obter_escritor().executar(lambda conn: func(*args, **kwargs))
+    return wrapper
+
+
+@contextmanager
+def get_connection_leitura() -> Generator[sqlite3.Connection, None, None]:
+    """
+    Context manager com uma conexão somente leitura do pool de leitura.
+
+    Usado pelas consultas dos repositórios (obter_*, contar_*, buscar_*): não
+    faz commit ao sair e a conexão recusa qualquer escrita. Dentro de
+    transacao() ou do escritor único, devolve a conexão da transação aberta,
+    para que a leitura enxergue as escritas ainda não confirmadas.
+    """
+    conn_transacao = getattr(_transacao_atual, "conn", None)
+    if conn_transacao is not None:
+        yield conn_transacao
+        return
+
+    pool = _obter_pool_leitura()
+    conn = pool.adquirir()
+    try:
+        yield conn
+    finally:
+        pool.devolver(conn)
 
 
 def get_connection_sem_commit() -> sqlite3.Connection:
-    """Retorna conexão sem commit automático para operações de leitura."""
-    return _criar_conexao()
+    """
+    Retorna conexão somente leitura, sem commit, para operações de leitura.
+
+    A conexão não pertence ao pool: quem a obtém é responsável por fechá-la.
+    """
+    return _criar_conexao_leitura()
 
 
 def inicializar_banco():
-    # Chama o método criar_tabela de cada repositório para garantir que as tabelas existam
-    from repo import (
-        administrador_repo,
-        tutor_repo,
-        usuario_repo,
-        veterinario_repo,
-        categoria_artigo_repo,
-        postagem_artigo_repo,
-        curtida_artigo_repo,
-        postagem_feed_repo,
-        curtida_feed_repo,
-        denuncia_repo,
-        verificacao_crmv_repo,
-        seguida_repo,
-    )
-
-    usuario_repo.criar_tabela()
-    tutor_repo.criar_tabela()
-    veterinario_repo.criar_tabela()
-    administrador_repo.criar_tabela()
-    categoria_artigo_repo.criar_tabela()
-    postagem_artigo_repo.criar_tabela()
-    curtida_artigo_repo.criar_tabela()
-    postagem_feed_repo.criar_tabela()
-    curtida_feed_repo.criar_tabela()
-    denuncia_repo.criar_tabela()
-    verificacao_crmv_repo.criar_tabela()
-    seguida_repo.criar_tabela()
-
-    # Importar dados iniciais se necessário
-    importar_admins()
-    importar_veterinarios()
-    importar_tutores()
-    importar_categorias_artigos()
-    importar_postagens_artigos()
-    importar_postagens_feeds()
-
-
-def importar_admins():
+    # Cria/atualiza o esquema aplicando as migrações pendentes (ver util/migracoes.py)
+    from util.migracoes import esquema_atualizado, marcar_versao_banco, migrar, trava_migracao
+
+    # Caminho rápido: banco já migrado e com dados iniciais, nada de DDL nem consultas por tabela
+    if esquema_atualizado():
+        return
+
+    # Só um processo migra; os demais esperam o lock e encontram o banco atualizado
+    with trava_migracao():
+        if esquema_atualizado():
+            return
+        migrar()
+
+        # Importar dados iniciais se necessário
+        importar_dados()
+        marcar_versao_banco()
+
+
+# Pasta com os arquivos JSON dos dados iniciais
+DIRETORIO_DADOS = Path(__file__).parent.parent / "data"
+
+
+def importar_dados(diretorio: Path = DIRETORIO_DADOS, processos: Optional[int] = None) -> dict:
+    """
+    Importa todos os arquivos JSON de `diretorio`, na ordem exigida pelas chaves estrangeiras.
+
+    Cada arquivo é gravado com executemany em uma única transação e as senhas
+    são transformadas em hash em paralelo (ver `criar_hashes_senhas`).
+
+    Returns:
+        Quantidade de registros importados por arquivo
+    """
+    inicio = time.perf_counter()
+    importados = {
+        "admins": importar_admins(diretorio, processos),
+        "veterinarios": importar_veterinarios(diretorio, processos),
+        "tutores": importar_tutores(diretorio, processos),
+        "categorias_artigos": importar_categorias_artigos(diretorio),
+        "postagens_artigos": importar_postagens_artigos(diretorio),
+        "postagens_feeds": importar_postagens_feeds(diretorio),
+    }
+    total = sum(importados.values())
+    if total:
+        logger.info(f"{total} registros importados em {time.perf_counter() - inicio:.2f}s: {importados}")
+    return importados
+
+
+def _ler_json(diretorio: Path, nome_arquivo: str) -> Optional[list]:
+    """Lê um arquivo de dados iniciais; retorna None se ele não existir."""
+    json_path = Path(diretorio) / nome_arquivo
+    if not json_path.exists():
+        logger.warning(f"Arquivo {json_path} não encontrado.")
+        return None
+
+    with open(json_path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def importar_admins(diretorio: Path = DIRETORIO_DADOS, processos: Optional[int] = None) -> int:
     """Importa administradores do arquivo JSON se a tabela estiver vazia."""
     from repo import administrador_repo
     from model.administrador_model import Administrador
-    from util.security import criar_hash_senha
+    from util.security import criar_hashes_senhas
 
     # Verifica se a tabela está vazia
     admins_existentes = administrador_repo.obter_pagina(offset=0, limite=1)
     if admins_existentes:
         logger.info("Tabela de administradores já contém dados. Importação ignorada.")
-        return
+        return 0
 
-    # Lê o arquivo JSON
-    json_path = Path(__file__).parent.parent / "data" / "admins.json"
-    if not json_path.exists():
-        logger.warning(f"Arquivo {json_path} não encontrado.")
-        return
+    dados = _ler_json(diretorio, "admins.json")
+    if dados is None:
+        return 0
 
-    with open(json_path, "r", encoding="utf-8") as f:
-        dados = json.load(f)
-
-    # Importa cada administrador
-    for item in dados:
-        admin = Administrador(
+    senhas = criar_hashes_senhas([item["senha"] for item in dados], processos)
+    admins = [
+        Administrador(
             id_admin=item["id_admin"],
             nome=item["nome"],
             email=item["email"],
-            senha=criar_hash_senha(item["senha"]),
+            senha=senha,
         )
-        administrador_repo.importar(admin)
-        logger.info(f"Administrador '{admin.nome}' importado com sucesso.")
+        for item, senha in zip(dados, senhas)
+    ]
+    total = administrador_repo.importar_lote(admins)
+    logger.info(f"{total} administradores importados com sucesso.")
+    return total
 
 
-def importar_tutores():
+def importar_tutores(diretorio: Path = DIRETORIO_DADOS, processos: Optional[int] = None) -> int:
     """Importa tutores do arquivo JSON se a tabela estiver vazia."""
     from repo import tutor_repo
     from model.tutor_model import Tutor
-    from util.security import criar_hash_senha
+    from util.security import criar_hashes_senhas
 
     # Verifica se a tabela está vazia
     tutores_existentes = tutor_repo.obter_pagina(limite=1, offset=0)
     if tutores_existentes:
         logger.info("Tabela de tutores já contém dados. Importação ignorada.")
-        return
-
-    # Lê o arquivo JSON
-    json_path = Path(__file__).parent.parent / "data" / "tutores.json"
-    if not json_path.exists():
-        logger.warning(f"Arquivo {json_path} não encontrado.")
-        return
+        return 0
 
-    with open(json_path, "r", encoding="utf-8") as f:
-        dados = json.load(f)
+    dados = _ler_json(diretorio, "tutores.json")
+    if dados is None:
+        return 0
 
-    # Importa cada tutor
-    for item in dados:
-        tutor = Tutor(
+    senhas = criar_hashes_senhas([item["senha"] for item in dados], processos)
+    tutores = [
+        Tutor(
             id_usuario=item["id_usuario"],
             nome=item["nome"],
             email=item["email"],
-            senha=criar_hash_senha(item["senha"]),
+            senha=senha,
             telefone=item["telefone"],
             perfil="tutor",
             token_redefinicao=None,
@@ -164,38 +833,36 @@ def importar_tutores():
             quantidade_pets=item["quantidade_pets"],
             descricao_pets=item["descricao_pets"],
         )
-        tutor_repo.importar(tutor)
-        logger.info(f"Tutor '{tutor.nome}' importado com sucesso.")
+        for item, senha in zip(dados, senhas)
+    ]
+    total = tutor_repo.importar_lote(tutores)
+    logger.info(f"{total} tutores importados com sucesso.")
+    return total
 
 
-def importar_veterinarios():
+def importar_veterinarios(diretorio: Path = DIRETORIO_DADOS, processos: Optional[int] = None) -> int:
     """Importa veterinários do arquivo JSON se a tabela estiver vazia."""
     from repo import veterinario_repo
     from model.veterinario_model import Veterinario
-    from util.security import criar_hash_senha
+    from util.security import criar_hashes_senhas
 
     # Verifica se a tabela está vazia
     vets_existentes = veterinario_repo.obter_pagina(limite=1, offset=0)
     if vets_existentes:
         logger.info("Tabela de veterinários já contém dados. Importação ignorada.")
-        return
-
-    # Lê o arquivo JSON
-    json_path = Path(__file__).parent.parent / "data" / "veterinarios.json"
-    if not json_path.exists():
-        logger.warning(f"Arquivo {json_path} não encontrado.")
-        return
+        return 0
 
-    with open(json_path, "r", encoding="utf-8") as f:
-        dados = json.load(f)
+    dados = _ler_json(diretorio, "veterinarios.json")
+    if dados is None:
+        return 0
 
-    # Importa cada veterinário
-    for item in dados:
-        vet = Veterinario(
+    senhas = criar_hashes_senhas([item["senha"] for item in dados], processos)
+    vets = [
+        Veterinario(
             id_usuario=item["id_usuario"],
             nome=item["nome"],
             email=item["email"],
-            senha=criar_hash_senha(item["senha"]),
+            senha=senha,
             telefone=item["telefone"],
             perfil="veterinario",
             token_redefinicao=None,
@@ -205,11 +872,14 @@ def importar_veterinarios():
             verificado=item["verificado"],
             bio=item["bio"],
         )
-        veterinario_repo.importar(vet)
-        logger.info(f"Veterinário '{vet.nome}' importado com sucesso.")
+        for item, senha in zip(dados, senhas)
+    ]
+    total = veterinario_repo.importar_lote(vets)
+    logger.info(f"{total} veterinários importados com sucesso.")
+    return total
 
 
-def importar_categorias_artigos():
+def importar_categorias_artigos(diretorio: Path = DIRETORIO_DADOS) -> int:
     """Importa categorias de artigos do arquivo JSON se a tabela estiver vazia."""
     from repo import categoria_artigo_repo
     from model.categoria_artigo_model import CategoriaArtigo
@@ -218,29 +888,26 @@ def importar_categorias_artigos():
     categorias_existentes = categoria_artigo_repo.obter_pagina(offset=0, limite=1)
     if categorias_existentes:
         logger.info("Tabela de categorias de artigos já contém dados. Importação ignorada.")
-        return
-
-    # Lê o arquivo JSON
-    json_path = Path(__file__).parent.parent / "data" / "categorias_artigos.json"
-    if not json_path.exists():
-        logger.warning(f"Arquivo {json_path} não encontrado.")
-        return
+        return 0
 
-    with open(json_path, "r", encoding="utf-8") as f:
-        dados = json.load(f)
+    dados = _ler_json(diretorio, "categorias_artigos.json")
+    if dados is None:
+        return 0
 
-    # Importa cada categoria
-    for item in dados:
-        categoria = CategoriaArtigo(
+    categorias = [
+        CategoriaArtigo(
             id_categoria_artigo=item["id_categoria_artigo"],
             nome=item["nome"],
             cor=item["cor"],
         )
-        categoria_artigo_repo.importar(categoria)
-        logger.info(f"Categoria '{categoria.nome}' importada com sucesso.")
+        for item in dados
+    ]
+    total = categoria_artigo_repo.importar_lote(categorias)
+    logger.info(f"{total} categorias de artigos importadas com sucesso.")
+    return total
 
 
-def importar_postagens_artigos():
+def importar_postagens_artigos(diretorio: Path = DIRETORIO_DADOS) -> int:
     """Importa postagens de artigos do arquivo JSON se a tabela estiver vazia."""
     from datetime import date
     from repo import postagem_artigo_repo
@@ -250,20 +917,14 @@ def importar_postagens_artigos():
     postagens_existentes = postagem_artigo_repo.obter_pagina(pagina=1, tamanho_pagina=1)
     if postagens_existentes:
         logger.info("Tabela de postagens de artigos já contém dados. Importação ignorada.")
-        return
-
-    # Lê o arquivo JSON
-    json_path = Path(__file__).parent.parent / "data" / "postagens_artigos.json"
-    if not json_path.exists():
-        logger.warning(f"Arquivo {json_path} não encontrado.")
-        return
+        return 0
 
-    with open(json_path, "r", encoding="utf-8") as f:
-        dados = json.load(f)
+    dados = _ler_json(diretorio, "postagens_artigos.json")
+    if dados is None:
+        return 0
 
-    # Importa cada postagem
-    for item in dados:
-        postagem = PostagemArtigo(
+    postagens = [
+        PostagemArtigo(
             id_postagem_artigo=item["id_postagem_artigo"],
             id_veterinario=item["id_veterinario"],
             titulo=item["titulo"],
@@ -272,11 +933,14 @@ def importar_postagens_artigos():
             data_publicacao=date.today(),  # Usa data atual pois não está no JSON
             visualizacoes=item.get("visualizacoes", 0),  # Usa 0 como padrão se não existir
         )
-        postagem_artigo_repo.importar(postagem)
-        logger.info(f"Postagem '{postagem.titulo}' importada com sucesso.")
+        for item in dados
+    ]
+    total = postagem_artigo_repo.importar_lote(postagens)
+    logger.info(f"{total} postagens de artigos importadas com sucesso.")
+    return total
 
 
-def importar_postagens_feeds():
+def importar_postagens_feeds(diretorio: Path = DIRETORIO_DADOS) -> int:
     """Importa postagens de feeds do arquivo JSON se a tabela estiver vazia."""
     from datetime import datetime
     from repo import postagem_feed_repo
@@ -286,25 +950,22 @@ def importar_postagens_feeds():
     postagens_existentes = postagem_feed_repo.obter_pagina(pagina=1, tamanho_pagina=1)
     if postagens_existentes:
         logger.info("Tabela de postagens de feeds já contém dados. Importação ignorada.")
-        return
+        return 0
 
-    # Lê o arquivo JSON
-    json_path = Path(__file__).parent.parent / "data" / "postagens_feeds.json"
-    if not json_path.exists():
-        logger.warning(f"Arquivo {json_path} não encontrado.")
-        return
-
-    with open(json_path, "r", encoding="utf-8") as f:
-        dados = json.load(f)
+    dados = _ler_json(diretorio, "postagens_feeds.json")
+    if dados is None:
+        return 0
 
-    # Importa cada postagem
-    for item in dados:
-        postagem = PostagemFeed(
+    postagens = [
+        PostagemFeed(
             id_postagem_feed=item["id_postagem_feed"],
             id_tutor=item["id_tutor"],
             descricao=item["descricao"],
             data_postagem=datetime.strptime(item["data_postagem"], "%Y-%m-%d %H:%M:%S"),
             visualizacoes=item.get("visualizacoes", 0),
         )
-        postagem_feed_repo.importar(postagem)
-        logger.info(f"Postagem feed #{postagem.id_postagem_feed} do tutor {postagem.id_tutor} importada com sucesso.")
\ No newline at end of file
+        for item in dados
+    ]
+    total = postagem_feed_repo.importar_lote(postagens)
+    logger.info(f"{total} postagens de feeds importadas com sucesso.")
+    return total
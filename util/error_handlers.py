@@ -5,10 +5,10 @@ Decoradores e handlers para tratamento de erros
 import functools
 from typing import Callable, Optional
 from fastapi import Request
-from fastapi.templating import Jinja2Templates
 from pydantic import ValidationError
 from util.exceptions import ValidacaoError, RecursoNaoEncontradoError, LojaVirtualError
 from util.flash_messages import informar_erro, informar_sucesso
+from util.template_util import criar_templates
 
 
 def tratar_erro_rota(template_erro: Optional[str] = None,
@@ -38,7 +38,7 @@ def tratar_erro_rota(template_erro: Optional[str] = None,
                 # logger.warning("Erro de validação Pydantic", erro=error_msg, rota=str(request.url))
 
                 if template_erro:
-                    templates = Jinja2Templates(directory="templates")
+                    templates = criar_templates()
                     return templates.TemplateResponse(template_erro, {
                         "request": request,
                         "erro": error_msg
@@ -49,7 +49,7 @@ def tratar_erro_rota(template_erro: Optional[str] = None,
                 informar_erro(request, f"Dados inválidos: {e.mensagem}")
 
                 if template_erro:
-                    templates = Jinja2Templates(directory="templates")
+                    templates = criar_templates()
                     return templates.TemplateResponse(template_erro, {
                         "request": request,
                         "erro": e.mensagem
@@ -72,7 +72,7 @@ def tratar_erro_rota(template_erro: Optional[str] = None,
                 from fastapi.responses import RedirectResponse
                 return RedirectResponse(redirect_erro)
             elif template_erro:
-                templates = Jinja2Templates(directory="templates")
+                templates = criar_templates()
                 return templates.TemplateResponse(template_erro, {
                     "request": request,
                     "erro": "Ocorreu um erro. Tente novamente."
@@ -2,9 +2,12 @@
 Gerenciador de Arquivos de Upload
 """
 import os
+import shutil
+import hashlib
 import logging
+import tempfile
 from pathlib import Path
-from typing import Optional
+from typing import BinaryIO, Optional, Union
 
 from config.upload_config import UploadConfig
 
@@ -17,39 +20,58 @@ class FileManager:
 
     @staticmethod
     def salvar_arquivo(
-        conteudo: bytes,
+        conteudo: Union[bytes, BinaryIO],
         nome_arquivo: str,
-        usuario_id: int
+        usuario_id: int,
+        subpasta: Optional[str] = None
     ) -> str:
         """
         Salva arquivo com permissões corretas
 
+        O conteúdo pode ser bytes ou um arquivo aberto (ex.: ImagemValidada.arquivo),
+        copiado em blocos. A gravação é feita em um arquivo temporário no mesmo
+        diretório e renomeada ao final, de forma que nunca fica um arquivo pela
+        metade no lugar da imagem.
+
+        Args:
+            conteudo: Bytes ou arquivo binário com o conteúdo
+            nome_arquivo: Nome do arquivo de destino
+            usuario_id: ID do dono do arquivo (para log)
+            subpasta: Subpasta de static/img (ex.: "feeds"); padrão: usuarios
+
         Returns:
             str: Caminho relativo do arquivo salvo
         """
-        # Caminho completo
-        caminho_completo = UploadConfig.USUARIOS_DIR / nome_arquivo
+        diretorio = UploadConfig.IMG_DIR / subpasta if subpasta else UploadConfig.USUARIOS_DIR
+        caminho_completo = diretorio / nome_arquivo
+        caminho_temporario = diretorio / f".{nome_arquivo}.tmp"
 
         try:
             # Verificar permissões do diretório
-            if not os.access(UploadConfig.USUARIOS_DIR, os.W_OK):
+            if not os.access(diretorio, os.W_OK):
                 raise PermissionError(
-                    f"Sem permissão de escrita em {UploadConfig.USUARIOS_DIR}"
+                    f"Sem permissão de escrita em {diretorio}"
                 )
 
             # Salvar arquivo
-            with open(caminho_completo, 'wb') as f:
-                f.write(conteudo)
+            with open(caminho_temporario, 'wb') as f:
+                if isinstance(conteudo, (bytes, bytearray, memoryview)):
+                    f.write(conteudo)
+                else:
+                    conteudo.seek(0)
+                    shutil.copyfileobj(conteudo, f, UploadConfig.CHUNK_SIZE)
+                tamanho = f.tell()
 
             # Definir permissões
-            os.chmod(caminho_completo, UploadConfig.FILE_PERMISSIONS)
+            os.chmod(caminho_temporario, UploadConfig.FILE_PERMISSIONS)
+            os.replace(caminho_temporario, caminho_completo)
 
             # Caminho relativo para URL
-            caminho_relativo = f"/static/img/usuarios/{nome_arquivo}"
+            caminho_relativo = f"/{diretorio.as_posix()}/{nome_arquivo}"
 
             logger.info(
                 f"Arquivo salvo com sucesso: {nome_arquivo} "
-                f"(usuário: {usuario_id}, tamanho: {len(conteudo)} bytes)"
+                f"(usuário: {usuario_id}, tamanho: {tamanho} bytes)"
             )
 
             return caminho_relativo
@@ -59,11 +81,87 @@ class FileManager:
             raise
         except OSError as e:
             logger.error(f"Erro de sistema ao salvar arquivo: {e}")
+            caminho_temporario.unlink(missing_ok=True)
             raise
         except Exception as e:
             logger.error(f"Erro inesperado ao salvar arquivo: {e}", exc_info=True)
+            caminho_temporario.unlink(missing_ok=True)
+            raise
+
+    @staticmethod
+    def caminho_blob(hash_midia: str, nome: str) -> Path:
+        """
+        Caminho de um arquivo do armazenamento endereçado por conteúdo
+
+        Args:
+            hash_midia: SHA-256 do arquivo original
+            nome: Sufixo do arquivo (ex.: ".jpg" para a original, "_card.webp" para variantes)
+        """
+        return UploadConfig.MIDIA_DIR / hash_midia[:2] / f"{hash_midia}{nome}"
+
+    @staticmethod
+    def salvar_blob(conteudo: Union[bytes, BinaryIO], extensao: str) -> str:
+        """
+        Salva arquivo no armazenamento endereçado por conteúdo
+
+        O nome do arquivo é o SHA-256 do conteúdo: arquivos idênticos são
+        gravados uma única vez e o conteúdo de uma URL nunca muda.
+
+        Returns:
+            str: Hash do conteúdo
+        """
+        UploadConfig.MIDIA_DIR.mkdir(parents=True, exist_ok=True)
+        descritor, nome_temporario = tempfile.mkstemp(dir=UploadConfig.MIDIA_DIR, suffix=".tmp")
+        caminho_temporario = Path(nome_temporario)
+        resumo = hashlib.sha256()
+        try:
+            with os.fdopen(descritor, 'wb') as f:
+                if isinstance(conteudo, (bytes, bytearray, memoryview)):
+                    resumo.update(conteudo)
+                    f.write(conteudo)
+                else:
+                    conteudo.seek(0)
+                    while True:
+                        bloco = conteudo.read(UploadConfig.CHUNK_SIZE)
+                        if not bloco:
+                            break
+                        resumo.update(bloco)
+                        f.write(bloco)
+
+            hash_midia = resumo.hexdigest()
+            destino = FileManager.caminho_blob(hash_midia, extensao)
+            if destino.exists():
+                # Mesmo conteúdo já armazenado
+                caminho_temporario.unlink()
+                logger.info(f"Blob reaproveitado: {destino.name}")
+            else:
+                destino.parent.mkdir(parents=True, exist_ok=True)
+                os.chmod(caminho_temporario, UploadConfig.FILE_PERMISSIONS)
+                os.replace(caminho_temporario, destino)
+                logger.info(f"Blob salvo: {destino.name}")
+            return hash_midia
+
+        except Exception as e:
+            logger.error(f"Erro ao salvar blob: {e}", exc_info=True)
+            caminho_temporario.unlink(missing_ok=True)
             raise
 
+    @staticmethod
+    def deletar_blob(hash_midia: str, extensao: str):
+        """Deleta um blob e suas variantes"""
+        nomes = [extensao] + [
+            f"_{variante}.{formato}"
+            for variante in UploadConfig.VARIANTES
+            for formato in UploadConfig.FORMATOS_VARIANTES
+        ]
+        for nome in nomes:
+            caminho = FileManager.caminho_blob(hash_midia, nome)
+            try:
+                caminho.unlink(missing_ok=True)
+            except Exception as e:
+                logger.error(f"Erro ao deletar blob {caminho.name}: {e}")
+        logger.info(f"Blob deletado: {hash_midia}")
+
     @staticmethod
     def deletar_foto_antiga(caminho_foto: Optional[str]):
         """
@@ -92,8 +190,6 @@ class FileManager:
     @staticmethod
     def verificar_espaco_disco(tamanho_necessario: int) -> bool:
         """Verifica se há espaço suficiente no disco"""
-        import shutil
-
         try:
             stats = shutil.disk_usage(UploadConfig.USUARIOS_DIR)
             espaco_livre = stats.free
@@ -150,12 +246,14 @@ class FileManager:
         return None
 
     @staticmethod
-    def deletar_todas_fotos_usuario(id_usuario: int):
+    def deletar_todas_fotos_usuario(id_usuario: int, manter: Optional[str] = None):
         """
         Deleta todas as extensões possíveis de foto de um usuário
 
         Args:
             id_usuario: ID do usuário
+            manter: Nome do arquivo recém-enviado, que não deve ser apagado.
+                    Sem ele, as variantes (thumb/card/full) também são apagadas.
         """
         nome_base = UploadConfig.FOTO_USUARIO_PATTERN.format(id_usuario)
 
@@ -165,6 +263,8 @@ class FileManager:
                 # Remove ponto da extensão
                 ext_limpa = extensao.lstrip('.')
                 nome_arquivo = f"{nome_base}.{ext_limpa}"
+                if nome_arquivo == manter:
+                    continue
                 caminho_completo = UploadConfig.USUARIOS_DIR / nome_arquivo
 
                 if caminho_completo.exists():
@@ -181,3 +281,37 @@ class FileManager:
                     f"Erro ao deletar {nome_arquivo or extensao}: {e}",
                     exc_info=True
                 )
+
+        if manter is None:
+            FileManager._deletar_variantes(UploadConfig.USUARIOS_DIR, nome_base)
+
+    @staticmethod
+    def deletar_imagem_feed(id_postagem: int):
+        """
+        Deleta a imagem de uma postagem do Petgram e suas variantes
+
+        Args:
+            id_postagem: ID da postagem
+        """
+        nome_base = f"{id_postagem:08d}"
+        for extensao in UploadConfig.ALLOWED_EXTENSIONS:
+            caminho_completo = UploadConfig.FEEDS_DIR / f"{nome_base}{extensao}"
+            try:
+                if caminho_completo.exists():
+                    caminho_completo.unlink()
+                    logger.info(f"Imagem de postagem deletada: {caminho_completo.name}")
+            except Exception as e:
+                logger.error(f"Erro ao deletar {caminho_completo.name}: {e}")
+
+        FileManager._deletar_variantes(UploadConfig.FEEDS_DIR, nome_base)
+
+    @staticmethod
+    def _deletar_variantes(diretorio: Path, nome_base: str):
+        """Deleta as variantes (thumb/card/full em todos os formatos) de uma imagem"""
+        for variante in UploadConfig.VARIANTES:
+            for formato in UploadConfig.FORMATOS_VARIANTES:
+                caminho = diretorio / f"{nome_base}_{variante}.{formato}"
+                try:
+                    caminho.unlink(missing_ok=True)
+                except Exception as e:
+                    logger.error(f"Erro ao deletar variante {caminho.name}: {e}")
@@ -2,12 +2,17 @@
 Validador Robusto de Arquivos de Upload
 """
 import uuid
+import asyncio
+import tempfile
+from dataclasses import dataclass
+from io import BytesIO
 from pathlib import Path
-from typing import Tuple, Optional
+from typing import BinaryIO, Tuple, Optional, Union
 from PIL import Image
 from fastapi import UploadFile
 
 from config.upload_config import UploadConfig
+from util.imagem_executor import ExecutorImagensOcupadoError, executar_processamento_imagem
 
 
 class FileValidationError(Exception):
@@ -15,6 +20,33 @@ class FileValidationError(Exception):
     pass
 
 
+@dataclass
+class ImagemValidada:
+    """
+    Imagem que passou por todas as validações.
+
+    O conteúdo fica em um arquivo temporário nomeado em disco, posicionado
+    no início; o caminho permite que outros processos (pool de imagens)
+    abram o arquivo sem que o conteúdo seja copiado entre processos.
+    Use como gerenciador de contexto para liberar (e apagar) o arquivo ao final.
+    """
+    arquivo: BinaryIO
+    extensao: str
+    tipo: str
+    tamanho: int
+    largura: int
+    altura: int
+
+    def fechar(self):
+        self.arquivo.close()
+
+    def __enter__(self) -> "ImagemValidada":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.fechar()
+
+
 class FileValidator:
     """Validador completo de arquivos de upload"""
 
@@ -22,12 +54,16 @@ class FileValidator:
     async def validar_imagem_completo(
         arquivo: UploadFile,
         max_size: int = UploadConfig.MAX_FILE_SIZE
-    ) -> Tuple[bytes, str]:
+    ) -> ImagemValidada:
         """
         Validação completa de arquivo de imagem
 
+        O upload é lido em blocos: a assinatura (magic bytes) é conferida no
+        primeiro bloco e a leitura é interrompida assim que o tamanho máximo é
+        ultrapassado, sem acumular o arquivo inteiro em memória.
+
         Returns:
-            Tuple[bytes, str]: (conteúdo do arquivo, extensão validada)
+            ImagemValidada: arquivo temporário com o conteúdo e metadados
 
         Raises:
             FileValidationError: Se arquivo inválido
@@ -47,58 +83,88 @@ class FileValidator:
                 f"Extensão não permitida. Use: {extensoes_str}"
             )
 
-        # 3. Ler conteúdo com limite de tamanho
-        try:
-            conteudo = await FileValidator._ler_com_limite(arquivo, max_size)
-        except FileValidationError:
-            raise
-
-        # 4. Validar magic bytes
-        tipo_real = FileValidator._validar_magic_bytes(conteudo)
-        if not tipo_real:
+        # 3. Validar MIME type
+        if arquivo.content_type not in UploadConfig.ALLOWED_MIME_TYPES:
             raise FileValidationError(
-                "Arquivo não é uma imagem válida (validação de assinatura falhou)"
+                f"Tipo MIME não permitido: {arquivo.content_type}"
             )
 
-        # 5. Validar com biblioteca de imagem
-        try:
-            FileValidator._validar_com_pillow(conteudo)
-        except Exception as e:
-            raise FileValidationError(f"Arquivo de imagem corrompido: {str(e)}")
+        # 4. Ler conteúdo com limite de tamanho, validando os magic bytes
+        tipo_real, temporario, tamanho = await FileValidator._ler_com_limite(arquivo, max_size)
 
-        # 6. Validar MIME type
-        if arquivo.content_type not in UploadConfig.ALLOWED_MIME_TYPES:
+        # 5. Validar com biblioteca de imagem, em um processo do pool de imagens
+        #    (o processo recebe apenas o caminho do arquivo temporário)
+        try:
+            temporario.flush()
+            largura, altura = await executar_processamento_imagem(
+                FileValidator._validar_com_pillow, temporario.name
+            )
+        except ExecutorImagensOcupadoError:
+            temporario.close()
             raise FileValidationError(
-                f"Tipo MIME não permitido: {arquivo.content_type}"
+                "Muitas imagens em processamento no momento. Tente novamente em instantes."
             )
+        except asyncio.TimeoutError:
+            temporario.close()
+            raise FileValidationError("Tempo esgotado ao processar a imagem")
+        except Exception as e:
+            temporario.close()
+            if isinstance(e, FileValidationError):
+                raise
+            raise FileValidationError(f"Arquivo de imagem corrompido: {str(e)}")
 
-        return conteudo, extensao
+        temporario.seek(0)
+        return ImagemValidada(
+            arquivo=temporario,
+            extensao=extensao,
+            tipo=tipo_real,
+            tamanho=tamanho,
+            largura=largura,
+            altura=altura,
+        )
 
     @staticmethod
     async def _ler_com_limite(
         arquivo: UploadFile,
         max_size: int
-    ) -> bytes:
-        """Lê arquivo com limite de tamanho"""
-        conteudo = b""
-        chunk_size = 1024 * 1024  # 1MB por vez
+    ) -> Tuple[str, BinaryIO, int]:
+        """
+        Lê arquivo com limite de tamanho para um arquivo temporário
 
-        while True:
-            chunk = await arquivo.read(chunk_size)
-            if not chunk:
-                break
+        O primeiro bloco já é conferido contra os magic bytes, de modo que
+        arquivos que não são imagens são rejeitados sem ler o restante.
 
-            conteudo += chunk
+        Returns:
+            Tuple[str, BinaryIO, int]: (tipo real, arquivo temporário, tamanho em bytes)
+        """
+        primeiro = await arquivo.read(UploadConfig.CHUNK_SIZE)
+        if not primeiro:
+            raise FileValidationError("Arquivo vazio")
 
-            if len(conteudo) > max_size:
-                raise FileValidationError(
-                    f"Arquivo muito grande. Máximo: {max_size // (1024*1024)}MB"
-                )
+        tipo_real = FileValidator._validar_magic_bytes(primeiro)
+        if not tipo_real:
+            raise FileValidationError(
+                "Arquivo não é uma imagem válida (validação de assinatura falhou)"
+            )
 
-        if len(conteudo) == 0:
-            raise FileValidationError("Arquivo vazio")
+        temporario = tempfile.NamedTemporaryFile(prefix="upload_")
+        try:
+            chunk = primeiro
+            tamanho = 0
+            while chunk:
+                tamanho += len(chunk)
+                if tamanho > max_size:
+                    raise FileValidationError(
+                        f"Arquivo muito grande. Máximo: {max_size // (1024*1024)}MB"
+                    )
+                temporario.write(chunk)
+                chunk = await arquivo.read(UploadConfig.CHUNK_SIZE)
+        except BaseException:
+            temporario.close()
+            raise
 
-        return conteudo
+        temporario.seek(0)
+        return tipo_real, temporario, tamanho
 
     @staticmethod
     def _validar_nome_arquivo(filename: str):
@@ -151,28 +217,36 @@ class FileValidator:
         return None
 
     @staticmethod
-    def _validar_com_pillow(conteudo: bytes):
-        """Valida imagem usando Pillow e retorna dimensões"""
-        from io import BytesIO
+    def _validar_com_pillow(arquivo: Union[str, bytes, BinaryIO]) -> Tuple[int, int]:
+        """
+        Valida imagem usando Pillow e retorna dimensões (largura, altura)
 
+        Executado no pool de processos de imagens, por isso aceita o caminho
+        do arquivo (além de bytes ou de um arquivo aberto).
+        """
         try:
-            img = Image.open(BytesIO(conteudo))
-            img.verify()  # Verifica integridade
-
-            # Reabrir para obter dimensões (verify() invalida objeto)
-            img = Image.open(BytesIO(conteudo))
-            width, height = img.size
-
-            # Validar dimensões
-            if width < UploadConfig.MIN_WIDTH or height < UploadConfig.MIN_HEIGHT:
-                raise FileValidationError(
-                    f"Imagem muito pequena. Mínimo: {UploadConfig.MIN_WIDTH}x{UploadConfig.MIN_HEIGHT}px"
-                )
-
-            if width > UploadConfig.MAX_WIDTH or height > UploadConfig.MAX_HEIGHT:
-                raise FileValidationError(
-                    f"Imagem muito grande. Máximo: {UploadConfig.MAX_WIDTH}x{UploadConfig.MAX_HEIGHT}px"
-                )
+            if isinstance(arquivo, (bytes, bytearray)):
+                arquivo = BytesIO(arquivo)
+            if not isinstance(arquivo, str):
+                arquivo.seek(0)
+            with Image.open(arquivo) as img:
+                # Dimensões vêm do cabeçalho, antes de decodificar a imagem
+                width, height = img.size
+
+                # Validar dimensões
+                if width < UploadConfig.MIN_WIDTH or height < UploadConfig.MIN_HEIGHT:
+                    raise FileValidationError(
+                        f"Imagem muito pequena. Mínimo: {UploadConfig.MIN_WIDTH}x{UploadConfig.MIN_HEIGHT}px"
+                    )
+
+                if width > UploadConfig.MAX_WIDTH or height > UploadConfig.MAX_HEIGHT:
+                    raise FileValidationError(
+                        f"Imagem muito grande. Máximo: {UploadConfig.MAX_WIDTH}x{UploadConfig.MAX_HEIGHT}px"
+                    )
+
+                img.verify()  # Verifica integridade
+
+            return width, height
 
         except FileValidationError:
             raise
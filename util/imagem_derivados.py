@@ -0,0 +1,234 @@
+"""
+Armazenamento das imagens enviadas e suas variantes (thumb, card, full).
+
+Cada upload do Petgram ou de foto de perfil é salvo no armazenamento
+endereçado por conteúdo (static/midia, ver FileManager.salvar_blob) e gera
+versões com largura fixa em WebP e JPEG ao lado do blob:
+
+    static/midia/3f/3fa9...c1.jpg          (original)
+    static/midia/3f/3fa9...c1_card.webp
+    static/midia/3f/3fa9...c1_card.jpg
+    ...
+
+A tabela `midia` associa cada usuário/postagem ao blob atual. Como o nome do
+arquivo é o hash do conteúdo, as URLs são imutáveis e podem ser cacheadas por
+tempo indeterminado; trocar a foto muda a URL.
+
+Trocar ou remover a imagem não apaga o blob anterior: ele é registrado como
+órfão e só é apagado por `coletar_blobs_orfaos` (manutenção periódica, ver
+util/db_manutencao.py) depois de UploadConfig.MIDIA_CARENCIA_ORFAOS, se
+continuar sem referências. Até lá, páginas em cache e workers que ainda não
+recarregaram o índice de mídia continuam servindo a URL antiga.
+
+Os templates usam `url_imagem` e `srcset_imagem` (registradas como funções
+globais do Jinja2) para montar `src`/`srcset`. Registros sem mídia (imagens
+anteriores a este armazenamento) continuam usando static/img/<pasta>/00000123.jpg.
+
+Imagens antigas de static/img podem ganhar variantes com:
+    python -m util.imagem_derivados
+"""
+
+import logging
+import sys
+from pathlib import Path
+from typing import List, Optional
+
+from PIL import Image, ImageOps
+
+from config.upload_config import UploadConfig
+from model.midia_model import Midia
+from repo import midia_repo
+from util.file_manager import FileManager
+from util.file_validator import ImagemValidada
+from util.imagem_executor import executar_processamento_imagem
+from util.indice_midia import indice_midia
+from util.repo_util import executar_repo
+
+logger = logging.getLogger(__name__)
+
+_FORMATOS_PILLOW = {"webp": "WEBP", "jpg": "JPEG"}
+
+
+def nome_variante(nome_base: str, variante: str, formato: str) -> str:
+    """Nome do arquivo de uma variante (ex.: '00000123_card.webp')."""
+    return f"{nome_base}_{variante}.{formato}"
+
+
+def url_imagem(pasta: str, id_registro: int, variante: Optional[str] = None, formato: str = "jpg") -> str:
+    """
+    URL de uma imagem enviada (pasta "feeds" ou "usuarios").
+
+    Sem `variante`, aponta para a original.
+    """
+    blob = indice_midia.obter(pasta, id_registro)
+    if blob is not None:
+        hash_midia, extensao = blob
+        sufixo = extensao if variante is None else f"_{variante}.{formato}"
+        return f"{UploadConfig.MIDIA_URL}/{hash_midia[:2]}/{hash_midia}{sufixo}"
+
+    nome_base = f"{id_registro:08d}"
+    if variante is None:
+        return f"/static/img/{pasta}/{nome_base}.{formato}"
+    return f"/static/img/{pasta}/{nome_variante(nome_base, variante, formato)}"
+
+
+def srcset_imagem(pasta: str, id_registro: int, formato: str = "webp") -> str:
+    """Valor do atributo srcset com todas as variantes no formato pedido."""
+    return ", ".join(
+        f"{url_imagem(pasta, id_registro, variante, formato)} {largura}w"
+        for variante, largura in UploadConfig.VARIANTES.items()
+    )
+
+
+def _converter_rgb(img: Image.Image) -> Image.Image:
+    """Converte para RGB, aplicando fundo branco em imagens com transparência."""
+    if img.mode in ("RGBA", "LA") or (img.mode == "P" and "transparency" in img.info):
+        img = img.convert("RGBA")
+        fundo = Image.new("RGB", img.size, (255, 255, 255))
+        fundo.paste(img, mask=img.getchannel("A"))
+        return fundo
+    return img.convert("RGB") if img.mode != "RGB" else img
+
+
+def _salvar(img: Image.Image, caminho: Path, formato: str) -> None:
+    temporario = caminho.with_name(f".{caminho.name}.tmp")
+    if formato == "webp":
+        img.save(temporario, _FORMATOS_PILLOW[formato], quality=UploadConfig.QUALIDADE_WEBP, method=4)
+    else:
+        img.save(
+            temporario, _FORMATOS_PILLOW[formato],
+            quality=UploadConfig.QUALIDADE_JPEG, optimize=True, progressive=True,
+        )
+    temporario.chmod(UploadConfig.FILE_PERMISSIONS)
+    temporario.replace(caminho)
+
+
+def gerar_variantes(origem: str, diretorio: str, nome_base: str) -> List[str]:
+    """
+    Gera todas as variantes da imagem em `origem`. Executado no pool de processos.
+
+    O worker recebe o caminho do arquivo, não o conteúdo: a imagem não é
+    carregada inteira na memória do processo web nem copiada para o worker.
+
+    A imagem é decodificada uma única vez; cada variante é reduzida a partir
+    da anterior (maior), e imagens menores que a largura da variante não são
+    ampliadas.
+
+    Returns:
+        Nomes dos arquivos gerados
+    """
+    larguras = sorted(UploadConfig.VARIANTES.items(), key=lambda item: item[1], reverse=True)
+    with Image.open(origem) as original:
+        # JPEG pode ser decodificado já reduzido quando a original é muito maior
+        original.draft("RGB", (larguras[0][1], larguras[0][1]))
+        img = _converter_rgb(ImageOps.exif_transpose(original))
+
+    gerados = []
+    for variante, largura in larguras:
+        if img.width > largura:
+            altura = max(round(img.height * largura / img.width), 1)
+            img = img.resize((largura, altura), Image.LANCZOS)
+        for formato in UploadConfig.FORMATOS_VARIANTES:
+            nome = nome_variante(nome_base, variante, formato)
+            _salvar(img, Path(diretorio) / nome, formato)
+            gerados.append(nome)
+    return gerados
+
+
+def _variantes_existem(hash_midia: str) -> bool:
+    ultima = list(UploadConfig.VARIANTES)[-1]
+    formato = UploadConfig.FORMATOS_VARIANTES[-1]
+    return FileManager.caminho_blob(hash_midia, f"_{ultima}.{formato}").exists()
+
+
+async def _salvar_com_variantes(imagem: ImagemValidada, pasta: str, id_registro: int) -> str:
+    """Grava o blob (se ainda não existir) e gera as variantes que faltam. Retorna o hash."""
+    hash_midia = await executar_repo(FileManager.salvar_blob, imagem.arquivo, imagem.extensao)
+
+    if not _variantes_existem(hash_midia):
+        origem = FileManager.caminho_blob(hash_midia, imagem.extensao)
+        try:
+            gerados = await executar_processamento_imagem(
+                gerar_variantes, str(origem), str(origem.parent), hash_midia
+            )
+            logger.info(f"Variantes geradas para {pasta}/{id_registro}: {len(gerados)} arquivos")
+        except Exception as e:
+            logger.error(f"Erro ao gerar variantes de {pasta}/{id_registro}: {e}")
+    return hash_midia
+
+
+async def armazenar_imagem(imagem: ImagemValidada, pasta: str, id_registro: int) -> str:
+    """
+    Salva uma imagem validada como blob, gera as variantes e associa ao registro.
+
+    Se o mesmo conteúdo já estiver armazenado, arquivo e variantes são
+    reaproveitados. O blob anterior do registro fica órfão e é apagado mais
+    tarde pela coleta. Falhas ao gerar variantes não invalidam o upload: os
+    templates usam a original como reserva.
+
+    Args:
+        imagem: Resultado de FileValidator.validar_imagem_completo
+        pasta: "feeds" ou "usuarios"
+        id_registro: ID da postagem ou do usuário
+
+    Returns:
+        URL da imagem original
+    """
+    hash_midia = await _salvar_com_variantes(imagem, pasta, id_registro)
+    await executar_repo(midia_repo.definir, Midia(pasta, id_registro, hash_midia, imagem.extensao))
+
+    # Um blob órfão reaproveitado pode ter sido coletado entre a gravação e o
+    # definir; depois do definir ele tem referência e a coleta não o apaga mais.
+    if not FileManager.caminho_blob(hash_midia, imagem.extensao).exists():
+        await _salvar_com_variantes(imagem, pasta, id_registro)
+    return url_imagem(pasta, id_registro)
+
+
+async def remover_imagem(pasta: str, id_registro: int) -> None:
+    """Desassocia a imagem do registro; o blob, se ficar sem referências, aguarda a coleta."""
+    await executar_repo(midia_repo.excluir, pasta, id_registro)
+
+
+def coletar_blobs_orfaos(carencia_segundos: float = UploadConfig.MIDIA_CARENCIA_ORFAOS) -> int:
+    """
+    Apaga blobs (e variantes) sem referências há mais de `carencia_segundos`.
+
+    Returns:
+        Quantidade de blobs apagados
+    """
+    apagados = midia_repo.coletar_orfaos(carencia_segundos, FileManager.deletar_blob)
+    if apagados:
+        logger.info(f"Coleta de mídia: {apagados} blobs órfãos apagados")
+    return apagados
+
+
+def gerar_variantes_pendentes(pastas: Optional[List[Path]] = None) -> int:
+    """
+    Gera variantes para originais que ainda não as têm.
+
+    Returns:
+        Quantidade de imagens processadas
+    """
+    pastas = pastas or [UploadConfig.FEEDS_DIR, UploadConfig.USUARIOS_DIR]
+    variante_referencia = next(iter(UploadConfig.VARIANTES))
+    processadas = 0
+    for pasta in pastas:
+        for caminho in sorted(pasta.iterdir()):
+            if caminho.suffix not in UploadConfig.ALLOWED_EXTENSIONS or "_" in caminho.stem:
+                continue
+            referencia = pasta / nome_variante(caminho.stem, variante_referencia, "webp")
+            if referencia.exists():
+                continue
+            try:
+                gerar_variantes(str(caminho), str(pasta), caminho.stem)
+                processadas += 1
+            except Exception as e:
+                logger.error(f"Erro ao gerar variantes de {caminho}: {e}")
+    return processadas
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s - %(message)s")
+    total = gerar_variantes_pendentes()
+    logger.info(f"Variantes geradas para {total} imagens.")
+    sys.exit(0)
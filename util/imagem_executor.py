@@ -0,0 +1,190 @@
+"""
+Pool de processos para validação e transformação de imagens.
+
+Decodificar imagens com o Pillow é trabalho de CPU preso ao GIL: feito dentro
+de uma rota async, trava o event loop para todas as outras requisições. As
+funções enviadas para este pool rodam em processos separados, com:
+
+- timeout por tarefa (padrão: UploadConfig.UPLOAD_TIMEOUT);
+- limite de tarefas pendentes: com o pool saturado, novas tarefas são
+  recusadas na hora com ExecutorImagensOcupadoError em vez de formar fila;
+- métricas separando o tempo de espera na fila do tempo de processamento.
+
+As funções e argumentos precisam ser serializáveis (funções de módulo,
+bytes, tuplas, etc.).
+"""
+
+import os
+import time
+import asyncio
+import logging
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, Optional, Tuple, TypeVar
+
+from config.upload_config import UploadConfig
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+
+IMAGENS_PROCESSOS: int = int(os.getenv("IMAGENS_PROCESSOS", str(min(4, os.cpu_count() or 1))))
+IMAGENS_FILA_MAX: int = int(os.getenv("IMAGENS_FILA_MAX", str(IMAGENS_PROCESSOS * 4)))
+
+
+class ExecutorImagensOcupadoError(Exception):
+    """O pool de imagens atingiu o limite de tarefas pendentes."""
+    pass
+
+
+def _executar_medindo(func: Callable[..., T], args: Tuple, kwargs: Dict) -> Tuple[T, float, float]:
+    """Roda no processo filho: retorna (resultado, início, duração do processamento)."""
+    inicio = time.time()
+    resultado = func(*args, **kwargs)
+    return resultado, inicio, time.time() - inicio
+
+
+class ExecutorImagens:
+    """
+    Pool limitado de processos para trabalho de CPU chamado por rotas async.
+
+    Uma tarefa conta como pendente desde o envio até o processo filho terminar,
+    mesmo que a rota já tenha desistido por timeout, de modo que o limite
+    reflete a ocupação real do pool.
+    """
+
+    def __init__(
+        self,
+        max_processos: int = IMAGENS_PROCESSOS,
+        limite_fila: int = IMAGENS_FILA_MAX,
+        timeout_segundos: float = UploadConfig.UPLOAD_TIMEOUT,
+    ):
+        self.max_processos = max_processos
+        self.limite_fila = max(limite_fila, 1)
+        self.timeout_segundos = timeout_segundos
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._pendentes = 0
+        self._pico_pendentes = 0
+        self._recusadas = 0
+        self._concluidas = 0
+        self._erros = 0
+        self._timeouts = 0
+        self._tempo_fila_total = 0.0
+        self._tempo_fila_maximo = 0.0
+        self._tempo_processamento_total = 0.0
+        self._tempo_processamento_maximo = 0.0
+
+    def _obter_executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(max_workers=self.max_processos)
+            return self._executor
+
+    async def executar(
+        self, func: Callable[..., T], *args, timeout: Optional[float] = None, **kwargs
+    ) -> T:
+        """
+        Executa `func(*args, **kwargs)` em um processo do pool e aguarda o resultado.
+
+        Raises:
+            ExecutorImagensOcupadoError: Se o limite de tarefas pendentes foi atingido
+            asyncio.TimeoutError: Se a tarefa não terminar dentro do timeout
+        """
+        with self._lock:
+            if self._pendentes >= self.limite_fila:
+                self._recusadas += 1
+                raise ExecutorImagensOcupadoError(
+                    f"Pool de imagens ocupado ({self._pendentes} tarefas pendentes)"
+                )
+            self._pendentes += 1
+            self._pico_pendentes = max(self._pico_pendentes, self._pendentes)
+
+        enviada_em = time.time()
+        try:
+            futuro = self._obter_executor().submit(_executar_medindo, func, args, kwargs)
+        except BaseException:
+            with self._lock:
+                self._pendentes -= 1
+            raise
+        futuro.add_done_callback(lambda f: self._ao_concluir(f, enviada_em))
+
+        try:
+            resultado, _, _ = await asyncio.wait_for(
+                asyncio.wrap_future(futuro), timeout or self.timeout_segundos
+            )
+        except asyncio.TimeoutError:
+            with self._lock:
+                self._timeouts += 1
+            logger.warning(f"Tempo esgotado no processamento de imagem: {getattr(func, '__qualname__', func)}")
+            raise
+        return resultado
+
+    def _ao_concluir(self, futuro: Future, enviada_em: float) -> None:
+        excecao = None if futuro.cancelled() else futuro.exception()
+        with self._lock:
+            self._pendentes -= 1
+            if futuro.cancelled():
+                return
+            if excecao is not None:
+                self._erros += 1
+                if isinstance(excecao, BrokenProcessPool):
+                    # Um processo filho morreu: o próximo envio cria um pool novo
+                    self._executor = None
+                return
+            _, inicio, duracao = futuro.result()
+            espera = max(inicio - enviada_em, 0.0)
+            self._concluidas += 1
+            self._tempo_fila_total += espera
+            self._tempo_fila_maximo = max(self._tempo_fila_maximo, espera)
+            self._tempo_processamento_total += duracao
+            self._tempo_processamento_maximo = max(self._tempo_processamento_maximo, duracao)
+
+    def metricas(self) -> dict:
+        """Retorna um retrato das métricas do pool."""
+        with self._lock:
+            concluidas = self._concluidas
+            return {
+                "max_processos": self.max_processos,
+                "limite_fila": self.limite_fila,
+                "pendentes": self._pendentes,
+                "pico_pendentes": self._pico_pendentes,
+                "recusadas": self._recusadas,
+                "concluidas": concluidas,
+                "erros": self._erros,
+                "timeouts": self._timeouts,
+                "tempo_fila_medio": self._tempo_fila_total / concluidas if concluidas else 0.0,
+                "tempo_fila_maximo": self._tempo_fila_maximo,
+                "tempo_processamento_medio": (
+                    self._tempo_processamento_total / concluidas if concluidas else 0.0
+                ),
+                "tempo_processamento_maximo": self._tempo_processamento_maximo,
+            }
+
+    def fechar(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+
+_executor_imagens = ExecutorImagens()
+
+
+async def executar_processamento_imagem(func: Callable[..., Any], *args, **kwargs) -> Any:
+    """
+    Executa uma função de processamento de imagem no pool de processos.
+
+    Examples:
+        >>> largura, altura = await executar_processamento_imagem(medir_imagem, conteudo)
+    """
+    return await _executor_imagens.executar(func, *args, **kwargs)
+
+
+def obter_metricas_executor_imagens() -> dict:
+    return _executor_imagens.metricas()
+
+
+def fechar_executor_imagens() -> None:
+    _executor_imagens.fechar()
@@ -0,0 +1,132 @@
+"""
+Índice em memória da tabela `midia`: (tipo, id do registro) -> blob atual.
+
+Os templates montam a URL de fotos de perfil e imagens do Petgram a cada
+card renderizado; consultar o banco por imagem seria uma consulta extra por
+item da listagem. O índice é carregado por inteiro uma única vez (na
+inicialização da aplicação) e, daí em diante, atualizado apenas nos registros
+alterados: triggers gravam cada inserção, troca ou remoção em
+`midia_alteracao` (sql/migracoes/021_midia_alteracao.sql) e o índice aplica as
+entradas posteriores à última que já viu.
+
+As alterações são aplicadas pelo ouvinte de `cache_util`, logo após as
+escritas de `midia_repo` neste processo, e pela thread de atualização
+periódica (ver util/versao_dados.py), que traz as escritas de outros workers.
+`obter`, chamado durante a renderização, nunca consulta o banco.
+
+Em bancos sem o registro de alterações (ainda não migrados), cada
+invalidação recarrega o índice inteiro.
+"""
+
+import logging
+import sqlite3
+import threading
+from typing import Dict, Optional, Tuple
+
+from util.cache_util import invalidar_tags, registrar_ouvinte
+from util.versao_dados import atualizacao_periodica
+
+logger = logging.getLogger(__name__)
+
+TAG_MIDIA = "midia"
+
+
+class IndiceMidia:
+    """Mapa (tipo, id_registro) -> (hash, extensão), atualizado por registro."""
+
+    def __init__(self):
+        self._itens: Optional[Dict[Tuple[str, int], Tuple[str, str]]] = None
+        # Última alteração aplicada; None sem o registro de alterações
+        self._seq: Optional[int] = None
+        self._lock = threading.Lock()
+
+    def carregar(self) -> bool:
+        """Lê a tabela midia e substitui o conteúdo do índice."""
+        from repo import midia_repo
+
+        with self._lock:
+            return self._carregar(midia_repo)
+
+    def _carregar(self, midia_repo) -> bool:
+        # Lida antes da tabela: uma escrita no meio do caminho é reaplicada depois
+        try:
+            seq = midia_repo.obter_ultima_alteracao()
+        except sqlite3.OperationalError:
+            seq = None
+        try:
+            midias = midia_repo.obter_todos()
+        except Exception as e:
+            # Índice vazio até a próxima invalidação: as URLs caem nos caminhos antigos
+            logger.error(f"Erro ao carregar índice de mídia: {e}")
+            self._itens = {}
+            self._seq = None
+            return False
+
+        self._itens = {(m.tipo, m.id_registro): (m.hash, m.extensao) for m in midias}
+        self._seq = seq
+        return True
+
+    def descartar(self) -> None:
+        with self._lock:
+            self._itens = None
+            self._seq = None
+
+    def aplicar_alteracoes(self) -> int:
+        """
+        Aplica ao índice as alterações registradas desde a última aplicada.
+
+        Recarrega o índice inteiro se ele ainda não foi carregado, se não há
+        registro de alterações ou se as entradas seguintes já foram removidas
+        pela manutenção.
+
+        Returns:
+            Quantidade de registros atualizados (ou recarregados)
+        """
+        from repo import midia_repo
+
+        with self._lock:
+            if self._itens is None or self._seq is None:
+                self._carregar(midia_repo)
+                return len(self._itens)
+
+            alteracoes = midia_repo.obter_alteracoes(self._seq)
+            if not alteracoes:
+                return 0
+            if alteracoes[0][0] != self._seq + 1:
+                logger.info("Registro de alterações da mídia incompleto: recarregando o índice")
+                self._carregar(midia_repo)
+                return len(self._itens)
+
+            for seq, tipo, id_registro, hash_midia, extensao in alteracoes:
+                if hash_midia is None:
+                    self._itens.pop((tipo, id_registro), None)
+                else:
+                    self._itens[(tipo, id_registro)] = (hash_midia, extensao)
+                self._seq = seq
+            return len(alteracoes)
+
+    def obter(self, tipo: str, id_registro: int) -> Optional[Tuple[str, str]]:
+        """Retorna (hash, extensão) do blob atual do registro, se houver (sem consultar o banco)."""
+        itens = self._itens
+        return itens.get((tipo, id_registro)) if itens is not None else None
+
+    def verificar_atualizacao(self) -> None:
+        """
+        Executada pela thread de atualização periódica: aplica as alterações
+        feitas por outros processos e, se houver, invalida a tag para descartar
+        as páginas em cache deste processo.
+        """
+        if self._itens is None:
+            self.carregar()
+        elif self._seq is not None and self.aplicar_alteracoes():
+            invalidar_tags(TAG_MIDIA)
+
+    def ao_invalidar(self, tags: Tuple[str, ...]) -> None:
+        """Ouvinte de `cache_util`: aplica as alterações após escritas na tabela midia."""
+        if TAG_MIDIA in tags and self._itens is not None:
+            self.aplicar_alteracoes()
+
+
+indice_midia = IndiceMidia()
+registrar_ouvinte(indice_midia.ao_invalidar)
+atualizacao_periodica.registrar(indice_midia.verificar_atualizacao)
@@ -0,0 +1,262 @@
+"""
+Migrações versionadas do esquema do banco de dados.
+
+Cada migração tem um número de versão, uma descrição e uma função que recebe
+a conexão. `migrar()` garante a tabela schema_version, descobre as versões
+ainda não aplicadas e aplica cada uma, em ordem, dentro da sua própria
+transação (ver db_util.transacao). A versão é registrada na mesma transação:
+ou a migração é aplicada e registrada por inteiro, ou o banco não muda.
+
+Para alterar o esquema (ex.: um índice novo), acrescente uma migração ao fim
+de MIGRACOES com a próxima versão e um arquivo novo em sql/migracoes; uma migração já publicada nunca deve ser
+alterada, pois os bancos que já a aplicaram não a executarão de novo. Por
+isso o DDL de cada versão fica congelado em sql/migracoes/NNN_*.sql, e não é
+lido das constantes CRIAR_TABELA dos repositórios: editar o DDL de um
+repositório não muda nenhuma migração publicada (e
+tests/test_migracoes.py acusa a diferença até que uma migração nova seja
+criada).
+
+Na inicialização da aplicação (db_util.inicializar_banco), o caminho rápido
+compara `PRAGMA user_version` com VERSAO_ESQUEMA: a versão só é gravada depois
+de aplicadas as migrações e importados os dados iniciais, então um único
+PRAGMA basta para pular todo o DDL e as verificações de tabelas vazias. Quando
+há trabalho a fazer, `trava_migracao()` (lock de arquivo entre processos)
+garante que só um worker do uvicorn migra; os demais esperam e reencontram o
+banco já atualizado.
+
+Uso:
+    python -m util.db_cli migrar [--dry-run]
+"""
+
+import logging
+import sqlite3
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Generator, List, Optional, Sequence, Set
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+from sql import migracao_sql
+from util.db_util import _get_db_path, get_connection, transacao
+
+logger = logging.getLogger(__name__)
+
+DIRETORIO_SQL = Path(__file__).parent.parent / "sql"
+
+
+@dataclass(frozen=True)
+class Migracao:
+    versao: int
+    descricao: str
+    aplicar: Callable[[sqlite3.Connection], None]
+
+
+def dividir_script(texto: str) -> List[str]:
+    """Separa um script SQL em comandos, ignorando linhas de comentário (`--`)."""
+    comandos = []
+    atual = ""
+    for linha in texto.splitlines():
+        if linha.strip().startswith("--"):
+            continue
+        atual += linha + "\n"
+        if sqlite3.complete_statement(atual):
+            comandos.append(atual.strip())
+            atual = ""
+    if atual.strip():
+        raise ValueError(f"Comando SQL incompleto no fim do script: {atual.strip()[:80]}")
+    return comandos
+
+
+def _executar_script(nome_arquivo: str) -> Callable[[sqlite3.Connection], None]:
+    """
+    Migração que executa um arquivo de sql/ comando a comando.
+
+    Não usa executescript(), que faria COMMIT antes de começar e tiraria o
+    script da transação da migração.
+    """
+
+    def aplicar(conn: sqlite3.Connection) -> None:
+        texto = (DIRETORIO_SQL / nome_arquivo).read_text(encoding="utf-8")
+        for comando in dividir_script(texto):
+            conn.execute(comando)
+
+    return aplicar
+
+
+def _adicionar_coluna(tabela: str, coluna: str, definicao: str) -> Callable[[sqlite3.Connection], None]:
+    """Migração que executa ALTER TABLE ADD COLUMN só se a coluna ainda não existir."""
+
+    def aplicar(conn: sqlite3.Connection) -> None:
+        colunas = {row["name"] for row in conn.execute(f"PRAGMA table_info({tabela})")}
+        if coluna not in colunas:
+            conn.execute(f"ALTER TABLE {tabela} ADD COLUMN {coluna} {definicao}")
+
+    return aplicar
+
+
+def _etapas(*etapas: Callable[[sqlite3.Connection], None]) -> Callable[[sqlite3.Connection], None]:
+    """Migração composta por várias etapas, executadas em ordem na mesma transação."""
+
+    def aplicar(conn: sqlite3.Connection) -> None:
+        for etapa in etapas:
+            etapa(conn)
+
+    return aplicar
+
+
+# Ordem das tabelas respeita as chaves estrangeiras. As tabelas de postagem
+# recebem total_curtidas por ALTER TABLE quando já existiam antes do contador
+# (bancos anteriores às migrações); as migrações das curtidas recalculam o total.
+MIGRACOES: List[Migracao] = [
+    Migracao(1, "tabela usuario", _executar_script("migracoes/001_usuario.sql")),
+    Migracao(2, "tabela tutor", _executar_script("migracoes/002_tutor.sql")),
+    Migracao(3, "tabela veterinario", _executar_script("migracoes/003_veterinario.sql")),
+    Migracao(4, "tabela administrador", _executar_script("migracoes/004_administrador.sql")),
+    Migracao(5, "tabela categoria_artigo", _executar_script("migracoes/005_categoria_artigo.sql")),
+    Migracao(
+        6,
+        "tabela postagem_artigo e índice de busca",
+        _etapas(
+            _executar_script("migracoes/006_postagem_artigo.sql"),
+            _adicionar_coluna("postagem_artigo", "total_curtidas", "INTEGER NOT NULL DEFAULT 0"),
+        ),
+    ),
+    Migracao(7, "tabela curtida_artigo e contadores", _executar_script("migracoes/007_curtida_artigo.sql")),
+    Migracao(
+        8,
+        "tabela postagem_feed e índice de busca",
+        _etapas(
+            _executar_script("migracoes/008_postagem_feed.sql"),
+            _adicionar_coluna("postagem_feed", "total_curtidas", "INTEGER NOT NULL DEFAULT 0"),
+        ),
+    ),
+    Migracao(9, "tabela curtida_feed e contadores", _executar_script("migracoes/009_curtida_feed.sql")),
+    Migracao(10, "tabela denuncia", _executar_script("migracoes/010_denuncia.sql")),
+    Migracao(11, "tabela verificacao_crmv", _executar_script("migracoes/011_verificacao_crmv.sql")),
+    Migracao(12, "tabela seguida", _executar_script("migracoes/012_seguida.sql")),
+    Migracao(13, "tabela midia", _executar_script("migracoes/013_midia.sql")),
+    Migracao(14, "tabela chamado", _executar_script("migracoes/014_chamado.sql")),
+    Migracao(15, "tabela resposta_chamado", _executar_script("migracoes/015_resposta_chamado.sql")),
+    Migracao(16, "tabela comentario", _executar_script("migracoes/016_comentario.sql")),
+    Migracao(17, "índices das tabelas", _executar_script("migracoes/017_indices.sql")),
+    Migracao(18, "índices compostos das listagens", _executar_script("migracoes/018_indices_compostos.sql")),
+    Migracao(19, "contador de versão das categorias", _executar_script("migracoes/019_versao_dados.sql")),
+    Migracao(20, "blobs órfãos e contador de versão da mídia", _executar_script("migracoes/020_midia_orfa.sql")),
+    Migracao(21, "registro de alterações da mídia", _executar_script("migracoes/021_midia_alteracao.sql")),
+]
+
+# Versão gravada em PRAGMA user_version quando esquema e dados iniciais estão em dia
+VERSAO_ESQUEMA = MIGRACOES[-1].versao
+
+
+def _validar(migracoes: Sequence[Migracao]) -> None:
+    versoes = [m.versao for m in migracoes]
+    if versoes != sorted(set(versoes)):
+        raise ValueError(f"Versões de migração devem ser únicas e crescentes: {versoes}")
+
+
+def versoes_aplicadas() -> Set[int]:
+    """Versões registradas em schema_version (vazio se a tabela ainda não existe)."""
+    with get_connection() as conn:
+        existe = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'schema_version'"
+        ).fetchone()
+        if not existe:
+            return set()
+        return {row["versao"] for row in conn.execute(migracao_sql.OBTER_VERSOES)}
+
+
+def migracoes_pendentes(migracoes: Optional[Sequence[Migracao]] = None) -> List[Migracao]:
+    """Migrações ainda não aplicadas, em ordem de versão."""
+    migracoes = MIGRACOES if migracoes is None else migracoes
+    _validar(migracoes)
+    aplicadas = versoes_aplicadas()
+    return [m for m in migracoes if m.versao not in aplicadas]
+
+
+def migrar(dry_run: bool = False, migracoes: Optional[Sequence[Migracao]] = None) -> List[Migracao]:
+    """
+    Aplica as migrações pendentes, cada uma em sua própria transação.
+
+    Args:
+        dry_run: Apenas lista o que seria aplicado, sem alterar o banco
+        migracoes: Lista de migrações (padrão: MIGRACOES)
+
+    Returns:
+        Migrações aplicadas (ou que seriam aplicadas, no dry-run)
+
+    Raises:
+        sqlite3.Error: Se uma migração falhar; ela é desfeita e as seguintes não são aplicadas
+    """
+    pendentes = migracoes_pendentes(migracoes)
+    if dry_run:
+        for migracao in pendentes:
+            logger.info(f"[dry-run] Migração {migracao.versao} pendente: {migracao.descricao}")
+        return pendentes
+
+    if pendentes:
+        with get_connection() as conn:
+            conn.execute(migracao_sql.CRIAR_TABELA)
+
+    aplicadas = []
+    for migracao in pendentes:
+        with transacao() as conn:
+            # Outro processo pode ter aplicado a versão antes de obtermos o lock de escrita
+            if conn.execute(migracao_sql.OBTER_VERSAO, (migracao.versao,)).fetchone():
+                continue
+            migracao.aplicar(conn)
+            conn.execute(migracao_sql.REGISTRAR, (migracao.versao, migracao.descricao))
+        aplicadas.append(migracao)
+        logger.info(f"Migração {migracao.versao} aplicada: {migracao.descricao}")
+    return aplicadas
+
+
+def obter_versao_banco() -> int:
+    """Versão marcada no banco (`PRAGMA user_version`; 0 em um banco novo)."""
+    with get_connection() as conn:
+        return conn.execute("PRAGMA user_version").fetchone()[0]
+
+
+def marcar_versao_banco(versao: int = VERSAO_ESQUEMA) -> None:
+    """Grava a versão em `PRAGMA user_version` (chamar só após migrar e importar os dados iniciais)."""
+    with get_connection() as conn:
+        conn.execute(f"PRAGMA user_version = {int(versao)}")
+
+
+def esquema_atualizado() -> bool:
+    """Caminho rápido: um único PRAGMA diz se há algo a migrar ou importar."""
+    return obter_versao_banco() == VERSAO_ESQUEMA
+
+
+@contextmanager
+def trava_migracao(caminho: Optional[str] = None) -> Generator[None, None, None]:
+    """
+    Lock exclusivo entre processos em `<banco>.lock`, bloqueante.
+
+    Não é reentrante: não abrir de novo dentro do mesmo bloco.
+    """
+    caminho = caminho or f"{_get_db_path()}.lock"
+    inicio = time.monotonic()
+    with open(caminho, "a+") as arquivo:
+        if fcntl is not None:
+            fcntl.flock(arquivo.fileno(), fcntl.LOCK_EX)
+        else:
+            arquivo.seek(0)
+            msvcrt.locking(arquivo.fileno(), msvcrt.LK_LOCK, 1)
+        espera = time.monotonic() - inicio
+        if espera > 0.1:
+            logger.info(f"Lock de migração obtido após {espera:.2f}s de espera")
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(arquivo.fileno(), fcntl.LOCK_UN)
+            else:
+                arquivo.seek(0)
+                msvcrt.locking(arquivo.fileno(), msvcrt.LK_UNLCK, 1)
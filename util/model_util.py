@@ -1,9 +1,18 @@
 """
 Utilitários para instanciação de modelos a partir de resultados de banco de dados.
+
+Os repositórios usam `mapear_linhas`/`mapear_linha`: na primeira vez que uma
+combinação (colunas do resultado, modelo) aparece, é gerada e compilada uma
+função que monta o modelo lendo as colunas da tupla por posição; as
+execuções seguintes reaproveitam a função do cache. As linhas chegam como
+tuplas (sem sqlite3.Row), e não há busca de coluna por nome a cada linha.
 """
 
-from typing import TypeVar, Type, Dict, Any, Optional
-from sqlite3 import Row
+import dataclasses
+from datetime import date, datetime
+from functools import lru_cache
+from sqlite3 import Cursor, Row
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple, Type, TypeVar
 
 T = TypeVar('T')
 
@@ -100,3 +109,164 @@ def row_to_dict_partial(row: Row, campos: list[str]) -> Dict[str, Any]:
     """
     row_dict = dict(row)
     return {campo: row_dict.get(campo) for campo in campos if campo in row_dict}
+
+
+def converter_data_hora(valor: Any) -> Optional[datetime]:
+    """
+    Converte o texto de uma coluna de data/hora em datetime.
+
+    Usa `datetime.fromisoformat`, que aceita os formatos gravados pelo SQLite
+    (CURRENT_TIMESTAMP, 'YYYY-MM-DD HH:MM:SS.ffffff' e apenas 'YYYY-MM-DD',
+    que vira meia-noite). None e datetime são devolvidos sem alteração.
+
+    Raises:
+        ValueError: Se o texto não estiver em formato ISO
+    """
+    if valor is None or isinstance(valor, datetime):
+        return valor
+    if isinstance(valor, date):
+        return datetime(valor.year, valor.month, valor.day)
+    return datetime.fromisoformat(valor.strip())
+
+
+def converter_data(valor: Any) -> Optional[date]:
+    """
+    Converte o texto de uma coluna de data ou data/hora em date (descarta a hora).
+
+    Raises:
+        ValueError: Se o texto não estiver em formato ISO
+    """
+    if valor is None or (isinstance(valor, date) and not isinstance(valor, datetime)):
+        return valor
+    return converter_data_hora(valor).date()
+
+
+def _itens(mapa: Optional[Mapping[str, Any]]) -> Tuple[Tuple[str, Any], ...]:
+    return tuple(sorted(mapa.items())) if mapa else ()
+
+
+@lru_cache(maxsize=256)
+def _compilar_mapeador(
+    model_class: type,
+    nomes_colunas: Tuple[str, ...],
+    colunas: Tuple[Tuple[str, str], ...],
+    conversores: Tuple[Tuple[str, Callable[[Any], Any]], ...],
+    valores: Tuple[Tuple[str, Any], ...],
+    padroes: Tuple[Tuple[str, Any], ...],
+) -> Callable[[tuple], Any]:
+    """
+    Gera e compila a função que monta `model_class` a partir de uma tupla.
+
+    Para cada campo do dataclass, na ordem:
+    - valor fixo em `valores`;
+    - coluna de mesmo nome (ou a indicada em `colunas`), lida por posição
+      e passada pelo conversor do campo, se houver;
+    - valor de `padroes`;
+    - default do próprio dataclass (o argumento é omitido).
+
+    Colunas do resultado que não correspondem a nenhum campo são ignoradas.
+
+    Raises:
+        ValueError: Se um campo sem default não estiver no resultado, em
+            `valores` nem em `padroes` (em geral, coluna esquecida no SQL)
+    """
+    posicoes = {nome: i for i, nome in reversed(list(enumerate(nomes_colunas)))}
+    colunas_d, conversores_d = dict(colunas), dict(conversores)
+    valores_d, padroes_d = dict(valores), dict(padroes)
+
+    ambiente: Dict[str, Any] = {"_modelo": model_class}
+    argumentos = []
+    for campo in dataclasses.fields(model_class):
+        if not campo.init:
+            continue
+        nome = campo.name
+        if nome in valores_d:
+            ambiente[f"_v_{nome}"] = valores_d[nome]
+            expressao = f"_v_{nome}"
+        elif colunas_d.get(nome, nome) in posicoes:
+            expressao = f"linha[{posicoes[colunas_d.get(nome, nome)]}]"
+            if nome in conversores_d:
+                ambiente[f"_c_{nome}"] = conversores_d[nome]
+                expressao = f"_c_{nome}({expressao})"
+        elif nome in padroes_d:
+            ambiente[f"_v_{nome}"] = padroes_d[nome]
+            expressao = f"_v_{nome}"
+        elif campo.default is not dataclasses.MISSING or campo.default_factory is not dataclasses.MISSING:
+            continue
+        else:
+            raise ValueError(
+                f"Coluna '{colunas_d.get(nome, nome)}' ausente no resultado para o campo "
+                f"{model_class.__name__}.{nome} (informe-o em padroes se a ausência for esperada)"
+            )
+        argumentos.append(f"{nome}={expressao}")
+
+    codigo = f"def mapear(linha):\n    return _modelo({', '.join(argumentos)})\n"
+    exec(compile(codigo, f"<mapeador {model_class.__name__}>", "exec"), ambiente)
+    return ambiente["mapear"]
+
+
+def obter_mapeador(
+    cursor: Cursor,
+    model_class: Type[T],
+    colunas: Optional[Mapping[str, str]] = None,
+    conversores: Optional[Mapping[str, Callable[[Any], Any]]] = None,
+    valores: Optional[Mapping[str, Any]] = None,
+    padroes: Optional[Mapping[str, Any]] = None,
+) -> Callable[[tuple], T]:
+    """
+    Retorna o mapeador compilado para o resultado do cursor e passa o cursor a devolver tuplas.
+
+    O cache é indexado pelos nomes das colunas do resultado (cursor.description),
+    que são determinados pelo SQL: consultas com as mesmas colunas compartilham
+    o mapeador.
+
+    Args:
+        cursor: Cursor com a consulta já executada
+        model_class: Dataclass do modelo
+        colunas: {campo: coluna} quando o nome da coluna difere do campo
+        conversores: {campo: função} aplicada ao valor da coluna (ex.: enum, data)
+        valores: {campo: valor} fixo, ignorando a coluna (ex.: senha não exposta)
+        padroes: {campo: valor} usado quando a coluna não está no resultado
+            (campos sem default ausentes do resultado levantam ValueError)
+
+    As opções fazem parte da chave do cache: use constantes (valores que
+    mudam a cada chamada, como parâmetros da consulta, gerariam um mapeador
+    novo por chamada).
+    """
+    cursor.row_factory = None
+    nomes_colunas = tuple(descricao[0] for descricao in cursor.description or ())
+    return _compilar_mapeador(
+        model_class, nomes_colunas, _itens(colunas), _itens(conversores), _itens(valores), _itens(padroes)
+    )
+
+
+def mapear_linhas(cursor: Cursor, model_class: Type[T], **opcoes: Any) -> List[T]:
+    """
+    Monta um modelo para cada linha restante do cursor.
+
+    As opções são as de `obter_mapeador`.
+
+    Examples:
+        >>> cursor.execute(OBTER_PAGINA, (limite, offset))
+        >>> chamados = mapear_linhas(cursor, Chamado, conversores={"status": ChamadoStatus})
+    """
+    mapear = obter_mapeador(cursor, model_class, **opcoes)
+    return [mapear(linha) for linha in cursor.fetchall()]
+
+
+def mapear_linha(cursor: Cursor, model_class: Type[T], **opcoes: Any) -> Optional[T]:
+    """
+    Monta o modelo da próxima linha do cursor (None se não houver).
+
+    Examples:
+        >>> cursor.execute(OBTER_POR_ID, (id_usuario,))
+        >>> usuario = mapear_linha(cursor, Usuario)
+    """
+    mapear = obter_mapeador(cursor, model_class, **opcoes)
+    linha = cursor.fetchone()
+    return mapear(linha) if linha is not None else None
+
+
+def limpar_cache_mapeadores() -> None:
+    """Descarta os mapeadores compilados (ex.: após recarregar um modelo)."""
+    _compilar_mapeador.cache_clear()
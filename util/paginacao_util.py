@@ -0,0 +1,94 @@
+"""
+Utilitários para paginação por cursor (keyset) nas listagens.
+
+Em vez de LIMIT/OFFSET, cada página é buscada a partir da chave
+(data, id) do último item exibido, de forma que páginas profundas custam o
+mesmo que a primeira. O cursor é um token opaco que vai na URL
+(?apos=... ou ?antes=...).
+"""
+
+import base64
+import binascii
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+# Chave de ordenação de um item: (data, id)
+ChaveCursor = Tuple[str, int]
+
+
+@dataclass
+class PaginaCursor:
+    """Página de resultados com os cursores para navegação anterior/próxima."""
+    itens: List[Dict[str, Any]] = field(default_factory=list)
+    cursor_anterior: Optional[str] = None
+    cursor_proximo: Optional[str] = None
+
+
+def codificar_cursor(data: Any, id_registro: int) -> str:
+    """Gera o token de cursor para a chave (data, id)."""
+    bruto = f"{data}|{id_registro}".encode("utf-8")
+    return base64.urlsafe_b64encode(bruto).decode("ascii").rstrip("=")
+
+
+def decodificar_cursor(cursor: Optional[str]) -> Optional[ChaveCursor]:
+    """
+    Lê a chave (data, id) de um token de cursor.
+
+    Returns:
+        A chave decodificada ou None se o cursor estiver ausente ou inválido
+    """
+    if not cursor:
+        return None
+    try:
+        preenchimento = "=" * (-len(cursor) % 4)
+        bruto = base64.urlsafe_b64decode(cursor + preenchimento).decode("utf-8")
+        data, id_registro = bruto.rsplit("|", 1)
+        return data, int(id_registro)
+    except (ValueError, binascii.Error, UnicodeDecodeError):
+        return None
+
+
+def montar_pagina(
+    linhas: List[Dict[str, Any]],
+    tamanho_pagina: int,
+    campo_data: str,
+    campo_id: str,
+    voltando: bool = False,
+    primeira_pagina: bool = True,
+) -> PaginaCursor:
+    """
+    Monta a página a partir das linhas buscadas com LIMIT tamanho_pagina + 1.
+
+    A linha excedente apenas indica que existe outra página naquela direção.
+    Quando `voltando` é True as linhas vieram em ordem crescente (consulta
+    com ?antes=) e são invertidas para manter a ordem de exibição.
+
+    Args:
+        linhas: Resultado da consulta (até tamanho_pagina + 1 itens)
+        tamanho_pagina: Quantidade de itens exibidos por página
+        campo_data: Nome do campo de data usado na ordenação
+        campo_id: Nome do campo de ID usado como desempate
+        voltando: Se a consulta foi feita a partir de um cursor ?antes=
+        primeira_pagina: Se a consulta não recebeu nenhum cursor
+    """
+    tem_mais = len(linhas) > tamanho_pagina
+    itens = linhas[:tamanho_pagina]
+    if voltando:
+        itens.reverse()
+
+    pagina = PaginaCursor(itens=itens)
+    if not itens:
+        return pagina
+
+    primeiro, ultimo = itens[0], itens[-1]
+    if voltando:
+        # Viemos de uma página mais nova: sempre há próxima
+        pagina.cursor_proximo = codificar_cursor(ultimo[campo_data], ultimo[campo_id])
+        if tem_mais:
+            pagina.cursor_anterior = codificar_cursor(primeiro[campo_data], primeiro[campo_id])
+    else:
+        if tem_mais:
+            pagina.cursor_proximo = codificar_cursor(ultimo[campo_data], ultimo[campo_id])
+        if not primeira_pagina:
+            pagina.cursor_anterior = codificar_cursor(primeiro[campo_data], primeiro[campo_id])
+    return pagina
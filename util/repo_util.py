@@ -2,9 +2,15 @@
 Utilitários para repositórios, incluindo decoradores para tratamento de exceções.
 """
 
+import os
+import time
+import asyncio
 import logging
+import threading
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
 from functools import wraps
-from typing import Callable, TypeVar, Any
+from typing import Awaitable, Callable, Optional, TypeVar, Any
 
 logger = logging.getLogger(__name__)
 
@@ -173,3 +179,134 @@ def validar_paginacao(limite: int, offset: int) -> bool:
         return False
 
     return True
+
+
+# Pool de threads para executar chamadas bloqueantes (repositórios sqlite3,
+# bcrypt) fora do event loop das rotas async.
+REPO_THREADS: int = int(os.getenv("REPO_THREADS", "8"))
+
+
+class ExecutorRepo:
+    """
+    Pool limitado de threads para trabalho bloqueante chamado por rotas async.
+
+    Mantém métricas de profundidade de fila (tarefas aguardando uma thread
+    livre), tarefas em execução e tempo de espera na fila.
+    """
+
+    def __init__(self, max_threads: int = REPO_THREADS):
+        self.max_threads = max_threads
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._na_fila = 0
+        self._em_execucao = 0
+        self._pico_fila = 0
+        self._concluidas = 0
+        self._erros = 0
+        self._tempo_fila_total = 0.0
+        self._tempo_fila_maximo = 0.0
+
+    def _obter_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_threads, thread_name_prefix="repo"
+                )
+            return self._executor
+
+    async def executar(self, func: Callable[..., T], *args, **kwargs) -> T:
+        """Executa `func(*args, **kwargs)` em uma thread do pool e aguarda o resultado."""
+        executor = self._obter_executor()
+        contexto = contextvars.copy_context()
+        enfileirada_em = time.perf_counter()
+        with self._lock:
+            self._na_fila += 1
+            self._pico_fila = max(self._pico_fila, self._na_fila)
+
+        def tarefa() -> T:
+            espera = time.perf_counter() - enfileirada_em
+            with self._lock:
+                self._na_fila -= 1
+                self._em_execucao += 1
+                self._tempo_fila_total += espera
+                self._tempo_fila_maximo = max(self._tempo_fila_maximo, espera)
+            try:
+                return contexto.run(func, *args, **kwargs)
+            except Exception:
+                with self._lock:
+                    self._erros += 1
+                raise
+            finally:
+                with self._lock:
+                    self._em_execucao -= 1
+                    self._concluidas += 1
+
+        def ao_concluir(futuro) -> None:
+            # Cancelada antes de começar (ex.: a requisição que aguardava foi
+            # cancelada): tarefa() nunca roda, então a saída da fila é contada aqui
+            if futuro.cancelled():
+                with self._lock:
+                    self._na_fila -= 1
+
+        futuro = executor.submit(tarefa)
+        futuro.add_done_callback(ao_concluir)
+        return await asyncio.wrap_future(futuro)
+
+    def metricas(self) -> dict:
+        """Retorna um retrato das métricas do pool."""
+        with self._lock:
+            return {
+                "max_threads": self.max_threads,
+                "na_fila": self._na_fila,
+                "em_execucao": self._em_execucao,
+                "pico_fila": self._pico_fila,
+                "concluidas": self._concluidas,
+                "erros": self._erros,
+                "tempo_fila_medio": (
+                    self._tempo_fila_total / self._concluidas if self._concluidas else 0.0
+                ),
+                "tempo_fila_maximo": self._tempo_fila_maximo,
+            }
+
+    def fechar(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+
+_executor_repo = ExecutorRepo()
+
+
+async def executar_repo(func: Callable[..., T], *args, **kwargs) -> T:
+    """
+    Executa uma função bloqueante (repositório, hash de senha) no pool de
+    threads, sem travar o event loop.
+
+    Examples:
+        >>> artigo = await executar_repo(postagem_artigo_repo.obter_por_id, 1)
+    """
+    return await _executor_repo.executar(func, *args, **kwargs)
+
+
+def repo_async(func: Callable[..., T]) -> Callable[..., Awaitable[T]]:
+    """
+    Decorador que gera uma versão awaitable de uma função bloqueante,
+    executada no pool de threads dos repositórios.
+
+    Examples:
+        >>> obter_artigo = repo_async(postagem_artigo_repo.obter_por_id)
+        >>> artigo = await obter_artigo(1)
+    """
+    @wraps(func)
+    async def wrapper(*args, **kwargs) -> T:
+        return await _executor_repo.executar(func, *args, **kwargs)
+    return wrapper
+
+
+def obter_metricas_executor_repo() -> dict:
+    return _executor_repo.metricas()
+
+
+def fechar_executor_repo() -> None:
+    _executor_repo.fechar()
@@ -2,10 +2,13 @@
 Módulo de segurança para gerenciar senhas e tokens
 """
 
+import os
 import secrets
 import string
 import logging
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
+from typing import List, Optional, Sequence
 from passlib.context import CryptContext
 
 # Configurar logger
@@ -14,6 +17,9 @@ logger = logging.getLogger(__name__)
 # Contexto para hash de senhas usando bcrypt
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+# Abaixo desta quantidade, subir processos custa mais que calcular os hashes em série
+MINIMO_HASHES_PARALELOS = 4
+
 
 def criar_hash_senha(senha: str) -> str:
     """
@@ -28,6 +34,30 @@ def criar_hash_senha(senha: str) -> str:
     return pwd_context.hash(senha)
 
 
+def criar_hashes_senhas(senhas: Sequence[str], processos: Optional[int] = None) -> List[str]:
+    """
+    Cria os hashes bcrypt de várias senhas em paralelo, em um pool de processos
+
+    O bcrypt é propositalmente lento e segura o GIL; na importação de dados
+    iniciais (ou de massas de teste) calcular os hashes em série domina o tempo
+    total.
+
+    Args:
+        senhas: Senhas em texto plano
+        processos: Quantidade de processos (padrão: número de CPUs)
+
+    Returns:
+        Hashes na mesma ordem das senhas
+    """
+    processos = processos or os.cpu_count() or 1
+    if processos <= 1 or len(senhas) < MINIMO_HASHES_PARALELOS:
+        return [criar_hash_senha(senha) for senha in senhas]
+
+    processos = min(processos, len(senhas))
+    with ProcessPoolExecutor(max_workers=processos) as executor:
+        return list(executor.map(criar_hash_senha, senhas, chunksize=max(1, len(senhas) // (processos * 4))))
+
+
 def verificar_senha(senha_plana: str, senha_hash: str) -> bool:
     """
     Verifica se a senha em texto plano corresponde ao hash
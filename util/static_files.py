@@ -0,0 +1,99 @@
+"""
+Servidor de arquivos estáticos com cabeçalhos de cache e versões pré-comprimidas.
+
+Política de cache por classe de arquivo (caminho relativo a static/):
+
+- dist/ (assets versionados, ver util/assets.py) e midia/ (uploads
+  endereçados por conteúdo): o nome muda junto com o conteúdo, então são
+  imutáveis e ficam em cache por um ano sem revalidação;
+- img/: imagens do site, em cache por um dia e depois revalidadas pelo ETag;
+- demais (css/js sem versão, uploads antigos): sempre revalidados pelo ETag
+  (`no-cache`), respondendo 304 sem corpo quando não mudaram.
+
+Quando o cliente aceita, arquivos com irmão `.br` ou `.gz` (gerados pelo
+build de assets) são servidos comprimidos, com `Content-Encoding` e
+`Vary: Accept-Encoding`.
+"""
+
+import os
+import stat
+from mimetypes import guess_type
+
+import anyio
+from starlette.datastructures import Headers
+from starlette.responses import FileResponse, Response
+from starlette.staticfiles import NotModifiedResponse, StaticFiles
+from starlette.types import Scope
+
+from util.assets import EXTENSOES_COMPRIMIVEIS
+
+CACHE_CONTROL_IMUTAVEL = "public, max-age=31536000, immutable"
+CACHE_CONTROL_IMAGENS = "public, max-age=86400"
+CACHE_CONTROL_REVALIDAR = "no-cache"
+
+# Prefixo do caminho -> Cache-Control (o primeiro que casar vale)
+POLITICAS_CACHE = (
+    ("dist/", CACHE_CONTROL_IMUTAVEL),
+    ("midia/", CACHE_CONTROL_IMUTAVEL),
+    ("img/", CACHE_CONTROL_IMAGENS),
+)
+
+# Codificações pré-comprimidas, em ordem de preferência
+CODIFICACOES = (("br", ".br"), ("gzip", ".gz"))
+
+
+def politica_cache(caminho: str) -> str:
+    """Cache-Control para um caminho relativo a static/."""
+    caminho = caminho.replace(os.sep, "/")
+    for prefixo, politica in POLITICAS_CACHE:
+        if caminho.startswith(prefixo):
+            return politica
+    return CACHE_CONTROL_REVALIDAR
+
+
+def _codificacoes_aceitas(scope: Scope) -> set:
+    aceitas = set()
+    for item in Headers(scope=scope).get("accept-encoding", "").split(","):
+        nome, _, parametros = item.strip().partition(";")
+        if parametros.replace(" ", "") in ("q=0", "q=0.0", "q=0.00", "q=0.000"):
+            continue
+        aceitas.add(nome.strip().lower())
+    return aceitas
+
+
+class StaticFilesComCache(StaticFiles):
+    """StaticFiles com política de cache por classe de arquivo e suporte a .br/.gz."""
+
+    async def get_response(self, path: str, scope: Scope) -> Response:
+        comprimivel = os.path.splitext(path)[1] in EXTENSOES_COMPRIMIVEIS
+        resposta = None
+        if comprimivel and scope["method"] in ("GET", "HEAD"):
+            resposta = await self._resposta_comprimida(path, scope)
+        if resposta is None:
+            resposta = await super().get_response(path, scope)
+
+        if resposta.status_code in (200, 304):
+            resposta.headers["Cache-Control"] = politica_cache(path)
+            if comprimivel:
+                resposta.headers["Vary"] = "Accept-Encoding"
+        return resposta
+
+    async def _resposta_comprimida(self, path: str, scope: Scope):
+        """Resposta com a versão pré-comprimida aceita pelo cliente, se existir."""
+        aceitas = _codificacoes_aceitas(scope)
+        for codificacao, extensao in CODIFICACOES:
+            if codificacao not in aceitas:
+                continue
+            caminho_completo, stat_result = await anyio.to_thread.run_sync(
+                self.lookup_path, path + extensao
+            )
+            if stat_result is None or not stat.S_ISREG(stat_result.st_mode):
+                continue
+
+            media_type = guess_type(path)[0] or "application/octet-stream"
+            resposta = FileResponse(caminho_completo, stat_result=stat_result, media_type=media_type)
+            resposta.headers["Content-Encoding"] = codificacao
+            if self.is_not_modified(resposta.headers, Headers(scope=scope)):
+                return NotModifiedResponse(resposta.headers)
+            return resposta
+        return None
@@ -1,71 +1,157 @@
+import os
+import logging
+import threading
 from typing import List, Optional, Union
 from datetime import datetime, date
-from jinja2 import FileSystemLoader
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, TemplateError
 from fastapi.templating import Jinja2Templates
 from fastapi import Request
 
+logger = logging.getLogger(__name__)
+
+# Diretório raiz dos templates, sempre presente no caminho de busca
+DIRETORIO_TEMPLATES = "templates"
+
+# Quantidade de templates compilados mantidos em memória pelo ambiente
+TEMPLATES_CACHE_SIZE: int = int(os.getenv("TEMPLATES_CACHE_SIZE", "1000"))
+
+# Diretório do cache de bytecode (vazio = diretório temporário do sistema)
+TEMPLATES_BYTECODE_DIR: Optional[str] = os.getenv("TEMPLATES_BYTECODE_DIR") or None
+
+_templates: Optional[Jinja2Templates] = None
+_lock_templates = threading.Lock()
+
+
+def _criar_ambiente() -> Jinja2Templates:
+    """
+    Cria o ambiente Jinja2 único do processo.
+
+    Em produção `auto_reload` fica desligado: os templates não são verificados
+    no disco a cada renderização. O cache de bytecode evita recompilar os
+    templates a cada reinício da aplicação.
+    """
+    if TEMPLATES_BYTECODE_DIR:
+        os.makedirs(TEMPLATES_BYTECODE_DIR, exist_ok=True)
+
+    ambiente = Environment(
+        loader=FileSystemLoader([DIRETORIO_TEMPLATES]),
+        autoescape=True,
+        cache_size=TEMPLATES_CACHE_SIZE,
+        auto_reload=os.getenv("ENVIRONMENT", "development") != "production",
+        bytecode_cache=FileSystemBytecodeCache(TEMPLATES_BYTECODE_DIR),
+    )
+    templates = Jinja2Templates(env=ambiente)
+
+    # Adicionar funções globais ao ambiente Jinja2
+    _adicionar_funcoes_globais(templates)
+    return templates
+
+
+def obter_templates() -> Jinja2Templates:
+    """Retorna o objeto Jinja2Templates compartilhado, criando-o na primeira chamada."""
+    global _templates
+    if _templates is None:
+        with _lock_templates:
+            if _templates is None:
+                _templates = _criar_ambiente()
+    return _templates
+
 
 def criar_templates(diretorio_especifico: Optional[Union[str, List[str]]] = None) -> Jinja2Templates:
     """
-    Cria um objeto Jinja2Templates configurado com múltiplos diretórios.
-    
-    O diretório raiz "templates" é sempre incluído automaticamente para garantir
-    acesso aos templates base como base.html.
-    
+    Retorna o objeto Jinja2Templates compartilhado, incluindo diretórios extras
+    no caminho de busca.
+
+    Todas as rotas usam o mesmo ambiente Jinja2, de forma que cada template é
+    compilado uma única vez por processo. O diretório raiz "templates" é sempre
+    incluído para garantir acesso aos templates base como base.html; os
+    diretórios específicos são adicionados depois dele, permitindo referenciar
+    templates pelo nome curto (ex.: "login.html" em "templates/publico").
+
     Args:
         diretorio_especifico: Diretório(s) específico(s) além do raiz.
                              Pode ser uma string única ou lista de strings.
                              Exemplo: "templates/admin/categorias" ou
                                      ["templates/admin", "templates/public"]
-    
+
     Returns:
-        Objeto Jinja2Templates configurado com os diretórios especificados
-    
+        Objeto Jinja2Templates compartilhado
+
     Exemplo de uso:
         # Para um diretório específico
         templates = criar_templates("templates/admin/categorias")
-        
+
         # Para múltiplos diretórios
         templates = criar_templates(["templates/admin", "templates/admin/produtos"])
-        
+
         # Apenas com o diretório raiz
         templates = criar_templates()
     """
-    # Sempre incluir o diretório raiz onde estão os templates base
-    diretorios = ["templates"]
-    
-    # Adicionar diretórios específicos se fornecidos
+    templates = obter_templates()
+
+    diretorios: List[str] = []
     if diretorio_especifico:
         if isinstance(diretorio_especifico, str):
-            # Se for uma string única, adiciona à lista
             diretorios.append(diretorio_especifico)
         elif isinstance(diretorio_especifico, list):
-            # Se for uma lista, estende a lista de diretórios
             diretorios.extend(diretorio_especifico)
-    
-    # Criar o objeto Jinja2Templates com diretório base como "."
-    # Isso é necessário para que o FileSystemLoader funcione corretamente
-    templates = Jinja2Templates(directory=".")
-    
-    # Configurar o loader com múltiplos diretórios
-    # O FileSystemLoader tentará encontrar templates em ordem nos diretórios listados
-    templates.env.loader = FileSystemLoader(diretorios)
 
-    # Adicionar funções globais ao ambiente Jinja2
-    _adicionar_funcoes_globais(templates)
+    caminho_busca = templates.env.loader.searchpath
+    with _lock_templates:
+        for diretorio in diretorios:
+            if diretorio not in caminho_busca:
+                caminho_busca.append(diretorio)
 
     return templates
 
 
+def precompilar_templates() -> int:
+    """
+    Compila todos os templates HTML do caminho de busca.
+
+    Chamado na inicialização da aplicação para que a primeira requisição de
+    cada worker não pague o custo de compilação. Templates com erro de sintaxe
+    são registrados no log e ignorados.
+
+    Returns:
+        Quantidade de templates compilados
+    """
+    ambiente = obter_templates().env
+    compilados = 0
+    for nome in ambiente.list_templates(extensions=["html"]):
+        try:
+            ambiente.get_template(nome)
+            compilados += 1
+        except TemplateError as e:
+            logger.error(f"Erro ao compilar template {nome}: {e}")
+    logger.info(f"{compilados} templates pré-compilados")
+    return compilados
+
+
 def _adicionar_funcoes_globais(templates: Jinja2Templates) -> None:
     """
     Adiciona funções globais e filtros ao ambiente Jinja2
     """
     from util.mensagens import obter_mensagens
+    from util.catalogo_categorias import catalogo_categorias
+    from util.imagem_derivados import url_imagem, srcset_imagem
+    from util.assets import asset, fontes_imagem, pacote
 
     # Adicionar obter_mensagens como função global
     templates.env.globals['obter_mensagens'] = obter_mensagens
 
+    # URLs versionadas de CSS/JS/imagens e pacotes por página (static/dist/manifest.json)
+    templates.env.globals['asset'] = asset
+    templates.env.globals['pacote'] = pacote
+    templates.env.globals['fontes_imagem'] = fontes_imagem
+
+    # URLs das imagens enviadas e srcset com as variantes (thumb/card/full)
+    templates.env.globals['url_imagem'] = url_imagem
+    templates.env.globals['srcset_imagem'] = srcset_imagem
+
+    # Versão do catálogo de categorias (muda a cada alteração feita pelo administrador)
+    templates.env.globals['versao_categorias'] = lambda: catalogo_categorias.versao
+
     # Adicionar filtros de formatação de data/hora pt-BR
     templates.env.filters['data_br'] = formatar_data_br
     templates.env.filters['hora_br'] = formatar_hora_br
@@ -0,0 +1,125 @@
+"""
+Verificação, entre processos, de que uma cópia em memória do banco ficou velha.
+
+Catálogos mantidos em memória (como o de categorias) são atualizados
+pelo ouvinte de `cache_util` no processo que fez a escrita; os demais workers
+do uvicorn não recebem esse aviso. Para eles, a tabela `versao_dados` guarda
+um contador por tag, incrementado por triggers na mesma transação da escrita
+(ver sql/migracoes/019_versao_dados.sql). Cada cópia em memória lembra o
+contador que viu ao carregar.
+
+A comparação com o banco não acontece nas requisições: a thread de
+`AtualizacaoPeriodica` executa, a cada `CACHE_VERSAO_INTERVALO` segundos, as
+verificações registradas pelas cópias em memória, e as rotas e templates
+apenas leem o conteúdo já carregado. O índice de mídia usa a mesma thread,
+mas acompanha um registro de alterações em vez do contador (ver
+util/indice_midia.py).
+
+Em bancos sem a tabela (ainda não migrados), a verificação nunca acusa
+mudança e vale apenas a atualização pelo ouvinte.
+"""
+
+import atexit
+import logging
+import os
+import sqlite3
+import threading
+from typing import Callable, List, Optional
+
+from sql.versao_dados_sql import OBTER_VERSAO
+from util.db_util import get_connection_leitura
+
+logger = logging.getLogger(__name__)
+
+CACHE_VERSAO_INTERVALO: float = float(os.getenv("CACHE_VERSAO_INTERVALO", "1"))
+
+
+class VersaoDados:
+    """Contador de versão de uma tag em `versao_dados`."""
+
+    def __init__(self, tag: str):
+        self.tag = tag
+        self._vista: Optional[int] = None
+        self._lock = threading.Lock()
+
+    def consultar(self) -> Optional[int]:
+        """Versão atual no banco (None se a tabela ou a tag não existirem)."""
+        try:
+            with get_connection_leitura() as conn:
+                row = conn.execute(OBTER_VERSAO, (self.tag,)).fetchone()
+        except sqlite3.OperationalError:
+            return None
+        return row[0] if row else None
+
+    def marcar(self, versao: Optional[int]) -> None:
+        """Registra a versão correspondente aos dados carregados (consultada antes da leitura)."""
+        with self._lock:
+            self._vista = versao
+
+    def desatualizada(self) -> bool:
+        """Se a versão do banco mudou desde `marcar`."""
+        with self._lock:
+            vista = self._vista
+        versao = self.consultar()
+        return versao is not None and versao != vista
+
+
+class AtualizacaoPeriodica:
+    """Thread que executa as verificações registradas a cada `intervalo_segundos`."""
+
+    def __init__(self, intervalo_segundos: float = CACHE_VERSAO_INTERVALO):
+        self.intervalo_segundos = intervalo_segundos
+        self._verificacoes: List[Callable[[], None]] = []
+        self._parar = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def registrar(self, verificacao: Callable[[], None]) -> None:
+        """Registra uma função sem argumentos que confere e atualiza uma cópia em memória."""
+        with self._lock:
+            self._verificacoes.append(verificacao)
+
+    def em_execucao(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def executar_uma_vez(self) -> None:
+        with self._lock:
+            verificacoes = list(self._verificacoes)
+        for verificacao in verificacoes:
+            try:
+                verificacao()
+            except Exception as e:
+                logger.error(f"Erro na atualização periódica {getattr(verificacao, '__qualname__', verificacao)}: {e}")
+
+    def iniciar(self) -> None:
+        """Inicia a thread (nada a fazer se o intervalo for 0)."""
+        if self.em_execucao() or self.intervalo_segundos <= 0:
+            return
+        self._parar.clear()
+        self._thread = threading.Thread(target=self._executar, name="atualizacao-versoes", daemon=True)
+        self._thread.start()
+
+    def parar(self) -> None:
+        if self._thread is None:
+            return
+        self._parar.set()
+        self._thread.join()
+        self._thread = None
+
+    def _executar(self) -> None:
+        while not self._parar.wait(self.intervalo_segundos):
+            self.executar_uma_vez()
+
+
+atualizacao_periodica = AtualizacaoPeriodica()
+
+
+def iniciar_atualizacao() -> None:
+    atualizacao_periodica.iniciar()
+
+
+def parar_atualizacao() -> None:
+    atualizacao_periodica.parar()
+
+
+atexit.register(parar_atualizacao)
@@ -0,0 +1,150 @@
+"""
+Acumulador em memória (write-behind) para contadores de visualizações.
+
+Cada visualização de página apenas incrementa um contador em memória; os
+incrementos acumulados são gravados no banco em uma única transação
+(executemany) a cada `VISUALIZACOES_FLUSH_SEGUNDOS` segundos, quando o
+número de eventos pendentes chega a `VISUALIZACOES_FLUSH_EVENTOS`, ou no
+encerramento da aplicação.
+"""
+
+import os
+import atexit
+import logging
+import threading
+from typing import Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+VISUALIZACOES_FLUSH_SEGUNDOS: float = float(os.getenv("VISUALIZACOES_FLUSH_SEGUNDOS", "5.0"))
+VISUALIZACOES_FLUSH_EVENTOS: int = int(os.getenv("VISUALIZACOES_FLUSH_EVENTOS", "100"))
+
+# Recebe a lista de (incremento, id) e grava no banco
+GravarIncrementos = Callable[[List[Tuple[int, int]]], int]
+
+
+class BufferVisualizacoes:
+    """
+    Acumula incrementos de visualizações por ID e os grava em lote.
+
+    Enquanto a thread de descarga não estiver em execução (testes, scripts),
+    atingir o limite de eventos grava os incrementos imediatamente na thread
+    que registrou a visualização.
+    """
+
+    def __init__(
+        self,
+        nome: str,
+        gravar: GravarIncrementos,
+        intervalo_segundos: float = VISUALIZACOES_FLUSH_SEGUNDOS,
+        limite_eventos: int = VISUALIZACOES_FLUSH_EVENTOS,
+    ):
+        self.nome = nome
+        self._gravar = gravar
+        self.intervalo_segundos = intervalo_segundos
+        self.limite_eventos = limite_eventos
+
+        self._lock = threading.Lock()
+        self._lock_gravacao = threading.Lock()
+        self._pendentes: Dict[int, int] = {}
+        self._eventos = 0
+        self._acordar = threading.Event()
+        self._parar = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def registrar(self, id_registro: int, quantidade: int = 1) -> None:
+        """Acumula `quantidade` visualizações para o registro informado."""
+        with self._lock:
+            self._pendentes[id_registro] = self._pendentes.get(id_registro, 0) + quantidade
+            self._eventos += 1
+            atingiu_limite = self._eventos >= self.limite_eventos
+
+        if atingiu_limite:
+            if self.em_execucao():
+                self._acordar.set()
+            else:
+                self.descarregar()
+
+    def pendentes(self, id_registro: int) -> int:
+        """Retorna as visualizações ainda não gravadas para o registro."""
+        with self._lock:
+            return self._pendentes.get(id_registro, 0)
+
+    def descarregar(self) -> int:
+        """
+        Grava todos os incrementos pendentes em uma única transação.
+
+        Em caso de erro os incrementos voltam para o buffer e serão gravados
+        na próxima descarga.
+
+        Returns:
+            Quantidade de registros atualizados
+        """
+        with self._lock_gravacao:
+            with self._lock:
+                if not self._pendentes:
+                    return 0
+                lote, self._pendentes = self._pendentes, {}
+                self._eventos = 0
+
+            incrementos = [(quantidade, id_registro) for id_registro, quantidade in lote.items()]
+            try:
+                return self._gravar(incrementos)
+            except Exception as e:
+                logger.error(f"Erro ao gravar visualizações de {self.nome}: {e}")
+                with self._lock:
+                    for id_registro, quantidade in lote.items():
+                        self._pendentes[id_registro] = self._pendentes.get(id_registro, 0) + quantidade
+                        self._eventos += 1
+                return 0
+
+    def em_execucao(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def iniciar(self) -> None:
+        """Inicia a thread que descarrega o buffer periodicamente."""
+        if self.em_execucao():
+            return
+        self._parar.clear()
+        self._thread = threading.Thread(
+            target=self._executar, name=f"visualizacoes-{self.nome}", daemon=True
+        )
+        self._thread.start()
+
+    def parar(self) -> None:
+        """Interrompe a thread de descarga e grava o que estiver pendente."""
+        self._parar.set()
+        self._acordar.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self.descarregar()
+
+    def _executar(self) -> None:
+        while not self._parar.is_set():
+            self._acordar.wait(self.intervalo_segundos)
+            self._acordar.clear()
+            self.descarregar()
+
+
+_buffers: List[BufferVisualizacoes] = []
+
+
+def criar_buffer(nome: str, gravar: GravarIncrementos) -> BufferVisualizacoes:
+    """Cria um buffer registrado para ser iniciado/parado junto com a aplicação."""
+    buffer = BufferVisualizacoes(nome, gravar)
+    _buffers.append(buffer)
+    return buffer
+
+
+def iniciar_buffers() -> None:
+    for buffer in _buffers:
+        buffer.iniciar()
+
+
+def parar_buffers() -> None:
+    for buffer in _buffers:
+        buffer.parar()
+
+
+atexit.register(parar_buffers)